@@ -1,6 +1,7 @@
 import { system, world } from '@minecraft/server'
-import { getCompatibleNamespaces, readToolLockFromItem, registerToolLockResolver } from './tool_lock_memory.js'
+import { readToolLockFromItem, registerToolLockResolver } from './tool_lock_memory.js'
 import { playToolMaterialSound, soundConfig } from './sound_config.js'
+import { SHAPE_FAMILY_BY_ID } from './shape_families.generated.js'
 
 // Supported namespaces for custom components and durability filtering.
 const TOOL_NAMESPACES = ['dorios_atelier', 'utilitycraft']
@@ -10,52 +11,38 @@ const FURNITURE_HAMMER_ID_SUFFIX = '_furniture_hammer'
 // Lock metadata and variant state mapping.
 const HAMMER_LOCK_KIND = 'hammer'
 const STATE_ORDER = ['default', 'stairs', 'slab', 'vertical_slab']
-const STATE_SUFFIX = {
-    default: '',
-    stairs: '_stairs',
-    slab: '_slab',
-    vertical_slab: '_vertical_slab'
-}
+// Next states to try from each state; the current state comes last.
+const STATE_CYCLE = Object.fromEntries(STATE_ORDER.map((state, index) => [
+    state,
+    STATE_ORDER.map((_, offset) => STATE_ORDER[(index + offset + 1) % STATE_ORDER.length])
+]))
 
 // Rotation sequences used when player is sneaking.
 const CARDINAL_ORDER = ['north', 'east', 'south', 'west']
 const ROTATION_ORDER = [0, 1, 2, 3, 4, 5, 6, 7]
 const weirdoDirection = [0, 1, 2, 3]
-const WOOD_BASE_TOKENS = [
-    'oak',
-    'spruce',
-    'birch',
-    'jungle',
-    'acacia',
-    'dark_oak',
-    'mangrove',
-    'cherry',
-    'bamboo',
-    'crimson',
-    'warped'
-]
+// Legacy minecraft:stone keeps its subtype in stone_type; map it to the flattened id.
 const STONE_TYPE_ALIAS = {
-    stone: 'stone',
-    granite: 'granite',
-    smooth_granite: 'smooth_granite',
-    granite_smooth: 'smooth_granite',
-    diorite: 'diorite',
-    smooth_diorite: 'smooth_diorite',
-    diorite_smooth: 'smooth_diorite',
-    andesite: 'andesite',
-    smooth_andesite: 'smooth_andesite',
-    andesite_smooth: 'smooth_andesite'
+    stone: 'minecraft:stone',
+    granite: 'minecraft:granite',
+    smooth_granite: 'minecraft:polished_granite',
+    granite_smooth: 'minecraft:polished_granite',
+    diorite: 'minecraft:diorite',
+    smooth_diorite: 'minecraft:polished_diorite',
+    diorite_smooth: 'minecraft:polished_diorite',
+    andesite: 'minecraft:andesite',
+    smooth_andesite: 'minecraft:polished_andesite',
+    andesite_smooth: 'minecraft:polished_andesite'
 }
 
 const TITLE_BY_STATE = {
     default: 'Default',
     stairs: 'Stairs',
     slab: 'Slab',
-    vertical_slab: 'Vertical Slab'
+    vertical_slab: 'Vertical Slab',
+    three_steps_stairs: 'Three-Step Stairs'
 }
 
-const isLikelyWoodBaseName = name => WOOD_BASE_TOKENS.some(token => name === token || name.includes(token))
-
 // Applies manual durability consumption and breaks the tool when needed.
 const damageHeldHammer = (player, eventItemStack) => {
     system.run(() => {
@@ -113,14 +100,7 @@ registerToolLockResolver(HAMMER_LOCK_KIND, viewedBlock => {
     const typeId = viewedBlock?.typeId
     if (!typeId) return undefined
 
-    const rawName = typeId.includes(':') ? typeId.split(':').slice(1).join(':') : typeId
-    const state = rawName.endsWith('_vertical_slab')
-        ? 'vertical_slab'
-        : rawName.endsWith('_stairs')
-            ? 'stairs'
-            : rawName.endsWith('_slab')
-                ? 'slab'
-                : 'default'
+    const state = SHAPE_FAMILY_BY_ID.get(typeId)?.state ?? 'default'
 
     return {
         kind: HAMMER_LOCK_KIND,
@@ -214,105 +194,30 @@ system.beforeEvents.startup.subscribe(initEvent => {
                     }
                 }
             } else {
-                // Parse current block variant state from suffix.
-                const currentTypeId = block.typeId
-                const currentNamespace = currentTypeId?.includes(':') ? currentTypeId.split(':')[0] : 'minecraft'
-                let rawName = currentTypeId?.includes(':') ? currentTypeId.split(':').slice(1).join(':') : String(currentTypeId)
-
-                // Exception: vanilla stone stores subtype in state/data, so read and map a virtual base name.
-                if (currentTypeId === 'minecraft:stone') {
+                // Resolve the shape family generated by tools/generate_uniform_variants.py.
+                let typeId = block.typeId
+                if (typeId === 'minecraft:stone') {
                     const stoneTypeState = block.permutation?.getState('stone_type')
                         ?? block.permutation?.getState('minecraft:stone_type')
-                    const mappedStoneName = STONE_TYPE_ALIAS[String(stoneTypeState ?? '').toLowerCase()]
-                    if (!mappedStoneName) {
-                        return
-                    }
-                    rawName = mappedStoneName
-                }
-
-                let currentState = 'default'
-                let baseName = rawName
-                if (rawName.endsWith('_vertical_slab')) {
-                    currentState = 'vertical_slab'
-                    baseName = rawName.slice(0, -'_vertical_slab'.length)
-                } else if (rawName.endsWith('_stairs')) {
-                    currentState = 'stairs'
-                    baseName = rawName.slice(0, -'_stairs'.length)
-                } else if (rawName.endsWith('_slab')) {
-                    currentState = 'slab'
-                    baseName = rawName.slice(0, -'_slab'.length)
+                    typeId = STONE_TYPE_ALIAS[String(stoneTypeState ?? '').toLowerCase()] ?? typeId
                 }
+                const entry = SHAPE_FAMILY_BY_ID.get(typeId)
+                if (!entry) return
 
                 // Build target state sequence (locked state or normal cycle order).
-                const stateSequence = lock?.state
-                    ? [lock.state]
-                    : (() => {
-                        const index = STATE_ORDER.indexOf(currentState)
-                        if (index < 0) return STATE_ORDER.slice()
-                        const nextStates = []
-                        for (let offset = 1; offset <= STATE_ORDER.length; offset += 1) {
-                            nextStates.push(STATE_ORDER[(index + offset) % STATE_ORDER.length])
-                        }
-                        return nextStates
-                    })()
+                const stateSequence = lock?.state ? [lock.state] : STATE_CYCLE[entry.state] ?? STATE_ORDER
 
-                // Try every candidate and skip invalid variants automatically.
+                // Skip states the family does not have.
                 for (const targetState of stateSequence) {
-                    const suffix = STATE_SUFFIX[targetState] ?? ''
-                    const namespaces = getCompatibleNamespaces(currentNamespace)
-                    const candidates = []
-                    const seen = new Set()
-                    const nameCandidates = []
-                    const pushName = value => {
-                        if (!value || nameCandidates.includes(value)) return
-                        nameCandidates.push(value)
-                    }
-
-                    // Default path for all materials.
-                    pushName(`${baseName}${suffix}`)
-
-                    // Wood special-case: many blocks are *_planks but variants are *_stairs/*_slab.
-                    if (baseName.endsWith('_planks')) {
-                        const planksFreeBase = baseName.slice(0, -'_planks'.length)
-                        pushName(`${planksFreeBase}${suffix}`)
-                    }
-
-                    // Reverse wood fallback: from stairs/slabs back to *_planks on default state.
-                    if (targetState === 'default' && !baseName.endsWith('_planks') && isLikelyWoodBaseName(baseName)) {
-                        pushName(`${baseName}_planks`)
-                    }
-
-                    const push = value => {
-                        if (!value || seen.has(value)) return
-                        seen.add(value)
-                        candidates.push(value)
-                    }
-
-                    for (const targetName of nameCandidates) {
-                        for (const ns of namespaces) {
-                            push(`${ns}:${targetName}`)
-                        }
-                    }
-
-                    if (targetState === 'vertical_slab') {
-                        for (const targetName of nameCandidates) {
-                            push(`dorios_atelier:${targetName}`)
-                            push(`utilitycraft:${targetName}`)
-                        }
-                    }
-
-                    for (const candidate of candidates) {
-                        if (candidate === block.typeId) continue
-                        try {
-                            block.setType(candidate)
-                            changed = true
-                            break
-                        } catch {
-                            // Try next candidate.
-                        }
+                    const candidate = entry.family[targetState]
+                    if (!candidate || candidate === block.typeId) continue
+                    try {
+                        block.setType(candidate)
+                        changed = true
+                        break
+                    } catch {
+                        // Try next state.
                     }
-
-                    if (changed) break
                 }
             }
 
@@ -0,0 +1,106 @@
+// Generated by tools/generate_glass_variants.py. Do not edit by hand.
+
+// Glass id -> { style, color, next, previous } along its glass cutter cycle.
+export const GLASS_CYCLE_BY_ID = new Map([
+	['minecraft:black_stained_glass', Object.freeze({ style: 'stained', color: 'black', next: 'dorios_atelier:black_stained_glass', previous: 'dorios_atelier:black_tempered_glass' })],
+	['dorios_atelier:black_stained_glass', Object.freeze({ style: 'stained', color: 'black', next: 'dorios_atelier:black_clean_glass', previous: 'minecraft:black_stained_glass' })],
+	['dorios_atelier:black_clean_glass', Object.freeze({ style: 'clean', color: 'black', next: 'dorios_atelier:black_broadline_glass', previous: 'dorios_atelier:black_stained_glass' })],
+	['dorios_atelier:black_broadline_glass', Object.freeze({ style: 'broadline', color: 'black', next: 'dorios_atelier:black_hitch_cross_glass', previous: 'dorios_atelier:black_clean_glass' })],
+	['dorios_atelier:black_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'black', next: 'dorios_atelier:black_tempered_glass', previous: 'dorios_atelier:black_broadline_glass' })],
+	['dorios_atelier:black_tempered_glass', Object.freeze({ style: 'tempered', color: 'black', next: 'minecraft:black_stained_glass', previous: 'dorios_atelier:black_hitch_cross_glass' })],
+	['minecraft:blue_stained_glass', Object.freeze({ style: 'stained', color: 'blue', next: 'dorios_atelier:blue_stained_glass', previous: 'dorios_atelier:blue_tempered_glass' })],
+	['dorios_atelier:blue_stained_glass', Object.freeze({ style: 'stained', color: 'blue', next: 'dorios_atelier:blue_clean_glass', previous: 'minecraft:blue_stained_glass' })],
+	['dorios_atelier:blue_clean_glass', Object.freeze({ style: 'clean', color: 'blue', next: 'dorios_atelier:blue_broadline_glass', previous: 'dorios_atelier:blue_stained_glass' })],
+	['dorios_atelier:blue_broadline_glass', Object.freeze({ style: 'broadline', color: 'blue', next: 'dorios_atelier:blue_hitch_cross_glass', previous: 'dorios_atelier:blue_clean_glass' })],
+	['dorios_atelier:blue_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'blue', next: 'dorios_atelier:blue_tempered_glass', previous: 'dorios_atelier:blue_broadline_glass' })],
+	['dorios_atelier:blue_tempered_glass', Object.freeze({ style: 'tempered', color: 'blue', next: 'minecraft:blue_stained_glass', previous: 'dorios_atelier:blue_hitch_cross_glass' })],
+	['minecraft:glass', Object.freeze({ style: 'stained', color: '', next: 'dorios_atelier:clean_glass', previous: 'dorios_atelier:tempered_glass' })],
+	['dorios_atelier:clean_glass', Object.freeze({ style: 'clean', color: '', next: 'dorios_atelier:broadline_glass', previous: 'minecraft:glass' })],
+	['dorios_atelier:broadline_glass', Object.freeze({ style: 'broadline', color: '', next: 'dorios_atelier:hitch_cross_glass', previous: 'dorios_atelier:clean_glass' })],
+	['dorios_atelier:hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: '', next: 'dorios_atelier:tempered_glass', previous: 'dorios_atelier:broadline_glass' })],
+	['dorios_atelier:tempered_glass', Object.freeze({ style: 'tempered', color: '', next: 'minecraft:glass', previous: 'dorios_atelier:hitch_cross_glass' })],
+	['minecraft:brown_stained_glass', Object.freeze({ style: 'stained', color: 'brown', next: 'dorios_atelier:brown_stained_glass', previous: 'dorios_atelier:brown_tempered_glass' })],
+	['dorios_atelier:brown_stained_glass', Object.freeze({ style: 'stained', color: 'brown', next: 'dorios_atelier:brown_clear_glass', previous: 'minecraft:brown_stained_glass' })],
+	['dorios_atelier:brown_clear_glass', Object.freeze({ style: 'clean', color: 'brown', next: 'dorios_atelier:brown_broadline_glass', previous: 'dorios_atelier:brown_stained_glass' })],
+	['dorios_atelier:brown_broadline_glass', Object.freeze({ style: 'broadline', color: 'brown', next: 'dorios_atelier:brown_hitch_cross_glass', previous: 'dorios_atelier:brown_clear_glass' })],
+	['dorios_atelier:brown_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'brown', next: 'dorios_atelier:brown_tempered_glass', previous: 'dorios_atelier:brown_broadline_glass' })],
+	['dorios_atelier:brown_tempered_glass', Object.freeze({ style: 'tempered', color: 'brown', next: 'minecraft:brown_stained_glass', previous: 'dorios_atelier:brown_hitch_cross_glass' })],
+	['minecraft:cyan_stained_glass', Object.freeze({ style: 'stained', color: 'cyan', next: 'dorios_atelier:cyan_stained_glass', previous: 'dorios_atelier:cyan_tempered_glass' })],
+	['dorios_atelier:cyan_stained_glass', Object.freeze({ style: 'stained', color: 'cyan', next: 'dorios_atelier:cyan_clean_glass', previous: 'minecraft:cyan_stained_glass' })],
+	['dorios_atelier:cyan_clean_glass', Object.freeze({ style: 'clean', color: 'cyan', next: 'dorios_atelier:cyan_broadline_glass', previous: 'dorios_atelier:cyan_stained_glass' })],
+	['dorios_atelier:cyan_broadline_glass', Object.freeze({ style: 'broadline', color: 'cyan', next: 'dorios_atelier:cyan_hitch_cross_glass', previous: 'dorios_atelier:cyan_clean_glass' })],
+	['dorios_atelier:cyan_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'cyan', next: 'dorios_atelier:cyan_tempered_glass', previous: 'dorios_atelier:cyan_broadline_glass' })],
+	['dorios_atelier:cyan_tempered_glass', Object.freeze({ style: 'tempered', color: 'cyan', next: 'minecraft:cyan_stained_glass', previous: 'dorios_atelier:cyan_hitch_cross_glass' })],
+	['minecraft:gray_stained_glass', Object.freeze({ style: 'stained', color: 'gray', next: 'dorios_atelier:gray_stained_glass', previous: 'dorios_atelier:gray_tempered_glass' })],
+	['dorios_atelier:gray_stained_glass', Object.freeze({ style: 'stained', color: 'gray', next: 'dorios_atelier:gray_clean_glass', previous: 'minecraft:gray_stained_glass' })],
+	['dorios_atelier:gray_clean_glass', Object.freeze({ style: 'clean', color: 'gray', next: 'dorios_atelier:gray_broadline_glass', previous: 'dorios_atelier:gray_stained_glass' })],
+	['dorios_atelier:gray_broadline_glass', Object.freeze({ style: 'broadline', color: 'gray', next: 'dorios_atelier:gray_hitch_cross_glass', previous: 'dorios_atelier:gray_clean_glass' })],
+	['dorios_atelier:gray_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'gray', next: 'dorios_atelier:gray_tempered_glass', previous: 'dorios_atelier:gray_broadline_glass' })],
+	['dorios_atelier:gray_tempered_glass', Object.freeze({ style: 'tempered', color: 'gray', next: 'minecraft:gray_stained_glass', previous: 'dorios_atelier:gray_hitch_cross_glass' })],
+	['minecraft:green_stained_glass', Object.freeze({ style: 'stained', color: 'green', next: 'dorios_atelier:green_stained_glass', previous: 'dorios_atelier:green_tempered_glass' })],
+	['dorios_atelier:green_stained_glass', Object.freeze({ style: 'stained', color: 'green', next: 'dorios_atelier:green_clean_glass', previous: 'minecraft:green_stained_glass' })],
+	['dorios_atelier:green_clean_glass', Object.freeze({ style: 'clean', color: 'green', next: 'dorios_atelier:green_broadline_glass', previous: 'dorios_atelier:green_stained_glass' })],
+	['dorios_atelier:green_broadline_glass', Object.freeze({ style: 'broadline', color: 'green', next: 'dorios_atelier:green_hitch_cross_glass', previous: 'dorios_atelier:green_clean_glass' })],
+	['dorios_atelier:green_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'green', next: 'dorios_atelier:green_tempered_glass', previous: 'dorios_atelier:green_broadline_glass' })],
+	['dorios_atelier:green_tempered_glass', Object.freeze({ style: 'tempered', color: 'green', next: 'minecraft:green_stained_glass', previous: 'dorios_atelier:green_hitch_cross_glass' })],
+	['minecraft:light_blue_stained_glass', Object.freeze({ style: 'stained', color: 'light_blue', next: 'dorios_atelier:light_blue_stained_glass', previous: 'dorios_atelier:light_blue_tempered_glass' })],
+	['dorios_atelier:light_blue_stained_glass', Object.freeze({ style: 'stained', color: 'light_blue', next: 'dorios_atelier:light_blue_clean_glass', previous: 'minecraft:light_blue_stained_glass' })],
+	['dorios_atelier:light_blue_clean_glass', Object.freeze({ style: 'clean', color: 'light_blue', next: 'dorios_atelier:light_blue_broadline_glass', previous: 'dorios_atelier:light_blue_stained_glass' })],
+	['dorios_atelier:light_blue_broadline_glass', Object.freeze({ style: 'broadline', color: 'light_blue', next: 'dorios_atelier:light_blue_hitch_cross_glass', previous: 'dorios_atelier:light_blue_clean_glass' })],
+	['dorios_atelier:light_blue_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'light_blue', next: 'dorios_atelier:light_blue_tempered_glass', previous: 'dorios_atelier:light_blue_broadline_glass' })],
+	['dorios_atelier:light_blue_tempered_glass', Object.freeze({ style: 'tempered', color: 'light_blue', next: 'minecraft:light_blue_stained_glass', previous: 'dorios_atelier:light_blue_hitch_cross_glass' })],
+	['minecraft:lime_stained_glass', Object.freeze({ style: 'stained', color: 'lima', next: 'dorios_atelier:lima_stained_glass', previous: 'dorios_atelier:lima_tempered_glass' })],
+	['dorios_atelier:lima_stained_glass', Object.freeze({ style: 'stained', color: 'lima', next: 'dorios_atelier:lima_clean_glass', previous: 'minecraft:lime_stained_glass' })],
+	['dorios_atelier:lima_clean_glass', Object.freeze({ style: 'clean', color: 'lima', next: 'dorios_atelier:lima_broadline_glass', previous: 'dorios_atelier:lima_stained_glass' })],
+	['dorios_atelier:lima_broadline_glass', Object.freeze({ style: 'broadline', color: 'lima', next: 'dorios_atelier:lima_hitch_cross_glass', previous: 'dorios_atelier:lima_clean_glass' })],
+	['dorios_atelier:lima_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'lima', next: 'dorios_atelier:lima_tempered_glass', previous: 'dorios_atelier:lima_broadline_glass' })],
+	['dorios_atelier:lima_tempered_glass', Object.freeze({ style: 'tempered', color: 'lima', next: 'minecraft:lime_stained_glass', previous: 'dorios_atelier:lima_hitch_cross_glass' })],
+	['minecraft:magenta_stained_glass', Object.freeze({ style: 'stained', color: 'magenta', next: 'dorios_atelier:magenta_stained_glass', previous: 'dorios_atelier:magenta_tempered_glass' })],
+	['dorios_atelier:magenta_stained_glass', Object.freeze({ style: 'stained', color: 'magenta', next: 'dorios_atelier:magenta_clean_glass', previous: 'minecraft:magenta_stained_glass' })],
+	['dorios_atelier:magenta_clean_glass', Object.freeze({ style: 'clean', color: 'magenta', next: 'dorios_atelier:magenta_broadline_glass', previous: 'dorios_atelier:magenta_stained_glass' })],
+	['dorios_atelier:magenta_broadline_glass', Object.freeze({ style: 'broadline', color: 'magenta', next: 'dorios_atelier:magenta_hitch_cross_glass', previous: 'dorios_atelier:magenta_clean_glass' })],
+	['dorios_atelier:magenta_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'magenta', next: 'dorios_atelier:magenta_tempered_glass', previous: 'dorios_atelier:magenta_broadline_glass' })],
+	['dorios_atelier:magenta_tempered_glass', Object.freeze({ style: 'tempered', color: 'magenta', next: 'minecraft:magenta_stained_glass', previous: 'dorios_atelier:magenta_hitch_cross_glass' })],
+	['minecraft:orange_stained_glass', Object.freeze({ style: 'stained', color: 'orange', next: 'dorios_atelier:orange_stained_glass', previous: 'dorios_atelier:orange_tempered_glass' })],
+	['dorios_atelier:orange_stained_glass', Object.freeze({ style: 'stained', color: 'orange', next: 'dorios_atelier:orange_clean_glass', previous: 'minecraft:orange_stained_glass' })],
+	['dorios_atelier:orange_clean_glass', Object.freeze({ style: 'clean', color: 'orange', next: 'dorios_atelier:orange_broadline_glass', previous: 'dorios_atelier:orange_stained_glass' })],
+	['dorios_atelier:orange_broadline_glass', Object.freeze({ style: 'broadline', color: 'orange', next: 'dorios_atelier:orange_hitch_cross_glass', previous: 'dorios_atelier:orange_clean_glass' })],
+	['dorios_atelier:orange_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'orange', next: 'dorios_atelier:orange_tempered_glass', previous: 'dorios_atelier:orange_broadline_glass' })],
+	['dorios_atelier:orange_tempered_glass', Object.freeze({ style: 'tempered', color: 'orange', next: 'minecraft:orange_stained_glass', previous: 'dorios_atelier:orange_hitch_cross_glass' })],
+	['minecraft:pink_stained_glass', Object.freeze({ style: 'stained', color: 'pink', next: 'dorios_atelier:pink_stained_glass', previous: 'dorios_atelier:pink_tempered_glass' })],
+	['dorios_atelier:pink_stained_glass', Object.freeze({ style: 'stained', color: 'pink', next: 'dorios_atelier:pink_clean_glass', previous: 'minecraft:pink_stained_glass' })],
+	['dorios_atelier:pink_clean_glass', Object.freeze({ style: 'clean', color: 'pink', next: 'dorios_atelier:pink_broadline_glass', previous: 'dorios_atelier:pink_stained_glass' })],
+	['dorios_atelier:pink_broadline_glass', Object.freeze({ style: 'broadline', color: 'pink', next: 'dorios_atelier:pink_hitch_cross_glass', previous: 'dorios_atelier:pink_clean_glass' })],
+	['dorios_atelier:pink_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'pink', next: 'dorios_atelier:pink_tempered_glass', previous: 'dorios_atelier:pink_broadline_glass' })],
+	['dorios_atelier:pink_tempered_glass', Object.freeze({ style: 'tempered', color: 'pink', next: 'minecraft:pink_stained_glass', previous: 'dorios_atelier:pink_hitch_cross_glass' })],
+	['minecraft:purple_stained_glass', Object.freeze({ style: 'stained', color: 'purple', next: 'dorios_atelier:purple_stained_glass', previous: 'dorios_atelier:purple_tempered_glass' })],
+	['dorios_atelier:purple_stained_glass', Object.freeze({ style: 'stained', color: 'purple', next: 'dorios_atelier:purple_clean_glass', previous: 'minecraft:purple_stained_glass' })],
+	['dorios_atelier:purple_clean_glass', Object.freeze({ style: 'clean', color: 'purple', next: 'dorios_atelier:purple_broadline_glass', previous: 'dorios_atelier:purple_stained_glass' })],
+	['dorios_atelier:purple_broadline_glass', Object.freeze({ style: 'broadline', color: 'purple', next: 'dorios_atelier:purple_hitch_cross_glass', previous: 'dorios_atelier:purple_clean_glass' })],
+	['dorios_atelier:purple_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'purple', next: 'dorios_atelier:purple_tempered_glass', previous: 'dorios_atelier:purple_broadline_glass' })],
+	['dorios_atelier:purple_tempered_glass', Object.freeze({ style: 'tempered', color: 'purple', next: 'minecraft:purple_stained_glass', previous: 'dorios_atelier:purple_hitch_cross_glass' })],
+	['minecraft:red_stained_glass', Object.freeze({ style: 'stained', color: 'red', next: 'dorios_atelier:red_stained_glass', previous: 'dorios_atelier:red_tempered_glass' })],
+	['dorios_atelier:red_stained_glass', Object.freeze({ style: 'stained', color: 'red', next: 'dorios_atelier:red_clean_glass', previous: 'minecraft:red_stained_glass' })],
+	['dorios_atelier:red_clean_glass', Object.freeze({ style: 'clean', color: 'red', next: 'dorios_atelier:red_broadline_glass', previous: 'dorios_atelier:red_stained_glass' })],
+	['dorios_atelier:red_broadline_glass', Object.freeze({ style: 'broadline', color: 'red', next: 'dorios_atelier:red_hitch_cross_glass', previous: 'dorios_atelier:red_clean_glass' })],
+	['dorios_atelier:red_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'red', next: 'dorios_atelier:red_tempered_glass', previous: 'dorios_atelier:red_broadline_glass' })],
+	['dorios_atelier:red_tempered_glass', Object.freeze({ style: 'tempered', color: 'red', next: 'minecraft:red_stained_glass', previous: 'dorios_atelier:red_hitch_cross_glass' })],
+	['minecraft:light_gray_stained_glass', Object.freeze({ style: 'stained', color: 'silver', next: 'dorios_atelier:silver_stained_glass', previous: 'dorios_atelier:silver_tempered_glass' })],
+	['dorios_atelier:silver_stained_glass', Object.freeze({ style: 'stained', color: 'silver', next: 'dorios_atelier:silver_clean_glass', previous: 'minecraft:light_gray_stained_glass' })],
+	['dorios_atelier:silver_clean_glass', Object.freeze({ style: 'clean', color: 'silver', next: 'dorios_atelier:silver_broadline_glass', previous: 'dorios_atelier:silver_stained_glass' })],
+	['dorios_atelier:silver_broadline_glass', Object.freeze({ style: 'broadline', color: 'silver', next: 'dorios_atelier:silver_hitch_cross_glass', previous: 'dorios_atelier:silver_clean_glass' })],
+	['dorios_atelier:silver_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'silver', next: 'dorios_atelier:silver_tempered_glass', previous: 'dorios_atelier:silver_broadline_glass' })],
+	['dorios_atelier:silver_tempered_glass', Object.freeze({ style: 'tempered', color: 'silver', next: 'minecraft:light_gray_stained_glass', previous: 'dorios_atelier:silver_hitch_cross_glass' })],
+	['minecraft:white_stained_glass', Object.freeze({ style: 'stained', color: 'white', next: 'dorios_atelier:white_stained_glass', previous: 'dorios_atelier:white_tempered_glass' })],
+	['dorios_atelier:white_stained_glass', Object.freeze({ style: 'stained', color: 'white', next: 'dorios_atelier:white_clean_glass', previous: 'minecraft:white_stained_glass' })],
+	['dorios_atelier:white_clean_glass', Object.freeze({ style: 'clean', color: 'white', next: 'dorios_atelier:white_broadline_glass', previous: 'dorios_atelier:white_stained_glass' })],
+	['dorios_atelier:white_broadline_glass', Object.freeze({ style: 'broadline', color: 'white', next: 'dorios_atelier:white_hitch_cross_glass', previous: 'dorios_atelier:white_clean_glass' })],
+	['dorios_atelier:white_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'white', next: 'dorios_atelier:white_tempered_glass', previous: 'dorios_atelier:white_broadline_glass' })],
+	['dorios_atelier:white_tempered_glass', Object.freeze({ style: 'tempered', color: 'white', next: 'minecraft:white_stained_glass', previous: 'dorios_atelier:white_hitch_cross_glass' })],
+	['minecraft:yellow_stained_glass', Object.freeze({ style: 'stained', color: 'yellow', next: 'dorios_atelier:yellow_stained_glass', previous: 'dorios_atelier:yellow_tempered_glass' })],
+	['dorios_atelier:yellow_stained_glass', Object.freeze({ style: 'stained', color: 'yellow', next: 'dorios_atelier:yellow_clean_glass', previous: 'minecraft:yellow_stained_glass' })],
+	['dorios_atelier:yellow_clean_glass', Object.freeze({ style: 'clean', color: 'yellow', next: 'dorios_atelier:yellow_broadline_glass', previous: 'dorios_atelier:yellow_stained_glass' })],
+	['dorios_atelier:yellow_broadline_glass', Object.freeze({ style: 'broadline', color: 'yellow', next: 'dorios_atelier:yellow_hitch_cross_glass', previous: 'dorios_atelier:yellow_clean_glass' })],
+	['dorios_atelier:yellow_hitch_cross_glass', Object.freeze({ style: 'hitch_cross', color: 'yellow', next: 'dorios_atelier:yellow_tempered_glass', previous: 'dorios_atelier:yellow_broadline_glass' })],
+	['dorios_atelier:yellow_tempered_glass', Object.freeze({ style: 'tempered', color: 'yellow', next: 'minecraft:yellow_stained_glass', previous: 'dorios_atelier:yellow_hitch_cross_glass' })],
+])
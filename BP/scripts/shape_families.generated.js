@@ -0,0 +1,179 @@
+// Generated by tools/generate_uniform_variants.py. Do not edit by hand.
+
+const SHAPE_FAMILIES = [
+    { default: 'minecraft:acacia_planks', stairs: 'minecraft:acacia_stairs', slab: 'minecraft:acacia_slab' },
+    { default: 'minecraft:andesite', stairs: 'minecraft:andesite_stairs', slab: 'minecraft:andesite_slab', vertical_slab: 'dorios_atelier:andesite_vertical_slab', three_steps_stairs: 'dorios_atelier:andesite_three_steps_stairs' },
+    { default: 'dorios_atelier:andesite_bricks', stairs: 'dorios_atelier:andesite_bricks_stairs', slab: 'dorios_atelier:andesite_bricks_slab', vertical_slab: 'dorios_atelier:andesite_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:andesite_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:andesite_tiles', stairs: 'dorios_atelier:andesite_tiles_stairs', slab: 'dorios_atelier:andesite_tiles_slab', vertical_slab: 'dorios_atelier:andesite_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:andesite_tiles_three_steps_stairs' },
+    { default: 'minecraft:bamboo_planks', stairs: 'minecraft:bamboo_stairs', slab: 'minecraft:bamboo_slab' },
+    { default: 'dorios_atelier:basalt_bricks', stairs: 'dorios_atelier:basalt_bricks_stairs', slab: 'dorios_atelier:basalt_bricks_slab', vertical_slab: 'dorios_atelier:basalt_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:basalt_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:basalt_tiles', stairs: 'dorios_atelier:basalt_tiles_stairs', slab: 'dorios_atelier:basalt_tiles_slab', vertical_slab: 'dorios_atelier:basalt_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:basalt_tiles_three_steps_stairs' },
+    { default: 'minecraft:birch_planks', stairs: 'minecraft:birch_stairs', slab: 'minecraft:birch_slab' },
+    { default: 'minecraft:blackstone', stairs: 'minecraft:blackstone_stairs', slab: 'minecraft:blackstone_slab' },
+    { default: 'dorios_atelier:blackstone_tiles', stairs: 'dorios_atelier:blackstone_tiles_stairs', slab: 'dorios_atelier:blackstone_tiles_slab', vertical_slab: 'dorios_atelier:blackstone_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:blackstone_tiles_three_steps_stairs' },
+    { default: 'minecraft:calcite', stairs: 'dorios_atelier:calcite_stairs', slab: 'dorios_atelier:calcite_slab', vertical_slab: 'dorios_atelier:calcite_vertical_slab', three_steps_stairs: 'dorios_atelier:calcite_three_steps_stairs' },
+    { default: 'dorios_atelier:calcite_bricks', stairs: 'dorios_atelier:calcite_bricks_stairs', slab: 'dorios_atelier:calcite_bricks_slab', vertical_slab: 'dorios_atelier:calcite_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:calcite_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:calcite_tiles', stairs: 'dorios_atelier:calcite_tiles_stairs', slab: 'dorios_atelier:calcite_tiles_slab', vertical_slab: 'dorios_atelier:calcite_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:calcite_tiles_three_steps_stairs' },
+    { default: 'minecraft:cherry_planks', stairs: 'minecraft:cherry_stairs', slab: 'minecraft:cherry_slab' },
+    { default: 'minecraft:chiseled_deepslate', stairs: 'dorios_atelier:chiseled_deepslate_stairs', slab: 'dorios_atelier:chiseled_deepslate_slab', vertical_slab: 'dorios_atelier:chiseled_deepslate_vertical_slab', three_steps_stairs: 'dorios_atelier:chiseled_deepslate_three_steps_stairs' },
+    { default: 'minecraft:chiseled_nether_bricks', stairs: 'dorios_atelier:chiseled_nether_bricks_stairs', slab: 'dorios_atelier:chiseled_nether_bricks_slab', vertical_slab: 'dorios_atelier:chiseled_nether_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:chiseled_nether_bricks_three_steps_stairs' },
+    { default: 'minecraft:chiseled_polished_blackstone', stairs: 'dorios_atelier:chiseled_polished_blackstone_stairs', slab: 'dorios_atelier:chiseled_polished_blackstone_slab', vertical_slab: 'dorios_atelier:chiseled_polished_blackstone_vertical_slab', three_steps_stairs: 'dorios_atelier:chiseled_polished_blackstone_three_steps_stairs' },
+    { default: 'minecraft:chiseled_stone_bricks', stairs: 'dorios_atelier:chiseled_stone_bricks_stairs', slab: 'dorios_atelier:chiseled_stone_bricks_slab', vertical_slab: 'dorios_atelier:chiseled_stone_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:chiseled_stone_bricks_three_steps_stairs' },
+    { default: 'minecraft:cobbled_deepslate', stairs: 'minecraft:cobbled_deepslate_stairs', slab: 'minecraft:cobbled_deepslate_slab', vertical_slab: 'dorios_atelier:cobbled_deepslate_vertical_slab', three_steps_stairs: 'dorios_atelier:cobbled_deepslate_three_steps_stairs' },
+    { default: 'minecraft:cobblestone', stairs: 'minecraft:stone_stairs', slab: 'minecraft:cobblestone_slab', vertical_slab: 'dorios_atelier:cobblestone_vertical_slab', three_steps_stairs: 'dorios_atelier:cobblestone_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_andesite_bricks', stairs: 'dorios_atelier:cracked_andesite_bricks_stairs', slab: 'dorios_atelier:cracked_andesite_bricks_slab', vertical_slab: 'dorios_atelier:cracked_andesite_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_andesite_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_andesite_tiles', stairs: 'dorios_atelier:cracked_andesite_tiles_stairs', slab: 'dorios_atelier:cracked_andesite_tiles_slab', vertical_slab: 'dorios_atelier:cracked_andesite_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_andesite_tiles_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_basalt_bricks', stairs: 'dorios_atelier:cracked_basalt_bricks_stairs', slab: 'dorios_atelier:cracked_basalt_bricks_slab', vertical_slab: 'dorios_atelier:cracked_basalt_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_basalt_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_basalt_tiles', stairs: 'dorios_atelier:cracked_basalt_tiles_stairs', slab: 'dorios_atelier:cracked_basalt_tiles_slab', vertical_slab: 'dorios_atelier:cracked_basalt_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_basalt_tiles_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_blackstone_tiles', stairs: 'dorios_atelier:cracked_blackstone_tiles_stairs', slab: 'dorios_atelier:cracked_blackstone_tiles_slab', vertical_slab: 'dorios_atelier:cracked_blackstone_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_blackstone_tiles_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_calcite_bricks', stairs: 'dorios_atelier:cracked_calcite_bricks_stairs', slab: 'dorios_atelier:cracked_calcite_bricks_slab', vertical_slab: 'dorios_atelier:cracked_calcite_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_calcite_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_calcite_tiles', stairs: 'dorios_atelier:cracked_calcite_tiles_stairs', slab: 'dorios_atelier:cracked_calcite_tiles_slab', vertical_slab: 'dorios_atelier:cracked_calcite_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_calcite_tiles_three_steps_stairs' },
+    { default: 'minecraft:cracked_deepslate_bricks', stairs: 'dorios_atelier:cracked_deepslate_bricks_stairs', slab: 'dorios_atelier:cracked_deepslate_bricks_slab', vertical_slab: 'dorios_atelier:cracked_deepslate_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_deepslate_bricks_three_steps_stairs' },
+    { default: 'minecraft:cracked_deepslate_tiles', stairs: 'dorios_atelier:cracked_deepslate_tiles_stairs', slab: 'dorios_atelier:cracked_deepslate_tiles_slab', vertical_slab: 'dorios_atelier:cracked_deepslate_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_deepslate_tiles_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_diorite_bricks', stairs: 'dorios_atelier:cracked_diorite_bricks_stairs', slab: 'dorios_atelier:cracked_diorite_bricks_slab', vertical_slab: 'dorios_atelier:cracked_diorite_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_diorite_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_diorite_tiles', stairs: 'dorios_atelier:cracked_diorite_tiles_stairs', slab: 'dorios_atelier:cracked_diorite_tiles_slab', vertical_slab: 'dorios_atelier:cracked_diorite_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_diorite_tiles_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_dripstone_bricks', stairs: 'dorios_atelier:cracked_dripstone_bricks_stairs', slab: 'dorios_atelier:cracked_dripstone_bricks_slab', vertical_slab: 'dorios_atelier:cracked_dripstone_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_dripstone_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_dripstone_tiles', stairs: 'dorios_atelier:cracked_dripstone_tiles_stairs', slab: 'dorios_atelier:cracked_dripstone_tiles_slab', vertical_slab: 'dorios_atelier:cracked_dripstone_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_dripstone_tiles_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_granite_bricks', stairs: 'dorios_atelier:cracked_granite_bricks_stairs', slab: 'dorios_atelier:cracked_granite_bricks_slab', vertical_slab: 'dorios_atelier:cracked_granite_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_granite_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_granite_tiles', stairs: 'dorios_atelier:cracked_granite_tiles_stairs', slab: 'dorios_atelier:cracked_granite_tiles_slab', vertical_slab: 'dorios_atelier:cracked_granite_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_granite_tiles_three_steps_stairs' },
+    { default: 'minecraft:cracked_nether_bricks', stairs: 'dorios_atelier:cracked_nether_bricks_stairs', slab: 'dorios_atelier:cracked_nether_bricks_slab', vertical_slab: 'dorios_atelier:cracked_nether_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_nether_bricks_three_steps_stairs' },
+    { default: 'minecraft:cracked_polished_blackstone_bricks', stairs: 'dorios_atelier:cracked_polished_blackstone_bricks_stairs', slab: 'dorios_atelier:cracked_polished_blackstone_bricks_slab', vertical_slab: 'dorios_atelier:cracked_polished_blackstone_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_polished_blackstone_bricks_three_steps_stairs' },
+    { default: 'minecraft:cracked_stone_bricks', stairs: 'dorios_atelier:cracked_stone_bricks_stairs', slab: 'dorios_atelier:cracked_stone_bricks_slab', vertical_slab: 'dorios_atelier:cracked_stone_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_stone_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_tuff_bricks', stairs: 'dorios_atelier:cracked_tuff_bricks_stairs', slab: 'dorios_atelier:cracked_tuff_bricks_slab', vertical_slab: 'dorios_atelier:cracked_tuff_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_tuff_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:cracked_tuff_tiles', stairs: 'dorios_atelier:cracked_tuff_tiles_stairs', slab: 'dorios_atelier:cracked_tuff_tiles_slab', vertical_slab: 'dorios_atelier:cracked_tuff_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:cracked_tuff_tiles_three_steps_stairs' },
+    { default: 'minecraft:crimson_planks', stairs: 'minecraft:crimson_stairs', slab: 'minecraft:crimson_slab' },
+    { default: 'minecraft:cut_red_sandstone', slab: 'minecraft:cut_red_sandstone_slab' },
+    { default: 'minecraft:cut_sandstone', slab: 'minecraft:cut_sandstone_slab' },
+    { default: 'minecraft:dark_oak_planks', stairs: 'minecraft:dark_oak_stairs', slab: 'minecraft:dark_oak_slab' },
+    { default: 'minecraft:dark_prismarine', stairs: 'minecraft:dark_prismarine_stairs', slab: 'minecraft:dark_prismarine_slab', vertical_slab: 'dorios_atelier:dark_prismarine_vertical_slab', three_steps_stairs: 'dorios_atelier:dark_prismarine_three_steps_stairs' },
+    { default: 'minecraft:deepslate_bricks', stairs: 'minecraft:deepslate_brick_stairs', slab: 'minecraft:deepslate_brick_slab', vertical_slab: 'dorios_atelier:deepslate_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:deepslate_bricks_three_steps_stairs' },
+    { default: 'minecraft:deepslate_tiles', stairs: 'minecraft:deepslate_tile_stairs', slab: 'minecraft:deepslate_tile_slab', vertical_slab: 'dorios_atelier:deepslate_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:deepslate_tiles_three_steps_stairs' },
+    { default: 'minecraft:diorite', stairs: 'minecraft:diorite_stairs', slab: 'minecraft:diorite_slab', vertical_slab: 'dorios_atelier:diorite_vertical_slab', three_steps_stairs: 'dorios_atelier:diorite_three_steps_stairs' },
+    { default: 'dorios_atelier:diorite_bricks', stairs: 'dorios_atelier:diorite_bricks_stairs', slab: 'dorios_atelier:diorite_bricks_slab', vertical_slab: 'dorios_atelier:diorite_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:diorite_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:diorite_tiles', stairs: 'dorios_atelier:diorite_tiles_stairs', slab: 'dorios_atelier:diorite_tiles_slab', vertical_slab: 'dorios_atelier:diorite_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:diorite_tiles_three_steps_stairs' },
+    { default: 'dorios_atelier:dripstone_bricks', stairs: 'dorios_atelier:dripstone_bricks_stairs', slab: 'dorios_atelier:dripstone_bricks_slab', vertical_slab: 'dorios_atelier:dripstone_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:dripstone_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:dripstone_tiles', stairs: 'dorios_atelier:dripstone_tiles_stairs', slab: 'dorios_atelier:dripstone_tiles_slab', vertical_slab: 'dorios_atelier:dripstone_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:dripstone_tiles_three_steps_stairs' },
+    { default: 'minecraft:end_stone_bricks', stairs: 'minecraft:end_brick_stairs', slab: 'minecraft:end_stone_brick_slab' },
+    { default: 'minecraft:gilded_blackstone', stairs: 'dorios_atelier:gilded_blackstone_stairs', slab: 'dorios_atelier:gilded_blackstone_slab', vertical_slab: 'dorios_atelier:gilded_blackstone_vertical_slab', three_steps_stairs: 'dorios_atelier:gilded_blackstone_three_steps_stairs' },
+    { default: 'dorios_atelier:glowing_obsidian', stairs: 'dorios_atelier:glowing_obsidian_stairs', slab: 'dorios_atelier:glowing_obsidian_slab', vertical_slab: 'dorios_atelier:glowing_obsidian_vertical_slab', three_steps_stairs: 'dorios_atelier:glowing_obsidian_three_steps_stairs' },
+    { default: 'minecraft:granite', stairs: 'minecraft:granite_stairs', slab: 'minecraft:granite_slab', vertical_slab: 'dorios_atelier:granite_vertical_slab', three_steps_stairs: 'dorios_atelier:granite_three_steps_stairs' },
+    { default: 'dorios_atelier:granite_bricks', stairs: 'dorios_atelier:granite_bricks_stairs', slab: 'dorios_atelier:granite_bricks_slab', vertical_slab: 'dorios_atelier:granite_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:granite_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:granite_tiles', stairs: 'dorios_atelier:granite_tiles_stairs', slab: 'dorios_atelier:granite_tiles_slab', vertical_slab: 'dorios_atelier:granite_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:granite_tiles_three_steps_stairs' },
+    { default: 'minecraft:jungle_planks', stairs: 'minecraft:jungle_stairs', slab: 'minecraft:jungle_slab' },
+    { default: 'minecraft:mangrove_planks', stairs: 'minecraft:mangrove_stairs', slab: 'minecraft:mangrove_slab' },
+    { default: 'minecraft:mossy_cobblestone', stairs: 'minecraft:mossy_cobblestone_stairs', slab: 'minecraft:mossy_cobblestone_slab', vertical_slab: 'dorios_atelier:mossy_cobblestone_vertical_slab', three_steps_stairs: 'dorios_atelier:mossy_cobblestone_three_steps_stairs' },
+    { default: 'minecraft:mossy_stone_bricks', stairs: 'minecraft:mossy_stone_brick_stairs', slab: 'minecraft:mossy_stone_brick_slab', vertical_slab: 'dorios_atelier:mossy_stone_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:mossy_stone_bricks_three_steps_stairs' },
+    { default: 'minecraft:mud_bricks', stairs: 'minecraft:mud_brick_stairs', slab: 'minecraft:mud_brick_slab', vertical_slab: 'dorios_atelier:mud_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:mud_bricks_three_steps_stairs' },
+    { default: 'minecraft:nether_bricks', stairs: 'minecraft:nether_brick_stairs', slab: 'minecraft:nether_brick_slab' },
+    { default: 'minecraft:netherrack', stairs: 'dorios_atelier:netherrack_stairs', slab: 'dorios_atelier:netherrack_slab', vertical_slab: 'dorios_atelier:netherrack_vertical_slab', three_steps_stairs: 'dorios_atelier:netherrack_three_steps_stairs' },
+    { default: 'minecraft:oak_planks', stairs: 'minecraft:oak_stairs', slab: 'minecraft:oak_slab' },
+    { default: 'dorios_atelier:obsidian_bricks', stairs: 'dorios_atelier:obsidian_bricks_stairs', slab: 'dorios_atelier:obsidian_bricks_slab', vertical_slab: 'dorios_atelier:obsidian_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:obsidian_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:obsidian_tiles', stairs: 'dorios_atelier:obsidian_tiles_stairs', slab: 'dorios_atelier:obsidian_tiles_slab', vertical_slab: 'dorios_atelier:obsidian_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:obsidian_tiles_three_steps_stairs' },
+    { default: 'minecraft:packed_mud', stairs: 'dorios_atelier:packed_mud_stairs', slab: 'dorios_atelier:packed_mud_slab', vertical_slab: 'dorios_atelier:packed_mud_vertical_slab', three_steps_stairs: 'dorios_atelier:packed_mud_three_steps_stairs' },
+    { default: 'minecraft:polished_andesite', stairs: 'minecraft:polished_andesite_stairs', slab: 'minecraft:polished_andesite_slab', vertical_slab: 'dorios_atelier:polished_andesite_vertical_slab', three_steps_stairs: 'dorios_atelier:polished_andesite_three_steps_stairs' },
+    { default: 'minecraft:polished_blackstone', stairs: 'minecraft:polished_blackstone_stairs', slab: 'minecraft:polished_blackstone_slab', vertical_slab: 'dorios_atelier:polished_blackstone_vertical_slab', three_steps_stairs: 'dorios_atelier:polished_blackstone_three_steps_stairs' },
+    { default: 'minecraft:polished_blackstone_bricks', stairs: 'minecraft:polished_blackstone_brick_stairs', slab: 'minecraft:polished_blackstone_brick_slab', vertical_slab: 'dorios_atelier:polished_blackstone_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:polished_blackstone_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:polished_calcite', stairs: 'dorios_atelier:polished_calcite_stairs', slab: 'dorios_atelier:polished_calcite_slab', vertical_slab: 'dorios_atelier:polished_calcite_vertical_slab', three_steps_stairs: 'dorios_atelier:polished_calcite_three_steps_stairs' },
+    { default: 'minecraft:polished_deepslate', stairs: 'minecraft:polished_deepslate_stairs', slab: 'minecraft:polished_deepslate_slab', vertical_slab: 'dorios_atelier:polished_deepslate_vertical_slab', three_steps_stairs: 'dorios_atelier:polished_deepslate_three_steps_stairs' },
+    { default: 'minecraft:polished_diorite', stairs: 'minecraft:polished_diorite_stairs', slab: 'minecraft:polished_diorite_slab', vertical_slab: 'dorios_atelier:polished_diorite_vertical_slab', three_steps_stairs: 'dorios_atelier:polished_diorite_three_steps_stairs' },
+    { default: 'dorios_atelier:polished_dripstone', stairs: 'dorios_atelier:polished_dripstone_stairs', slab: 'dorios_atelier:polished_dripstone_slab', vertical_slab: 'dorios_atelier:polished_dripstone_vertical_slab', three_steps_stairs: 'dorios_atelier:polished_dripstone_three_steps_stairs' },
+    { default: 'minecraft:polished_granite', stairs: 'minecraft:polished_granite_stairs', slab: 'minecraft:polished_granite_slab', vertical_slab: 'dorios_atelier:polished_granite_vertical_slab', three_steps_stairs: 'dorios_atelier:polished_granite_three_steps_stairs' },
+    { default: 'dorios_atelier:polished_obsidian', stairs: 'dorios_atelier:polished_obsidian_stairs', slab: 'dorios_atelier:polished_obsidian_slab', vertical_slab: 'dorios_atelier:polished_obsidian_vertical_slab', three_steps_stairs: 'dorios_atelier:polished_obsidian_three_steps_stairs' },
+    { default: 'minecraft:polished_tuff', stairs: 'minecraft:polished_tuff_stairs', slab: 'minecraft:polished_tuff_slab', vertical_slab: 'dorios_atelier:polished_tuff_vertical_slab', three_steps_stairs: 'dorios_atelier:polished_tuff_three_steps_stairs' },
+    { default: 'minecraft:prismarine', stairs: 'minecraft:prismarine_stairs', slab: 'minecraft:prismarine_slab', vertical_slab: 'dorios_atelier:prismarine_vertical_slab', three_steps_stairs: 'dorios_atelier:prismarine_three_steps_stairs' },
+    { default: 'minecraft:prismarine_bricks', stairs: 'minecraft:prismarine_bricks_stairs', slab: 'minecraft:prismarine_brick_slab', vertical_slab: 'dorios_atelier:prismarine_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:prismarine_bricks_three_steps_stairs' },
+    { default: 'minecraft:purpur_block', stairs: 'minecraft:purpur_stairs', slab: 'minecraft:purpur_slab', vertical_slab: 'dorios_atelier:purpur_block_vertical_slab', three_steps_stairs: 'dorios_atelier:purpur_block_three_steps_stairs' },
+    { default: 'minecraft:quartz_block', stairs: 'minecraft:quartz_stairs', slab: 'minecraft:quartz_slab' },
+    { default: 'minecraft:quartz_bricks', stairs: 'dorios_atelier:quartz_bricks_stairs', slab: 'dorios_atelier:quartz_bricks_slab', vertical_slab: 'dorios_atelier:quartz_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:quartz_bricks_three_steps_stairs' },
+    { default: 'minecraft:red_nether_bricks', stairs: 'minecraft:red_nether_brick_stairs', slab: 'minecraft:red_nether_brick_slab' },
+    { default: 'minecraft:red_sandstone', stairs: 'minecraft:red_sandstone_stairs', slab: 'minecraft:red_sandstone_slab' },
+    { default: 'minecraft:sandstone', stairs: 'minecraft:sandstone_stairs', slab: 'minecraft:sandstone_slab' },
+    { default: 'dorios_atelier:smooth_andesite', stairs: 'dorios_atelier:smooth_andesite_stairs', slab: 'dorios_atelier:smooth_andesite_slab', vertical_slab: 'dorios_atelier:smooth_andesite_vertical_slab', three_steps_stairs: 'dorios_atelier:smooth_andesite_three_steps_stairs' },
+    { default: 'minecraft:smooth_basalt', stairs: 'dorios_atelier:smooth_basalt_stairs', slab: 'dorios_atelier:smooth_basalt_slab', vertical_slab: 'dorios_atelier:smooth_basalt_vertical_slab', three_steps_stairs: 'dorios_atelier:smooth_basalt_three_steps_stairs' },
+    { default: 'dorios_atelier:smooth_blackstone', stairs: 'dorios_atelier:smooth_blackstone_stairs', slab: 'dorios_atelier:smooth_blackstone_slab', vertical_slab: 'dorios_atelier:smooth_blackstone_vertical_slab', three_steps_stairs: 'dorios_atelier:smooth_blackstone_three_steps_stairs' },
+    { default: 'dorios_atelier:smooth_calcite', stairs: 'dorios_atelier:smooth_calcite_stairs', slab: 'dorios_atelier:smooth_calcite_slab', vertical_slab: 'dorios_atelier:smooth_calcite_vertical_slab', three_steps_stairs: 'dorios_atelier:smooth_calcite_three_steps_stairs' },
+    { default: 'dorios_atelier:smooth_diorite', stairs: 'dorios_atelier:smooth_diorite_stairs', slab: 'dorios_atelier:smooth_diorite_slab', vertical_slab: 'dorios_atelier:smooth_diorite_vertical_slab', three_steps_stairs: 'dorios_atelier:smooth_diorite_three_steps_stairs' },
+    { default: 'dorios_atelier:smooth_dripstone', stairs: 'dorios_atelier:smooth_dripstone_stairs', slab: 'dorios_atelier:smooth_dripstone_slab', vertical_slab: 'dorios_atelier:smooth_dripstone_vertical_slab', three_steps_stairs: 'dorios_atelier:smooth_dripstone_three_steps_stairs' },
+    { default: 'dorios_atelier:smooth_granite', stairs: 'dorios_atelier:smooth_granite_stairs', slab: 'dorios_atelier:smooth_granite_slab', vertical_slab: 'dorios_atelier:smooth_granite_vertical_slab', three_steps_stairs: 'dorios_atelier:smooth_granite_three_steps_stairs' },
+    { default: 'minecraft:smooth_quartz', stairs: 'minecraft:smooth_quartz_stairs', slab: 'minecraft:smooth_quartz_slab', vertical_slab: 'dorios_atelier:smooth_quartz_vertical_slab', three_steps_stairs: 'dorios_atelier:smooth_quartz_three_steps_stairs' },
+    { default: 'minecraft:smooth_red_sandstone', stairs: 'minecraft:smooth_red_sandstone_stairs', slab: 'minecraft:smooth_red_sandstone_slab' },
+    { default: 'minecraft:smooth_sandstone', stairs: 'minecraft:smooth_sandstone_stairs', slab: 'minecraft:smooth_sandstone_slab' },
+    { default: 'minecraft:smooth_stone', stairs: 'dorios_atelier:smooth_stone_stairs', slab: 'minecraft:smooth_stone_slab', vertical_slab: 'dorios_atelier:smooth_stone_vertical_slab', three_steps_stairs: 'dorios_atelier:smooth_stone_three_steps_stairs' },
+    { default: 'dorios_atelier:smooth_tuff', stairs: 'dorios_atelier:smooth_tuff_stairs', slab: 'dorios_atelier:smooth_tuff_slab', vertical_slab: 'dorios_atelier:smooth_tuff_vertical_slab', three_steps_stairs: 'dorios_atelier:smooth_tuff_three_steps_stairs' },
+    { default: 'minecraft:spruce_planks', stairs: 'minecraft:spruce_stairs', slab: 'minecraft:spruce_slab' },
+    { default: 'minecraft:stone', stairs: 'minecraft:normal_stone_stairs', slab: 'minecraft:normal_stone_slab', vertical_slab: 'dorios_atelier:stone_vertical_slab', three_steps_stairs: 'dorios_atelier:stone_three_steps_stairs' },
+    { default: 'minecraft:stone_bricks', stairs: 'minecraft:stone_brick_stairs', slab: 'minecraft:stone_brick_slab', vertical_slab: 'dorios_atelier:stone_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:stone_bricks_three_steps_stairs' },
+    { default: 'minecraft:tuff', stairs: 'minecraft:tuff_stairs', slab: 'minecraft:tuff_slab', vertical_slab: 'dorios_atelier:tuff_vertical_slab', three_steps_stairs: 'dorios_atelier:tuff_three_steps_stairs' },
+    { default: 'minecraft:tuff_bricks', stairs: 'minecraft:tuff_brick_stairs', slab: 'minecraft:tuff_brick_slab', vertical_slab: 'dorios_atelier:tuff_bricks_vertical_slab', three_steps_stairs: 'dorios_atelier:tuff_bricks_three_steps_stairs' },
+    { default: 'dorios_atelier:tuff_tiles', stairs: 'dorios_atelier:tuff_tiles_stairs', slab: 'dorios_atelier:tuff_tiles_slab', vertical_slab: 'dorios_atelier:tuff_tiles_vertical_slab', three_steps_stairs: 'dorios_atelier:tuff_tiles_three_steps_stairs' },
+    { default: 'minecraft:warped_planks', stairs: 'minecraft:warped_stairs', slab: 'minecraft:warped_slab' },
+]
+
+// Pack shapes that duplicate a vanilla shape -> the vanilla id their family uses.
+const SHAPE_FAMILY_ALIASES = {
+    'dorios_atelier:andesite_slab': 'minecraft:andesite_slab',
+    'dorios_atelier:andesite_stairs': 'minecraft:andesite_stairs',
+    'dorios_atelier:cobbled_deepslate_slab': 'minecraft:cobbled_deepslate_slab',
+    'dorios_atelier:cobbled_deepslate_stairs': 'minecraft:cobbled_deepslate_stairs',
+    'dorios_atelier:cobblestone_slab': 'minecraft:cobblestone_slab',
+    'dorios_atelier:cobblestone_stairs': 'minecraft:stone_stairs',
+    'dorios_atelier:dark_prismarine_slab': 'minecraft:dark_prismarine_slab',
+    'dorios_atelier:dark_prismarine_stairs': 'minecraft:dark_prismarine_stairs',
+    'dorios_atelier:deepslate_bricks_slab': 'minecraft:deepslate_brick_slab',
+    'dorios_atelier:deepslate_bricks_stairs': 'minecraft:deepslate_brick_stairs',
+    'dorios_atelier:deepslate_tiles_slab': 'minecraft:deepslate_tile_slab',
+    'dorios_atelier:deepslate_tiles_stairs': 'minecraft:deepslate_tile_stairs',
+    'dorios_atelier:diorite_slab': 'minecraft:diorite_slab',
+    'dorios_atelier:diorite_stairs': 'minecraft:diorite_stairs',
+    'dorios_atelier:granite_slab': 'minecraft:granite_slab',
+    'dorios_atelier:granite_stairs': 'minecraft:granite_stairs',
+    'dorios_atelier:mossy_cobblestone_slab': 'minecraft:mossy_cobblestone_slab',
+    'dorios_atelier:mossy_cobblestone_stairs': 'minecraft:mossy_cobblestone_stairs',
+    'dorios_atelier:mossy_stone_bricks_slab': 'minecraft:mossy_stone_brick_slab',
+    'dorios_atelier:mossy_stone_bricks_stairs': 'minecraft:mossy_stone_brick_stairs',
+    'dorios_atelier:mud_bricks_slab': 'minecraft:mud_brick_slab',
+    'dorios_atelier:mud_bricks_stairs': 'minecraft:mud_brick_stairs',
+    'dorios_atelier:polished_andesite_slab': 'minecraft:polished_andesite_slab',
+    'dorios_atelier:polished_andesite_stairs': 'minecraft:polished_andesite_stairs',
+    'dorios_atelier:polished_blackstone_bricks_slab': 'minecraft:polished_blackstone_brick_slab',
+    'dorios_atelier:polished_blackstone_bricks_stairs': 'minecraft:polished_blackstone_brick_stairs',
+    'dorios_atelier:polished_blackstone_slab': 'minecraft:polished_blackstone_slab',
+    'dorios_atelier:polished_blackstone_stairs': 'minecraft:polished_blackstone_stairs',
+    'dorios_atelier:polished_deepslate_slab': 'minecraft:polished_deepslate_slab',
+    'dorios_atelier:polished_deepslate_stairs': 'minecraft:polished_deepslate_stairs',
+    'dorios_atelier:polished_diorite_slab': 'minecraft:polished_diorite_slab',
+    'dorios_atelier:polished_diorite_stairs': 'minecraft:polished_diorite_stairs',
+    'dorios_atelier:polished_granite_slab': 'minecraft:polished_granite_slab',
+    'dorios_atelier:polished_granite_stairs': 'minecraft:polished_granite_stairs',
+    'dorios_atelier:polished_tuff_slab': 'minecraft:polished_tuff_slab',
+    'dorios_atelier:polished_tuff_stairs': 'minecraft:polished_tuff_stairs',
+    'dorios_atelier:prismarine_bricks_slab': 'minecraft:prismarine_brick_slab',
+    'dorios_atelier:prismarine_bricks_stairs': 'minecraft:prismarine_bricks_stairs',
+    'dorios_atelier:prismarine_slab': 'minecraft:prismarine_slab',
+    'dorios_atelier:prismarine_stairs': 'minecraft:prismarine_stairs',
+    'dorios_atelier:purpur_block_slab': 'minecraft:purpur_slab',
+    'dorios_atelier:purpur_block_stairs': 'minecraft:purpur_stairs',
+    'dorios_atelier:smooth_quartz_slab': 'minecraft:smooth_quartz_slab',
+    'dorios_atelier:smooth_quartz_stairs': 'minecraft:smooth_quartz_stairs',
+    'dorios_atelier:smooth_stone_slab': 'minecraft:smooth_stone_slab',
+    'dorios_atelier:stone_bricks_slab': 'minecraft:stone_brick_slab',
+    'dorios_atelier:stone_bricks_stairs': 'minecraft:stone_brick_stairs',
+    'dorios_atelier:stone_slab': 'minecraft:normal_stone_slab',
+    'dorios_atelier:stone_stairs': 'minecraft:normal_stone_stairs',
+    'dorios_atelier:tuff_bricks_slab': 'minecraft:tuff_brick_slab',
+    'dorios_atelier:tuff_bricks_stairs': 'minecraft:tuff_brick_stairs',
+    'dorios_atelier:tuff_slab': 'minecraft:tuff_slab',
+    'dorios_atelier:tuff_stairs': 'minecraft:tuff_stairs',
+}
+
+// Block id -> { state, family } for every shape of every family.
+export const SHAPE_FAMILY_BY_ID = new Map()
+for (const family of SHAPE_FAMILIES) {
+    Object.freeze(family)
+    for (const [state, id] of Object.entries(family)) {
+        SHAPE_FAMILY_BY_ID.set(id, Object.freeze({ state, family }))
+    }
+}
+for (const [alias, id] of Object.entries(SHAPE_FAMILY_ALIASES)) {
+    SHAPE_FAMILY_BY_ID.set(alias, SHAPE_FAMILY_BY_ID.get(id))
+}
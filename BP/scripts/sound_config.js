@@ -1,5 +1,9 @@
 // Central sound config for all tools.
 // Add new sounds here first, then consume from scripts.
+// Material rules are also resolved per block id into sound_events.generated.js;
+// run tools/generate_sound_events.py after editing them.
+
+import { SOUND_EVENT_BY_ID } from './sound_events.generated.js'
 
 export const soundConfig = {
 	defaultPlaybackOptions: { volume: 1, pitch: 1 },
@@ -33,6 +37,12 @@ export const soundConfig = {
 		['minecraft:snow', 'dig.snow'],
 		['minecraft:snow_block', 'dig.snow']
 	],
+	// RP/blocks.json sound -> event, checked before the token rules.
+	blockSoundEvents: {
+		glass: 'dig.glass',
+		wood: 'dig.wood',
+		snow: 'dig.snow'
+	},
 	tokenMaterialRules: [
 		{ event: 'dig.glass', tokens: ['glass'] },
 		{
@@ -79,6 +89,9 @@ const tokenSetFromTypeId = blockTypeId => {
 export const resolveMaterialSoundEvent = blockTypeId => {
 	if (!blockTypeId) return soundConfig.defaultMaterialEvent
 
+	const generated = SOUND_EVENT_BY_ID.get(blockTypeId)
+	if (generated) return generated
+
 	const exact = exactMaterialEventMap.get(blockTypeId)
 	if (exact) return exact
 
@@ -0,0 +1,557 @@
+// Generated by tools/generate_sound_events.py from sound_config.js rules. Do not edit by hand.
+
+export const SOUND_EVENT_BY_ID = new Map([
+	['dorios_atelier:andesite_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:andesite_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:andesite_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:andesite_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:andesite_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:andesite_slab', 'block.stonecutter.use'],
+	['dorios_atelier:andesite_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:andesite_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:andesite_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:andesite_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:andesite_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:andesite_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:andesite_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:andesite_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:basalt_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:basalt_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:basalt_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:basalt_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:basalt_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:basalt_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:basalt_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:basalt_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:basalt_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:basalt_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:black_broadline_glass', 'dig.glass'],
+	['dorios_atelier:black_clean_glass', 'dig.glass'],
+	['dorios_atelier:black_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:black_stained_glass', 'dig.glass'],
+	['dorios_atelier:black_tempered_glass', 'dig.glass'],
+	['dorios_atelier:blackstone_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:blackstone_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:blackstone_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:blackstone_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:blackstone_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:blue_broadline_glass', 'dig.glass'],
+	['dorios_atelier:blue_clean_glass', 'dig.glass'],
+	['dorios_atelier:blue_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:blue_stained_glass', 'dig.glass'],
+	['dorios_atelier:blue_tempered_glass', 'dig.glass'],
+	['dorios_atelier:broadline_glass', 'dig.glass'],
+	['dorios_atelier:brown_broadline_glass', 'dig.glass'],
+	['dorios_atelier:brown_clear_glass', 'dig.glass'],
+	['dorios_atelier:brown_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:brown_stained_glass', 'dig.glass'],
+	['dorios_atelier:brown_tempered_glass', 'dig.glass'],
+	['dorios_atelier:calcite_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:calcite_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:calcite_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:calcite_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:calcite_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:calcite_slab', 'block.stonecutter.use'],
+	['dorios_atelier:calcite_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:calcite_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:calcite_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:calcite_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:calcite_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:calcite_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:calcite_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:calcite_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:carved_basalt', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_andesite', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_andesite_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_basalt', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_blackstone', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_calcite', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_calcite_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_deepslate_slab', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_deepslate_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_deepslate_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_deepslate_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_diorite', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_diorite_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_dripstone', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_dripstone_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_granite', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_granite_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_nether_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_nether_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_nether_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_nether_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_obsidian', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_polished_blackstone_slab', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_polished_blackstone_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_polished_blackstone_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_polished_blackstone_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_stone_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_stone_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_stone_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:chiseled_stone_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:clean_glass', 'dig.glass'],
+	['dorios_atelier:cobbled_deepslate_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cobbled_deepslate_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cobbled_deepslate_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cobbled_deepslate_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cobblestone_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cobblestone_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cobblestone_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cobblestone_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_andesite_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_andesite_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_andesite_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_andesite_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_andesite_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_andesite_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_andesite_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_andesite_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_andesite_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_andesite_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_basalt_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_basalt_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_basalt_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_basalt_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_basalt_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_basalt_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_basalt_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_basalt_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_basalt_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_basalt_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_blackstone_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_blackstone_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_blackstone_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_blackstone_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_blackstone_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_calcite_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_calcite_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_calcite_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_calcite_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_calcite_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_calcite_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_calcite_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_calcite_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_calcite_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_calcite_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_deepslate_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_deepslate_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_deepslate_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_deepslate_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_deepslate_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_deepslate_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_deepslate_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_deepslate_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_diorite_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_diorite_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_diorite_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_diorite_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_diorite_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_diorite_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_diorite_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_diorite_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_diorite_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_diorite_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_dripstone_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_dripstone_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_dripstone_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_dripstone_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_dripstone_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_dripstone_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_dripstone_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_dripstone_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_dripstone_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_dripstone_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_granite_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_granite_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_granite_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_granite_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_granite_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_granite_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_granite_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_granite_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_granite_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_granite_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_nether_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_nether_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_nether_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_nether_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_polished_blackstone_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_polished_blackstone_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_polished_blackstone_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_polished_blackstone_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_stone_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_stone_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_stone_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_stone_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_tuff_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_tuff_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_tuff_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_tuff_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_tuff_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_tuff_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_tuff_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_tuff_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_tuff_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:cracked_tuff_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:cyan_broadline_glass', 'dig.glass'],
+	['dorios_atelier:cyan_clean_glass', 'dig.glass'],
+	['dorios_atelier:cyan_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:cyan_stained_glass', 'dig.glass'],
+	['dorios_atelier:cyan_tempered_glass', 'dig.glass'],
+	['dorios_atelier:dark_prismarine_slab', 'dig.wood'],
+	['dorios_atelier:dark_prismarine_stairs', 'dig.wood'],
+	['dorios_atelier:dark_prismarine_three_steps_stairs', 'dig.wood'],
+	['dorios_atelier:dark_prismarine_vertical_slab', 'dig.wood'],
+	['dorios_atelier:deepslate_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:deepslate_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:deepslate_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:deepslate_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:deepslate_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:deepslate_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:deepslate_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:deepslate_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:diorite_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:diorite_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:diorite_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:diorite_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:diorite_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:diorite_slab', 'block.stonecutter.use'],
+	['dorios_atelier:diorite_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:diorite_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:diorite_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:diorite_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:diorite_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:diorite_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:diorite_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:diorite_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:dripstone_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:dripstone_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:dripstone_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:dripstone_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:dripstone_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:dripstone_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:dripstone_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:dripstone_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:dripstone_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:dripstone_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:gilded_blackstone_slab', 'block.stonecutter.use'],
+	['dorios_atelier:gilded_blackstone_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:gilded_blackstone_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:gilded_blackstone_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:glowing_obsidian', 'block.stonecutter.use'],
+	['dorios_atelier:glowing_obsidian_slab', 'block.stonecutter.use'],
+	['dorios_atelier:glowing_obsidian_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:glowing_obsidian_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:glowing_obsidian_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:granite_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:granite_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:granite_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:granite_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:granite_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:granite_slab', 'block.stonecutter.use'],
+	['dorios_atelier:granite_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:granite_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:granite_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:granite_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:granite_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:granite_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:granite_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:granite_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:gray_broadline_glass', 'dig.glass'],
+	['dorios_atelier:gray_clean_glass', 'dig.glass'],
+	['dorios_atelier:gray_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:gray_stained_glass', 'dig.glass'],
+	['dorios_atelier:gray_tempered_glass', 'dig.glass'],
+	['dorios_atelier:green_broadline_glass', 'dig.glass'],
+	['dorios_atelier:green_clean_glass', 'dig.glass'],
+	['dorios_atelier:green_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:green_stained_glass', 'dig.glass'],
+	['dorios_atelier:green_tempered_glass', 'dig.glass'],
+	['dorios_atelier:hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:light_blue_broadline_glass', 'dig.glass'],
+	['dorios_atelier:light_blue_clean_glass', 'dig.glass'],
+	['dorios_atelier:light_blue_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:light_blue_stained_glass', 'dig.glass'],
+	['dorios_atelier:light_blue_tempered_glass', 'dig.glass'],
+	['dorios_atelier:lima_broadline_glass', 'dig.glass'],
+	['dorios_atelier:lima_clean_glass', 'dig.glass'],
+	['dorios_atelier:lima_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:lima_stained_glass', 'dig.glass'],
+	['dorios_atelier:lima_tempered_glass', 'dig.glass'],
+	['dorios_atelier:magenta_broadline_glass', 'dig.glass'],
+	['dorios_atelier:magenta_clean_glass', 'dig.glass'],
+	['dorios_atelier:magenta_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:magenta_stained_glass', 'dig.glass'],
+	['dorios_atelier:magenta_tempered_glass', 'dig.glass'],
+	['dorios_atelier:mossy_cobblestone_slab', 'block.stonecutter.use'],
+	['dorios_atelier:mossy_cobblestone_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:mossy_cobblestone_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:mossy_cobblestone_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:mossy_stone_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:mossy_stone_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:mossy_stone_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:mossy_stone_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:mud_bricks_slab', 'dig.grass'],
+	['dorios_atelier:mud_bricks_stairs', 'dig.grass'],
+	['dorios_atelier:mud_bricks_three_steps_stairs', 'dig.grass'],
+	['dorios_atelier:mud_bricks_vertical_slab', 'dig.grass'],
+	['dorios_atelier:netherrack_slab', 'block.stonecutter.use'],
+	['dorios_atelier:netherrack_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:netherrack_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:netherrack_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:obsidian_bricks', 'block.stonecutter.use'],
+	['dorios_atelier:obsidian_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:obsidian_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:obsidian_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:obsidian_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:obsidian_pillar', 'block.stonecutter.use'],
+	['dorios_atelier:obsidian_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:obsidian_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:obsidian_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:obsidian_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:obsidian_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:orange_broadline_glass', 'dig.glass'],
+	['dorios_atelier:orange_clean_glass', 'dig.glass'],
+	['dorios_atelier:orange_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:orange_stained_glass', 'dig.glass'],
+	['dorios_atelier:orange_tempered_glass', 'dig.glass'],
+	['dorios_atelier:packed_mud_slab', 'dig.grass'],
+	['dorios_atelier:packed_mud_stairs', 'dig.grass'],
+	['dorios_atelier:packed_mud_three_steps_stairs', 'dig.grass'],
+	['dorios_atelier:packed_mud_vertical_slab', 'dig.grass'],
+	['dorios_atelier:pink_broadline_glass', 'dig.glass'],
+	['dorios_atelier:pink_clean_glass', 'dig.glass'],
+	['dorios_atelier:pink_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:pink_stained_glass', 'dig.glass'],
+	['dorios_atelier:pink_tempered_glass', 'dig.glass'],
+	['dorios_atelier:polished_andesite_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_andesite_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_andesite_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_andesite_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_blackstone_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_blackstone_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_blackstone_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_blackstone_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_blackstone_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_blackstone_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_blackstone_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_blackstone_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_calcite', 'block.stonecutter.use'],
+	['dorios_atelier:polished_calcite_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_calcite_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_calcite_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_calcite_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_deepslate_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_deepslate_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_deepslate_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_deepslate_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_diorite_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_diorite_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_diorite_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_diorite_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_dripstone', 'block.stonecutter.use'],
+	['dorios_atelier:polished_dripstone_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_dripstone_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_dripstone_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_dripstone_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_granite_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_granite_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_granite_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_granite_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_obsidian', 'block.stonecutter.use'],
+	['dorios_atelier:polished_obsidian_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_obsidian_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_obsidian_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_obsidian_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_tuff_slab', 'block.stonecutter.use'],
+	['dorios_atelier:polished_tuff_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_tuff_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:polished_tuff_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:prismarine_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:prismarine_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:prismarine_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:prismarine_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:prismarine_slab', 'block.stonecutter.use'],
+	['dorios_atelier:prismarine_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:prismarine_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:prismarine_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:purple_broadline_glass', 'dig.glass'],
+	['dorios_atelier:purple_clean_glass', 'dig.glass'],
+	['dorios_atelier:purple_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:purple_stained_glass', 'dig.glass'],
+	['dorios_atelier:purple_tempered_glass', 'dig.glass'],
+	['dorios_atelier:purpur_block_slab', 'block.stonecutter.use'],
+	['dorios_atelier:purpur_block_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:purpur_block_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:purpur_block_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:quartz_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:quartz_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:quartz_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:quartz_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:red_broadline_glass', 'dig.glass'],
+	['dorios_atelier:red_clean_glass', 'dig.glass'],
+	['dorios_atelier:red_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:red_stained_glass', 'dig.glass'],
+	['dorios_atelier:red_tempered_glass', 'dig.glass'],
+	['dorios_atelier:sanded_acacia_wood', 'dig.wood'],
+	['dorios_atelier:sanded_bamboo_wood', 'dig.wood'],
+	['dorios_atelier:sanded_birch_wood', 'dig.wood'],
+	['dorios_atelier:sanded_cherry_wood', 'dig.wood'],
+	['dorios_atelier:sanded_crimson_wood', 'dig.wood'],
+	['dorios_atelier:sanded_dark_oak_wood', 'dig.wood'],
+	['dorios_atelier:sanded_jungle_wood', 'dig.wood'],
+	['dorios_atelier:sanded_mangrove_wood', 'dig.wood'],
+	['dorios_atelier:sanded_oak_wood', 'dig.wood'],
+	['dorios_atelier:sanded_pale_oak_wood', 'dig.wood'],
+	['dorios_atelier:sanded_spruce_wood', 'dig.wood'],
+	['dorios_atelier:sanded_warped_wood', 'dig.wood'],
+	['dorios_atelier:silver_broadline_glass', 'dig.glass'],
+	['dorios_atelier:silver_clean_glass', 'dig.glass'],
+	['dorios_atelier:silver_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:silver_stained_glass', 'dig.glass'],
+	['dorios_atelier:silver_tempered_glass', 'dig.glass'],
+	['dorios_atelier:smooth_andesite', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_andesite_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_andesite_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_andesite_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_andesite_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_basalt_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_basalt_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_basalt_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_basalt_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_blackstone', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_blackstone_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_blackstone_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_blackstone_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_blackstone_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_calcite', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_calcite_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_calcite_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_calcite_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_calcite_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_diorite', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_diorite_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_diorite_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_diorite_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_diorite_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_dripstone', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_dripstone_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_dripstone_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_dripstone_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_dripstone_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_granite', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_granite_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_granite_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_granite_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_granite_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_quartz_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_quartz_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_quartz_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_quartz_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_stone_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_stone_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_stone_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_stone_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_tuff', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_tuff_slab', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_tuff_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_tuff_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:smooth_tuff_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:snowy_grass_block', 'dig.snow'],
+	['dorios_atelier:stone_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:stone_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:stone_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:stone_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:stone_slab', 'block.stonecutter.use'],
+	['dorios_atelier:stone_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:stone_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:stone_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:tempered_glass', 'dig.glass'],
+	['dorios_atelier:tuff_bricks_slab', 'block.stonecutter.use'],
+	['dorios_atelier:tuff_bricks_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:tuff_bricks_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:tuff_bricks_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:tuff_slab', 'block.stonecutter.use'],
+	['dorios_atelier:tuff_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:tuff_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:tuff_tiles', 'block.stonecutter.use'],
+	['dorios_atelier:tuff_tiles_slab', 'block.stonecutter.use'],
+	['dorios_atelier:tuff_tiles_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:tuff_tiles_three_steps_stairs', 'block.stonecutter.use'],
+	['dorios_atelier:tuff_tiles_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:tuff_vertical_slab', 'block.stonecutter.use'],
+	['dorios_atelier:white_broadline_glass', 'dig.glass'],
+	['dorios_atelier:white_clean_glass', 'dig.glass'],
+	['dorios_atelier:white_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:white_stained_glass', 'dig.glass'],
+	['dorios_atelier:white_tempered_glass', 'dig.glass'],
+	['dorios_atelier:yellow_broadline_glass', 'dig.glass'],
+	['dorios_atelier:yellow_clean_glass', 'dig.glass'],
+	['dorios_atelier:yellow_hitch_cross_glass', 'dig.glass'],
+	['dorios_atelier:yellow_stained_glass', 'dig.glass'],
+	['dorios_atelier:yellow_tempered_glass', 'dig.glass'],
+	['minecraft:andesite', 'block.stonecutter.use'],
+	['minecraft:basalt', 'block.stonecutter.use'],
+	['minecraft:blackstone', 'block.stonecutter.use'],
+	['minecraft:calcite', 'block.stonecutter.use'],
+	['minecraft:chiseled_deepslate', 'block.stonecutter.use'],
+	['minecraft:chiseled_nether_bricks', 'block.stonecutter.use'],
+	['minecraft:chiseled_polished_blackstone', 'block.stonecutter.use'],
+	['minecraft:chiseled_quartz_block', 'block.stonecutter.use'],
+	['minecraft:chiseled_red_sandstone', 'block.stonecutter.use'],
+	['minecraft:chiseled_sandstone', 'block.stonecutter.use'],
+	['minecraft:chiseled_stone_bricks', 'block.stonecutter.use'],
+	['minecraft:chiseled_tuff', 'block.stonecutter.use'],
+	['minecraft:chiseled_tuff_bricks', 'block.stonecutter.use'],
+	['minecraft:cobbled_deepslate', 'block.stonecutter.use'],
+	['minecraft:cobblestone', 'block.stonecutter.use'],
+	['minecraft:cracked_deepslate_bricks', 'block.stonecutter.use'],
+	['minecraft:cracked_deepslate_tiles', 'block.stonecutter.use'],
+	['minecraft:cracked_nether_bricks', 'block.stonecutter.use'],
+	['minecraft:cracked_polished_blackstone_bricks', 'block.stonecutter.use'],
+	['minecraft:cracked_stone_bricks', 'block.stonecutter.use'],
+	['minecraft:cut_red_sandstone', 'block.stonecutter.use'],
+	['minecraft:cut_sandstone', 'block.stonecutter.use'],
+	['minecraft:dark_prismarine', 'dig.wood'],
+	['minecraft:deepslate', 'block.stonecutter.use'],
+	['minecraft:deepslate_bricks', 'block.stonecutter.use'],
+	['minecraft:deepslate_tiles', 'block.stonecutter.use'],
+	['minecraft:diorite', 'block.stonecutter.use'],
+	['minecraft:end_stone_bricks', 'block.stonecutter.use'],
+	['minecraft:gilded_blackstone', 'block.stonecutter.use'],
+	['minecraft:granite', 'block.stonecutter.use'],
+	['minecraft:mossy_cobblestone', 'block.stonecutter.use'],
+	['minecraft:mossy_stone_bricks', 'block.stonecutter.use'],
+	['minecraft:mud_bricks', 'dig.grass'],
+	['minecraft:nether_bricks', 'block.stonecutter.use'],
+	['minecraft:netherrack', 'block.stonecutter.use'],
+	['minecraft:packed_mud', 'dig.grass'],
+	['minecraft:polished_andesite', 'block.stonecutter.use'],
+	['minecraft:polished_basalt', 'block.stonecutter.use'],
+	['minecraft:polished_blackstone', 'block.stonecutter.use'],
+	['minecraft:polished_blackstone_bricks', 'block.stonecutter.use'],
+	['minecraft:polished_deepslate', 'block.stonecutter.use'],
+	['minecraft:polished_diorite', 'block.stonecutter.use'],
+	['minecraft:polished_granite', 'block.stonecutter.use'],
+	['minecraft:polished_tuff', 'block.stonecutter.use'],
+	['minecraft:prismarine', 'block.stonecutter.use'],
+	['minecraft:prismarine_bricks', 'block.stonecutter.use'],
+	['minecraft:purpur_block', 'block.stonecutter.use'],
+	['minecraft:purpur_pillar', 'block.stonecutter.use'],
+	['minecraft:quartz_block', 'block.stonecutter.use'],
+	['minecraft:quartz_bricks', 'block.stonecutter.use'],
+	['minecraft:quartz_pillar', 'block.stonecutter.use'],
+	['minecraft:red_nether_bricks', 'block.stonecutter.use'],
+	['minecraft:red_sandstone', 'block.stonecutter.use'],
+	['minecraft:sandstone', 'block.stonecutter.use'],
+	['minecraft:smooth_basalt', 'block.stonecutter.use'],
+	['minecraft:smooth_quartz', 'block.stonecutter.use'],
+	['minecraft:smooth_red_sandstone', 'block.stonecutter.use'],
+	['minecraft:smooth_sandstone', 'block.stonecutter.use'],
+	['minecraft:smooth_stone', 'block.stonecutter.use'],
+	['minecraft:stone', 'block.stonecutter.use'],
+	['minecraft:stone_bricks', 'block.stonecutter.use'],
+	['minecraft:tuff', 'block.stonecutter.use'],
+	['minecraft:tuff_bricks', 'block.stonecutter.use'],
+])
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+"""
+Count the block permutations declared by every block and flag the ones over budget.
+
+A block has one permutation per combination of its state values: custom
+`description.states` (value lists or integer ranges) times the states enabled by
+its traits (`minecraft:placement_direction`, `minecraft:placement_position`,
+`minecraft:connection`). The game keeps every permutation of every block in memory
+and registers them all at world load, so the pack total is the number to watch.
+
+Besides the current count, two alternative state layouts are estimated per block:
+- fold_mirrored: `*_left` / `*_right` values of a custom state merged into one value
+  and the mirrored case expressed by rotating through the direction state instead
+  (e.g. stair_shape 5 -> 3 values);
+- drop_unreferenced: states that no permutation condition and no BP script mentions
+  are removed.
+
+The exit code is 1 when a block exceeds --budget or the pack exceeds --max-total, so
+the analyzer can gate a release build.
+
+Examples
+--------
+- python tools/analyze_permutations.py
+- python tools/analyze_permutations.py --budget 32 --top 20
+- python tools/analyze_permutations.py --max-total 20000 BP/blocks/decorative
+- python tools/analyze_permutations.py --report tools/generated/permutation_report.json
+"""
+
+import argparse
+import json
+import math
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from pack_io import ROOT, read_json
+
+BLOCKS_DIR = ROOT / "BP/blocks"
+SCRIPTS_DIR = ROOT / "BP/scripts"
+
+DEFAULT_BUDGET = 64
+# Values of the states a trait can enable; connection states expand to one boolean per side.
+TRAIT_STATE_VALUES = {
+    "minecraft:cardinal_direction": 4,
+    "minecraft:facing_direction": 6,
+    "minecraft:corner_and_cardinal_direction": 8,
+    "minecraft:block_face": 6,
+    "minecraft:vertical_half": 2,
+    "minecraft:cardinal_connections": 2**4,
+}
+MIRRORED_VALUE_PATTERN = re.compile(r"_(left|right)$")
+STATE_REFERENCE_PATTERN = re.compile(r"""block_state\(\s*['"]([^'"]+)['"]""")
+
+
+@dataclass
+class BlockPermutations:
+    identifier: str
+    path: Path
+    states: dict[str, int]
+    # Custom list states only; trait values are fixed by the game.
+    state_values: dict[str, list[Any]] = field(default_factory=dict)
+    referenced_states: set[str] = field(default_factory=set)
+
+    @property
+    def count(self) -> int:
+        return math.prod(self.states.values())
+
+    def fold_mirrored(self) -> int:
+        count = self.count
+        for values in self.state_values.values():
+            folded = {MIRRORED_VALUE_PATTERN.sub("", str(value)) for value in values}
+            count = count // len(values) * len(folded)
+        return count
+
+    def drop_unreferenced(self, script_text: str) -> int:
+        count = self.count
+        for name, values in self.states.items():
+            if name not in self.referenced_states and name not in script_text:
+                count //= values
+        return count
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Count block permutations and flag blocks over budget.")
+    parser.add_argument("paths", nargs="*", type=Path, help="Block files or folders to analyze (default: BP/blocks).")
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET, help="Maximum permutations per block.")
+    parser.add_argument("--max-total", type=int, default=None, help="Maximum permutations for the whole selection.")
+    parser.add_argument("--top", type=int, default=10, help="How many of the largest blocks to list.")
+    parser.add_argument("--report", type=Path, default=None, help="Also write the per-block counts to this JSON file.")
+    return parser.parse_args()
+
+
+def state_value_count(values: Any) -> int:
+    if isinstance(values, list):
+        return len(values)
+    if isinstance(values, dict) and isinstance(values.get("values"), dict):
+        bounds = values["values"]
+        return int(bounds["max"]) - int(bounds["min"]) + 1
+    raise ValueError(f"Unsupported state definition: {values!r}")
+
+
+def analyze_block(path: Path, payload: dict[str, Any]) -> BlockPermutations | None:
+    block = payload.get("minecraft:block")
+    if not isinstance(block, dict):
+        return None
+    description = block.get("description", {})
+
+    states: dict[str, int] = {}
+    state_values: dict[str, list[Any]] = {}
+    for name, values in description.get("states", {}).items():
+        states[name] = state_value_count(values)
+        if isinstance(values, list):
+            state_values[name] = values
+
+    for trait in description.get("traits", {}).values():
+        for name in trait.get("enabled_states", []):
+            if name not in TRAIT_STATE_VALUES:
+                raise ValueError(f"{path}: unknown trait state {name}")
+            states[name] = TRAIT_STATE_VALUES[name]
+
+    referenced: set[str] = set()
+    for permutation in block.get("permutations", []):
+        referenced.update(STATE_REFERENCE_PATTERN.findall(permutation.get("condition", "")))
+    # Connection conditions read per-side states (connection_north, ...), not the trait state.
+    if any(name.startswith("minecraft:connection_") for name in referenced):
+        referenced.add("minecraft:cardinal_connections")
+
+    return BlockPermutations(description.get("identifier", path.stem), path, states, state_values, referenced)
+
+
+def iter_block_files(paths: list[Path]) -> list[Path]:
+    files: list[Path] = []
+    for path in paths or [BLOCKS_DIR]:
+        path = path if path.is_absolute() else ROOT / path
+        files.extend(sorted(path.rglob("*.json")) if path.is_dir() else [path])
+    return files
+
+
+def read_script_text() -> str:
+    return "\n".join(path.read_text(encoding="utf-8") for path in sorted(SCRIPTS_DIR.rglob("*.js")))
+
+
+def group_key(block: BlockPermutations) -> str:
+    return block.path.parent.relative_to(ROOT).as_posix()
+
+
+def build_report(blocks: list[BlockPermutations], budget: int, script_text: str) -> dict[str, Any]:
+    groups: dict[str, dict[str, int]] = {}
+    for block in blocks:
+        group = groups.setdefault(group_key(block), {"blocks": 0, "permutations": 0})
+        group["blocks"] += 1
+        group["permutations"] += block.count
+
+    return {
+        "budget": budget,
+        "total": sum(block.count for block in blocks),
+        "alternatives": {
+            "fold_mirrored": sum(block.fold_mirrored() for block in blocks),
+            "drop_unreferenced": sum(block.drop_unreferenced(script_text) for block in blocks),
+        },
+        "groups": dict(sorted(groups.items())),
+        # Keyed by file, so duplicated identifiers are listed once per file.
+        "blocks": {
+            block.path.relative_to(ROOT).as_posix(): {
+                "identifier": block.identifier,
+                "permutations": block.count,
+                "states": block.states,
+            }
+            for block in sorted(blocks, key=lambda block: (-block.count, block.identifier, block.path))
+        },
+    }
+
+
+def print_report(report: dict[str, Any], top: int) -> list[str]:
+    over_budget = [path for path, entry in report["blocks"].items() if entry["permutations"] > report["budget"]]
+
+    print("Largest blocks:")
+    for entry in list(report["blocks"].values())[:top]:
+        layout = " x ".join(f"{name}={values}" for name, values in entry["states"].items()) or "no states"
+        print(f"- {entry['identifier']}: {entry['permutations']} ({layout})")
+
+    print("Permutations by folder:")
+    for folder, group in report["groups"].items():
+        print(f"- {folder}: {group['permutations']} ({group['blocks']} blocks)")
+
+    if over_budget:
+        print(f"Blocks over budget ({report['budget']}):")
+        for path in over_budget:
+            print(f"- {report['blocks'][path]['identifier']}: {report['blocks'][path]['permutations']} ({path})")
+
+    print("Permutation summary:")
+    print(f"- blocks: {len(report['blocks'])}")
+    print(f"- total: {report['total']}")
+    print(f"- over_budget: {len(over_budget)}")
+    for name, total in report["alternatives"].items():
+        print(f"- {name}: {total} (saves {report['total'] - total})")
+    return over_budget
+
+
+def main() -> int:
+    args = parse_args()
+    blocks = []
+    for path in iter_block_files(args.paths):
+        block = analyze_block(path, read_json(path))
+        if block is not None:
+            blocks.append(block)
+
+    report = build_report(blocks, args.budget, read_script_text())
+    over_budget = print_report(report, args.top)
+
+    if args.report is not None:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    over_total = args.max_total is not None and report["total"] > args.max_total
+    if over_total:
+        print(f"Pack total {report['total']} exceeds --max-total {args.max_total}.")
+    return 1 if over_budget or over_total else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
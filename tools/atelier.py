@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+"""
+Single entry point for the pack tools.
+
+`atelier.py <command> [args]` runs one tool exactly as its own script would (same
+arguments, same exit code). Only the module of the chosen command is imported, so
+`--help` and light commands do not pay for the generators' imports.
+
+`atelier.py pipeline [stages]` runs several generator stages in one process on one
+shared ChangePlan: files are read from disk once, the crafting catalog is parsed once
+(CraftingCatalog.for_plan), and every stage sees what the previous ones planned. The
+combined plan is then printed (--dry-run) or applied at once and validated.
+
+Examples
+--------
+- python tools/atelier.py --help
+- python tools/atelier.py uniform --dry-run
+- python tools/atelier.py validate BP/blocks
+- python tools/atelier.py catalog query "SELECT key FROM lang_missing WHERE locale = 'es_MX'"
+- python tools/atelier.py promote polished_basalt_tiles --dry-run
+- python tools/atelier.py pipeline --dry-run
+- python tools/atelier.py pipeline uniform custom glass sounds --panes
+"""
+
+import argparse
+import importlib
+import sys
+
+# command -> (module, summary); summaries live here so listing them imports nothing.
+COMMANDS = {
+    "uniform": ("generate_uniform_variants", "Generate slab/stairs/three-step/vertical variants for uniform blocks."),
+    "custom": ("generate_custom_variants", "Expand tools/custom_variant_matrix.json into custom tile variants."),
+    "glass": ("generate_glass_variants", "Generate glass blocks (and optional panes) from glass textures."),
+    "sounds": ("generate_sound_events", "Generate the block id -> tool sound event table."),
+    "validate": ("validate_pack", "Validate BP/RP JSON files against the vendored schemas."),
+    "permutations": ("analyze_permutations", "Count block permutations and flag blocks over budget."),
+    "catalog": ("pack_catalog", "Sync the pack into a SQLite catalog and query it."),
+    "derive-culling": ("derive_culling", "Derive culling rules from block geometry."),
+    "consolidate-culling": ("consolidate_culling", "Fold per-block culling files into shared per-shape files."),
+    "shard-recipes": ("shard_recipes", "Shard or unshard BP/recipes/stonecutter by material."),
+    "texture-index": ("texture_index", "Report or prune unused texture assets."),
+    "optimize-geometry": ("optimize_geometry", "Merge cubes and drop hidden faces in RP/models/blocks."),
+    "optimize-textures": ("optimize_textures", "Losslessly recompress RP/textures PNGs into a staging directory."),
+    "synthesize-textures": ("synthesize_textures", "Generate modifier texture variants from the stone bases."),
+    "split-textures": ("split_textures", "Split 32x16 textures into 16x16 top/side textures."),
+    "dedupe-lang": ("dedupe_lang_keys", "Dedupe, complete and order the lang files of every locale."),
+    "migrate-namespace": ("migrate_namespace", "Rewrite legacy namespaces across the pack."),
+    "rename-variants": ("rename_variant_filenames", "Shorten variant file names and rewrite references in one batch."),
+    "promote": ("promote_upcoming", "Promote staged Upcoming blocks into the pack with all their variants."),
+}
+
+# Stages `pipeline` can run, in execution order; each module provides pipeline_stage(plan, args).
+PIPELINE_STAGES = ("uniform", "custom", "glass", "sounds")
+DEFAULT_PIPELINE = ("uniform", "custom", "glass")
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="atelier.py",
+        description="Dorios' Atelier pack tools.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="commands:\n"
+        + "\n".join(f"  {name:<22}{summary}" for name, (_, summary) in COMMANDS.items())
+        + f"\n  {'pipeline':<22}Run several generator stages on one shared plan.",
+    )
+    parser.add_argument("command", choices=(*COMMANDS, "pipeline"), metavar="command", help="Tool to run (see below).")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments passed to the tool.")
+    return parser.parse_args(argv)
+
+
+def parse_pipeline_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="atelier.py pipeline", description="Run generator stages on one shared plan.")
+    parser.add_argument(
+        "stages",
+        nargs="*",
+        metavar="stage",
+        help=f"Stages to run: {', '.join(PIPELINE_STAGES)} (default: {' '.join(DEFAULT_PIPELINE)}); always run in that order.",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Print the combined plan without touching files.")
+    parser.add_argument("--show-diff", action="store_true", help="With --dry-run, print a unified diff for every change.")
+    parser.add_argument("--include-non-stone", action="store_true", help="uniform: also generate for non-stone blocks.")
+    parser.add_argument("--panes", action="store_true", help="glass: also generate pane blocks.")
+    parser.add_argument("--full", action="store_true", help="glass: ignore the texture hash store.")
+    parser.add_argument("--skip-validation", action="store_true", help="Do not validate BP/RP after applying.")
+    args = parser.parse_args(argv)
+    # Checked here: argparse rejects an empty `nargs="*"` list when `choices` is set.
+    unknown = [stage for stage in args.stages if stage not in PIPELINE_STAGES]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)} (choose from {', '.join(PIPELINE_STAGES)})")
+    args.stages = args.stages or list(DEFAULT_PIPELINE)
+    return args
+
+
+def run_command(command: str, argv: list[str]) -> int:
+    module = importlib.import_module(COMMANDS[command][0])
+    sys.argv = [f"atelier.py {command}", *argv]
+    return module.main() or 0
+
+
+def run_pipeline(argv: list[str]) -> int:
+    args = parse_pipeline_args(argv)
+
+    from change_plan import ChangePlan, print_plan
+
+    plan = ChangePlan()
+    after_apply = []
+    for stage in (name for name in PIPELINE_STAGES if name in args.stages):
+        stats, hook = importlib.import_module(COMMANDS[stage][0]).pipeline_stage(plan, args)
+        print(f"Stage {stage}:")
+        for key, value in stats.items():
+            print(f"- {key}: {value}")
+        if hook is not None:
+            after_apply.append(hook)
+
+    if args.dry_run:
+        print_plan(plan, show_diff=args.show_diff)
+        print("Dry run enabled. No files were changed.")
+        return 0
+
+    applied = plan.apply()
+    for hook in after_apply:
+        hook()
+    print("Applied changes:")
+    for action, count in applied.items():
+        print(f"- {action}: {count}")
+
+    if args.skip_validation:
+        return 0
+    from validate_pack import print_validation_report, validate_pack
+
+    results, validation_stats = validate_pack()
+    print_validation_report(results, validation_stats)
+    return 1 if validation_stats["errors"] else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.command == "pipeline":
+        return run_pipeline(args.args)
+    return run_command(args.command, args.args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
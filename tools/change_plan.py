@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+"""
+In-memory changeset shared by the generator stages.
+
+Stages read through the plan (so they see files planned by earlier stages, and every
+input is read from disk at most once) and write into it instead of touching the tree.
+The resulting plan can be printed, saved for review, and applied later; applying a
+saved plan refuses to run if any target file changed since the plan was built.
+"""
+
+import difflib
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from json_cache import cache_enabled, shared_cache
+from pack_io import ROOT, dump_json_text
+
+PLAN_FORMAT_VERSION = 1
+# Non UTF-8 bytes (images) survive a read/write round trip as lone surrogates.
+TEXT_ERRORS = "surrogateescape"
+
+
+def text_sha1(text: str | None) -> str | None:
+    if text is None:
+        return None
+    return hashlib.sha1(text.encode("utf-8", TEXT_ERRORS)).hexdigest()
+
+
+def is_binary_text(text: str | None) -> bool:
+    return text is not None and ("\x00" in text or any("\udc80" <= char <= "\udcff" for char in text))
+
+
+def read_disk_text(path: Path) -> str:
+    # Images keep their exact bytes; text gets the newline translation of Path.read_text.
+    text = path.read_bytes().decode("utf-8", TEXT_ERRORS)
+    return text if is_binary_text(text) else text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+@dataclass
+class FileChange:
+    path: Path
+    action: str
+    original: str | None
+    content: str | None
+
+    def diff(self, root: Path = ROOT) -> str:
+        relative = self.path.relative_to(root).as_posix() if self.path.is_relative_to(root) else self.path.as_posix()
+        if is_binary_text(self.original) or is_binary_text(self.content):
+            return f"Binary file {relative} ({self.action})\n"
+        lines = difflib.unified_diff(
+            (self.original or "").splitlines(keepends=True),
+            (self.content or "").splitlines(keepends=True),
+            fromfile=f"a/{relative}" if self.original is not None else "/dev/null",
+            tofile=f"b/{relative}" if self.content is not None else "/dev/null",
+        )
+        return "".join(lines)
+
+
+class ChangePlan:
+    def __init__(self, root: Path = ROOT) -> None:
+        self.root = root
+        self._disk_text: dict[Path, str | None] = {}
+        self._pending: dict[Path, str | None] = {}
+        self._listings: dict[tuple[Path, str, bool], list[Path]] = {}
+
+    def _load_disk_text(self, path: Path) -> str | None:
+        if path not in self._disk_text:
+            self._disk_text[path] = read_disk_text(path) if path.is_file() else None
+        return self._disk_text[path]
+
+    def read_text(self, path: Path) -> str:
+        text = self._pending[path] if path in self._pending else self._load_disk_text(path)
+        if text is None:
+            raise FileNotFoundError(f"File not found (on disk or in plan): {path}")
+        return text
+
+    def read_json(self, path: Path) -> dict[str, Any]:
+        # Files untouched by the plan are parsed through the persistent cache.
+        if path not in self._pending and cache_enabled() and path.is_file():
+            return shared_cache().read_json(path)
+        return json.loads(self.read_text(path))
+
+    def exists(self, path: Path) -> bool:
+        if path in self._pending:
+            return self._pending[path] is not None
+        return self._load_disk_text(path) is not None
+
+    def write_text(self, path: Path, text: str) -> None:
+        self._load_disk_text(path)
+        self._pending[path] = text
+
+    def write_json(self, path: Path, payload: dict[str, Any]) -> None:
+        self.write_text(path, dump_json_text(payload))
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        self.write_text(path, data.decode("utf-8", TEXT_ERRORS))
+
+    def delete(self, path: Path) -> None:
+        self._load_disk_text(path)
+        self._pending[path] = None
+
+    def move(self, source: Path, target: Path) -> None:
+        text = self.read_text(source)
+        self.delete(source)
+        self.write_text(target, text)
+
+    def _disk_listing(self, directory: Path, pattern: str, recursive: bool) -> list[Path]:
+        key = (directory, pattern, recursive)
+        if key not in self._listings:
+            matches = directory.rglob(pattern) if recursive else directory.glob(pattern)
+            self._listings[key] = [path for path in matches if path.is_file()]
+        return self._listings[key]
+
+    def _list(self, directory: Path, pattern: str, recursive: bool) -> list[Path]:
+        # Listed disk files exist unless the plan deletes them; no need to load their content.
+        listed = self._disk_listing(directory, pattern, recursive)
+        found = {path for path in listed if path not in self._pending or self._pending[path] is not None}
+        for path, text in self._pending.items():
+            if text is None:
+                continue
+            if recursive:
+                if directory in path.parents and path.match(pattern):
+                    found.add(path)
+            elif path.parent == directory and path.match(pattern):
+                found.add(path)
+        return sorted(found)
+
+    def glob(self, directory: Path, pattern: str) -> list[Path]:
+        return self._list(directory, pattern, recursive=False)
+
+    def rglob(self, directory: Path, pattern: str) -> list[Path]:
+        return self._list(directory, pattern, recursive=True)
+
+    def changes(self) -> list[FileChange]:
+        changes: list[FileChange] = []
+        for path in sorted(self._pending):
+            original = self._disk_text.get(path)
+            content = self._pending[path]
+            if original == content:
+                continue
+            if original is None:
+                action = "create"
+            elif content is None:
+                action = "delete"
+            else:
+                action = "modify"
+            changes.append(FileChange(path=path, action=action, original=original, content=content))
+        return changes
+
+    def summary(self) -> dict[str, int]:
+        counts = {"create": 0, "modify": 0, "delete": 0}
+        for change in self.changes():
+            counts[change.action] += 1
+        return counts
+
+    def relative(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def apply(self) -> dict[str, int]:
+        changes = self.changes()
+        for change in changes:
+            if change.content is None:
+                change.path.unlink(missing_ok=True)
+                self._prune_empty_parents(change.path.parent)
+            else:
+                change.path.parent.mkdir(parents=True, exist_ok=True)
+                if is_binary_text(change.content):
+                    # Bypass newline translation so images are written byte for byte.
+                    change.path.write_bytes(change.content.encode("utf-8", TEXT_ERRORS))
+                else:
+                    change.path.write_text(change.content, encoding="utf-8", errors=TEXT_ERRORS)
+
+        for change in changes:
+            self._disk_text[change.path] = change.content
+        self._pending.clear()
+        self._listings.clear()
+
+        counts = {"create": 0, "modify": 0, "delete": 0}
+        for change in changes:
+            counts[change.action] += 1
+        return counts
+
+    def inverse(self) -> ChangePlan:
+        # Undoes this plan once it is applied: the inverse's "disk" is this plan's result.
+        undo = ChangePlan(self.root)
+        for change in self.changes():
+            undo._disk_text[change.path] = change.content
+            undo._pending[change.path] = change.original
+        return undo
+
+    def _prune_empty_parents(self, directory: Path) -> None:
+        while directory != self.root and self.root in directory.parents:
+            try:
+                directory.rmdir()
+            except OSError:
+                return
+            directory = directory.parent
+
+    def to_payload(self, include_diffs: bool = True) -> dict[str, Any]:
+        entries: list[dict[str, Any]] = []
+        for change in self.changes():
+            entry: dict[str, Any] = {
+                "path": self.relative(change.path),
+                "action": change.action,
+                "base_sha1": text_sha1(change.original),
+                "content": change.content,
+            }
+            if include_diffs:
+                entry["diff"] = change.diff(self.root)
+            entries.append(entry)
+        return {"version": PLAN_FORMAT_VERSION, "changes": entries}
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(dump_json_text(self.to_payload()), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path, root: Path = ROOT) -> ChangePlan:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("version") != PLAN_FORMAT_VERSION:
+            raise ValueError(f"Unsupported plan version in {path}: {payload.get('version')}")
+
+        plan = cls(root)
+        stale: list[str] = []
+        for entry in payload.get("changes", []):
+            target = root / entry["path"]
+            if text_sha1(plan._load_disk_text(target)) != entry.get("base_sha1"):
+                stale.append(entry["path"])
+            plan._pending[target] = entry.get("content")
+
+        if stale:
+            raise RuntimeError(
+                "Plan is stale; these files changed since it was built: " + ", ".join(sorted(stale))
+            )
+        return plan
+
+
+def print_plan(plan: ChangePlan, show_diff: bool = False) -> None:
+    changes = plan.changes()
+    print("Planned changes:")
+    for action, count in plan.summary().items():
+        print(f"- {action}: {count}")
+    for change in changes:
+        print(f"  {change.action:<6} {plan.relative(change.path)}")
+        if show_diff:
+            diff = change.diff(plan.root)
+            if diff:
+                print(diff, end="" if diff.endswith("\n") else "\n")
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+"""
+Consolidate per-block culling files into one shared rule set per geometry shape.
+
+The uniform generator used to write `RP/block_culling/<base>_{slab,str,tss}.json` for
+every base block, each a copy of the template that differs only in
+`description.identifier`. This migration:
+
+1. matches every file in RP/block_culling against the slab, stairs, three-step stairs
+   and custom glass rule sets (format version and rules compared, identifier ignored);
+2. writes the shared files (`slab.json`, `stairs.json`, `three_steps_stairs.json`,
+   `custom_glass.json`) where missing;
+3. rewrites `minecraft:geometry.culling` in BP/blocks (components and permutations)
+   to the shared identifiers, editing only the identifier text;
+4. deletes the per-block files that were folded in.
+
+Files whose rules differ from every shape are left untouched and listed. Once the
+shared files exist, the uniform generator's `--culling-mode auto` points new blocks
+at them instead of writing per-block copies.
+
+Examples
+--------
+- python tools/consolidate_culling.py --dry-run
+- python tools/consolidate_culling.py --dry-run --show-diff
+- python tools/consolidate_culling.py
+"""
+
+import argparse
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+from change_plan import ChangePlan, print_plan
+from generate_glass_variants import CULLING_PATH as GLASS_CULLING_PATH
+from generate_glass_variants import NAMESPACE
+from generate_uniform_variants import (
+    BP_ROOT,
+    CULLING_DIR,
+    SHARED_CULLING_FILES,
+    VARIANT_FILE_SUFFIXES,
+    culling_identifier,
+    generate_culling,
+    load_culling_template,
+)
+
+CULLING_REFERENCE_PATTERN = re.compile(r'("culling"\s*:\s*")([^"]+)(")')
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fold identical per-block culling files into shared per-shape files.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the planned changes without touching files.")
+    parser.add_argument("--show-diff", action="store_true", help="With --dry-run, print a unified diff for every change.")
+    return parser.parse_args()
+
+
+def rules_signature(payload: dict[str, Any]) -> str:
+    rules = payload.get("minecraft:block_culling_rules", {})
+    return json.dumps([payload.get("format_version"), rules.get("rules")], sort_keys=True)
+
+
+def load_shared_shapes(plan: ChangePlan) -> dict[str, tuple[Path, str, dict[str, Any]]]:
+    shapes = {
+        variant_suffix: (
+            CULLING_DIR / file_name,
+            culling_identifier("", variant_suffix, "shared"),
+            load_culling_template(variant_suffix, plan),
+        )
+        for variant_suffix, file_name in SHARED_CULLING_FILES.items()
+    }
+    shapes["custom_glass"] = (GLASS_CULLING_PATH, f"{NAMESPACE}:custom_glass", plan.read_json(GLASS_CULLING_PATH))
+    return shapes
+
+
+def match_shape(path: Path, candidates: list[str]) -> str | None:
+    # Stairs and three-step stairs currently share identical rules; keep each file with
+    # the shape its name says it belongs to.
+    for shape in candidates:
+        file_suffix = VARIANT_FILE_SUFFIXES.get(shape)
+        if file_suffix and path.name.endswith(f"_{file_suffix}.json"):
+            return shape
+    return candidates[0] if candidates else None
+
+
+def consolidate_culling(plan: ChangePlan) -> tuple[dict[str, int], list[str]]:
+    shapes = load_shared_shapes(plan)
+    shapes_by_signature: dict[str, list[str]] = {}
+    for shape, (_, _, template) in shapes.items():
+        shapes_by_signature.setdefault(rules_signature(template), []).append(shape)
+    shared_paths = {path for path, _, _ in shapes.values()}
+
+    identifier_map: dict[str, str] = {}
+    folded: dict[str, int] = {shape: 0 for shape in shapes}
+    kept: list[str] = []
+
+    for path in plan.glob(CULLING_DIR, "*.json"):
+        if path in shared_paths:
+            continue
+        try:
+            payload = plan.read_json(path)
+        except json.JSONDecodeError:
+            kept.append(plan.relative(path))
+            continue
+
+        shape = match_shape(path, shapes_by_signature.get(rules_signature(payload), []))
+        identifier = payload.get("minecraft:block_culling_rules", {}).get("description", {}).get("identifier")
+        if shape is None or not identifier:
+            kept.append(plan.relative(path))
+            continue
+
+        identifier_map[identifier] = shapes[shape][1]
+        folded[shape] += 1
+        plan.delete(path)
+
+    for shape, (shared_path, shared_identifier, template) in shapes.items():
+        if folded[shape] and not plan.exists(shared_path):
+            plan.write_json(shared_path, generate_culling(template, shared_identifier))
+
+    rewritten_blocks = 0
+    for path in plan.rglob(BP_ROOT / "blocks", "*.json"):
+        text = plan.read_text(path)
+        updated = CULLING_REFERENCE_PATTERN.sub(
+            lambda match: f"{match.group(1)}{identifier_map.get(match.group(2), match.group(2))}{match.group(3)}",
+            text,
+        )
+        if updated != text:
+            plan.write_text(path, updated)
+            rewritten_blocks += 1
+
+    stats = {f"folded_{shape}_files": count for shape, count in folded.items()}
+    stats["rewritten_blocks"] = rewritten_blocks
+    stats["kept_files"] = len(kept)
+    return stats, kept
+
+
+def main() -> int:
+    args = parse_args()
+    plan = ChangePlan()
+    stats, kept = consolidate_culling(plan)
+
+    print("Culling consolidation summary:")
+    for key, value in stats.items():
+        print(f"- {key}: {value}")
+    if kept:
+        print("Kept (rules differ from every shared shape):")
+        for relative in kept:
+            print(f"- {relative}")
+
+    if args.dry_run:
+        print_plan(plan, show_diff=args.show_diff)
+        print("Dry run enabled. No files were changed.")
+        return 0
+
+    applied = plan.apply()
+    print("Applied changes:")
+    for action, count in applied.items():
+        print(f"- {action}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+"""
+Indexed model of BP/item_catalog/crafting_item_catalog.json shared by the generators.
+
+The catalog is parsed once per ChangePlan (`CraftingCatalog.for_plan`), so every
+generator stage working on the same plan edits the same object. Lookups go through
+indexes instead of scanning categories and groups:
+- category name -> category;
+- group name -> (position, group), per category;
+- item id -> group, plus a per-group item set for membership tests.
+Mutations mark the model dirty and `save` writes it back into the plan only then.
+"""
+
+import weakref
+from pathlib import Path
+from typing import Any, Iterable
+
+from change_plan import ChangePlan
+from pack_io import ROOT
+
+CATALOG_PATH = ROOT / "BP/item_catalog/crafting_item_catalog.json"
+
+_CATALOGS: weakref.WeakKeyDictionary[ChangePlan, CraftingCatalog] = weakref.WeakKeyDictionary()
+
+
+def group_name(group: dict[str, Any]) -> str | None:
+    return group.get("group_identifier", {}).get("name")
+
+
+class CraftingCatalog:
+    def __init__(self, payload: dict[str, Any], path: Path = CATALOG_PATH) -> None:
+        self.payload = payload
+        self.path = path
+        self.dirty = False
+        self._categories = {
+            category["category_name"]: category
+            for category in payload["minecraft:crafting_items_catalog"]["categories"]
+        }
+        self._groups: dict[str, dict[str, tuple[int, dict[str, Any]]]] = {}
+        self._item_sets: dict[int, set[str]] = {}
+        self._group_by_item: dict[str, dict[str, Any]] = {}
+        for name in self._categories:
+            self._reindex_category(name)
+
+    @classmethod
+    def for_plan(cls, plan: ChangePlan, path: Path = CATALOG_PATH) -> CraftingCatalog:
+        catalog = _CATALOGS.get(plan)
+        if catalog is None or catalog.path != path:
+            catalog = cls(plan.read_json(path), path)
+            _CATALOGS[plan] = catalog
+        return catalog
+
+    def save(self, plan: ChangePlan) -> bool:
+        if not self.dirty:
+            return False
+        plan.write_json(self.path, self.payload)
+        self.dirty = False
+        return True
+
+    def _reindex_category(self, category_name: str) -> None:
+        index: dict[str, tuple[int, dict[str, Any]]] = {}
+        for position, group in enumerate(self._categories[category_name].get("groups", [])):
+            name = group_name(group)
+            if name is not None and name not in index:
+                index[name] = (position, group)
+            self._index_items(group)
+        self._groups[category_name] = index
+
+    def _index_items(self, group: dict[str, Any]) -> None:
+        items = group.get("items", [])
+        self._item_sets[id(group)] = set(items)
+        for item in items:
+            self._group_by_item.setdefault(item, group)
+
+    def category(self, name: str) -> dict[str, Any]:
+        return self._categories[name]
+
+    def group(self, category_name: str, *names: str) -> dict[str, Any] | None:
+        # With several names (primary + legacy), the one listed first in the file wins.
+        matches = [self._groups[category_name][name] for name in names if name in self._groups[category_name]]
+        return min(matches, key=lambda match: match[0])[1] if matches else None
+
+    def group_of(self, item: str) -> dict[str, Any] | None:
+        return self._group_by_item.get(item)
+
+    def contains(self, group: dict[str, Any], item: str) -> bool:
+        return item in self._item_sets.get(id(group), ())
+
+    def add_group(self, category_name: str, name: str, icon: str, items: Iterable[str] = ()) -> dict[str, Any]:
+        group = {
+            "group_identifier": {
+                "icon": icon,
+                "name": name,
+            },
+            "items": list(items),
+        }
+        groups = self._categories[category_name].setdefault("groups", [])
+        groups.append(group)
+        self._groups[category_name].setdefault(name, (len(groups) - 1, group))
+        self._index_items(group)
+        self.dirty = True
+        return group
+
+    def set_identifier(self, category_name: str, group: dict[str, Any], name: str, icon: str) -> None:
+        identifier = group.setdefault("group_identifier", {})
+        if identifier.get("icon") == icon and identifier.get("name") == name:
+            return
+        identifier["icon"] = icon
+        identifier["name"] = name
+        self.dirty = True
+        self._reindex_category(category_name)
+
+    def set_items(self, group: dict[str, Any], items: Iterable[str]) -> bool:
+        desired = list(items)
+        if group.get("items") == desired:
+            return False
+        for item in group.get("items", []):
+            if self._group_by_item.get(item) is group:
+                del self._group_by_item[item]
+        group["items"] = desired
+        self._index_items(group)
+        self.dirty = True
+        return True
+
+    def add_items(self, group: dict[str, Any], items: Iterable[str]) -> int:
+        current = self._item_sets.setdefault(id(group), set(group.get("items", [])))
+        additions = [item for item in dict.fromkeys(items) if item not in current]
+        if not additions:
+            return 0
+        group.setdefault("items", []).extend(additions)
+        current.update(additions)
+        for item in additions:
+            self._group_by_item.setdefault(item, group)
+        self.dirty = True
+        return len(additions)
+
+    def remove_items(self, group: dict[str, Any], items: Iterable[str]) -> int:
+        removed = set(items) & self._item_sets.get(id(group), set())
+        if removed:
+            self.set_items(group, [item for item in group["items"] if item not in removed])
+        return len(removed)
+
+    def sync_group(self, category_name: str, name: str, icon: str, items: Iterable[str]) -> int:
+        # Existing group: only its items are synced. Missing group: appended with `icon`.
+        group = self.group(category_name, name)
+        if group is None:
+            self.add_group(category_name, name, icon, dict.fromkeys(items))
+            return 1
+        return int(self.set_items(group, dict.fromkeys(items)))
+
+    def replace_group(self, category_name: str, name: str, icon: str, items: Iterable[str]) -> int:
+        # Like sync_group, but the icon is reset as well; the group keeps its position.
+        group = self.group(category_name, name)
+        if group is None:
+            self.add_group(category_name, name, icon, items)
+            return 1
+        changed = self.set_items(group, items)
+        if group["group_identifier"].get("icon") != icon:
+            group["group_identifier"]["icon"] = icon
+            self.dirty = changed = True
+        return int(changed)
@@ -1,49 +1,235 @@
 from __future__ import annotations
 
+"""
+Keep every lang file listed in RP/texts/languages.json consistent with the others.
+
+All locales are loaded in one pass into a key matrix (key -> value per locale), then:
+- duplicate keys are dropped within each file (the last occurrence wins);
+- keys missing from a locale are reported and, unless --no-fill, filled with the
+  block name generated for that locale (`tile.dorios_atelier:*.name` keys of locales
+  with a LocalePlugin), else the --fallback locale's value, else a name generated
+  from the key;
+- every file is written in one canonical key order: the fallback locale's order, with
+  keys it lacks placed after their predecessor in the first locale that has them.
+  Blank-line sections follow the locale that defines the key's position; `##` comments
+  stay with the key they precede in their own file.
+Each file is read once and written at most once, and the work is linear in keys x locales.
+
+Examples
+--------
+- python tools/dedupe_lang_keys.py --dry-run
+- python tools/dedupe_lang_keys.py --dry-run --show-diff --no-fill
+- python tools/dedupe_lang_keys.py
+"""
+
+import argparse
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-LANG_FILES = [
-    ROOT / "RP/texts/en_US.lang",
-    ROOT / "RP/texts/pt_BR.lang",
-    ROOT / "RP/texts/es_MX.lang",
-]
+from change_plan import ChangePlan, print_plan
+from generate_uniform_variants import load_vanilla_name_map, localize_block_name_from_identifier
+from label_wrap import wrap_labels
+from locale_engine import LOCALE_PLUGINS, humanize_identifier
+from pack_io import RP_ROOT
 
+TEXTS_DIR = RP_ROOT / "texts"
+LANGUAGES_PATH = TEXTS_DIR / "languages.json"
+FALLBACK_LOCALE = "en_US"
 
-def dedupe_lang_file(path: Path) -> int:
-    if not path.exists():
-        return 0
+TILE_KEY_PATTERN = re.compile(r"^tile\.dorios_atelier:([a-z0-9_]+)\.name$")
+
+
+@dataclass
+class LangFile:
+    locale: str
+    path: Path
+    # Insertion order is the file order after dropping earlier duplicates.
+    entries: dict[str, str] = field(default_factory=dict)
+    blank_before: set[str] = field(default_factory=set)
+    comments_before: dict[str, list[str]] = field(default_factory=dict)
+    trailing_comments: list[str] = field(default_factory=list)
+    duplicates: int = 0
+    missing: list[str] = field(default_factory=list)
+    filled: dict[str, int] = field(default_factory=lambda: {"generated": 0, "fallback": 0})
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Dedupe, complete and order the lang files of every locale.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the planned changes without touching files.")
+    parser.add_argument("--show-diff", action="store_true", help="With --dry-run, print a unified diff for every change.")
+    parser.add_argument("--no-fill", action="store_true", help="Only report missing keys instead of filling them.")
+    parser.add_argument("--fallback", default=FALLBACK_LOCALE, help="Locale whose values and order are the reference.")
+    return parser.parse_args()
 
-    lines = path.read_text(encoding="utf-8").splitlines()
-    key_occurrences: dict[str, list[int]] = {}
 
-    for idx, line in enumerate(lines):
+def parse_lang_file(locale: str, path: Path, text: str) -> LangFile:
+    lang = LangFile(locale, path)
+    blank = False
+    comments: list[str] = []
+    for line in text.splitlines():
         stripped = line.strip()
-        if not stripped or stripped.startswith("##") or "=" not in line:
+        if not stripped:
+            blank = True
             continue
-        key = line.split("=", 1)[0]
-        key_occurrences.setdefault(key, []).append(idx)
+        if stripped.startswith("##") or "=" not in line:
+            comments.append(line)
+            continue
+
+        key, value = line.split("=", 1)
+        if key in lang.entries:
+            # Re-inserting moves the key to its last occurrence.
+            del lang.entries[key]
+            lang.duplicates += 1
+        lang.entries[key] = value
+        if blank:
+            lang.blank_before.add(key)
+        if comments:
+            lang.comments_before.setdefault(key, []).extend(comments)
+        blank, comments = False, []
+    lang.trailing_comments = comments
+    return lang
+
+
+def load_locales(plan: ChangePlan) -> list[str]:
+    return [locale for locale in plan.read_json(LANGUAGES_PATH) if plan.exists(TEXTS_DIR / f"{locale}.lang")]
+
+
+def canonical_order(langs: list[LangFile]) -> tuple[list[str], dict[str, LangFile]]:
+    # Keys a locale adds are anchored after their predecessor there, then flattened once.
+    owner: dict[str, LangFile] = {}
+    anchored: dict[str | None, list[str]] = {}
+    for lang in langs:
+        previous: str | None = None
+        for key in lang.entries:
+            if key not in owner:
+                owner[key] = lang
+                anchored.setdefault(previous, []).append(key)
+            previous = key
+
+    # The first key anchored after a key is the owner's own successor; keys inserted by
+    # later locales come right after the anchor, before that successor.
+    order: list[str] = []
+    stack: list[str | None] = [None]
+    while stack:
+        key = stack.pop()
+        if key is not None:
+            order.append(key)
+        children = anchored.get(key, [])
+        stack.extend(children[:1] + children[:0:-1])
+    return order, owner
 
-    duplicate_indices: set[int] = set()
-    for indices in key_occurrences.values():
-        if len(indices) <= 1:
+
+def generated_value(
+    lang: LangFile, key: str, vanilla_names: dict[str, dict[str, str]], names: dict[str, dict[str, str]]
+) -> str | None:
+    match = TILE_KEY_PATTERN.match(key)
+    plugin = LOCALE_PLUGINS.get(lang.locale)
+    if match is None or plugin is None:
+        return None
+    if lang.locale not in vanilla_names:
+        vanilla_names[lang.locale] = load_vanilla_name_map(plugin.vanilla_name_list)
+    return localize_block_name_from_identifier(match.group(1), plugin, names[lang.locale], vanilla_names[lang.locale])
+
+
+def tile_names(lang: LangFile) -> dict[str, str]:
+    names: dict[str, str] = {}
+    for key, value in lang.entries.items():
+        match = TILE_KEY_PATTERN.match(key)
+        if match:
+            names[match.group(1)] = value
+    return names
+
+
+def fill_missing(langs: list[LangFile], order: list[str], fallback: LangFile | None, fill: bool) -> None:
+    vanilla_names: dict[str, dict[str, str]] = {}
+    names = {lang.locale: tile_names(lang) for lang in langs}
+    generated: list[tuple[LangFile, str, str]] = []
+    for key in order:
+        for lang in langs:
+            if key in lang.entries:
+                continue
+            lang.missing.append(key)
+            if not fill:
+                continue
+            value = generated_value(lang, key, vanilla_names, names)
+            if value is not None:
+                generated.append((lang, key, value))
+                lang.filled["generated"] += 1
+            elif fallback is not None and key in fallback.entries:
+                lang.entries[key] = fallback.entries[key]
+                lang.filled["fallback"] += 1
+            else:
+                name = key.split(":", 1)[-1].removesuffix(".name")
+                lang.entries[key] = humanize_identifier(name)
+                lang.filled["generated"] += 1
+
+    wrapped = wrap_labels(value for _lang, _key, value in generated)
+    for lang, key, value in generated:
+        lang.entries[key] = wrapped[value]
+
+
+def render_lang_file(lang: LangFile, order: list[str], owner: dict[str, LangFile]) -> str:
+    lines: list[str] = []
+    for key in order:
+        if key not in lang.entries:
             continue
-        duplicate_indices.update(indices[:-1])
+        if lines and key in owner[key].blank_before and lines[-1] != "":
+            lines.append("")
+        lines.extend(lang.comments_before.get(key, []))
+        lines.append(f"{key}={lang.entries[key]}")
+    lines.extend(lang.trailing_comments)
+    return "\n".join(lines) + "\n"
 
-    if not duplicate_indices:
-        return 0
 
-    new_lines = [line for idx, line in enumerate(lines) if idx not in duplicate_indices]
-    path.write_text("\n".join(new_lines).rstrip("\n") + "\n", encoding="utf-8")
-    return len(duplicate_indices)
+def normalize_lang_files(
+    plan: ChangePlan, fallback_locale: str = FALLBACK_LOCALE, fill: bool = True
+) -> tuple[list[LangFile], list[str]]:
+    langs = [
+        parse_lang_file(locale, TEXTS_DIR / f"{locale}.lang", plan.read_text(TEXTS_DIR / f"{locale}.lang"))
+        for locale in load_locales(plan)
+    ]
+    # The fallback locale goes first, so its order and sections are the reference.
+    langs.sort(key=lambda lang: lang.locale != fallback_locale)
+    fallback = langs[0] if langs and langs[0].locale == fallback_locale else None
+
+    order, owner = canonical_order(langs)
+    fill_missing(langs, order, fallback, fill)
+    for lang in langs:
+        plan.write_text(lang.path, render_lang_file(lang, order, owner))
+    return langs, order
+
 
+def main() -> int:
+    args = parse_args()
+    plan = ChangePlan()
+    langs, order = normalize_lang_files(plan, args.fallback, fill=not args.no_fill)
+
+    print("Lang summary:")
+    print(f"- locales: {len(langs)}")
+    print(f"- keys: {len(order)}")
+    for lang in langs:
+        print(
+            f"- {lang.locale}: duplicates {lang.duplicates}, missing {len(lang.missing)}, "
+            f"filled {lang.filled['fallback']} from fallback + {lang.filled['generated']} generated"
+        )
+    missing = [(lang.locale, key) for lang in langs for key in lang.missing]
+    if missing:
+        print("Missing keys:")
+        for locale, key in missing:
+            print(f"- {locale}: {key}")
+
+    if args.dry_run:
+        print_plan(plan, show_diff=args.show_diff)
+        print("Dry run enabled. No files were changed.")
+        return 0
 
-def main() -> None:
-    removed_total = 0
-    for lang_file in LANG_FILES:
-        removed_total += dedupe_lang_file(lang_file)
-    print(f"Removed duplicate entries: {removed_total}")
+    applied = plan.apply()
+    print("Applied changes:")
+    for action, count in applied.items():
+        print(f"- {action}: {count}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+"""
+Derive block culling rules from RP/models/blocks geometry and check the existing ones.
+
+For every culling rule set in RP/block_culling, the blocks that reference it give the
+geometry identifier and every `minecraft:transformation` they use (components and
+permutations). A rule `direction -> bone/cube/face` is emitted only when that cube face
+lies on the block boundary facing `direction` in model space *and* still does after
+each of those transformations, so the face is hidden by a full neighbour whether or
+not the client rotates rule directions with the block. Faces without UVs, rotated
+bones and rotated cubes are skipped.
+
+The tool compares the derived rules with the existing file:
+- missing: derivable rules the file does not have (faces currently overdrawn);
+- unsafe: rules in the file that are not derivable (faces that may leave holes).
+
+Derived rule sets are cached by geometry hash in tools/generated/culling_cache.json.
+Pass --write to replace the rules in the files (conditions are kept when a file uses a
+single condition for all of its rules).
+
+Examples
+--------
+- python tools/derive_culling.py
+- python tools/derive_culling.py --write --dry-run --show-diff
+"""
+
+import argparse
+import hashlib
+import json
+from typing import Any
+
+from change_plan import ChangePlan, print_plan
+from pack_io import ROOT, BP_ROOT, RP_ROOT
+
+MODELS_DIR = RP_ROOT / "models/blocks"
+CULLING_DIR = RP_ROOT / "block_culling"
+CACHE_PATH = ROOT / "tools/generated/culling_cache.json"
+
+CACHE_FORMAT_VERSION = 1
+EPSILON = 0.02
+
+# Model space in pixels: x and z span [-8, 8], y spans [0, 16]; the block centre is (0, 8, 0).
+BLOCK_MIN = (-8.0, 0.0, -8.0)
+BLOCK_MAX = (8.0, 16.0, 8.0)
+BLOCK_CENTER = (0.0, 8.0, 0.0)
+PIXELS_PER_BLOCK = 16.0
+
+FACE_NORMALS: dict[str, tuple[int, int, int]] = {
+    "east": (1, 0, 0),
+    "west": (-1, 0, 0),
+    "up": (0, 1, 0),
+    "down": (0, -1, 0),
+    "south": (0, 0, 1),
+    "north": (0, 0, -1),
+}
+FACE_ORDER = ("down", "up", "north", "south", "west", "east")
+
+Box = tuple[tuple[float, float, float], tuple[float, float, float]]
+Rule = tuple[str, str, int, str]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Derive culling rules from block geometry and compare them with RP/block_culling.")
+    parser.add_argument("--write", action="store_true", help="Replace the rules in each culling file with the derived set.")
+    parser.add_argument("--dry-run", action="store_true", help="With --write, print the planned changes without touching files.")
+    parser.add_argument("--show-diff", action="store_true", help="With --dry-run, print a unified diff for every change.")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the derivation cache.")
+    return parser.parse_args()
+
+
+def face_box(origin: list[float], size: list[float], face: str) -> Box:
+    low = [float(value) for value in origin]
+    high = [low[axis] + float(size[axis]) for axis in range(3)]
+    normal = FACE_NORMALS[face]
+    for axis, sign in enumerate(normal):
+        if sign > 0:
+            low[axis] = high[axis]
+        elif sign < 0:
+            high[axis] = low[axis]
+    return tuple(low), tuple(high)
+
+
+def rotate_point(point: tuple[float, float, float], rotation: list[float]) -> tuple[float, float, float]:
+    # Quarter turns about the block centre, applied x, then y, then z.
+    x, y, z = (point[axis] - BLOCK_CENTER[axis] for axis in range(3))
+    for axis, degrees in enumerate(rotation):
+        turns = round(float(degrees) / 90) % 4
+        for _ in range(turns):
+            if axis == 0:
+                y, z = -z, y
+            elif axis == 1:
+                x, z = z, -x
+            else:
+                x, y = -y, x
+    return x + BLOCK_CENTER[0], y + BLOCK_CENTER[1], z + BLOCK_CENTER[2]
+
+
+def transform_box(box: Box, transformation: dict[str, Any]) -> Box | None:
+    rotation = transformation.get("rotation", [0, 0, 0])
+    if any(float(degrees) % 90 for degrees in rotation):
+        return None
+    if any(float(value) != 1 for value in transformation.get("scale", [1, 1, 1])):
+        return None
+    translation = [float(value) * PIXELS_PER_BLOCK for value in transformation.get("translation", [0, 0, 0])]
+
+    corners = [rotate_point(corner, rotation) for corner in box]
+    low = tuple(min(corner[axis] for corner in corners) + translation[axis] for axis in range(3))
+    high = tuple(max(corner[axis] for corner in corners) + translation[axis] for axis in range(3))
+    return low, high
+
+
+def boundary_direction(box: Box) -> str | None:
+    low, high = box
+    for axis in range(3):
+        if low[axis] < BLOCK_MIN[axis] - EPSILON or high[axis] > BLOCK_MAX[axis] + EPSILON:
+            return None
+    for direction, normal in FACE_NORMALS.items():
+        axis = next(index for index, sign in enumerate(normal) if sign)
+        plane = BLOCK_MAX[axis] if normal[axis] > 0 else BLOCK_MIN[axis]
+        if abs(low[axis] - plane) <= EPSILON and abs(high[axis] - plane) <= EPSILON:
+            return direction
+    return None
+
+
+def cube_has_face(cube: dict[str, Any], face: str) -> bool:
+    uv = cube.get("uv")
+    if isinstance(uv, dict):
+        return face in uv
+    return True
+
+
+def derive_rules(geometry: dict[str, Any], transformations: list[dict[str, Any]]) -> list[Rule]:
+    rules: list[Rule] = []
+    for bone in geometry.get("bones", []):
+        if any(float(value) for value in bone.get("rotation", [0, 0, 0])):
+            continue
+        for cube_index, cube in enumerate(bone.get("cubes", [])):
+            if "rotation" in cube and any(float(value) for value in cube["rotation"]):
+                continue
+            for face in FACE_ORDER:
+                if not cube_has_face(cube, face):
+                    continue
+                box = face_box(cube["origin"], cube["size"], face)
+                if boundary_direction(box) != face:
+                    continue
+                if all(
+                    (moved := transform_box(box, transformation)) is not None and boundary_direction(moved) == face
+                    for transformation in transformations
+                ):
+                    rules.append((face, bone["name"], cube_index, face))
+    return rules
+
+
+def index_geometries(plan: ChangePlan) -> dict[str, dict[str, Any]]:
+    geometries: dict[str, dict[str, Any]] = {}
+    for path in plan.glob(MODELS_DIR, "*.json"):
+        for geometry in plan.read_json(path).get("minecraft:geometry", []):
+            identifier = geometry.get("description", {}).get("identifier")
+            if identifier:
+                geometries[identifier] = geometry
+    return geometries
+
+
+def collect_culling_usage(plan: ChangePlan) -> dict[str, tuple[set[str], list[dict[str, Any]]]]:
+    # culling identifier -> (geometry identifiers, distinct transformations of the referencing blocks)
+    usage: dict[str, tuple[set[str], list[dict[str, Any]]]] = {}
+    for path in plan.rglob(BP_ROOT / "blocks", "*.json"):
+        block = plan.read_json(path).get("minecraft:block", {})
+        components = block.get("components", {})
+        geometry = components.get("minecraft:geometry")
+        if not isinstance(geometry, dict) or "culling" not in geometry:
+            continue
+
+        geometry_ids, transformations = usage.setdefault(geometry["culling"], (set(), []))
+        geometry_ids.add(geometry.get("identifier", ""))
+        variants = [components] + [permutation.get("components", {}) for permutation in block.get("permutations", [])]
+        for variant in variants:
+            transformation = variant.get("minecraft:transformation", {})
+            if transformation not in transformations:
+                transformations.append(transformation)
+        # The base components apply whenever no permutation overrides the transformation.
+        if {} not in transformations:
+            transformations.append({})
+    return usage
+
+
+def geometry_cache_key(geometry: dict[str, Any], transformations: list[dict[str, Any]]) -> str:
+    canonical = json.dumps(
+        [geometry, sorted(json.dumps(item, sort_keys=True) for item in transformations)],
+        sort_keys=True,
+    )
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def load_cache() -> dict[str, list[list[Any]]]:
+    if not CACHE_PATH.exists():
+        return {}
+    try:
+        payload = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+    if payload.get("version") != CACHE_FORMAT_VERSION:
+        return {}
+    return payload.get("geometries", {})
+
+
+def save_cache(entries: dict[str, list[list[Any]]]) -> None:
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": CACHE_FORMAT_VERSION, "geometries": entries}
+    CACHE_PATH.write_text(json.dumps(payload, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def existing_rules(payload: dict[str, Any]) -> tuple[list[Rule], set[str | None]]:
+    rules: list[Rule] = []
+    conditions: set[str | None] = set()
+    for rule in payload.get("minecraft:block_culling_rules", {}).get("rules", []):
+        part = rule.get("geometry_part", {})
+        rules.append((rule.get("direction"), part.get("bone"), part.get("cube", 0), part.get("face")))
+        conditions.add(rule.get("condition"))
+    return rules, conditions
+
+
+def build_rule(rule: Rule, condition: str | None) -> dict[str, Any]:
+    direction, bone, cube, face = rule
+    entry: dict[str, Any] = {}
+    if condition is not None:
+        entry["condition"] = condition
+    entry["direction"] = direction
+    entry["geometry_part"] = {"bone": bone, "cube": cube, "face": face}
+    return entry
+
+
+def format_rule(rule: Rule) -> str:
+    direction, bone, cube, face = rule
+    return f"{direction}: {bone}[{cube}].{face}"
+
+
+def derive_all(plan: ChangePlan, use_cache: bool = True, write: bool = False) -> list[dict[str, Any]]:
+    geometries = index_geometries(plan)
+    usage = collect_culling_usage(plan)
+    cache = load_cache() if use_cache else {}
+    reports: list[dict[str, Any]] = []
+
+    for path in plan.glob(CULLING_DIR, "*.json"):
+        payload = plan.read_json(path)
+        identifier = payload.get("minecraft:block_culling_rules", {}).get("description", {}).get("identifier", "")
+        current, conditions = existing_rules(payload)
+        report: dict[str, Any] = {"path": plan.relative(path), "identifier": identifier, "current": len(current)}
+        reports.append(report)
+
+        geometry_ids, transformations = usage.get(identifier, (set(), []))
+        if len(geometry_ids) != 1:
+            report["skipped"] = "unreferenced" if not geometry_ids else f"shared by geometries {sorted(geometry_ids)}"
+            continue
+        geometry_id = next(iter(geometry_ids))
+        geometry = geometries.get(geometry_id)
+        if geometry is None:
+            report["skipped"] = f"{geometry_id} is not defined in {plan.relative(MODELS_DIR)}"
+            continue
+
+        key = geometry_cache_key(geometry, transformations)
+        if key in cache:
+            derived = [tuple(rule) for rule in cache[key]]
+        else:
+            derived = derive_rules(geometry, transformations)
+            cache[key] = [list(rule) for rule in derived]
+
+        report["geometry"] = geometry_id
+        report["derived"] = len(derived)
+        report["missing"] = [format_rule(rule) for rule in derived if rule not in current]
+        report["unsafe"] = [format_rule(rule) for rule in current if rule not in derived]
+
+        if write and derived != current and derived:
+            condition = next(iter(conditions)) if len(conditions) == 1 else None
+            payload["minecraft:block_culling_rules"]["rules"] = [build_rule(rule, condition) for rule in derived]
+            plan.write_json(path, payload)
+
+    if use_cache:
+        save_cache(cache)
+    return reports
+
+
+def main() -> int:
+    args = parse_args()
+    plan = ChangePlan()
+    reports = derive_all(plan, use_cache=not args.no_cache, write=args.write)
+
+    for report in reports:
+        print(f"{report['path']} ({report['identifier']})")
+        if "skipped" in report:
+            print(f"  skipped: {report['skipped']}")
+            continue
+        print(f"  geometry: {report['geometry']}")
+        print(f"  rules: {report['current']} current, {report['derived']} derived")
+        for rule in report["missing"]:
+            print(f"  missing {rule}")
+        for rule in report["unsafe"]:
+            print(f"  unsafe  {rule}")
+
+    if not args.write:
+        return 1 if any(report.get("unsafe") for report in reports) else 0
+
+    if args.dry_run:
+        print_plan(plan, show_diff=args.show_diff)
+        print("Dry run enabled. No files were changed.")
+        return 0
+
+    applied = plan.apply()
+    print("Applied changes:")
+    for action, count in applied.items():
+        print(f"- {action}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+"""
+Token-based durability profiles shared by the glass, uniform and custom generators.
+
+Identifiers are split into `_` tokens (namespace dropped) and matched against rules
+keyed by token sequences, e.g. ("hitch", "cross"). The rules are compiled once into
+a trie, so resolving an identifier walks each token position at most as deep as the
+longest rule. When several rules match, the winner is picked deterministically:
+highest priority, then the longest token sequence, then the earliest position.
+Whole tokens are matched, so "clean" does not match inside "unclean".
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+TIER_TAG_SUFFIX = "_tier_destructible"
+
+
+@dataclass(frozen=True)
+class DurabilityProfile:
+    seconds_to_destroy: float
+    # None makes the block immune to explosions (`destructible_by_explosion: false`).
+    explosion_resistance: float | None
+    # Replaces any `tag:minecraft:*_tier_destructible` tag when set.
+    tier_tag: str | None = None
+
+
+@dataclass(frozen=True)
+class DurabilityRule:
+    tokens: tuple[str, ...]
+    priority: int
+    profile: DurabilityProfile
+
+
+class ProfileResolver:
+    def __init__(self, rules: list[DurabilityRule], default: DurabilityProfile | None = None) -> None:
+        self.default = default
+        self._trie: dict[str, Any] = {}
+        for rule in rules:
+            node = self._trie
+            for token in rule.tokens:
+                node = node.setdefault(token, {})
+            if "" in node:
+                raise ValueError(f"Duplicate durability rule: {'_'.join(rule.tokens)}")
+            # Tokens are never empty, so "" marks the end of a rule.
+            node[""] = rule
+
+    def match(self, identifier: str) -> DurabilityRule | None:
+        tokens = tokenize(identifier)
+        best: tuple[int, int, int] | None = None
+        best_rule: DurabilityRule | None = None
+        for start in range(len(tokens)):
+            node = self._trie
+            for position in range(start, len(tokens)):
+                node = node.get(tokens[position])
+                if node is None:
+                    break
+                rule = node.get("")
+                if rule is None:
+                    continue
+                rank = (rule.priority, len(rule.tokens), -start)
+                if best is None or rank > best:
+                    best, best_rule = rank, rule
+        return best_rule
+
+    def resolve(self, identifier: str) -> DurabilityProfile | None:
+        rule = self.match(identifier)
+        return rule.profile if rule is not None else self.default
+
+
+def tokenize(identifier: str) -> list[str]:
+    name = identifier.split(":", 1)[-1]
+    return [token for token in name.split("_") if token]
+
+
+def apply_durability(components: dict[str, Any], profile: DurabilityProfile) -> None:
+    components["minecraft:destructible_by_mining"] = {"seconds_to_destroy": profile.seconds_to_destroy}
+    if profile.explosion_resistance is None:
+        components["minecraft:destructible_by_explosion"] = False
+    else:
+        components["minecraft:destructible_by_explosion"] = {"explosion_resistance": profile.explosion_resistance}
+
+    if profile.tier_tag is not None:
+        for key in [key for key in components if key.startswith("tag:minecraft:") and key.endswith(TIER_TAG_SUFFIX)]:
+            del components[key]
+        components[f"tag:{profile.tier_tag}"] = {}
+
+
+# Glass: the sturdier style wins when a name carries several style tokens.
+GLASS_RESOLVER = ProfileResolver(
+    [
+        DurabilityRule(("tempered",), 60, DurabilityProfile(1.2, 6.0)),
+        DurabilityRule(("clean",), 50, DurabilityProfile(0.12, 0.35)),
+        DurabilityRule(("clear",), 50, DurabilityProfile(0.12, 0.35)),
+        DurabilityRule(("broadline",), 40, DurabilityProfile(0.22, 0.7)),
+        DurabilityRule(("hitch", "cross"), 30, DurabilityProfile(0.28, 1.0)),
+        DurabilityRule(("stained",), 20, DurabilityProfile(0.18, 0.5)),
+    ],
+    default=DurabilityProfile(0.2, 0.6),
+)
+
+# Stone: only materials that differ from their template's durability need a rule.
+STONE_RESOLVER = ProfileResolver(
+    [
+        DurabilityRule(("obsidian",), 100, DurabilityProfile(40, None, "minecraft:diamond_tier_destructible")),
+    ]
+)
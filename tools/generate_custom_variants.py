@@ -1,193 +1,219 @@
 from __future__ import annotations
 
+"""
+Expand the custom material x shape matrix into blocks, culling, recipes, catalog and lang.
+
+tools/custom_variant_matrix.json declares the shapes (template folder, recipe count,
+catalog group, per-locale labels) and the materials (per-locale labels, durability
+profile, and optionally which outputs to emit per shape). Every shape template is
+read once; a single pass over the matrix then plans every output:
+- block: the template material's block with identifier, texture, culling and
+  durability swapped in;
+- culling: a per-material copy of the template culling (per-block mode only; in
+  shared mode blocks point at the shared rule set);
+- recipe: a stonecutter recipe from the material's base block;
+- catalog: membership of the shape's catalog group;
+- lang: the block name in every locale plus the group labels.
+Outputs default to all of them; materials whose variants predate the matrix list
+the outputs that are still generated for them.
+
+Adding a material is one line in the matrix.
+
+Examples
+--------
+- python tools/generate_custom_variants.py --dry-run
+- python tools/generate_custom_variants.py --dry-run --show-diff
+- python tools/generate_custom_variants.py
+"""
+
+import argparse
 import copy
 import json
+from dataclasses import dataclass, field
 from pathlib import Path
-
-ROOT = Path(__file__).resolve().parents[1]
-BP_ROOT = ROOT / "BP"
-RP_ROOT = ROOT / "RP"
+from typing import Any, Callable
+
+from change_plan import ChangePlan, print_plan
+from crafting_catalog import CraftingCatalog
+from durability_profiles import STONE_RESOLVER, apply_durability
+from generate_sound_events import update_sound_events_script
+from generate_uniform_variants import (
+    culling_identifier,
+    detect_culling_mode,
+    detect_recipe_layout,
+    load_vanilla_name_map,
+    localize_block_name_from_identifier,
+    stonecutter_recipe_exists,
+    stonecutter_recipe_path,
+    variant_filename,
+)
+from locale_engine import LocalePlugin, iter_locales
+from pack_io import ROOT, RP_ROOT
+
+MATRIX_PATH = ROOT / "tools/custom_variant_matrix.json"
+CULLING_DIR = RP_ROOT / "block_culling"
+# Labels of locales the matrix does not translate fall back to this locale (groups) or to
+# the locale plugin's generated block name (blocks).
+FALLBACK_LOCALE = "en_US"
 
 NAMESPACE = "dorios_atelier"
 LEGACY_NAMESPACE = "utilitycraft"
 GROUP_NAMESPACE = "dorios_atelier"
 LEGACY_GROUP_NAMESPACE = "dorios"
 
-MATERIALS_NEW = ["blackstone", "calcite", "diorite", "dripstone", "granite", "obsidian", "tuff"]
-MATERIALS_ALL = ["andesite", "basalt", *MATERIALS_NEW]
-
-
-def read_json(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
-def write_json(path: Path, payload: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=4) + "\n", encoding="utf-8")
-
-
-def configure_obsidian_common_components(components: dict) -> None:
-    components["minecraft:destructible_by_mining"] = {"seconds_to_destroy": 40}
-    components["minecraft:destructible_by_explosion"] = False
-    if "tag:minecraft:stone_tier_destructible" in components:
-        del components["tag:minecraft:stone_tier_destructible"]
-    components["tag:minecraft:diamond_tier_destructible"] = {}
-
-
-def generate_vertical_slabs() -> None:
-    template_path = BP_ROOT / "blocks/decorative/vertical_slabs/andesite_tiles_vslab.json"
-    template = read_json(template_path)
-
-    for material in MATERIALS_NEW:
-        data = copy.deepcopy(template)
-        block = data["minecraft:block"]
-        block["description"]["identifier"] = f"{NAMESPACE}:{material}_tiles_vertical_slab"
-        block["components"]["minecraft:material_instances"]["*"]["texture"] = f"utilitycraft_{material}_tiles"
-
-        if material == "obsidian":
-            configure_obsidian_common_components(block["components"])
-
-        out_path = BP_ROOT / f"blocks/decorative/vertical_slabs/{material}_tiles_vslab.json"
-        write_json(out_path, data)
-
-
-def generate_three_step_stairs() -> None:
-    template_path = BP_ROOT / "blocks/decorative/unique_stairs/andesite_tiles_tss.json"
-    template = read_json(template_path)
-
-    for material in MATERIALS_ALL:
-        data = copy.deepcopy(template)
-        block = data["minecraft:block"]
-        block["description"]["identifier"] = f"{NAMESPACE}:{material}_tiles_three_steps_stairs"
-        block["description"]["menu_category"] = {"category": "construction"}
-        block["components"]["minecraft:geometry"]["culling"] = f"{NAMESPACE}:culling.{material}_tiles_three_steps_stairs"
-        block["components"]["minecraft:material_instances"]["*"]["texture"] = f"utilitycraft_{material}_tiles"
-
-        if material == "obsidian":
-            configure_obsidian_common_components(block["components"])
-
-        out_path = BP_ROOT / f"blocks/decorative/unique_stairs/{material}_tiles_tss.json"
-        write_json(out_path, data)
-
-
-def generate_three_step_culling() -> None:
-    template_path = RP_ROOT / "block_culling/andesite_tiles_tss.json"
-    template = read_json(template_path)
-
-    for material in MATERIALS_NEW:
-        data = copy.deepcopy(template)
-        data["minecraft:block_culling_rules"]["description"]["identifier"] = (
-            f"{NAMESPACE}:culling.{material}_tiles_three_steps_stairs"
+OUTPUT_KINDS = ("block", "culling", "recipe", "catalog", "lang")
+
+
+@dataclass
+class ShapeSpec:
+    name: str
+    block_dir: Path
+    recipe_count: int
+    catalog_group: str
+    group_labels: dict[str, str]
+    labels: dict[str, str]
+    menu_category: dict[str, Any] | None = None
+    culling: bool = False
+
+
+@dataclass
+class MaterialSpec:
+    name: str
+    labels: dict[str, str] = field(default_factory=dict)
+    durability: str | None = None
+    outputs: dict[str, list[str]] = field(default_factory=dict)
+
+    def emits(self, shape: str, kind: str) -> bool:
+        return kind in self.outputs.get(shape, OUTPUT_KINDS)
+
+
+@dataclass
+class VariantMatrix:
+    base: str
+    template_material: str
+    shapes: list[ShapeSpec]
+    materials: list[MaterialSpec]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate custom tile variants from tools/custom_variant_matrix.json.")
+    parser.add_argument("--matrix", type=Path, default=MATRIX_PATH, help="Matrix file to expand.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the planned changes without touching files.")
+    parser.add_argument("--show-diff", action="store_true", help="With --dry-run, print a unified diff for every change.")
+    return parser.parse_args()
+
+
+def load_matrix(path: Path = MATRIX_PATH) -> VariantMatrix:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    shapes = [
+        ShapeSpec(
+            name=name,
+            block_dir=ROOT / spec["block_dir"],
+            recipe_count=spec["recipe_count"],
+            catalog_group=spec["catalog_group"],
+            group_labels=spec["group_labels"],
+            labels=spec["labels"],
+            menu_category=spec.get("menu_category"),
+            culling=spec.get("culling", False),
         )
-        out_path = RP_ROOT / f"block_culling/{material}_tiles_tss.json"
-        write_json(out_path, data)
-
-
-def make_stonecutter_recipe(material: str, variant: str, count: int) -> dict:
-    # variant: "three_steps_stairs" | "vertical_slab"
+        for name, spec in payload["shapes"].items()
+    ]
+    materials = [
+        MaterialSpec(
+            name=name,
+            labels=spec.get("labels", {}),
+            durability=spec.get("durability"),
+            outputs=spec.get("outputs", {}),
+        )
+        for name, spec in payload["materials"].items()
+    ]
+    return VariantMatrix(payload["base"], payload["template_material"], shapes, materials)
+
+
+def make_variant_block(
+    template: dict,
+    matrix: VariantMatrix,
+    shape: ShapeSpec,
+    material: MaterialSpec,
+    culling_mode: str,
+) -> dict:
+    base_name = f"{material.name}_{matrix.base}"
+    data = copy.deepcopy(template)
+    block = data["minecraft:block"]
+    block["description"]["identifier"] = f"{NAMESPACE}:{base_name}_{shape.name}"
+    if shape.menu_category is not None:
+        block["description"]["menu_category"] = copy.deepcopy(shape.menu_category)
+    if shape.culling:
+        block["components"]["minecraft:geometry"]["culling"] = culling_identifier(base_name, shape.name, culling_mode)
+    block["components"]["minecraft:material_instances"]["*"]["texture"] = f"{LEGACY_NAMESPACE}_{base_name}"
+
+    if material.durability is not None:
+        profile = STONE_RESOLVER.resolve(material.durability)
+        if profile is None:
+            raise ValueError(f"Unknown durability profile for {material.name}: {material.durability}")
+        apply_durability(block["components"], profile)
+    return data
+
+
+def make_variant_culling(template: dict, base_name: str, shape: str) -> dict:
+    data = copy.deepcopy(template)
+    data["minecraft:block_culling_rules"]["description"]["identifier"] = f"{NAMESPACE}:culling.{base_name}_{shape}"
+    return data
+
+
+def make_stonecutter_recipe(base_name: str, variant: str, count: int) -> dict:
     return {
         "format_version": "1.21.100",
         "minecraft:recipe_shapeless": {
             "description": {
-                "identifier": f"{NAMESPACE}:sc_{material}_tiles_{variant}_from_{material}_tiles"
+                "identifier": f"{NAMESPACE}:sc_{base_name}_{variant}_from_{base_name}"
             },
             "tags": ["stonecutter"],
-            "ingredients": [{"item": f"{NAMESPACE}:{material}_tiles"}],
-            "result": {"item": f"{NAMESPACE}:{material}_tiles_{variant}", "count": count},
-            "unlock": [{"item": f"{NAMESPACE}:{material}_tiles"}],
+            "ingredients": [{"item": f"{NAMESPACE}:{base_name}"}],
+            "result": {"item": f"{NAMESPACE}:{base_name}_{variant}", "count": count},
+            "unlock": [{"item": f"{NAMESPACE}:{base_name}"}],
         },
     }
 
 
-def generate_custom_recipes() -> None:
-    base_dir = BP_ROOT / "recipes/stonecutter"
-    base_dir.mkdir(parents=True, exist_ok=True)
-
-    for material in MATERIALS_NEW:
-        three_steps = make_stonecutter_recipe(material, "three_steps_stairs", 1)
-        vertical = make_stonecutter_recipe(material, "vertical_slab", 2)
-
-        write_json(base_dir / f"{material}_tiles_tss_from_{material}_tiles.json", three_steps)
-        write_json(base_dir / f"{material}_tiles_vslab_from_{material}_tiles.json", vertical)
+def update_catalog(matrix: VariantMatrix, plan: ChangePlan) -> None:
+    catalog = CraftingCatalog.for_plan(plan)
 
-
-def update_catalog() -> None:
-    path = BP_ROOT / "item_catalog/crafting_item_catalog.json"
-    data = read_json(path)
-
-    construction = next(
-        c for c in data["minecraft:crafting_items_catalog"]["categories"] if c["category_name"] == "construction"
-    )
-    groups = construction["groups"]
-
-    valid_stone_groups = {
+    shape_suffixes = tuple(f"_{matrix.base}_{shape.name}" for shape in matrix.shapes)
+    stone_group = catalog.group(
+        "construction",
         f"{GROUP_NAMESPACE}:itemGroup.name.stoneBricks",
         f"{LEGACY_GROUP_NAMESPACE}:itemGroup.name.stoneBricks",
-    }
-    stone_group = next(g for g in groups if g["group_identifier"]["name"] in valid_stone_groups)
-    stone_group["items"] = [
-        item
-        for item in stone_group["items"]
-        if not item.endswith("_tiles_vertical_slab") and not item.endswith("_tiles_three_steps_stairs")
-    ]
-
-    def merge_or_create_group(
-        primary_name: str,
-        legacy_name: str,
-        icon: str,
-        required_items: list[str],
-    ) -> None:
-        group = next(
-            (
-                g
-                for g in groups
-                if g.get("group_identifier", {}).get("name") in {primary_name, legacy_name}
-            ),
-            None,
+    )
+    if stone_group is None:
+        raise LookupError("Stone bricks catalog group not found.")
+    catalog.remove_items(stone_group, [item for item in stone_group["items"] if item.endswith(shape_suffixes)])
+
+    for shape in matrix.shapes:
+        primary_name = f"{GROUP_NAMESPACE}:itemGroup.name.{shape.catalog_group}"
+        icon = f"{NAMESPACE}:{matrix.template_material}_{matrix.base}_{shape.name}"
+        group = catalog.group(
+            "construction",
+            primary_name,
+            f"{LEGACY_GROUP_NAMESPACE}:itemGroup.name.{shape.catalog_group}",
         )
-
         if group is None:
-            group = {
-                "group_identifier": {
-                    "icon": icon,
-                    "name": primary_name,
-                },
-                "items": [],
-            }
-            groups.append(group)
-
-        group_identifier = group.setdefault("group_identifier", {})
-        group_identifier["icon"] = icon
-        group_identifier["name"] = primary_name
-
-        existing_items = list(group.get("items", []))
-        existing_set = set(existing_items)
-        for item in required_items:
-            if item not in existing_set:
-                existing_items.append(item)
-                existing_set.add(item)
-        group["items"] = existing_items
-
-    merge_or_create_group(
-        primary_name=f"{GROUP_NAMESPACE}:itemGroup.name.verticalSlabs",
-        legacy_name=f"{LEGACY_GROUP_NAMESPACE}:itemGroup.name.verticalSlabs",
-        icon=f"{NAMESPACE}:andesite_tiles_vertical_slab",
-        required_items=[f"{NAMESPACE}:{m}_tiles_vertical_slab" for m in MATERIALS_ALL],
-    )
-
-    merge_or_create_group(
-        primary_name=f"{GROUP_NAMESPACE}:itemGroup.name.threeStepStairs",
-        legacy_name=f"{LEGACY_GROUP_NAMESPACE}:itemGroup.name.threeStepStairs",
-        icon=f"{NAMESPACE}:andesite_tiles_three_steps_stairs",
-        required_items=[f"{NAMESPACE}:{m}_tiles_three_steps_stairs" for m in MATERIALS_ALL],
-    )
+            group = catalog.add_group("construction", primary_name, icon)
+        catalog.set_identifier("construction", group, primary_name, icon)
+        catalog.add_items(
+            group,
+            [
+                f"{NAMESPACE}:{material.name}_{matrix.base}_{shape.name}"
+                for material in matrix.materials
+                if material.emits(shape.name, "catalog")
+            ],
+        )
 
-    construction["groups"] = groups
-    write_json(path, data)
+    catalog.save(plan)
 
 
-def ensure_lang_entries(path: Path, entries: dict[str, str]) -> None:
-    text = path.read_text(encoding="utf-8")
+def ensure_lang_entries(path: Path, entries: dict[str, str], plan: ChangePlan) -> None:
+    text = plan.read_text(path)
     lines = text.splitlines()
     existing = {line.split("=", 1)[0] for line in lines if "=" in line and not line.startswith("##")}
 
@@ -200,80 +226,106 @@ def ensure_lang_entries(path: Path, entries: dict[str, str]) -> None:
     if text and not text.endswith("\n\n"):
         text += "\n"
     text += "\n".join(additions) + "\n"
-    path.write_text(text, encoding="utf-8")
-
-
-def update_lang_files() -> None:
-    en_material = {
-        "blackstone": "Blackstone",
-        "calcite": "Calcite",
-        "diorite": "Diorite",
-        "dripstone": "Dripstone",
-        "granite": "Granite",
-        "obsidian": "Obsidian",
-        "tuff": "Tuff",
-    }
-    pt_material = {
-        "blackstone": "Pedra-Negra",
-        "calcite": "Calcita",
-        "diorite": "Diorito",
-        "dripstone": "Espeleotema",
-        "granite": "Granito",
-        "obsidian": "Obsidiana",
-        "tuff": "Tufo",
-    }
-    es_material = {
-        "blackstone": "Blackstone",
-        "calcite": "Calcita",
-        "diorite": "Diorita",
-        "dripstone": "Dripstone",
-        "granite": "Granito",
-        "obsidian": "Obsidiana",
-        "tuff": "Tufo",
-    }
-
-    en_entries: dict[str, str] = {
-        f"{GROUP_NAMESPACE}:itemGroup.name.threeStepStairs": "Three-Step Stairs",
-        f"{GROUP_NAMESPACE}:itemGroup.name.verticalSlabs": "Vertical Slabs",
-    }
-    pt_entries: dict[str, str] = {
-        f"{GROUP_NAMESPACE}:itemGroup.name.threeStepStairs": "Escadas de Três Degraus",
-        f"{GROUP_NAMESPACE}:itemGroup.name.verticalSlabs": "Lajes Verticais",
-    }
-    es_entries: dict[str, str] = {
-        f"{GROUP_NAMESPACE}:itemGroup.name.threeStepStairs": "Escaleras de Tres Peldaños",
-        f"{GROUP_NAMESPACE}:itemGroup.name.verticalSlabs": "Losas Verticales",
-    }
+    plan.write_text(path, text)
 
-    for material, label in en_material.items():
-        en_entries[f"tile.{NAMESPACE}:{material}_tiles_vertical_slab.name"] = f"{label} Tiles Vertical Slab"
-        en_entries[f"tile.{NAMESPACE}:{material}_tiles_three_steps_stairs.name"] = f"{label} Tiles Three-Step Stairs"
 
-    for material, label in pt_material.items():
-        pt_entries[f"tile.{NAMESPACE}:{material}_tiles_vertical_slab.name"] = f"Laje Vertical de Ladrilhos de {label}"
-        pt_entries[f"tile.{NAMESPACE}:{material}_tiles_three_steps_stairs.name"] = (
-            f"Escada de Três Degraus de Ladrilhos de {label}"
+def build_lang_entries(matrix: VariantMatrix, locale: LocalePlugin) -> dict[str, str]:
+    code = locale.code
+    entries = {
+        f"{GROUP_NAMESPACE}:itemGroup.name.{shape.catalog_group}": shape.group_labels.get(
+            code, shape.group_labels[FALLBACK_LOCALE]
         )
-
-    for material, label in es_material.items():
-        es_entries[f"tile.{NAMESPACE}:{material}_tiles_vertical_slab.name"] = f"Losa Vertical de Losetas de {label}"
-        es_entries[f"tile.{NAMESPACE}:{material}_tiles_three_steps_stairs.name"] = (
-            f"Escalera de Tres Peldaños de Losetas de {label}"
-        )
-
-    ensure_lang_entries(RP_ROOT / "texts/en_US.lang", en_entries)
-    ensure_lang_entries(RP_ROOT / "texts/pt_BR.lang", pt_entries)
-    ensure_lang_entries(RP_ROOT / "texts/es_MX.lang", es_entries)
-
-
-def main() -> None:
-    generate_vertical_slabs()
-    generate_three_step_stairs()
-    generate_three_step_culling()
-    generate_custom_recipes()
-    update_catalog()
-    update_lang_files()
+        for shape in matrix.shapes
+    }
+    vanilla_name_map: dict[str, str] | None = None
+    for material in matrix.materials:
+        for shape in matrix.shapes:
+            if not material.emits(shape.name, "lang"):
+                continue
+            block_name = f"{material.name}_{matrix.base}_{shape.name}"
+            if code in material.labels and code in shape.labels:
+                label = shape.labels[code].format(material=material.labels[code])
+            else:
+                if vanilla_name_map is None:
+                    vanilla_name_map = load_vanilla_name_map(locale.vanilla_name_list)
+                label = localize_block_name_from_identifier(block_name, locale, {}, vanilla_name_map)
+            entries[f"tile.{NAMESPACE}:{block_name}.name"] = label
+    return entries
+
+
+def expand_matrix(matrix: VariantMatrix, plan: ChangePlan) -> dict[str, int]:
+    culling_mode = detect_culling_mode(plan)
+    recipe_layout = detect_recipe_layout(plan)
+    template_base = f"{matrix.template_material}_{matrix.base}"
+    stats = {kind: 0 for kind in OUTPUT_KINDS}
+
+    for shape in matrix.shapes:
+        block_template = plan.read_json(shape.block_dir / variant_filename(template_base, shape.name))
+        culling_template = None
+        if shape.culling and culling_mode != "shared":
+            culling_template = plan.read_json(CULLING_DIR / variant_filename(template_base, shape.name))
+
+        for material in matrix.materials:
+            base_name = f"{material.name}_{matrix.base}"
+            file_name = variant_filename(base_name, shape.name)
+
+            if material.emits(shape.name, "block"):
+                block = make_variant_block(block_template, matrix, shape, material, culling_mode)
+                plan.write_json(shape.block_dir / file_name, block)
+                stats["block"] += 1
+
+            if culling_template is not None and material.emits(shape.name, "culling"):
+                plan.write_json(CULLING_DIR / file_name, make_variant_culling(culling_template, base_name, shape.name))
+                stats["culling"] += 1
+
+            if material.emits(shape.name, "recipe"):
+                recipe_name = file_name.replace(".json", f"_from_{base_name}.json")
+                recipe = make_stonecutter_recipe(base_name, shape.name, shape.recipe_count)
+                # Rewrite the recipe where it already lives (flat or sharded), else follow the layout.
+                if plan.exists(stonecutter_recipe_path(recipe_name, "sharded")):
+                    recipe_path = stonecutter_recipe_path(recipe_name, "sharded")
+                elif stonecutter_recipe_exists(recipe_name, plan):
+                    recipe_path = stonecutter_recipe_path(recipe_name, "flat")
+                else:
+                    recipe_path = stonecutter_recipe_path(recipe_name, recipe_layout)
+                plan.write_json(recipe_path, recipe)
+                stats["recipe"] += 1
+
+            stats["catalog"] += material.emits(shape.name, "catalog")
+            stats["lang"] += material.emits(shape.name, "lang")
+
+    update_catalog(matrix, plan)
+    for locale in iter_locales():
+        if plan.exists(locale.lang_path):
+            ensure_lang_entries(locale.lang_path, build_lang_entries(matrix, locale), plan)
+    update_sound_events_script(plan)
+    return stats
+
+
+def pipeline_stage(plan: ChangePlan, args: argparse.Namespace) -> tuple[dict[str, Any], Callable[[], None] | None]:
+    return expand_matrix(load_matrix(), plan), None
+
+
+def main() -> int:
+    args = parse_args()
+    plan = ChangePlan()
+    stats = expand_matrix(load_matrix(args.matrix), plan)
+
+    print("Custom variant summary:")
+    for kind, count in stats.items():
+        print(f"- {kind}: {count}")
+
+    if args.dry_run:
+        print_plan(plan, show_diff=args.show_diff)
+        print("Dry run enabled. No files were changed.")
+        return 0
+
+    applied = plan.apply()
+    print("Applied changes:")
+    for action, count in applied.items():
+        print(f"- {action}: {count}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
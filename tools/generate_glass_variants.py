@@ -1,59 +1,122 @@
 from __future__ import annotations
 
+"""
+Generate custom glass blocks from the textures in RP/textures/blocks/glass.
+
+Every texture becomes a full glass block (blocks.json, terrain_texture.json, catalog
+group and lang entries included). Connected glass needs no extra variant: all glass
+blocks share the `custom_glass` culling rules, which drop faces between two blocks
+of the same glass so neighbouring blocks render as one pane of glass.
+
+Runs are incremental: the sha1 of every texture is stored in
+tools/generated/glass_texture_hashes.json, and only new or changed textures (or
+textures whose block file went missing) are regenerated. Changing the generator's
+templates invalidates the store. Shared files are only written when their content
+changes. Use --full to regenerate everything.
+
+With --panes, every texture also gets a `<name>_pane` block: a thin pane built on
+the `minecraft:connection` trait (arms shown towards connected neighbours), its own
+geometry, a 6 glass -> 16 panes recipe and a catalog group.
+
+BP/scripts/glass_cycles.generated.js is rebuilt from the full texture list on every
+run: each color's vanilla glass followed by its styles (stained, clean, broadline,
+hitch cross, tempered), with next/previous links for the glass cutter.
+
+Examples
+--------
+- python tools/generate_glass_variants.py
+- python tools/generate_glass_variants.py --dry-run --show-diff
+- python tools/generate_glass_variants.py --panes
+- python tools/generate_glass_variants.py --full
+"""
+
+import argparse
+import hashlib
 import json
 from pathlib import Path
+from typing import Any, Callable
 
-ROOT = Path(__file__).resolve().parents[1]
-BP_ROOT = ROOT / "BP"
-RP_ROOT = ROOT / "RP"
+from change_plan import ChangePlan, print_plan
+from crafting_catalog import CraftingCatalog
+from durability_profiles import GLASS_RESOLVER, DurabilityProfile
+from generate_sound_events import update_sound_events_script
+from locale_engine import iter_locales
+from pack_io import ROOT, BP_ROOT, RP_ROOT
 
 NAMESPACE = "dorios_atelier"
 GLASS_TEXTURE_DIR = RP_ROOT / "textures/blocks/glass"
-GLASS_BLOCK_DIR = BP_ROOT / "blocks/decorative/entire_blocks/Glass"
+ENTIRE_BLOCKS_DIR = BP_ROOT / "blocks/decorative/entire_blocks"
+GLASS_BLOCK_DIR = ENTIRE_BLOCKS_DIR / "Base"
+PANE_BLOCK_DIR = BP_ROOT / "blocks/decorative/panes"
+PANE_RECIPE_DIR = BP_ROOT / "recipes/crafting_table/glass_type"
+PANE_GEOMETRY_PATH = RP_ROOT / "models/blocks/glass_pane.geo.json"
 BLOCKS_JSON_PATH = RP_ROOT / "blocks.json"
 TERRAIN_TEXTURE_PATH = RP_ROOT / "textures/terrain_texture.json"
-CATALOG_PATH = BP_ROOT / "item_catalog/crafting_item_catalog.json"
 CULLING_PATH = RP_ROOT / "block_culling/custom_glass.json"
-LANG_PATHS = {
-    "en_US": RP_ROOT / "texts/en_US.lang",
-    "pt_BR": RP_ROOT / "texts/pt_BR.lang",
-    "es_MX": RP_ROOT / "texts/es_MX.lang",
-}
+CYCLE_SCRIPT_PATH = BP_ROOT / "scripts/glass_cycles.generated.js"
+HASH_STORE_PATH = ROOT / "tools/generated/glass_texture_hashes.json"
+HASH_STORE_FORMAT_VERSION = 1
+# Locales without their own group label or pane format use this locale's.
+FALLBACK_LOCALE = "en_US"
 
 GROUP_KEY = f"{NAMESPACE}:itemGroup.name.customGlass"
-
-
-GLASS_DURABILITY_PROFILES = {
-    "tempered": {"seconds_to_destroy": 1.2, "explosion_resistance": 6.0},
-    "clean": {"seconds_to_destroy": 0.12, "explosion_resistance": 0.35},
-    "clear": {"seconds_to_destroy": 0.12, "explosion_resistance": 0.35},
-    "broadline": {"seconds_to_destroy": 0.22, "explosion_resistance": 0.7},
-    "hitch_cross": {"seconds_to_destroy": 0.28, "explosion_resistance": 1.0},
-    "stained": {"seconds_to_destroy": 0.18, "explosion_resistance": 0.5},
+PANE_GROUP_KEY = f"{NAMESPACE}:itemGroup.name.customGlassPanes"
+GROUP_LABELS = {
+    GROUP_KEY: {"en_US": "Custom Glass", "pt_BR": "Vidros Personalizados", "es_MX": "Vidrios Personalizados"},
+    PANE_GROUP_KEY: {
+        "en_US": "Custom Glass Panes",
+        "pt_BR": "Painéis de Vidro Personalizados",
+        "es_MX": "Paneles de Vidrio Personalizados",
+    },
 }
+PANE_LABEL_FORMATS = {"en_US": "{label} Pane", "pt_BR": "Painel de {label}", "es_MX": "Panel de {label}"}
+
+PANE_FORMAT_VERSION = "1.26.0"
+PANE_GEOMETRY_ID = f"geometry.{NAMESPACE}_glass_pane"
+PANE_DIRECTIONS = ("north", "south", "west", "east")
+# Collision box per arm, in block space (origin / size), matching the geometry below.
+PANE_ARM_BOXES = {
+    "north": ([-1, 0, -8], [2, 16, 7]),
+    "south": ([-1, 0, 1], [2, 16, 7]),
+    "west": ([-8, 0, -1], [7, 16, 2]),
+    "east": ([1, 0, -1], [7, 16, 2]),
+}
+PANE_POST_BOX = ([-1, 0, -1], [2, 16, 2])
 
-
-def resolve_glass_profile(identifier_suffix: str) -> dict[str, float]:
-    for marker, profile in GLASS_DURABILITY_PROFILES.items():
-        if marker in identifier_suffix:
-            return profile
-    return {"seconds_to_destroy": 0.2, "explosion_resistance": 0.6}
+# Glass cutter cycle: styles in cutting order, matched by texture name suffix.
+GLASS_STYLE_SUFFIXES = (
+    ("stained", ("stained_glass",)),
+    ("clean", ("clean_glass", "clear_glass")),
+    ("broadline", ("broadline_glass",)),
+    ("hitch_cross", ("hitch_cross_glass",)),
+    ("tempered", ("tempered_glass",)),
+)
+# Texture color -> vanilla stained glass color, where the names differ.
+VANILLA_GLASS_COLORS = {"silver": "light_gray", "lima": "lime"}
 
 
-def read_json(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate custom glass blocks (and optional panes) from glass textures.")
+    parser.add_argument("--full", action="store_true", help="Ignore the texture hash store and regenerate every block.")
+    parser.add_argument("--panes", action="store_true", help="Also generate a connecting pane block for every texture.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the planned changes without touching files.")
+    parser.add_argument("--show-diff", action="store_true", help="With --dry-run, print a unified diff for every change.")
+    return parser.parse_args()
 
 
-def write_json(path: Path, payload: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=4) + "\n", encoding="utf-8")
+def resolve_glass_profile(identifier_suffix: str) -> DurabilityProfile:
+    return GLASS_RESOLVER.resolve(identifier_suffix)
 
 
-def collect_glass_texture_names() -> list[str]:
-    names = sorted(p.stem for p in GLASS_TEXTURE_DIR.glob("*.png"))
+def collect_glass_texture_names(plan: ChangePlan) -> list[str]:
+    names = sorted(p.stem for p in plan.glob(GLASS_TEXTURE_DIR, "*.png"))
     return [name for name in names if "pane" not in name]
 
 
+def texture_sha1(name: str) -> str:
+    return hashlib.sha1((GLASS_TEXTURE_DIR / f"{name}.png").read_bytes()).hexdigest()
+
+
 def make_glass_block(identifier_suffix: str, texture_key: str) -> dict:
     profile = resolve_glass_profile(identifier_suffix)
     return {
@@ -81,10 +144,10 @@ def make_glass_block(identifier_suffix: str, texture_key: str) -> dict:
                     }
                 },
                 "minecraft:destructible_by_mining": {
-                    "seconds_to_destroy": profile["seconds_to_destroy"]
+                    "seconds_to_destroy": profile.seconds_to_destroy
                 },
                 "minecraft:destructible_by_explosion": {
-                    "explosion_resistance": profile["explosion_resistance"]
+                    "explosion_resistance": profile.explosion_resistance
                 },
                 "minecraft:loot": "loot_tables/empty.json",
                 "tag:dorios_atelier:breakable_by_cutter": {}
@@ -93,15 +156,196 @@ def make_glass_block(identifier_suffix: str, texture_key: str) -> dict:
     }
 
 
+def pane_box(origin: list[int], size: list[int]) -> dict[str, list[int]]:
+    return {"origin": list(origin), "size": list(size)}
+
+
+def connection_state(direction: str) -> str:
+    return f"q.block_state('minecraft:connection_{direction}')"
+
+
+def make_pane_block(glass_name: str, texture_key: str) -> dict:
+    profile = resolve_glass_profile(glass_name)
+    post = pane_box(*PANE_POST_BOX)
+
+    # One permutation per connection combination, so the collision follows the arms.
+    permutations = []
+    for mask in range(1, 1 << len(PANE_DIRECTIONS)):
+        connected = [direction for bit, direction in enumerate(PANE_DIRECTIONS) if mask & (1 << bit)]
+        condition = " && ".join(
+            connection_state(direction) if direction in connected else f"!{connection_state(direction)}"
+            for direction in PANE_DIRECTIONS
+        )
+        boxes = [post] + [pane_box(*PANE_ARM_BOXES[direction]) for direction in connected]
+        permutations.append({"condition": condition, "components": {"minecraft:collision_box": boxes}})
+
+    return {
+        "format_version": PANE_FORMAT_VERSION,
+        "minecraft:block": {
+            "description": {
+                "identifier": f"{NAMESPACE}:{glass_name}_pane",
+                "menu_category": {
+                    "category": "construction"
+                },
+                "traits": {
+                    "minecraft:connection": {
+                        "enabled_states": ["minecraft:cardinal_connections"]
+                    }
+                }
+            },
+            "components": {
+                "minecraft:geometry": {
+                    "identifier": PANE_GEOMETRY_ID,
+                    "bone_visibility": {direction: connection_state(direction) for direction in PANE_DIRECTIONS}
+                },
+                "minecraft:light_dampening": 0,
+                "minecraft:light_emission": 0,
+                "minecraft:material_instances": {
+                    "*": {
+                        "texture": texture_key,
+                        "ambient_occlusion": 0.9,
+                        "face_dimming": True,
+                        "render_method": "blend"
+                    }
+                },
+                "minecraft:collision_box": [post],
+                "minecraft:selection_box": pane_box(*PANE_POST_BOX),
+                "minecraft:destructible_by_mining": {
+                    "seconds_to_destroy": profile.seconds_to_destroy
+                },
+                "minecraft:destructible_by_explosion": {
+                    "explosion_resistance": profile.explosion_resistance
+                },
+                "minecraft:loot": "loot_tables/empty.json",
+                "tag:dorios_atelier:breakable_by_cutter": {}
+            },
+            "permutations": permutations
+        }
+    }
+
+
+def pane_cube(origin: list[int], size: list[int], u: int) -> dict[str, Any]:
+    width_x, height, width_z = size
+    return {
+        "origin": origin,
+        "size": size,
+        "uv": {
+            "north": {"uv": [u, 0], "uv_size": [width_x, height]},
+            "east": {"uv": [u, 0], "uv_size": [width_z, height]},
+            "south": {"uv": [u, 0], "uv_size": [width_x, height]},
+            "west": {"uv": [u, 0], "uv_size": [width_z, height]},
+            "up": {"uv": [7, u], "uv_size": [width_x, width_z]},
+            "down": {"uv": [7, u], "uv_size": [width_x, width_z]},
+        },
+    }
+
+
+def make_pane_geometry() -> dict:
+    bones = [{"name": "post", "pivot": [0, 0, 0], "cubes": [pane_cube(*PANE_POST_BOX, 7)]}]
+    for direction in PANE_DIRECTIONS:
+        origin, size = PANE_ARM_BOXES[direction]
+        # Arms towards -x/-z sample the left half of the texture, the others the right half.
+        u = 0 if direction in ("north", "west") else 9
+        bones.append({"name": direction, "parent": "post", "pivot": [0, 0, 0], "cubes": [pane_cube(origin, size, u)]})
+    return {
+        "format_version": "1.12.0",
+        "minecraft:geometry": [
+            {
+                "description": {
+                    "identifier": PANE_GEOMETRY_ID,
+                    "texture_width": 16,
+                    "texture_height": 16,
+                    "visible_bounds_width": 2,
+                    "visible_bounds_height": 2.5,
+                    "visible_bounds_offset": [0, 0.75, 0],
+                },
+                "bones": bones,
+            }
+        ],
+    }
+
+
+def make_pane_recipe(glass_name: str) -> dict:
+    glass_id = f"{NAMESPACE}:{glass_name}"
+    return {
+        "format_version": "1.20.80",
+        "minecraft:recipe_shaped": {
+            "description": {
+                "identifier": f"{NAMESPACE}:craft_{glass_name}_pane"
+            },
+            "tags": [
+                "crafting_table"
+            ],
+            "pattern": [
+                "###",
+                "###"
+            ],
+            "key": {
+                "#": {
+                    "item": glass_id
+                }
+            },
+            "result": {
+                "item": f"{glass_id}_pane",
+                "count": 16
+            },
+            "unlock": [
+                {
+                    "item": glass_id
+                }
+            ]
+        }
+    }
+
+
+def generator_signature(panes: bool) -> str:
+    # Any template change regenerates every block on the next run.
+    probe = {"glass": make_glass_block("probe", "probe")}
+    if panes:
+        probe.update(pane=make_pane_block("probe", "probe"), recipe=make_pane_recipe("probe"))
+    return hashlib.sha1(json.dumps(probe, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def load_hash_store(signature: str) -> dict[str, str]:
+    if not HASH_STORE_PATH.exists():
+        return {}
+    try:
+        payload = json.loads(HASH_STORE_PATH.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+    if payload.get("version") != HASH_STORE_FORMAT_VERSION or payload.get("signature") != signature:
+        return {}
+    return payload.get("textures", {})
+
+
+def save_hash_store(signature: str, textures: dict[str, str]) -> None:
+    HASH_STORE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": HASH_STORE_FORMAT_VERSION, "signature": signature, "textures": textures}
+    HASH_STORE_PATH.write_text(json.dumps(payload, sort_keys=True, indent=4) + "\n", encoding="utf-8")
+
+
+def index_glass_block_paths(plan: ChangePlan, names: list[str]) -> dict[str, Path]:
+    # Glass blocks may have been moved into another entire_blocks category folder.
+    wanted = {f"{name}.json" for name in names}
+    return {path.stem: path for path in plan.rglob(ENTIRE_BLOCKS_DIR, "*.json") if path.name in wanted}
+
+
 def humanize_name(base_name: str) -> str:
     return " ".join(word.capitalize() for word in base_name.split("_"))
 
 
-def ensure_lang_entries(entries: dict[str, str], lang_path: Path) -> None:
-    if not lang_path.exists():
+def read_lang_labels(lang_path: Path, plan: ChangePlan) -> dict[str, str]:
+    if not plan.exists(lang_path):
+        return {}
+    lines = plan.read_text(lang_path).splitlines()
+    return dict(line.split("=", 1) for line in lines if "=" in line and not line.startswith("##"))
+
+
+def ensure_lang_entries(entries: dict[str, str], lang_path: Path, plan: ChangePlan) -> None:
+    if not plan.exists(lang_path):
         return
 
-    lines = lang_path.read_text(encoding="utf-8").splitlines()
+    lines = plan.read_text(lang_path).splitlines()
     existing_keys = {line.split("=", 1)[0] for line in lines if "=" in line and not line.startswith("##")}
 
     additions = [f"{k}={v}" for k, v in entries.items() if k not in existing_keys]
@@ -114,34 +358,70 @@ def ensure_lang_entries(entries: dict[str, str], lang_path: Path) -> None:
     if content and not content.endswith("\n\n"):
         content += "\n"
     content += "\n".join(additions) + "\n"
-    lang_path.write_text(content, encoding="utf-8")
+    plan.write_text(lang_path, content)
 
 
-def update_catalog(glass_ids: list[str]) -> None:
-    catalog = read_json(CATALOG_PATH)
-    categories = catalog["minecraft:crafting_items_catalog"]["categories"]
-    construction = next(c for c in categories if c["category_name"] == "construction")
-    groups = construction["groups"]
+def update_catalog(groups_by_key: dict[str, list[str]], plan: ChangePlan) -> None:
+    catalog = CraftingCatalog.for_plan(plan)
+    for group_key, item_ids in groups_by_key.items():
+        clean_glass = f"{NAMESPACE}:clean_glass" + ("_pane" if group_key == PANE_GROUP_KEY else "")
+        icon = clean_glass if clean_glass in item_ids else item_ids[0]
+        # Replaced in place so regenerating does not move the group to the end.
+        catalog.replace_group("construction", group_key, icon, sorted(item_ids))
+    catalog.save(plan)
 
-    groups = [g for g in groups if g.get("group_identifier", {}).get("name") != GROUP_KEY]
-
-    icon = f"{NAMESPACE}:clean_glass" if f"{NAMESPACE}:clean_glass" in glass_ids else glass_ids[0]
-    groups.append(
-        {
-            "group_identifier": {
-                "icon": icon,
-                "name": GROUP_KEY,
-            },
-            "items": sorted(glass_ids),
-        }
-    )
 
-    construction["groups"] = groups
-    write_json(CATALOG_PATH, catalog)
+def split_glass_style(name: str) -> tuple[str, str] | None:
+    for style, suffixes in GLASS_STYLE_SUFFIXES:
+        for suffix in suffixes:
+            if name == suffix or name.endswith(f"_{suffix}"):
+                return name[: -len(suffix)].rstrip("_"), style
+    return None
 
 
-def update_blocks_json(entries: dict[str, dict]) -> None:
-    data = read_json(BLOCKS_JSON_PATH)
+def build_glass_cycles(texture_names: list[str]) -> dict[str, list[tuple[str, str]]]:
+    style_order = {style: index for index, (style, _) in enumerate(GLASS_STYLE_SUFFIXES)}
+    members: dict[str, list[tuple[str, str]]] = {}
+    for name in texture_names:
+        parsed = split_glass_style(name)
+        if parsed is not None:
+            color, style = parsed
+            members.setdefault(color, []).append((f"{NAMESPACE}:{name}", style))
+
+    cycles: dict[str, list[tuple[str, str]]] = {}
+    for color, entries in members.items():
+        # Every cycle starts at the matching vanilla glass.
+        vanilla_color = VANILLA_GLASS_COLORS.get(color, color)
+        vanilla = f"minecraft:{vanilla_color}_stained_glass" if color else "minecraft:glass"
+        cycles[color] = [(vanilla, "stained")] + sorted(entries, key=lambda entry: style_order[entry[1]])
+    return cycles
+
+
+def render_cycle_script(cycles: dict[str, list[tuple[str, str]]]) -> str:
+    lines = [
+        "// Generated by tools/generate_glass_variants.py. Do not edit by hand.",
+        "",
+        "// Glass id -> { style, color, next, previous } along its glass cutter cycle.",
+        "export const GLASS_CYCLE_BY_ID = new Map([",
+    ]
+    for color, cycle in cycles.items():
+        for index, (identifier, style) in enumerate(cycle):
+            next_id = cycle[(index + 1) % len(cycle)][0]
+            previous_id = cycle[index - 1][0]
+            lines.append(
+                f"\t['{identifier}', Object.freeze({{ style: '{style}', color: '{color}', "
+                f"next: '{next_id}', previous: '{previous_id}' }})],"
+            )
+    lines += ["])", ""]
+    return "\n".join(lines)
+
+
+def update_cycle_script(texture_names: list[str], plan: ChangePlan) -> None:
+    plan.write_text(CYCLE_SCRIPT_PATH, render_cycle_script(build_glass_cycles(texture_names)))
+
+
+def update_blocks_json(entries: dict[str, dict], plan: ChangePlan) -> None:
+    data = plan.read_json(BLOCKS_JSON_PATH)
     changed = False
     for key, value in entries.items():
         if data.get(key) != value:
@@ -149,11 +429,11 @@ def update_blocks_json(entries: dict[str, dict]) -> None:
             changed = True
 
     if changed:
-        write_json(BLOCKS_JSON_PATH, data)
+        plan.write_json(BLOCKS_JSON_PATH, data)
 
 
-def update_terrain_texture(texture_entries: dict[str, dict]) -> None:
-    data = read_json(TERRAIN_TEXTURE_PATH)
+def update_terrain_texture(texture_entries: dict[str, dict], plan: ChangePlan) -> None:
+    data = plan.read_json(TERRAIN_TEXTURE_PATH)
     texture_data = data.setdefault("texture_data", {})
 
     changed = False
@@ -163,35 +443,56 @@ def update_terrain_texture(texture_entries: dict[str, dict]) -> None:
             changed = True
 
     if changed:
-        write_json(TERRAIN_TEXTURE_PATH, data)
+        plan.write_json(TERRAIN_TEXTURE_PATH, data)
 
 
-def update_custom_glass_culling() -> None:
-    payload = read_json(CULLING_PATH)
+def update_custom_glass_culling(plan: ChangePlan) -> None:
+    payload = plan.read_json(CULLING_PATH)
     description = payload.get("minecraft:block_culling_rules", {}).get("description", {})
     if description.get("identifier") != f"{NAMESPACE}:custom_glass":
         payload["minecraft:block_culling_rules"]["description"]["identifier"] = f"{NAMESPACE}:custom_glass"
-        write_json(CULLING_PATH, payload)
+        plan.write_json(CULLING_PATH, payload)
 
 
-def main() -> None:
-    texture_names = collect_glass_texture_names()
-    if not texture_names:
-        print("No glass textures found.")
-        return
+def needs_generation(
+    name: str,
+    hashes: dict[str, str],
+    stored: dict[str, str],
+    block_paths: dict[str, Path],
+    panes: bool,
+    plan: ChangePlan,
+) -> bool:
+    if stored.get(name) != hashes[name] or name not in block_paths:
+        return True
+    return panes and not plan.exists(PANE_BLOCK_DIR / f"{name}_pane.json")
+
+
+def lang_paths(plan: ChangePlan) -> dict[str, Path]:
+    # Every registered locale with a lang file (see locale_engine.LOCALE_PLUGINS).
+    return {locale.code: locale.lang_path for locale in iter_locales() if plan.exists(locale.lang_path)}
+
 
-    GLASS_BLOCK_DIR.mkdir(parents=True, exist_ok=True)
+def generate_glass(plan: ChangePlan, full: bool = False, panes: bool = False) -> tuple[dict[str, Any], dict[str, str]]:
+    texture_names = collect_glass_texture_names(plan)
+    signature = generator_signature(panes)
+    stored = {} if full else load_hash_store(signature)
+    hashes = {name: texture_sha1(name) for name in texture_names}
+    block_paths = index_glass_block_paths(plan, texture_names)
+
+    changed = [name for name in texture_names if needs_generation(name, hashes, stored, block_paths, panes, plan)]
 
     blocks_json_entries: dict[str, dict] = {}
     terrain_entries: dict[str, dict] = {}
-    glass_ids: list[str] = []
+    locale_paths = lang_paths(plan)
+    lang_entries: dict[str, dict[str, str]] = {locale: {} for locale in locale_paths}
+    # Pane labels reuse the glass label already translated in each locale.
+    lang_labels = {locale: read_lang_labels(path, plan) for locale, path in locale_paths.items()} if panes else {}
 
-    for name in texture_names:
+    for name in changed:
         texture_key = f"{NAMESPACE}_{name}"
         identifier = f"{NAMESPACE}:{name}"
-        payload = make_glass_block(name, texture_key)
-
-        write_json(GLASS_BLOCK_DIR / f"{name}.json", payload)
+        label = humanize_name(name)
+        plan.write_json(block_paths.get(name, GLASS_BLOCK_DIR / f"{name}.json"), make_glass_block(name, texture_key))
 
         blocks_json_entries[identifier] = {
             "sound": "glass",
@@ -200,29 +501,85 @@ def main() -> None:
         terrain_entries[texture_key] = {
             "textures": f"textures/blocks/glass/{name}"
         }
-        glass_ids.append(identifier)
+        for locale, entries in lang_entries.items():
+            entries[f"tile.{identifier}.name"] = label
+
+        if panes:
+            plan.write_json(PANE_BLOCK_DIR / f"{name}_pane.json", make_pane_block(name, texture_key))
+            plan.write_json(PANE_RECIPE_DIR / f"{name}_pane.json", make_pane_recipe(name))
+            blocks_json_entries[f"{identifier}_pane"] = {
+                "sound": "glass",
+                "textures": texture_key,
+            }
+            for locale, entries in lang_entries.items():
+                glass_label = lang_labels[locale].get(f"tile.{identifier}.name", label)
+                pane_format = PANE_LABEL_FORMATS.get(locale, PANE_LABEL_FORMATS[FALLBACK_LOCALE])
+                entries[f"tile.{identifier}_pane.name"] = pane_format.format(label=glass_label)
+
+    groups_by_key = {GROUP_KEY: [f"{NAMESPACE}:{name}" for name in texture_names]}
+    if panes:
+        groups_by_key[PANE_GROUP_KEY] = [f"{NAMESPACE}:{name}_pane" for name in texture_names]
+        plan.write_json(PANE_GEOMETRY_PATH, make_pane_geometry())
+
+    if texture_names:
+        update_blocks_json(blocks_json_entries, plan)
+        update_sound_events_script(plan)
+        update_terrain_texture(terrain_entries, plan)
+        update_custom_glass_culling(plan)
+        update_catalog(groups_by_key, plan)
+        update_cycle_script(texture_names, plan)
+
+        for locale, entries in lang_entries.items():
+            group_labels = {
+                group_key: GROUP_LABELS[group_key].get(locale, GROUP_LABELS[group_key][FALLBACK_LOCALE])
+                for group_key in groups_by_key
+            }
+            ensure_lang_entries({**group_labels, **entries}, locale_paths[locale], plan)
+
+    stats = {
+        "signature": signature,
+        "textures": len(texture_names),
+        "generated": len(changed),
+        "unchanged": len(texture_names) - len(changed),
+        "removed_textures": sorted(set(stored) - set(texture_names)),
+    }
+    return stats, hashes
 
-    update_blocks_json(blocks_json_entries)
-    update_terrain_texture(terrain_entries)
-    update_custom_glass_culling()
-    update_catalog(glass_ids)
 
-    en_entries = {GROUP_KEY: "Custom Glass"}
-    pt_entries = {GROUP_KEY: "Vidros Personalizados"}
-    es_entries = {GROUP_KEY: "Vidrios Personalizados"}
+def pipeline_stage(plan: ChangePlan, args: argparse.Namespace) -> tuple[dict[str, Any], Callable[[], None] | None]:
+    stats, hashes = generate_glass(plan, full=args.full, panes=args.panes)
+    summary = {key: stats[key] for key in ("textures", "generated", "unchanged")}
+    return summary, lambda: save_hash_store(stats["signature"], hashes)
 
-    for name in texture_names:
-        label = humanize_name(name)
-        en_entries[f"tile.{NAMESPACE}:{name}.name"] = label
-        pt_entries[f"tile.{NAMESPACE}:{name}.name"] = label
-        es_entries[f"tile.{NAMESPACE}:{name}.name"] = label
 
-    ensure_lang_entries(en_entries, LANG_PATHS["en_US"])
-    ensure_lang_entries(pt_entries, LANG_PATHS["pt_BR"])
-    ensure_lang_entries(es_entries, LANG_PATHS["es_MX"])
+def main() -> int:
+    args = parse_args()
+    plan = ChangePlan()
+    stats, hashes = generate_glass(plan, full=args.full, panes=args.panes)
+    if not stats["textures"]:
+        print("No glass textures found.")
+        return 0
+
+    print("Glass generation summary:")
+    for key in ("textures", "generated", "unchanged"):
+        print(f"- {key}: {stats[key]}")
+    if stats["removed_textures"]:
+        print("Textures removed since the last run (their blocks were left in place):")
+        for name in stats["removed_textures"]:
+            print(f"- {name}")
+
+    if args.dry_run:
+        print_plan(plan, show_diff=args.show_diff)
+        print("Dry run enabled. No files were changed.")
+        return 0
 
-    print(f"Generated/updated {len(texture_names)} glass blocks.")
+    applied = plan.apply()
+    save_hash_store(stats["signature"], hashes)
+    print("Applied changes:")
+    for action, count in applied.items():
+        print(f"- {action}: {count}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+"""
+Resolve the tool sound event of every block offline into BP/scripts/sound_events.generated.js.
+
+The rules stay in BP/scripts/sound_config.js and are read from there, so the script
+and the table cannot disagree. For each identifier, the first match wins:
+1. `exactMaterialEvents`;
+2. its RP/blocks.json `sound`, mapped through `blockSoundEvents`;
+3. the first `tokenMaterialRules` entry sharing a `_` token with the name;
+4. `defaultMaterialEvent`.
+The table covers every block in BP/blocks plus the vanilla blocks listed in
+tools/vanilla_blocks_list.md; sound_config.js keeps resolving anything else at runtime.
+
+The uniform, custom and glass generators refresh the table on every run; run this
+tool directly after editing the rules in sound_config.js. Run directly, it takes the
+block ids from the pack catalog (tools/pack_catalog.py) instead of parsing BP/blocks.
+
+Examples
+--------
+- python tools/generate_sound_events.py --dry-run
+- python tools/generate_sound_events.py --dry-run --show-diff
+- python tools/generate_sound_events.py
+"""
+
+import argparse
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from change_plan import ChangePlan, print_plan
+from pack_io import ROOT, BP_ROOT, RP_ROOT
+
+SOUND_CONFIG_PATH = BP_ROOT / "scripts/sound_config.js"
+SOUND_EVENTS_SCRIPT_PATH = BP_ROOT / "scripts/sound_events.generated.js"
+BLOCKS_DIR = BP_ROOT / "blocks"
+ASSETS_BLOCKS_PATH = RP_ROOT / "blocks.json"
+VANILLA_LIST_PATH = ROOT / "tools/vanilla_blocks_list.md"
+
+QUOTED_PATTERN = re.compile(r"'([^']+)'")
+
+
+@dataclass
+class SoundRules:
+    default_event: str
+    exact_events: dict[str, str]
+    block_sound_events: dict[str, str]
+    token_rules: list[tuple[str, set[str]]]
+
+    def resolve(self, identifier: str, block_sound: str | None = None) -> str:
+        exact = self.exact_events.get(identifier)
+        if exact is not None:
+            return exact
+        if block_sound in self.block_sound_events:
+            return self.block_sound_events[block_sound]
+        tokens = set(filter(None, identifier.split(":", 1)[-1].split("_")))
+        for event, rule_tokens in self.token_rules:
+            if tokens & rule_tokens:
+                return event
+        return self.default_event
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate the block id -> tool sound event table.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the planned changes without touching files.")
+    parser.add_argument("--show-diff", action="store_true", help="With --dry-run, print a unified diff for every change.")
+    return parser.parse_args()
+
+
+def config_section(script: str, key: str, opener: str, closer: str) -> str:
+    # Sections are top-level keys of `soundConfig`, closed on their own line at one tab.
+    match = re.search(rf"^\t{key}: \{opener}(.*?)^\t\{closer}", script, re.DOTALL | re.MULTILINE)
+    if match is None:
+        raise ValueError(f"soundConfig.{key} not found in {SOUND_CONFIG_PATH.name}")
+    return match.group(1)
+
+
+def parse_sound_rules(script: str) -> SoundRules:
+    default_match = re.search(r"^\tdefaultMaterialEvent: '([^']+)'", script, re.MULTILINE)
+    if default_match is None:
+        raise ValueError(f"soundConfig.defaultMaterialEvent not found in {SOUND_CONFIG_PATH.name}")
+
+    exact_events = dict(
+        re.findall(r"\['([^']+)', '([^']+)'\]", config_section(script, "exactMaterialEvents", "[", "]"))
+    )
+    block_sound_events = dict(
+        re.findall(r"(\w+): '([^']+)'", config_section(script, "blockSoundEvents", "{", "}"))
+    )
+    token_rules = [
+        (event, set(QUOTED_PATTERN.findall(tokens)))
+        for event, tokens in re.findall(
+            r"event: '([^']+)',\s*tokens: \[([^\]]*)\]",
+            config_section(script, "tokenMaterialRules", "[", "]"),
+        )
+    ]
+    return SoundRules(default_match.group(1), exact_events, block_sound_events, token_rules)
+
+
+def collect_block_identifiers(plan: ChangePlan) -> list[str]:
+    identifiers: list[str] = []
+    for path in plan.rglob(BLOCKS_DIR, "*.json"):
+        identifier = plan.read_json(path).get("minecraft:block", {}).get("description", {}).get("identifier")
+        if isinstance(identifier, str):
+            identifiers.append(identifier)
+    return identifiers
+
+
+def load_vanilla_identifiers(path: Path = VANILLA_LIST_PATH) -> list[str]:
+    if not path.exists():
+        return []
+    return re.findall(r"minecraft:[a-z0-9_]+", path.read_text(encoding="utf-8"))
+
+
+def build_sound_events(plan: ChangePlan, block_ids: list[str] | None = None) -> dict[str, str]:
+    rules = parse_sound_rules(plan.read_text(SOUND_CONFIG_PATH))
+    assets = plan.read_json(ASSETS_BLOCKS_PATH)
+    if block_ids is None:
+        block_ids = collect_block_identifiers(plan)
+
+    events: dict[str, str] = {}
+    for identifier in sorted(set(block_ids) | set(load_vanilla_identifiers())):
+        entry = assets.get(identifier)
+        block_sound = entry.get("sound") if isinstance(entry, dict) else None
+        events[identifier] = rules.resolve(identifier, block_sound)
+    return events
+
+
+def render_sound_events_script(events: dict[str, str]) -> str:
+    lines = [
+        "// Generated by tools/generate_sound_events.py from sound_config.js rules. Do not edit by hand.",
+        "",
+        "export const SOUND_EVENT_BY_ID = new Map([",
+    ]
+    lines.extend(f"\t['{identifier}', '{event}']," for identifier, event in events.items())
+    lines += ["])", ""]
+    return "\n".join(lines)
+
+
+def update_sound_events_script(plan: ChangePlan, block_ids: list[str] | None = None) -> int:
+    events = build_sound_events(plan, block_ids)
+    plan.write_text(SOUND_EVENTS_SCRIPT_PATH, render_sound_events_script(events))
+    return len(events)
+
+
+def pipeline_stage(plan: ChangePlan, args: argparse.Namespace) -> tuple[dict[str, Any], Callable[[], None] | None]:
+    return {"block_ids": update_sound_events_script(plan)}, None
+
+
+def main() -> int:
+    # Imported here: pack_catalog imports generate_uniform_variants, which imports this module.
+    from pack_catalog import block_identifiers, open_catalog
+
+    args = parse_args()
+    plan = ChangePlan()
+    # Nothing is planned under BP/blocks yet, so the synced catalog lists the same ids.
+    catalog = open_catalog()
+    try:
+        block_ids = block_identifiers(catalog)
+    finally:
+        catalog.close()
+    count = update_sound_events_script(plan, block_ids)
+    print("Sound event summary:")
+    print(f"- block_ids: {count}")
+
+    if args.dry_run:
+        print_plan(plan, show_diff=args.show_diff)
+        print("Dry run enabled. No files were changed.")
+        return 0
+
+    applied = plan.apply()
+    print("Applied changes:")
+    for action, count in applied.items():
+        print(f"- {action}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -16,6 +16,8 @@ What this tool does
     - `Assets/blocks.json` (sound + texture entries for new variants)
     - `Data/item_catalog/crafting_item_catalog.json` (removes accidental vanilla slab/stairs groups and syncs custom groups)
    - `Data/scripts/stairs.js` (STAIR_IDS list)
+   - `Data/scripts/shape_families.generated.js` (shape family of every block id, for the furniture hammer)
+   - `Data/scripts/sound_events.generated.js` (tool sound event of every block id, see generate_sound_events.py)
 4. Writes a mapping report to:
    - `tools/generated/uniform_variant_targets.json`
 
@@ -32,26 +34,47 @@ Examples
 - Include non-stone blocks too:
   python tools/generate_uniform_variants.py --include-non-stone
 
-- Only map and print (no file changes):
-  python tools/generate_uniform_variants.py --dry-run
+- Plan every stage and print the changes (no file changes):
+  python tools/generate_uniform_variants.py --dry-run --show-diff
+
+- Save a plan for review and apply it later without recomputing it:
+  python tools/generate_uniform_variants.py --dry-run --plan-out tools/generated/uniform_plan.json
+  python tools/generate_uniform_variants.py --apply-plan tools/generated/uniform_plan.json
+
+After applying, including with --apply-plan, BP/RP are validated against tools/schemas
+(see tools/validate_pack.py) and the exit code is 1 on errors; pass --skip-validation
+to skip it. A plan saved with --plan-out also carries the target report, which
+--apply-plan writes.
 """
 
 import argparse
 import copy
-import json
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-
-ROOT = Path(__file__).resolve().parents[1]
-BP_ROOT = ROOT / "BP"
-RP_ROOT = ROOT / "RP"
+from typing import Any, Callable, Iterable
+
+from change_plan import ChangePlan, print_plan
+from crafting_catalog import CraftingCatalog
+from durability_profiles import STONE_RESOLVER, apply_durability
+from generate_sound_events import update_sound_events_script
+from label_wrap import wrap_labels
+from locale_engine import (
+    LocalePlugin,
+    contains_english_tokens,
+    format_variant_label,
+    iter_locales,
+    localize_base_name,
+)
+from pack_io import ROOT, BP_ROOT, RP_ROOT, read_json, write_json
+from validate_pack import print_validation_report, validate_pack
 
 FORCE_INCLUDE_IDS: list[str] = []
 FORCE_EXCLUDE_IDS: list[str] = []
 
 REPORT_PATH = ROOT / "tools/generated/uniform_variant_targets.json"
+VANILLA_LIST_PATH = ROOT / "tools/vanilla_blocks_list.md"
 
 ENTIRE_BLOCKS_DIR = BP_ROOT / "blocks/decorative/entire_blocks"
 SLABS_DIR = BP_ROOT / "blocks/decorative/slabs"
@@ -61,8 +84,8 @@ CULLING_DIR = RP_ROOT / "block_culling"
 STONECUTTER_DIR = BP_ROOT / "recipes/stonecutter"
 
 ASSETS_BLOCKS_PATH = RP_ROOT / "blocks.json"
-CATALOG_PATH = BP_ROOT / "item_catalog/crafting_item_catalog.json"
 STAIRS_SCRIPT_PATH = BP_ROOT / "scripts/stairs.js"
+SHAPE_FAMILIES_SCRIPT_PATH = BP_ROOT / "scripts/shape_families.generated.js"
 
 SLAB_TEMPLATE_PATH = SLABS_DIR / "andesite_tiles_slab.json"
 STAIRS_TEMPLATE_PATH = STAIRS_DIR / "andesite_tiles_str.json"
@@ -72,6 +95,17 @@ ENTIRE_BLOCK_TEMPLATE_NAME = "andesite_bricks.json"
 SLAB_CULLING_TEMPLATE_PATH = CULLING_DIR / "andesite_tiles_slab.json"
 STAIRS_CULLING_TEMPLATE_PATH = CULLING_DIR / "andesite_tiles_str.json"
 THREE_STEP_STAIRS_CULLING_TEMPLATE_PATH = CULLING_DIR / "andesite_tiles_tss.json"
+CULLING_TEMPLATE_PATHS = {
+    "slab": SLAB_CULLING_TEMPLATE_PATH,
+    "stairs": STAIRS_CULLING_TEMPLATE_PATH,
+    "three_steps_stairs": THREE_STEP_STAIRS_CULLING_TEMPLATE_PATH,
+}
+# One rule set per geometry shape, referenced by every block of that shape ("shared" culling mode).
+SHARED_CULLING_FILES = {
+    "slab": "slab.json",
+    "stairs": "stairs.json",
+    "three_steps_stairs": "three_steps_stairs.json",
+}
 
 SLAB_GROUP_NAME = "minecraft:itemGroup.name.slab"
 STAIRS_GROUP_NAME = "minecraft:itemGroup.name.stairs"
@@ -79,13 +113,6 @@ VERTICAL_SLABS_GROUP_NAME = "dorios_atelier:itemGroup.name.verticalSlabs"
 THREE_STEP_STAIRS_GROUP_NAME = "dorios_atelier:itemGroup.name.threeStepStairs"
 STONEWORK_GROUP_NAME = "dorios_atelier:itemGroup.name.stoneBricks"
 
-LANG_NAME_MAX_CHARS = 32
-LANG_FILES: dict[str, Path] = {
-    "en_US": RP_ROOT / "texts/en_US.lang",
-    "pt_BR": RP_ROOT / "texts/pt_BR.lang",
-    "es_MX": RP_ROOT / "texts/es_MX.lang",
-}
-
 VARIANT_SUFFIXES = (
     "three_steps_stairs",
     "vertical_slab",
@@ -101,9 +128,83 @@ VARIANT_FILE_SUFFIXES = {
 }
 
 
+VARIANT_BLOCK_DIRS = {
+    "three_steps_stairs": UNIQUE_STAIRS_DIR,
+    "vertical_slab": BP_ROOT / "blocks/decorative/vertical_slabs",
+    "stairs": STAIRS_DIR,
+    "slab": SLABS_DIR,
+}
+
+
 def variant_filename(base_name: str, variant_suffix: str) -> str:
     return f"{base_name}_{VARIANT_FILE_SUFFIXES[variant_suffix]}.json"
 
+
+def variant_block_path(base_name: str, variant_suffix: str) -> Path:
+    return VARIANT_BLOCK_DIRS[variant_suffix] / variant_filename(base_name, variant_suffix)
+
+SHAPE_FAMILY_STATES = ("default", "stairs", "slab", "vertical_slab", "three_steps_stairs")
+# Vanilla wood sets: the full block is `<wood>_planks`, the variants drop the `_planks`.
+VANILLA_WOOD_FAMILY_NAMES = (
+    "oak",
+    "spruce",
+    "birch",
+    "jungle",
+    "acacia",
+    "dark_oak",
+    "mangrove",
+    "cherry",
+    "bamboo",
+    "crimson",
+    "warped",
+)
+# Vanilla stairs/slabs of the bases in vanilla_blocks_list.md. Bedrock does not derive these ids
+# from the base name (cobblestone stairs are `stone_stairs`, stone is `normal_stone_*`), so they
+# are listed by hand. A family prefers these over the pack's own stairs/slab of the same base.
+VANILLA_SHAPE_IDS: dict[str, dict[str, str]] = {
+    "stone": {"stairs": "minecraft:normal_stone_stairs", "slab": "minecraft:normal_stone_slab"},
+    "cobblestone": {"stairs": "minecraft:stone_stairs", "slab": "minecraft:cobblestone_slab"},
+    "mossy_cobblestone": {"stairs": "minecraft:mossy_cobblestone_stairs", "slab": "minecraft:mossy_cobblestone_slab"},
+    "smooth_stone": {"slab": "minecraft:smooth_stone_slab"},
+    "stone_bricks": {"stairs": "minecraft:stone_brick_stairs", "slab": "minecraft:stone_brick_slab"},
+    "mossy_stone_bricks": {"stairs": "minecraft:mossy_stone_brick_stairs", "slab": "minecraft:mossy_stone_brick_slab"},
+    "granite": {"stairs": "minecraft:granite_stairs", "slab": "minecraft:granite_slab"},
+    "polished_granite": {"stairs": "minecraft:polished_granite_stairs", "slab": "minecraft:polished_granite_slab"},
+    "diorite": {"stairs": "minecraft:diorite_stairs", "slab": "minecraft:diorite_slab"},
+    "polished_diorite": {"stairs": "minecraft:polished_diorite_stairs", "slab": "minecraft:polished_diorite_slab"},
+    "andesite": {"stairs": "minecraft:andesite_stairs", "slab": "minecraft:andesite_slab"},
+    "polished_andesite": {"stairs": "minecraft:polished_andesite_stairs", "slab": "minecraft:polished_andesite_slab"},
+    "sandstone": {"stairs": "minecraft:sandstone_stairs", "slab": "minecraft:sandstone_slab"},
+    "cut_sandstone": {"slab": "minecraft:cut_sandstone_slab"},
+    "smooth_sandstone": {"stairs": "minecraft:smooth_sandstone_stairs", "slab": "minecraft:smooth_sandstone_slab"},
+    "red_sandstone": {"stairs": "minecraft:red_sandstone_stairs", "slab": "minecraft:red_sandstone_slab"},
+    "cut_red_sandstone": {"slab": "minecraft:cut_red_sandstone_slab"},
+    "smooth_red_sandstone": {"stairs": "minecraft:smooth_red_sandstone_stairs", "slab": "minecraft:smooth_red_sandstone_slab"},
+    "cobbled_deepslate": {"stairs": "minecraft:cobbled_deepslate_stairs", "slab": "minecraft:cobbled_deepslate_slab"},
+    "polished_deepslate": {"stairs": "minecraft:polished_deepslate_stairs", "slab": "minecraft:polished_deepslate_slab"},
+    "deepslate_bricks": {"stairs": "minecraft:deepslate_brick_stairs", "slab": "minecraft:deepslate_brick_slab"},
+    "deepslate_tiles": {"stairs": "minecraft:deepslate_tile_stairs", "slab": "minecraft:deepslate_tile_slab"},
+    "nether_bricks": {"stairs": "minecraft:nether_brick_stairs", "slab": "minecraft:nether_brick_slab"},
+    "red_nether_bricks": {"stairs": "minecraft:red_nether_brick_stairs", "slab": "minecraft:red_nether_brick_slab"},
+    "blackstone": {"stairs": "minecraft:blackstone_stairs", "slab": "minecraft:blackstone_slab"},
+    "polished_blackstone": {"stairs": "minecraft:polished_blackstone_stairs", "slab": "minecraft:polished_blackstone_slab"},
+    "polished_blackstone_bricks": {
+        "stairs": "minecraft:polished_blackstone_brick_stairs",
+        "slab": "minecraft:polished_blackstone_brick_slab",
+    },
+    "end_stone_bricks": {"stairs": "minecraft:end_brick_stairs", "slab": "minecraft:end_stone_brick_slab"},
+    "purpur_block": {"stairs": "minecraft:purpur_stairs", "slab": "minecraft:purpur_slab"},
+    "quartz_block": {"stairs": "minecraft:quartz_stairs", "slab": "minecraft:quartz_slab"},
+    "smooth_quartz": {"stairs": "minecraft:smooth_quartz_stairs", "slab": "minecraft:smooth_quartz_slab"},
+    "prismarine": {"stairs": "minecraft:prismarine_stairs", "slab": "minecraft:prismarine_slab"},
+    "prismarine_bricks": {"stairs": "minecraft:prismarine_bricks_stairs", "slab": "minecraft:prismarine_brick_slab"},
+    "dark_prismarine": {"stairs": "minecraft:dark_prismarine_stairs", "slab": "minecraft:dark_prismarine_slab"},
+    "tuff": {"stairs": "minecraft:tuff_stairs", "slab": "minecraft:tuff_slab"},
+    "polished_tuff": {"stairs": "minecraft:polished_tuff_stairs", "slab": "minecraft:polished_tuff_slab"},
+    "tuff_bricks": {"stairs": "minecraft:tuff_brick_stairs", "slab": "minecraft:tuff_brick_slab"},
+    "mud_bricks": {"stairs": "minecraft:mud_brick_stairs", "slab": "minecraft:mud_brick_slab"},
+}
+
 MATERIAL_TOKEN_PRIORITY = (
     "blackstone",
     "deepslate",
@@ -132,87 +233,6 @@ ENTIRE_BLOCK_CATEGORY_PRIORITY: tuple[tuple[str, str], ...] = (
     ("wood", "Woods"),
 )
 
-ENGLISH_NAME_TOKENS = (
-    "Chiseled",
-    "Cracked",
-    "Polished",
-    "Smooth",
-    "Bricks",
-    "Tiles",
-    "Stairs",
-    "Slab",
-    "Pillar",
-    "Deepslate",
-    "Blackstone",
-)
-
-PT_WORD_MAP = {
-    "andesite": "Andesito",
-    "basalt": "Basalto",
-    "blackstone": "Pedra-Negra",
-    "calcite": "Calcita",
-    "cobblestone": "Pedregulho",
-    "deepslate": "Ardósia Abissal",
-    "diorite": "Diorito",
-    "dripstone": "Espeleotema",
-    "granite": "Granito",
-    "mud": "Lama",
-    "netherrack": "Netherrack",
-    "nether": "Nether",
-    "obsidian": "Obsidiana",
-    "packed": "Compactada",
-    "polished": "Polido",
-    "prismarine": "Prismarinho",
-    "purpur": "Purpur",
-    "quartz": "Quartzo",
-    "red": "Vermelho",
-    "sandstone": "Arenito",
-    "smooth": "Liso",
-    "stone": "Pedra",
-    "tuff": "Tufo",
-}
-
-ES_WORD_MAP = {
-    "andesite": "Andesita",
-    "basalt": "Basalto",
-    "blackstone": "Piedra Negra",
-    "calcite": "Calcita",
-    "cobblestone": "Adoquín",
-    "deepslate": "Pizarra Profunda",
-    "diorite": "Diorita",
-    "dripstone": "Espeleotema",
-    "granite": "Granito",
-    "mud": "Lodo",
-    "netherrack": "Netherrack",
-    "nether": "Nether",
-    "obsidian": "Obsidiana",
-    "packed": "Compactado",
-    "polished": "Pulido",
-    "prismarine": "Prismarina",
-    "purpur": "Purpur",
-    "quartz": "Cuarzo",
-    "red": "Rojo",
-    "sandstone": "Arenisca",
-    "smooth": "Liso",
-    "stone": "Piedra",
-    "tuff": "Tufo",
-}
-
-PT_BASE_OVERRIDES = {
-    "cobbled_deepslate": "Pedregulho de Ardósia Abissal",
-    "dark_prismarine": "Prismarinho Escuro",
-    "gilded_blackstone": "Pedra-Negra Dourada",
-    "packed_mud": "Lama Compactada",
-}
-
-ES_BASE_OVERRIDES = {
-    "cobbled_deepslate": "Adoquín de Pizarra Profunda",
-    "dark_prismarine": "Prismarina Oscura",
-    "gilded_blackstone": "Piedra Negra Dorada",
-    "packed_mud": "Lodo Compactado",
-}
-
-
 @dataclass
 class TargetBlock:
     identifier: str
@@ -237,7 +257,44 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Only map and report targets, without writing files.",
+        help="Plan every stage and print the resulting changes, without writing files.",
+    )
+    parser.add_argument(
+        "--recipe-layout",
+        choices=("auto", "flat", "sharded"),
+        default="auto",
+        help="Where new stonecutter recipes go: flat, per-material shard folders, or auto (match the existing layout).",
+    )
+    parser.add_argument(
+        "--culling-mode",
+        choices=("auto", "per-block", "shared"),
+        default="auto",
+        help=(
+            "Culling rules for new blocks: one file per block, one shared file per shape, "
+            "or auto (shared once tools/consolidate_culling.py has been run)."
+        ),
+    )
+    parser.add_argument(
+        "--show-diff",
+        action="store_true",
+        help="With --dry-run, print a unified diff for every planned change.",
+    )
+    parser.add_argument(
+        "--plan-out",
+        type=Path,
+        default=None,
+        help="Save the computed change plan (contents, base hashes and diffs) to this JSON file.",
+    )
+    parser.add_argument(
+        "--apply-plan",
+        type=Path,
+        default=None,
+        help="Apply a plan previously saved with --plan-out instead of recomputing it.",
+    )
+    parser.add_argument(
+        "--skip-validation",
+        action="store_true",
+        help="Do not validate BP/RP against tools/schemas after applying changes.",
     )
     parser.add_argument(
         "--import-vanilla-compatible",
@@ -253,21 +310,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--vanilla-list",
         type=Path,
-        default=ROOT / "tools/vanilla_blocks_list.md",
+        default=VANILLA_LIST_PATH,
         help="Path to markdown file containing minecraft:<block_id> entries.",
     )
     return parser.parse_args()
 
 
-def read_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
-def write_json(path: Path, payload: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=4) + "\n", encoding="utf-8")
-
-
 def extract_vanilla_ids_from_markdown(markdown_text: str) -> list[str]:
     matches = re.findall(r"minecraft:[a-z0-9_]+", markdown_text)
     return sorted(set(matches))
@@ -280,8 +328,8 @@ def load_vanilla_base_names(vanilla_list_path: Path) -> set[str]:
     return {identifier.split(":", 1)[1] for identifier in extract_vanilla_ids_from_markdown(markdown_text)}
 
 
-def load_vanilla_pt_name_map(vanilla_list_path: Path) -> dict[str, str]:
-    if not vanilla_list_path.exists():
+def load_vanilla_name_map(vanilla_list_path: Path | None) -> dict[str, str]:
+    if vanilla_list_path is None or not vanilla_list_path.exists():
         return {}
 
     text = vanilla_list_path.read_text(encoding="utf-8")
@@ -291,13 +339,13 @@ def load_vanilla_pt_name_map(vanilla_list_path: Path) -> dict[str, str]:
     return mappings
 
 
-def collect_variant_base_names() -> set[str]:
+def collect_variant_base_names(plan: ChangePlan) -> set[str]:
     suffixes = tuple(f"_{suffix}" for suffix in VARIANT_FILE_SUFFIXES.values())
     variant_directories = (SLABS_DIR, STAIRS_DIR, UNIQUE_STAIRS_DIR, BP_ROOT / "blocks/decorative/vertical_slabs")
 
     names: set[str] = set()
     for directory in variant_directories:
-        for path in sorted(directory.glob("*.json")):
+        for path in plan.glob(directory, "*.json"):
             stem = path.stem
             for suffix in suffixes:
                 if stem.endswith(suffix):
@@ -341,10 +389,10 @@ def texture_key_has_local_file(texture_key: str, terrain_texture_data: dict[str,
     return (ROOT / "Assets" / f"{path}.png").exists() or (ROOT / "Assets" / f"{path}.tga").exists()
 
 
-def detect_vanilla_bases_with_local_textures(vanilla_base_names: set[str]) -> set[str]:
-    assets_data = read_json(ASSETS_BLOCKS_PATH)
-    terrain_texture_data = read_json(RP_ROOT / "textures/terrain_texture.json").get("texture_data", {})
-    variant_bases = collect_variant_base_names()
+def detect_vanilla_bases_with_local_textures(vanilla_base_names: set[str], plan: ChangePlan) -> set[str]:
+    assets_data = plan.read_json(ASSETS_BLOCKS_PATH)
+    terrain_texture_data = plan.read_json(RP_ROOT / "textures/terrain_texture.json").get("texture_data", {})
+    variant_bases = collect_variant_base_names(plan)
 
     kept: set[str] = set()
     for base_name in sorted(vanilla_base_names):
@@ -356,106 +404,26 @@ def detect_vanilla_bases_with_local_textures(vanilla_base_names: set[str]) -> se
     return kept
 
 
-def contains_english_tokens(label: str) -> bool:
-    return any(token in label for token in ENGLISH_NAME_TOKENS)
-
-
-def translate_material_words(words: list[str], language: str) -> str:
-    word_map = PT_WORD_MAP if language == "pt_BR" else ES_WORD_MAP if language == "es_MX" else {}
-    translated = [word_map.get(word, word.capitalize()) for word in words]
-    return " ".join(translated).strip()
-
-
-def localize_base_name(base_name: str, language: str, vanilla_pt_name_map: dict[str, str]) -> str:
-    if language == "en_US":
-        return humanize_identifier(base_name)
-
-    if language == "pt_BR" and base_name in vanilla_pt_name_map:
-        return vanilla_pt_name_map[base_name]
-
-    if language == "pt_BR" and base_name in PT_BASE_OVERRIDES:
-        return PT_BASE_OVERRIDES[base_name]
-
-    if language == "es_MX" and base_name in ES_BASE_OVERRIDES:
-        return ES_BASE_OVERRIDES[base_name]
-
-    words = base_name.split("_")
-    is_plural = False
-
-    block_form = None
-    if words and words[-1] in {"bricks", "tiles", "pillar"}:
-        block_form = words.pop()
-        is_plural = block_form in {"bricks", "tiles"}
-
-    modifiers: list[str] = []
-    while words and words[0] in {"chiseled", "cracked", "polished", "smooth", "mossy"}:
-        modifiers.append(words.pop(0))
-
-    material_text = translate_material_words(words, language)
-
-    if language == "pt_BR":
-        if block_form == "bricks":
-            label = f"Tijolos de {material_text}" if material_text else "Tijolos"
-        elif block_form == "tiles":
-            label = f"Ladrilhos de {material_text}" if material_text else "Ladrilhos"
-        elif block_form == "pillar":
-            label = f"Pilar de {material_text}" if material_text else "Pilar"
-        else:
-            label = material_text
-
-        modifier_map = {
-            "chiseled": "Talhados" if is_plural else "Talhado",
-            "cracked": "Rachados" if is_plural else "Rachado",
-            "polished": "Polidos" if is_plural else "Polido",
-            "smooth": "Lisos" if is_plural else "Liso",
-            "mossy": "Musgosos" if is_plural else "Musgoso",
-        }
-    else:
-        if block_form == "bricks":
-            label = f"Ladrillos de {material_text}" if material_text else "Ladrillos"
-        elif block_form == "tiles":
-            label = f"Losetas de {material_text}" if material_text else "Losetas"
-        elif block_form == "pillar":
-            label = f"Pilar de {material_text}" if material_text else "Pilar"
-        else:
-            label = material_text
-
-        modifier_map = {
-            "chiseled": "Cincelados" if is_plural else "Cincelado",
-            "cracked": "Agrietados" if is_plural else "Agrietado",
-            "polished": "Pulidos" if is_plural else "Pulido",
-            "smooth": "Lisos" if is_plural else "Liso",
-            "mossy": "Musgosos" if is_plural else "Musgoso",
-        }
-
-    for modifier in modifiers:
-        suffix = modifier_map.get(modifier)
-        if suffix:
-            label = f"{label} {suffix}".strip()
-
-    return label
-
-
 def localize_block_name_from_identifier(
     block_name: str,
-    language: str,
+    locale: LocalePlugin,
     existing_names: dict[str, str],
-    vanilla_pt_name_map: dict[str, str],
+    vanilla_name_map: dict[str, str],
 ) -> str:
     parsed_variant = split_variant_item_name(block_name)
     if parsed_variant is None:
-        return localize_base_name(block_name, language, vanilla_pt_name_map)
+        return localize_base_name(block_name, locale, vanilla_name_map)
 
     base_name, variant_suffix = parsed_variant
     base_label = existing_names.get(base_name)
-    if base_label is None or (language in {"pt_BR", "es_MX"} and contains_english_tokens(base_label)):
-        base_label = localize_base_name(base_name, language, vanilla_pt_name_map)
+    if base_label is None or (locale.rejects_english_labels and contains_english_tokens(base_label)):
+        base_label = localize_base_name(base_name, locale, vanilla_name_map)
 
-    return format_variant_label(base_label, variant_suffix, language)
+    return format_variant_label(base_label, variant_suffix, locale)
 
 
-def iter_entire_block_files() -> list[Path]:
-    return sorted(ENTIRE_BLOCKS_DIR.rglob("*.json"))
+def iter_entire_block_files(plan: ChangePlan) -> list[Path]:
+    return plan.rglob(ENTIRE_BLOCKS_DIR, "*.json")
 
 
 def determine_entire_block_category(base_name: str) -> str:
@@ -478,17 +446,17 @@ def build_entire_block_target_path(base_name: str) -> Path:
     return ENTIRE_BLOCKS_DIR / category / f"{base_name}.json"
 
 
-def resolve_entire_block_template_path() -> Path:
-    for candidate in iter_entire_block_files():
+def resolve_entire_block_template_path(plan: ChangePlan) -> Path:
+    for candidate in iter_entire_block_files(plan):
         if candidate.name == ENTIRE_BLOCK_TEMPLATE_NAME:
             return candidate
     raise FileNotFoundError(f"Template block not found recursively: {ENTIRE_BLOCK_TEMPLATE_NAME}")
 
 
-def remove_vanilla_entire_blocks(vanilla_base_names: set[str], dry_run: bool) -> int:
+def remove_vanilla_entire_blocks(vanilla_base_names: set[str], plan: ChangePlan) -> int:
     removed = 0
-    for block_path in iter_entire_block_files():
-        payload = read_json(block_path)
+    for block_path in iter_entire_block_files(plan):
+        payload = plan.read_json(block_path)
         identifier = payload.get("minecraft:block", {}).get("description", {}).get("identifier")
         if not isinstance(identifier, str) or not identifier.startswith("dorios_atelier:"):
             continue
@@ -497,19 +465,18 @@ def remove_vanilla_entire_blocks(vanilla_base_names: set[str], dry_run: bool) ->
         if base_name not in vanilla_base_names:
             continue
 
-        if not dry_run:
-            block_path.unlink()
+        plan.delete(block_path)
         removed += 1
     return removed
 
 
-def ensure_vanilla_entire_blocks_exist(base_names: set[str], dry_run: bool) -> int:
+def ensure_vanilla_entire_blocks_exist(base_names: set[str], plan: ChangePlan) -> int:
     if not base_names:
         return 0
 
-    template = read_json(resolve_entire_block_template_path())
-    assets_data = read_json(ASSETS_BLOCKS_PATH)
-    existing_names = {path.stem for path in iter_entire_block_files()}
+    template = plan.read_json(resolve_entire_block_template_path(plan))
+    assets_data = plan.read_json(ASSETS_BLOCKS_PATH)
+    existing_names = {path.stem for path in iter_entire_block_files(plan)}
 
     created = 0
     for base_name in sorted(base_names):
@@ -526,50 +493,37 @@ def ensure_vanilla_entire_blocks_exist(base_names: set[str], dry_run: bool) -> i
             texture=texture_key,
         )
         target_path = build_entire_block_target_path(base_name)
-        if not dry_run:
-            write_json(target_path, payload)
+        plan.write_json(target_path, payload)
         existing_names.add(base_name)
         created += 1
 
     return created
 
 
-def organize_entire_blocks_by_category(dry_run: bool) -> int:
+def organize_entire_blocks_by_category(plan: ChangePlan) -> int:
+    # Directories left empty by the moves are pruned when the plan is applied.
     moved = 0
-    for block_path in iter_entire_block_files():
+    for block_path in iter_entire_block_files(plan):
         target_path = build_entire_block_target_path(block_path.stem)
         if block_path == target_path:
             continue
 
-        if not dry_run:
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            if target_path.exists() and target_path != block_path:
-                target_path.unlink()
-            block_path.replace(target_path)
+        plan.move(block_path, target_path)
         moved += 1
 
-    if not dry_run:
-        for directory in sorted([path for path in ENTIRE_BLOCKS_DIR.rglob("*") if path.is_dir()], reverse=True):
-            if directory == ENTIRE_BLOCKS_DIR:
-                continue
-            try:
-                directory.rmdir()
-            except OSError:
-                pass
-
     return moved
 
 
 def rewrite_stonecutter_recipes_to_vanilla_bases(
     migrate_to_vanilla_base_names: set[str],
     keep_utilitycraft_base_names: set[str],
-    dry_run: bool,
+    plan: ChangePlan,
 ) -> tuple[int, int]:
     rewritten_forward = 0
     rewritten_reverse = 0
 
-    for recipe_path in sorted(STONECUTTER_DIR.glob("*.json")):
-        payload = read_json(recipe_path)
+    for recipe_path in iter_stonecutter_recipe_files(plan):
+        payload = plan.read_json(recipe_path)
         recipe = payload.get("minecraft:recipe_shapeless", {})
 
         if "stonecutter" not in recipe.get("tags", []):
@@ -628,24 +582,24 @@ def rewrite_stonecutter_recipes_to_vanilla_bases(
                         changed = True
                         rewritten_reverse += 1
 
-        if changed and not dry_run:
-            write_json(recipe_path, payload)
+        if changed:
+            plan.write_json(recipe_path, payload)
 
     return rewritten_forward, rewritten_reverse
 
 
-def apply_vanilla_base_policy(vanilla_list_path: Path, dry_run: bool) -> dict[str, int]:
+def apply_vanilla_base_policy(vanilla_list_path: Path, plan: ChangePlan) -> dict[str, int]:
     vanilla_base_names = load_vanilla_base_names(vanilla_list_path)
-    keep_utilitycraft_bases = detect_vanilla_bases_with_local_textures(vanilla_base_names)
+    keep_utilitycraft_bases = detect_vanilla_bases_with_local_textures(vanilla_base_names, plan)
     migrate_to_vanilla_bases = vanilla_base_names - keep_utilitycraft_bases
 
-    removed_vanilla_entire_blocks = remove_vanilla_entire_blocks(migrate_to_vanilla_bases, dry_run)
-    restored_local_vanilla_entire_blocks = ensure_vanilla_entire_blocks_exist(keep_utilitycraft_bases, dry_run)
-    moved_entire_blocks = organize_entire_blocks_by_category(dry_run)
+    removed_vanilla_entire_blocks = remove_vanilla_entire_blocks(migrate_to_vanilla_bases, plan)
+    restored_local_vanilla_entire_blocks = ensure_vanilla_entire_blocks_exist(keep_utilitycraft_bases, plan)
+    moved_entire_blocks = organize_entire_blocks_by_category(plan)
     rewritten_forward_recipes, rewritten_reverse_recipes = rewrite_stonecutter_recipes_to_vanilla_bases(
         migrate_to_vanilla_bases,
         keep_utilitycraft_bases,
-        dry_run,
+        plan,
     )
 
     return {
@@ -678,7 +632,7 @@ def build_entire_block_from_template(
 def import_vanilla_compatible_blocks(
     vanilla_blocks_json_path: Path,
     vanilla_list_path: Path,
-    dry_run: bool,
+    plan: ChangePlan,
 ) -> dict[str, int]:
     if not vanilla_blocks_json_path.exists():
         raise FileNotFoundError(f"Vanilla blocks.json not found: {vanilla_blocks_json_path}")
@@ -687,9 +641,9 @@ def import_vanilla_compatible_blocks(
 
     vanilla_blocks = read_json(vanilla_blocks_json_path)
     vanilla_ids = extract_vanilla_ids_from_markdown(vanilla_list_path.read_text(encoding="utf-8"))
-    entire_template = read_json(resolve_entire_block_template_path())
-    assets_data = read_json(ASSETS_BLOCKS_PATH)
-    existing_entire_names = {path.stem for path in iter_entire_block_files()}
+    entire_template = plan.read_json(resolve_entire_block_template_path(plan))
+    assets_data = plan.read_json(ASSETS_BLOCKS_PATH)
+    existing_entire_names = {path.stem for path in iter_entire_block_files(plan)}
 
     imported_entire_blocks = 0
     imported_assets_entries = 0
@@ -716,8 +670,7 @@ def import_vanilla_compatible_blocks(
             skipped_already_existing += 1
         else:
             payload = build_entire_block_from_template(entire_template, custom_id, texture)
-            if not dry_run:
-                write_json(custom_path, payload)
+            plan.write_json(custom_path, payload)
             imported_entire_blocks += 1
             existing_entire_names.add(vanilla_name)
 
@@ -728,8 +681,8 @@ def import_vanilla_compatible_blocks(
             }
             imported_assets_entries += 1
 
-    if not dry_run and imported_assets_entries:
-        write_json(ASSETS_BLOCKS_PATH, assets_data)
+    if imported_assets_entries:
+        plan.write_json(ASSETS_BLOCKS_PATH, assets_data)
 
     return {
         "vanilla_ids_in_list": len(vanilla_ids),
@@ -741,65 +694,79 @@ def import_vanilla_compatible_blocks(
     }
 
 
-def find_targets(include_non_stone: bool) -> list[TargetBlock]:
-    blocks_assets = read_json(ASSETS_BLOCKS_PATH)
-    targets: list[TargetBlock] = []
-
-    for source_path in iter_entire_block_files():
-        source = read_json(source_path)
-        source_block = source.get("minecraft:block", {})
-        source_description = source_block.get("description", {})
-        source_components = source_block.get("components", {})
-
-        identifier = source_description.get("identifier")
-        if not identifier or identifier in FORCE_EXCLUDE_IDS:
-            continue
-
-        asset_entry = blocks_assets.get(identifier)
-        if not isinstance(asset_entry, dict):
-            continue
+def build_target(
+    identifier: str,
+    source_components: dict[str, Any],
+    asset_entry: Any,
+    include_non_stone: bool,
+    plan: ChangePlan,
+) -> TargetBlock | None:
+    if identifier in FORCE_EXCLUDE_IDS or not isinstance(asset_entry, dict):
+        return None
+
+    texture_value = asset_entry.get("textures")
+    if isinstance(texture_value, dict):
+        # Multi-face texture block: out of this tool's scope.
+        return None
+    if not isinstance(texture_value, str):
+        return None
+
+    is_stone = "tag:stone" in source_components
+    if not is_stone and not include_non_stone and identifier not in FORCE_INCLUDE_IDS:
+        return None
+
+    base_name = identifier.split(":", 1)[1]
+    has_slab = plan.exists(variant_block_path(base_name, "slab"))
+    has_stairs = plan.exists(variant_block_path(base_name, "stairs"))
+    has_three_steps_stairs = plan.exists(variant_block_path(base_name, "three_steps_stairs"))
+    has_vertical_slab = plan.exists(variant_block_path(base_name, "vertical_slab"))
+
+    if has_slab and has_stairs and has_three_steps_stairs and has_vertical_slab and identifier not in FORCE_INCLUDE_IDS:
+        return None
+
+    return TargetBlock(
+        identifier=identifier,
+        base_name=base_name,
+        texture=texture_value,
+        sound=str(asset_entry.get("sound", "stone")),
+        is_stone=is_stone,
+        has_slab=has_slab,
+        has_stairs=has_stairs,
+        has_three_steps_stairs=has_three_steps_stairs,
+        has_vertical_slab=has_vertical_slab,
+        source_components=source_components,
+    )
 
-        texture_value = asset_entry.get("textures")
-        if isinstance(texture_value, dict):
-            # Multi-face texture block: out of this tool's scope.
-            continue
-        if not isinstance(texture_value, str):
-            continue
 
-        is_stone = "tag:stone" in source_components
-        if not is_stone and not include_non_stone and identifier not in FORCE_INCLUDE_IDS:
-            continue
+def find_targets(include_non_stone: bool, plan: ChangePlan) -> list[TargetBlock]:
+    blocks_assets = plan.read_json(ASSETS_BLOCKS_PATH)
+    targets: list[TargetBlock] = []
 
-        base_name = identifier.split(":", 1)[1]
-        slab_path = SLABS_DIR / variant_filename(base_name, "slab")
-        stairs_path = STAIRS_DIR / variant_filename(base_name, "stairs")
-        has_slab = slab_path.exists()
-        has_stairs = stairs_path.exists()
-        has_three_steps_stairs = (UNIQUE_STAIRS_DIR / variant_filename(base_name, "three_steps_stairs")).exists()
-        has_vertical_slab = (BP_ROOT / "blocks/decorative/vertical_slabs" / variant_filename(base_name, "vertical_slab")).exists()
-
-        if has_slab and has_stairs and has_three_steps_stairs and has_vertical_slab and identifier not in FORCE_INCLUDE_IDS:
+    for source_path in iter_entire_block_files(plan):
+        source = plan.read_json(source_path)
+        source_block = source.get("minecraft:block", {})
+        identifier = source_block.get("description", {}).get("identifier")
+        if not identifier:
             continue
 
-        targets.append(
-            TargetBlock(
-                identifier=identifier,
-                base_name=base_name,
-                texture=texture_value,
-                sound=str(asset_entry.get("sound", "stone")),
-                is_stone=is_stone,
-                has_slab=has_slab,
-                has_stairs=has_stairs,
-                has_three_steps_stairs=has_three_steps_stairs,
-                has_vertical_slab=has_vertical_slab,
-                source_components=source_components,
-            )
+        target = build_target(
+            identifier,
+            source_block.get("components", {}),
+            blocks_assets.get(identifier),
+            include_non_stone,
+            plan,
         )
+        if target is not None:
+            targets.append(target)
 
     return targets
 
 
-def apply_source_behavior(target_components: dict[str, Any], source_components: dict[str, Any]) -> None:
+def apply_source_behavior(
+    target_components: dict[str, Any],
+    source_components: dict[str, Any],
+    base_name: str = "",
+) -> None:
     # Remove tag keys from template and re-apply tags from source.
     for key in [k for k in target_components.keys() if k.startswith("tag:")]:
         del target_components[key]
@@ -823,43 +790,49 @@ def apply_source_behavior(target_components: dict[str, Any], source_components:
         if key.startswith("tag:"):
             target_components[key] = copy.deepcopy(value)
 
+    # Sources without their own durability fall back to the shared material profile.
+    if "minecraft:destructible_by_mining" not in source_components and base_name:
+        profile = STONE_RESOLVER.resolve(base_name)
+        if profile is not None:
+            apply_durability(target_components, profile)
 
-def generate_slab_block(template: dict[str, Any], target: TargetBlock) -> dict[str, Any]:
+
+def generate_slab_block(template: dict[str, Any], target: TargetBlock, culling_mode: str = "per-block") -> dict[str, Any]:
     data = copy.deepcopy(template)
     block = data["minecraft:block"]
     components = block["components"]
 
     block["description"]["identifier"] = f"dorios_atelier:{target.base_name}_slab"
-    components["minecraft:geometry"]["culling"] = f"dorios_atelier:culling.{target.base_name}_slab"
+    components["minecraft:geometry"]["culling"] = culling_identifier(target.base_name, "slab", culling_mode)
     components["minecraft:material_instances"]["*"]["texture"] = target.texture
 
-    apply_source_behavior(components, target.source_components)
+    apply_source_behavior(components, target.source_components, target.base_name)
     return data
 
 
-def generate_stairs_block(template: dict[str, Any], target: TargetBlock) -> dict[str, Any]:
+def generate_stairs_block(template: dict[str, Any], target: TargetBlock, culling_mode: str = "per-block") -> dict[str, Any]:
     data = copy.deepcopy(template)
     block = data["minecraft:block"]
     components = block["components"]
 
     block["description"]["identifier"] = f"dorios_atelier:{target.base_name}_stairs"
-    components["minecraft:geometry"]["culling"] = f"dorios_atelier:culling.{target.base_name}_stairs"
+    components["minecraft:geometry"]["culling"] = culling_identifier(target.base_name, "stairs", culling_mode)
     components["minecraft:material_instances"]["*"]["texture"] = target.texture
 
-    apply_source_behavior(components, target.source_components)
+    apply_source_behavior(components, target.source_components, target.base_name)
     return data
 
 
-def generate_three_steps_stairs_block(template: dict[str, Any], target: TargetBlock) -> dict[str, Any]:
+def generate_three_steps_stairs_block(template: dict[str, Any], target: TargetBlock, culling_mode: str = "per-block") -> dict[str, Any]:
     data = copy.deepcopy(template)
     block = data["minecraft:block"]
     components = block["components"]
 
     block["description"]["identifier"] = f"dorios_atelier:{target.base_name}_three_steps_stairs"
-    components["minecraft:geometry"]["culling"] = f"dorios_atelier:culling.{target.base_name}_three_steps_stairs"
+    components["minecraft:geometry"]["culling"] = culling_identifier(target.base_name, "three_steps_stairs", culling_mode)
     components["minecraft:material_instances"]["*"]["texture"] = target.texture
 
-    apply_source_behavior(components, target.source_components)
+    apply_source_behavior(components, target.source_components, target.base_name)
     return data
 
 
@@ -871,25 +844,39 @@ def generate_vertical_slab_block(template: dict[str, Any], target: TargetBlock)
     block["description"]["identifier"] = f"dorios_atelier:{target.base_name}_vertical_slab"
     components["minecraft:material_instances"]["*"]["texture"] = target.texture
 
-    apply_source_behavior(components, target.source_components)
+    apply_source_behavior(components, target.source_components, target.base_name)
     return data
 
 
-def generate_slab_culling(template: dict[str, Any], base_name: str) -> dict[str, Any]:
-    data = copy.deepcopy(template)
-    data["minecraft:block_culling_rules"]["description"]["identifier"] = f"dorios_atelier:culling.{base_name}_slab"
-    return data
+def culling_identifier(base_name: str, variant_suffix: str, culling_mode: str) -> str:
+    if culling_mode == "shared":
+        return f"dorios_atelier:culling.{variant_suffix}"
+    return f"dorios_atelier:culling.{base_name}_{variant_suffix}"
 
 
-def generate_stairs_culling(template: dict[str, Any], base_name: str) -> dict[str, Any]:
-    data = copy.deepcopy(template)
-    data["minecraft:block_culling_rules"]["description"]["identifier"] = f"dorios_atelier:culling.{base_name}_stairs"
-    return data
+def culling_path(base_name: str, variant_suffix: str, culling_mode: str) -> Path:
+    if culling_mode == "shared":
+        return CULLING_DIR / SHARED_CULLING_FILES[variant_suffix]
+    return CULLING_DIR / variant_filename(base_name, variant_suffix)
 
 
-def generate_three_steps_stairs_culling(template: dict[str, Any], base_name: str) -> dict[str, Any]:
+def detect_culling_mode(plan: ChangePlan) -> str:
+    if all(plan.exists(CULLING_DIR / file_name) for file_name in SHARED_CULLING_FILES.values()):
+        return "shared"
+    return "per-block"
+
+
+def load_culling_template(variant_suffix: str, plan: ChangePlan) -> dict[str, Any]:
+    # The per-block template files are removed once culling has been consolidated.
+    shared_path = CULLING_DIR / SHARED_CULLING_FILES[variant_suffix]
+    if plan.exists(shared_path):
+        return plan.read_json(shared_path)
+    return plan.read_json(CULLING_TEMPLATE_PATHS[variant_suffix])
+
+
+def generate_culling(template: dict[str, Any], identifier: str) -> dict[str, Any]:
     data = copy.deepcopy(template)
-    data["minecraft:block_culling_rules"]["description"]["identifier"] = f"dorios_atelier:culling.{base_name}_three_steps_stairs"
+    data["minecraft:block_culling_rules"]["description"]["identifier"] = identifier
     return data
 
 
@@ -910,73 +897,40 @@ def make_stonecutter_recipe(base_name: str, variant_suffix: str, result_count: i
     }
 
 
-def split_variant_item_name(item_name: str) -> tuple[str, str] | None:
-    for suffix in VARIANT_SUFFIXES:
-        marker = f"_{suffix}"
-        if item_name.endswith(marker):
-            return item_name[: -len(marker)], suffix
-    return None
+def recipe_shard_name(file_name: str) -> str:
+    return infer_material_token(Path(file_name).stem)
 
 
-def wrap_label_lines(label: str, max_chars: int = LANG_NAME_MAX_CHARS) -> str:
-    words = [word for word in label.split() if word]
-    if not words:
-        return label
+def stonecutter_recipe_path(file_name: str, recipe_layout: str) -> Path:
+    if recipe_layout == "sharded":
+        return STONECUTTER_DIR / recipe_shard_name(file_name) / file_name
+    return STONECUTTER_DIR / file_name
 
-    lines: list[str] = []
-    current_line = ""
 
-    for word in words:
-        if not current_line:
-            current_line = word
-            continue
+def stonecutter_recipe_exists(file_name: str, plan: ChangePlan) -> bool:
+    return plan.exists(STONECUTTER_DIR / file_name) or plan.exists(stonecutter_recipe_path(file_name, "sharded"))
 
-        candidate = f"{current_line} {word}"
-        if len(candidate) <= max_chars:
-            current_line = candidate
-        else:
-            lines.append(current_line)
-            current_line = word
-
-    if current_line:
-        lines.append(current_line)
-
-    return "\\n".join(lines)
-
-
-def humanize_identifier(identifier: str) -> str:
-    words = identifier.split("_")
-    return " ".join(word.capitalize() for word in words)
-
-
-def format_variant_label(base_label: str, variant_suffix: str, language: str) -> str:
-    if language == "pt_BR":
-        templates = {
-            "slab": "Laje de {base}",
-            "stairs": "Escada de {base}",
-            "vertical_slab": "Laje Vertical de {base}",
-            "three_steps_stairs": "Escada de Três Degraus de {base}",
-        }
-    elif language == "es_MX":
-        templates = {
-            "slab": "Losa de {base}",
-            "stairs": "Escalera de {base}",
-            "vertical_slab": "Losa Vertical de {base}",
-            "three_steps_stairs": "Escalera de Tres Peldaños de {base}",
-        }
-    else:
-        templates = {
-            "slab": "{base} Slab",
-            "stairs": "{base} Stairs",
-            "vertical_slab": "{base} Vertical Slab",
-            "three_steps_stairs": "{base} Three-Step Stairs",
-        }
 
-    template = templates.get(variant_suffix, "{base}")
-    return template.format(base=base_label)
+def iter_stonecutter_recipe_files(plan: ChangePlan) -> list[Path]:
+    return plan.rglob(STONECUTTER_DIR, "*.json")
+
 
+def detect_recipe_layout(plan: ChangePlan) -> str:
+    for path in iter_stonecutter_recipe_files(plan):
+        if path.parent != STONECUTTER_DIR:
+            return "sharded"
+    return "flat"
 
-def collect_decorative_block_identifiers() -> list[str]:
+
+def split_variant_item_name(item_name: str) -> tuple[str, str] | None:
+    for suffix in VARIANT_SUFFIXES:
+        marker = f"_{suffix}"
+        if item_name.endswith(marker):
+            return item_name[: -len(marker)], suffix
+    return None
+
+
+def collect_decorative_block_identifiers(plan: ChangePlan) -> list[str]:
     directories = (
         ENTIRE_BLOCKS_DIR,
         SLABS_DIR,
@@ -988,11 +942,11 @@ def collect_decorative_block_identifiers() -> list[str]:
     identifiers: set[str] = set()
     for directory in directories:
         if directory == ENTIRE_BLOCKS_DIR:
-            json_paths = iter_entire_block_files()
+            json_paths = iter_entire_block_files(plan)
         else:
-            json_paths = sorted(directory.glob("*.json"))
+            json_paths = plan.glob(directory, "*.json")
         for path in json_paths:
-            payload = read_json(path)
+            payload = plan.read_json(path)
             identifier = payload.get("minecraft:block", {}).get("description", {}).get("identifier")
             if isinstance(identifier, str) and identifier.startswith("dorios_atelier:"):
                 identifiers.add(identifier)
@@ -1000,71 +954,110 @@ def collect_decorative_block_identifiers() -> list[str]:
     return sorted(identifiers)
 
 
-def update_block_localization_names(dry_run: bool) -> tuple[int, int]:
-    tile_line_pattern = re.compile(r"^(tile\.dorios_atelier:([a-z0-9_]+)\.name)=(.*)$")
-    block_identifiers = collect_decorative_block_identifiers()
-    vanilla_pt_name_map = load_vanilla_pt_name_map(ROOT / "tools/vanilla_blocks_list.md")
+TILE_LINE_PATTERN = re.compile(r"^(tile\.dorios_atelier:([a-z0-9_]+)\.name)=(.*)$")
 
-    updated_existing_entries = 0
-    created_missing_entries = 0
 
-    for language, lang_path in LANG_FILES.items():
-        if not lang_path.exists():
+@dataclass
+class LocaleLangState:
+    locale: LocalePlugin
+    vanilla_name_map: dict[str, str]
+    original_lines: list[str]
+    updated_lines: list[str] = field(default_factory=list)
+    existing_names: dict[str, str] = field(default_factory=dict)
+    updated_entries: int = 0
+    created_entries: int = 0
+
+
+def load_locale_lang_state(locale: LocalePlugin, plan: ChangePlan) -> LocaleLangState | None:
+    if not plan.exists(locale.lang_path):
+        return None
+
+    state = LocaleLangState(
+        locale=locale,
+        vanilla_name_map=load_vanilla_name_map(locale.vanilla_name_list),
+        original_lines=plan.read_text(locale.lang_path).splitlines(),
+    )
+
+    entries: list[tuple[str, str, str, str]] = []
+    for line in state.original_lines:
+        match = TILE_LINE_PATTERN.match(line)
+        if not match:
+            entries.append(("", "", "", line))
             continue
 
-        original_lines = lang_path.read_text(encoding="utf-8").splitlines()
-        updated_lines: list[str] = []
-        existing_names: dict[str, str] = {}
+        full_key = match.group(1)
+        block_name = match.group(2)
+        value = match.group(3).strip()
 
-        for line in original_lines:
-            match = tile_line_pattern.match(line)
-            if not match:
-                updated_lines.append(line)
-                continue
+        normalized_value = value.replace("\\n", " ").strip()
+        if locale.rejects_english_labels and contains_english_tokens(normalized_value):
+            normalized_value = localize_block_name_from_identifier(
+                block_name=block_name,
+                locale=locale,
+                existing_names=state.existing_names,
+                vanilla_name_map=state.vanilla_name_map,
+            )
+
+        state.existing_names[block_name] = normalized_value
+        entries.append((full_key, value, normalized_value, line))
+
+    wrapped_values = wrap_labels(normalized for full_key, _value, normalized, _line in entries if full_key)
+    for full_key, value, normalized_value, line in entries:
+        if not full_key:
+            state.updated_lines.append(line)
+            continue
+
+        wrapped_value = wrapped_values[normalized_value]
+        if wrapped_value != value:
+            state.updated_entries += 1
+        state.updated_lines.append(f"{full_key}={wrapped_value}")
+
+    return state
 
-            full_key = match.group(1)
-            block_name = match.group(2)
-            value = match.group(3).strip()
-
-            normalized_value = value.replace("\\n", " ").strip()
-            if language in {"pt_BR", "es_MX"} and contains_english_tokens(normalized_value):
-                normalized_value = localize_block_name_from_identifier(
-                    block_name=block_name,
-                    language=language,
-                    existing_names=existing_names,
-                    vanilla_pt_name_map=vanilla_pt_name_map,
-                )
-            wrapped_value = wrap_label_lines(normalized_value)
-
-            if wrapped_value != value:
-                updated_existing_entries += 1
-
-            existing_names[block_name] = normalized_value
-            updated_lines.append(f"{full_key}={wrapped_value}")
-
-        for identifier in block_identifiers:
-            block_name = identifier.split(":", 1)[1]
-            if block_name in existing_names:
+
+def add_missing_locale_entries(states: list[LocaleLangState], block_identifiers: list[str]) -> None:
+    # Single traversal of the identifiers; every registered locale is filled in the same pass.
+    generated: list[tuple[LocaleLangState, str, str]] = []
+    for identifier in block_identifiers:
+        block_name = identifier.split(":", 1)[1]
+        for state in states:
+            if block_name in state.existing_names:
                 continue
 
             generated_name = localize_block_name_from_identifier(
                 block_name=block_name,
-                language=language,
-                existing_names=existing_names,
-                vanilla_pt_name_map=vanilla_pt_name_map,
+                locale=state.locale,
+                existing_names=state.existing_names,
+                vanilla_name_map=state.vanilla_name_map,
             )
+            state.existing_names[block_name] = generated_name
+            state.created_entries += 1
+            generated.append((state, block_name, generated_name))
+
+    wrapped_names = wrap_labels(generated_name for _state, _block_name, generated_name in generated)
+    for state, block_name, generated_name in generated:
+        state.updated_lines.append(f"tile.dorios_atelier:{block_name}.name={wrapped_names[generated_name]}")
+
+
+def render_locale_lang_state(state: LocaleLangState) -> str:
+    return "\n".join(state.updated_lines) + "\n"
 
-            wrapped_name = wrap_label_lines(generated_name)
-            updated_lines.append(f"tile.dorios_atelier:{block_name}.name={wrapped_name}")
-            existing_names[block_name] = generated_name
-            created_missing_entries += 1
 
-        updated_content = "\n".join(updated_lines) + "\n"
-        original_content = "\n".join(original_lines) + "\n"
+def update_block_localization_names(plan: ChangePlan, block_identifiers: list[str] | None = None) -> tuple[int, int]:
+    if block_identifiers is None:
+        block_identifiers = collect_decorative_block_identifiers(plan)
+    loaded_states = [load_locale_lang_state(locale, plan) for locale in iter_locales()]
+    states = [state for state in loaded_states if state is not None]
 
-        if not dry_run and updated_content != original_content:
-            lang_path.write_text(updated_content, encoding="utf-8")
+    add_missing_locale_entries(states, block_identifiers)
 
+    for state in states:
+        content = render_locale_lang_state(state)
+        if content != "\n".join(state.original_lines) + "\n":
+            plan.write_text(state.locale.lang_path, content)
+
+    updated_existing_entries = sum(state.updated_entries for state in states)
+    created_missing_entries = sum(state.created_entries for state in states)
     return updated_existing_entries, created_missing_entries
 
 
@@ -1089,12 +1082,17 @@ def make_reverse_stonecutter_recipe(base_item_id: str, variant_item_id: str, var
     }
 
 
-def create_reverse_variant_recipes(dry_run: bool) -> tuple[int, int]:
+def create_reverse_variant_recipes(
+    plan: ChangePlan,
+    recipe_layout: str,
+    recipe_paths: Iterable[Path] | None = None,
+) -> tuple[int, int]:
+    # recipe_paths restricts the pass to those forward recipes (default: every stonecutter recipe).
     created_reverse_recipes = 0
     skipped_non_variant_recipes = 0
 
-    for recipe_path in sorted(STONECUTTER_DIR.glob("*.json")):
-        payload = read_json(recipe_path)
+    for recipe_path in iter_stonecutter_recipe_files(plan) if recipe_paths is None else recipe_paths:
+        payload = plan.read_json(recipe_path)
         recipe = payload.get("minecraft:recipe_shapeless", {})
 
         tags = recipe.get("tags", [])
@@ -1132,21 +1130,18 @@ def create_reverse_variant_recipes(dry_run: bool) -> tuple[int, int]:
         variant_item_id = result_item
 
         reverse_file_name = f"{base_name}_from_{result_name}.json"
-        reverse_path = STONECUTTER_DIR / reverse_file_name
-
-        if reverse_path.exists():
+        if stonecutter_recipe_exists(reverse_file_name, plan):
             continue
 
         reverse_payload = make_reverse_stonecutter_recipe(base_item_id, variant_item_id, variant_suffix)
-        if not dry_run:
-            write_json(reverse_path, reverse_payload)
+        plan.write_json(stonecutter_recipe_path(reverse_file_name, recipe_layout), reverse_payload)
         created_reverse_recipes += 1
 
     return created_reverse_recipes, skipped_non_variant_recipes
 
 
-def update_assets_blocks(targets: list[TargetBlock], dry_run: bool) -> tuple[int, int, int, int]:
-    data = read_json(ASSETS_BLOCKS_PATH)
+def update_assets_blocks(targets: list[TargetBlock], plan: ChangePlan) -> tuple[int, int, int, int]:
+    data = plan.read_json(ASSETS_BLOCKS_PATH)
     created_slab_entries = 0
     created_stairs_entries = 0
     created_three_step_stairs_entries = 0
@@ -1171,13 +1166,13 @@ def update_assets_blocks(targets: list[TargetBlock], dry_run: bool) -> tuple[int
             data[vertical_slab_id] = {"sound": target.sound, "textures": target.texture}
             created_vertical_slab_entries += 1
 
-    if not dry_run and (
+    if (
         created_slab_entries
         or created_stairs_entries
         or created_three_step_stairs_entries
         or created_vertical_slab_entries
     ):
-        write_json(ASSETS_BLOCKS_PATH, data)
+        plan.write_json(ASSETS_BLOCKS_PATH, data)
 
     return (
         created_slab_entries,
@@ -1187,41 +1182,6 @@ def update_assets_blocks(targets: list[TargetBlock], dry_run: bool) -> tuple[int
     )
 
 
-def sync_or_create_group_items(
-    groups: list[dict[str, Any]],
-    group_name: str,
-    icon: str,
-    items: list[str],
-) -> int:
-    seen: set[str] = set()
-    desired_items: list[str] = []
-    for item in items:
-        if item in seen:
-            continue
-        seen.add(item)
-        desired_items.append(item)
-
-    for group in groups:
-        current_name = group.get("group_identifier", {}).get("name")
-        if current_name == group_name:
-            current_items = group.get("items", [])
-            if current_items != desired_items:
-                group["items"] = desired_items
-                return 1
-            return 0
-
-    groups.append(
-        {
-            "group_identifier": {
-                "icon": icon,
-                "name": group_name,
-            },
-            "items": desired_items,
-        }
-    )
-    return 1
-
-
 def infer_material_token(base_name: str) -> str:
     words = base_name.split("_")
     for token in MATERIAL_TOKEN_PRIORITY:
@@ -1259,84 +1219,57 @@ def build_material_order(stonework_items: list[str]) -> list[str]:
     return ordered_tokens
 
 
+@lru_cache(maxsize=None)
+def variant_sort_parts(identifier: str) -> tuple[str, str]:
+    # Parsing the identifier is the expensive part of the sort key; it never changes.
+    base_name = extract_base_name(identifier)
+    return infer_material_token(base_name), base_name
+
+
 def sort_variant_items_by_material(items: list[str], material_order: list[str]) -> list[str]:
     order_index = {token: index for index, token in enumerate(material_order)}
+    missing_index = len(order_index) + 1
 
     def key(identifier: str) -> tuple[int, str, str]:
-        base_name = extract_base_name(identifier)
-        token = infer_material_token(base_name)
-        return (order_index.get(token, len(order_index) + 1), base_name, identifier)
+        token, base_name = variant_sort_parts(identifier)
+        return (order_index.get(token, missing_index), base_name, identifier)
 
     return sorted(set(items), key=key)
 
 
-def collect_identifiers_from_dir(directory: Path) -> list[str]:
+def collect_identifiers_from_dir(directory: Path, plan: ChangePlan) -> list[str]:
     identifiers: list[str] = []
-    for path in sorted(directory.glob("*.json")):
-        payload = read_json(path)
+    for path in plan.glob(directory, "*.json"):
+        payload = plan.read_json(path)
         identifier = payload.get("minecraft:block", {}).get("description", {}).get("identifier")
         if isinstance(identifier, str):
             identifiers.append(identifier)
     return identifiers
 
 
-def update_crafting_catalog(dry_run: bool) -> tuple[int, int, int, int, int, int]:
-    data = read_json(CATALOG_PATH)
-    categories = data["minecraft:crafting_items_catalog"]["categories"]
-    construction = next(category for category in categories if category["category_name"] == "construction")
-    groups = construction["groups"]
-    valid_stonework_names = {STONEWORK_GROUP_NAME, "dorios_atelier:itemGroup.name.stoneBricks"}
-    stonework_group = next(
-        (
-            group
-            for group in groups
-            if group.get("group_identifier", {}).get("name") in valid_stonework_names
-        ),
-        None,
-    )
+def update_crafting_catalog(plan: ChangePlan) -> tuple[int, int, int, int, int, int]:
+    catalog = CraftingCatalog.for_plan(plan)
+    stonework_group = catalog.group("construction", STONEWORK_GROUP_NAME, "dorios_atelier:itemGroup.name.stoneBricks")
     stonework_items = stonework_group.get("items", []) if isinstance(stonework_group, dict) else []
     material_order = build_material_order(stonework_items)
 
     removed_slab_groups = 0
     removed_stairs_groups = 0
 
-    slab_ids = collect_identifiers_from_dir(SLABS_DIR)
-    stairs_ids = collect_identifiers_from_dir(STAIRS_DIR)
-    vertical_slab_ids = collect_identifiers_from_dir(BP_ROOT / "blocks/decorative/vertical_slabs")
-    three_step_stairs_ids = collect_identifiers_from_dir(UNIQUE_STAIRS_DIR)
-    ordered_slab_ids = sort_variant_items_by_material(slab_ids, material_order)
-    ordered_stairs_ids = sort_variant_items_by_material(stairs_ids, material_order)
-    ordered_vertical_slab_ids = sort_variant_items_by_material(vertical_slab_ids, material_order)
-    ordered_three_step_stairs_ids = sort_variant_items_by_material(three_step_stairs_ids, material_order)
-
-    catalog_updates = 0
-    catalog_updates += sync_or_create_group_items(
-        construction["groups"],
-        SLAB_GROUP_NAME,
-        "dorios_atelier:andesite_tiles_slab",
-        ordered_slab_ids,
-    )
-    catalog_updates += sync_or_create_group_items(
-        construction["groups"],
-        STAIRS_GROUP_NAME,
-        "dorios_atelier:andesite_tiles_stairs",
-        ordered_stairs_ids,
-    )
-    catalog_updates += sync_or_create_group_items(
-        construction["groups"],
-        VERTICAL_SLABS_GROUP_NAME,
-        "dorios_atelier:andesite_tiles_vertical_slab",
-        ordered_vertical_slab_ids,
-    )
-    catalog_updates += sync_or_create_group_items(
-        construction["groups"],
-        THREE_STEP_STAIRS_GROUP_NAME,
-        "dorios_atelier:andesite_tiles_three_steps_stairs",
-        ordered_three_step_stairs_ids,
-    )
+    slab_ids = collect_identifiers_from_dir(SLABS_DIR, plan)
+    stairs_ids = collect_identifiers_from_dir(STAIRS_DIR, plan)
+    vertical_slab_ids = collect_identifiers_from_dir(BP_ROOT / "blocks/decorative/vertical_slabs", plan)
+    three_step_stairs_ids = collect_identifiers_from_dir(UNIQUE_STAIRS_DIR, plan)
+
+    for group_name, icon, ids in (
+        (SLAB_GROUP_NAME, "dorios_atelier:andesite_tiles_slab", slab_ids),
+        (STAIRS_GROUP_NAME, "dorios_atelier:andesite_tiles_stairs", stairs_ids),
+        (VERTICAL_SLABS_GROUP_NAME, "dorios_atelier:andesite_tiles_vertical_slab", vertical_slab_ids),
+        (THREE_STEP_STAIRS_GROUP_NAME, "dorios_atelier:andesite_tiles_three_steps_stairs", three_step_stairs_ids),
+    ):
+        catalog.sync_group("construction", group_name, icon, sort_variant_items_by_material(ids, material_order))
 
-    if not dry_run and (removed_slab_groups or removed_stairs_groups or catalog_updates):
-        write_json(CATALOG_PATH, data)
+    catalog.save(plan)
 
     return (
         removed_slab_groups,
@@ -1348,26 +1281,127 @@ def update_crafting_catalog(dry_run: bool) -> tuple[int, int, int, int, int, int
     )
 
 
-def update_stairs_script(dry_run: bool) -> int:
-    stairs_ids = collect_identifiers_from_dir(STAIRS_DIR) + collect_identifiers_from_dir(UNIQUE_STAIRS_DIR)
-    stairs_ids = sorted(set(stairs_ids))
+STAIR_IDS_PATTERN = re.compile(r"const STAIR_IDS = new Set\(\[(?:.|\n)*?\]\);")
+
 
-    script = STAIRS_SCRIPT_PATH.read_text(encoding="utf-8")
+def replace_stair_ids(script: str, stairs_ids: list[str]) -> str:
     replacement_lines = ["const STAIR_IDS = new Set(["]
     for identifier in stairs_ids:
         replacement_lines.append(f'    "{identifier}",')
     replacement_lines.append("]);")
-    replacement_block = "\n".join(replacement_lines)
+    return STAIR_IDS_PATTERN.sub(lambda _match: "\n".join(replacement_lines), script, count=1)
 
-    pattern = r"const STAIR_IDS = new Set\(\[(?:.|\n)*?\]\);"
-    updated = re.sub(pattern, replacement_block, script, count=1)
 
-    if updated != script and not dry_run:
-        STAIRS_SCRIPT_PATH.write_text(updated, encoding="utf-8")
+def update_stairs_script(plan: ChangePlan) -> int:
+    stairs_ids = collect_identifiers_from_dir(STAIRS_DIR, plan) + collect_identifiers_from_dir(UNIQUE_STAIRS_DIR, plan)
+    stairs_ids = sorted(set(stairs_ids))
+
+    script = plan.read_text(STAIRS_SCRIPT_PATH)
+    updated = replace_stair_ids(script, stairs_ids)
+
+    if updated != script:
+        plan.write_text(STAIRS_SCRIPT_PATH, updated)
 
     return len(stairs_ids)
 
 
+def apply_vanilla_shapes(families: dict[str, dict[str, str]], vanilla_base_names: set[str]) -> dict[str, str]:
+    aliases: dict[str, str] = {}
+    for base_name, shapes in VANILLA_SHAPE_IDS.items():
+        if base_name not in vanilla_base_names:
+            continue
+        family = families.setdefault(base_name, {"default": f"minecraft:{base_name}"})
+        # A pack block with local textures keeps its own shapes; the vanilla ones would not match it.
+        if family["default"] != f"minecraft:{base_name}":
+            continue
+        for state, vanilla_id in shapes.items():
+            pack_id = family.get(state)
+            if pack_id is not None and pack_id != vanilla_id:
+                aliases[pack_id] = vanilla_id
+            family[state] = vanilla_id
+    return aliases
+
+
+def order_shape_families(families: dict[str, dict[str, str]]) -> list[dict[str, str]]:
+    return [
+        {state: families[base_name][state] for state in SHAPE_FAMILY_STATES if state in families[base_name]}
+        for base_name in sorted(families)
+    ]
+
+
+def build_shape_families(plan: ChangePlan) -> tuple[list[dict[str, str]], dict[str, str]]:
+    entire_block_ids: set[str] = set()
+    for path in iter_entire_block_files(plan):
+        identifier = plan.read_json(path).get("minecraft:block", {}).get("description", {}).get("identifier")
+        if isinstance(identifier, str):
+            entire_block_ids.add(identifier)
+    variant_dirs = (SLABS_DIR, STAIRS_DIR, UNIQUE_STAIRS_DIR, BP_ROOT / "blocks/decorative/vertical_slabs")
+
+    families: dict[str, dict[str, str]] = {}
+    for directory in variant_dirs:
+        for identifier in collect_identifiers_from_dir(directory, plan):
+            parsed = split_variant_item_name(identifier.split(":", 1)[1])
+            if parsed is not None:
+                families.setdefault(parsed[0], {})[parsed[1]] = identifier
+
+    for base_name, family in families.items():
+        # Variants only exist for pack blocks and vanilla bases (see apply_vanilla_base_policy).
+        custom_id = f"dorios_atelier:{base_name}"
+        family["default"] = custom_id if custom_id in entire_block_ids else f"minecraft:{base_name}"
+
+    for wood in VANILLA_WOOD_FAMILY_NAMES:
+        families.setdefault(wood, {}).update(
+            default=f"minecraft:{wood}_planks",
+            stairs=f"minecraft:{wood}_stairs",
+            slab=f"minecraft:{wood}_slab",
+        )
+
+    aliases = apply_vanilla_shapes(families, load_vanilla_base_names(VANILLA_LIST_PATH))
+    return order_shape_families(families), aliases
+
+
+def render_shape_families_script(families: list[dict[str, str]], aliases: dict[str, str]) -> str:
+    lines = [
+        "// Generated by tools/generate_uniform_variants.py. Do not edit by hand.",
+        "",
+        "const SHAPE_FAMILIES = [",
+    ]
+    for family in families:
+        fields = ", ".join(f"{state}: '{identifier}'" for state, identifier in family.items())
+        lines.append(f"    {{ {fields} }},")
+    lines += [
+        "]",
+        "",
+        "// Pack shapes that duplicate a vanilla shape -> the vanilla id their family uses.",
+        "const SHAPE_FAMILY_ALIASES = {",
+    ]
+    for alias in sorted(aliases):
+        lines.append(f"    '{alias}': '{aliases[alias]}',")
+    lines += [
+        "}",
+        "",
+        "// Block id -> { state, family } for every shape of every family.",
+        "export const SHAPE_FAMILY_BY_ID = new Map()",
+        "for (const family of SHAPE_FAMILIES) {",
+        "    Object.freeze(family)",
+        "    for (const [state, id] of Object.entries(family)) {",
+        "        SHAPE_FAMILY_BY_ID.set(id, Object.freeze({ state, family }))",
+        "    }",
+        "}",
+        "for (const [alias, id] of Object.entries(SHAPE_FAMILY_ALIASES)) {",
+        "    SHAPE_FAMILY_BY_ID.set(alias, SHAPE_FAMILY_BY_ID.get(id))",
+        "}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def update_shape_families_script(plan: ChangePlan) -> int:
+    families, aliases = build_shape_families(plan)
+    plan.write_text(SHAPE_FAMILIES_SCRIPT_PATH, render_shape_families_script(families, aliases))
+    return len(families)
+
+
 def build_report(targets: list[TargetBlock]) -> dict[str, Any]:
     return {
         "target_count": len(targets),
@@ -1387,14 +1421,20 @@ def build_report(targets: list[TargetBlock]) -> dict[str, Any]:
     }
 
 
-def run_generation(targets: list[TargetBlock], dry_run: bool) -> dict[str, int]:
-    slab_template = read_json(SLAB_TEMPLATE_PATH)
-    stairs_template = read_json(STAIRS_TEMPLATE_PATH)
-    three_step_stairs_template = read_json(THREE_STEP_STAIRS_TEMPLATE_PATH)
-    vertical_slab_template = read_json(VERTICAL_SLAB_TEMPLATE_PATH)
-    slab_culling_template = read_json(SLAB_CULLING_TEMPLATE_PATH)
-    stairs_culling_template = read_json(STAIRS_CULLING_TEMPLATE_PATH)
-    three_step_stairs_culling_template = read_json(THREE_STEP_STAIRS_CULLING_TEMPLATE_PATH)
+def generate_target_files(
+    targets: list[TargetBlock],
+    plan: ChangePlan,
+    recipe_layout: str = "flat",
+    culling_mode: str = "per-block",
+) -> dict[str, int]:
+    # Block, culling and forward recipe files of the given targets only; nothing else is scanned.
+    slab_template = plan.read_json(SLAB_TEMPLATE_PATH)
+    stairs_template = plan.read_json(STAIRS_TEMPLATE_PATH)
+    three_step_stairs_template = plan.read_json(THREE_STEP_STAIRS_TEMPLATE_PATH)
+    vertical_slab_template = plan.read_json(VERTICAL_SLAB_TEMPLATE_PATH)
+    slab_culling_template = load_culling_template("slab", plan)
+    stairs_culling_template = load_culling_template("stairs", plan)
+    three_step_stairs_culling_template = load_culling_template("three_steps_stairs", plan)
 
     created_slab_blocks = 0
     created_stairs_blocks = 0
@@ -1409,84 +1449,116 @@ def run_generation(targets: list[TargetBlock], dry_run: bool) -> dict[str, int]:
     created_vertical_slab_recipes = 0
 
     for target in targets:
-        slab_block_path = SLABS_DIR / variant_filename(target.base_name, "slab")
-        stairs_block_path = STAIRS_DIR / variant_filename(target.base_name, "stairs")
-        three_step_stairs_block_path = UNIQUE_STAIRS_DIR / variant_filename(target.base_name, "three_steps_stairs")
-        vertical_slab_block_path = BP_ROOT / "blocks/decorative/vertical_slabs" / variant_filename(target.base_name, "vertical_slab")
-        slab_culling_path = CULLING_DIR / variant_filename(target.base_name, "slab")
-        stairs_culling_path = CULLING_DIR / variant_filename(target.base_name, "stairs")
-        three_step_stairs_culling_path = CULLING_DIR / variant_filename(target.base_name, "three_steps_stairs")
-        slab_recipe_path = STONECUTTER_DIR / f"{target.base_name}_slab_from_{target.base_name}.json"
-        stairs_recipe_path = STONECUTTER_DIR / f"{target.base_name}_str_from_{target.base_name}.json"
-        three_step_stairs_recipe_path = STONECUTTER_DIR / f"{target.base_name}_tss_from_{target.base_name}.json"
-        vertical_slab_recipe_path = STONECUTTER_DIR / f"{target.base_name}_vslab_from_{target.base_name}.json"
-
-        if not slab_block_path.exists():
-            if not dry_run:
-                write_json(slab_block_path, generate_slab_block(slab_template, target))
+        slab_block_path = variant_block_path(target.base_name, "slab")
+        stairs_block_path = variant_block_path(target.base_name, "stairs")
+        three_step_stairs_block_path = variant_block_path(target.base_name, "three_steps_stairs")
+        vertical_slab_block_path = variant_block_path(target.base_name, "vertical_slab")
+        slab_culling_path = culling_path(target.base_name, "slab", culling_mode)
+        stairs_culling_path = culling_path(target.base_name, "stairs", culling_mode)
+        three_step_stairs_culling_path = culling_path(target.base_name, "three_steps_stairs", culling_mode)
+        slab_recipe_name = f"{target.base_name}_slab_from_{target.base_name}.json"
+        stairs_recipe_name = f"{target.base_name}_str_from_{target.base_name}.json"
+        three_step_stairs_recipe_name = f"{target.base_name}_tss_from_{target.base_name}.json"
+        vertical_slab_recipe_name = f"{target.base_name}_vslab_from_{target.base_name}.json"
+
+        if not plan.exists(slab_block_path):
+            plan.write_json(slab_block_path, generate_slab_block(slab_template, target, culling_mode))
             created_slab_blocks += 1
 
-        if not stairs_block_path.exists():
-            if not dry_run:
-                write_json(stairs_block_path, generate_stairs_block(stairs_template, target))
+        if not plan.exists(stairs_block_path):
+            plan.write_json(stairs_block_path, generate_stairs_block(stairs_template, target, culling_mode))
             created_stairs_blocks += 1
 
-        if not three_step_stairs_block_path.exists():
-            if not dry_run:
-                write_json(three_step_stairs_block_path, generate_three_steps_stairs_block(three_step_stairs_template, target))
+        if not plan.exists(three_step_stairs_block_path):
+            plan.write_json(three_step_stairs_block_path, generate_three_steps_stairs_block(three_step_stairs_template, target, culling_mode))
             created_three_steps_stairs_blocks += 1
 
-        if not vertical_slab_block_path.exists():
-            if not dry_run:
-                write_json(vertical_slab_block_path, generate_vertical_slab_block(vertical_slab_template, target))
+        if not plan.exists(vertical_slab_block_path):
+            plan.write_json(vertical_slab_block_path, generate_vertical_slab_block(vertical_slab_template, target))
             created_vertical_slabs += 1
 
-        if not slab_culling_path.exists():
-            if not dry_run:
-                write_json(slab_culling_path, generate_slab_culling(slab_culling_template, target.base_name))
+        if not plan.exists(slab_culling_path):
+            plan.write_json(
+                slab_culling_path,
+                generate_culling(slab_culling_template, culling_identifier(target.base_name, "slab", culling_mode)),
+            )
             created_slab_culling += 1
 
-        if not stairs_culling_path.exists():
-            if not dry_run:
-                write_json(stairs_culling_path, generate_stairs_culling(stairs_culling_template, target.base_name))
+        if not plan.exists(stairs_culling_path):
+            plan.write_json(
+                stairs_culling_path,
+                generate_culling(stairs_culling_template, culling_identifier(target.base_name, "stairs", culling_mode)),
+            )
             created_stairs_culling += 1
 
-        if not three_step_stairs_culling_path.exists():
-            if not dry_run:
-                write_json(
-                    three_step_stairs_culling_path,
-                    generate_three_steps_stairs_culling(three_step_stairs_culling_template, target.base_name),
-                )
+        if not plan.exists(three_step_stairs_culling_path):
+            plan.write_json(
+                three_step_stairs_culling_path,
+                generate_culling(
+                    three_step_stairs_culling_template,
+                    culling_identifier(target.base_name, "three_steps_stairs", culling_mode),
+                ),
+            )
             created_three_steps_stairs_culling += 1
 
-        if not slab_recipe_path.exists():
-            if not dry_run:
-                write_json(slab_recipe_path, make_stonecutter_recipe(target.base_name, "slab", 2))
+        if not stonecutter_recipe_exists(slab_recipe_name, plan):
+            plan.write_json(
+                stonecutter_recipe_path(slab_recipe_name, recipe_layout),
+                make_stonecutter_recipe(target.base_name, "slab", 2),
+            )
             created_slab_recipes += 1
 
-        if not stairs_recipe_path.exists():
-            if not dry_run:
-                write_json(stairs_recipe_path, make_stonecutter_recipe(target.base_name, "stairs", 1))
+        if not stonecutter_recipe_exists(stairs_recipe_name, plan):
+            plan.write_json(
+                stonecutter_recipe_path(stairs_recipe_name, recipe_layout),
+                make_stonecutter_recipe(target.base_name, "stairs", 1),
+            )
             created_stairs_recipes += 1
 
-        if not three_step_stairs_recipe_path.exists():
-            if not dry_run:
-                write_json(three_step_stairs_recipe_path, make_stonecutter_recipe(target.base_name, "three_steps_stairs", 1))
+        if not stonecutter_recipe_exists(three_step_stairs_recipe_name, plan):
+            plan.write_json(
+                stonecutter_recipe_path(three_step_stairs_recipe_name, recipe_layout),
+                make_stonecutter_recipe(target.base_name, "three_steps_stairs", 1),
+            )
             created_three_steps_stairs_recipes += 1
 
-        if not vertical_slab_recipe_path.exists():
-            if not dry_run:
-                write_json(vertical_slab_recipe_path, make_stonecutter_recipe(target.base_name, "vertical_slab", 2))
+        if not stonecutter_recipe_exists(vertical_slab_recipe_name, plan):
+            plan.write_json(
+                stonecutter_recipe_path(vertical_slab_recipe_name, recipe_layout),
+                make_stonecutter_recipe(target.base_name, "vertical_slab", 2),
+            )
             created_vertical_slab_recipes += 1
 
-    created_reverse_recipes, skipped_non_variant_recipes = create_reverse_variant_recipes(dry_run)
+    return {
+        "created_slab_blocks": created_slab_blocks,
+        "created_stairs_blocks": created_stairs_blocks,
+        "created_three_steps_stairs_blocks": created_three_steps_stairs_blocks,
+        "created_vertical_slabs": created_vertical_slabs,
+        "created_slab_culling": created_slab_culling,
+        "created_stairs_culling": created_stairs_culling,
+        "created_three_steps_stairs_culling": created_three_steps_stairs_culling,
+        "created_slab_recipes": created_slab_recipes,
+        "created_stairs_recipes": created_stairs_recipes,
+        "created_three_steps_stairs_recipes": created_three_steps_stairs_recipes,
+        "created_vertical_slab_recipes": created_vertical_slab_recipes,
+    }
+
+
+def run_generation(
+    targets: list[TargetBlock],
+    plan: ChangePlan,
+    recipe_layout: str = "flat",
+    culling_mode: str = "per-block",
+) -> dict[str, int]:
+    stats = generate_target_files(targets, plan, recipe_layout, culling_mode)
+    created_reverse_recipes, skipped_non_variant_recipes = create_reverse_variant_recipes(plan, recipe_layout)
 
     (
         assets_slab_entries,
         assets_stairs_entries,
         assets_three_step_stairs_entries,
         assets_vertical_slab_entries,
-    ) = update_assets_blocks(targets, dry_run)
+    ) = update_assets_blocks(targets, plan)
     (
         removed_vanilla_slab_groups,
         removed_vanilla_stairs_groups,
@@ -1494,22 +1566,14 @@ def run_generation(targets: list[TargetBlock], dry_run: bool) -> dict[str, int]:
         catalog_stairs_items,
         catalog_vertical_slab_items,
         catalog_three_step_stairs_items,
-    ) = update_crafting_catalog(dry_run)
-    tracked_stairs_ids = update_stairs_script(dry_run)
-    updated_localization_entries, created_localization_entries = update_block_localization_names(dry_run)
+    ) = update_crafting_catalog(plan)
+    tracked_stairs_ids = update_stairs_script(plan)
+    shape_families = update_shape_families_script(plan)
+    sound_event_ids = update_sound_events_script(plan)
+    updated_localization_entries, created_localization_entries = update_block_localization_names(plan)
 
     return {
-        "created_slab_blocks": created_slab_blocks,
-        "created_stairs_blocks": created_stairs_blocks,
-        "created_three_steps_stairs_blocks": created_three_steps_stairs_blocks,
-        "created_vertical_slabs": created_vertical_slabs,
-        "created_slab_culling": created_slab_culling,
-        "created_stairs_culling": created_stairs_culling,
-        "created_three_steps_stairs_culling": created_three_steps_stairs_culling,
-        "created_slab_recipes": created_slab_recipes,
-        "created_stairs_recipes": created_stairs_recipes,
-        "created_three_steps_stairs_recipes": created_three_steps_stairs_recipes,
-        "created_vertical_slab_recipes": created_vertical_slab_recipes,
+        **stats,
         "created_reverse_variant_recipes": created_reverse_recipes,
         "skipped_non_variant_stonecutter_recipes": skipped_non_variant_recipes,
         "assets_slab_entries": assets_slab_entries,
@@ -1523,18 +1587,47 @@ def run_generation(targets: list[TargetBlock], dry_run: bool) -> dict[str, int]:
         "catalog_vertical_slab_items": catalog_vertical_slab_items,
         "catalog_three_step_stairs_items": catalog_three_step_stairs_items,
         "tracked_stairs_ids": tracked_stairs_ids,
+        "shape_families": shape_families,
+        "sound_event_ids": sound_event_ids,
         "updated_localization_entries": updated_localization_entries,
         "created_localization_entries": created_localization_entries,
     }
 
 
-def main() -> None:
+def pipeline_stage(plan: ChangePlan, args: argparse.Namespace) -> tuple[dict[str, Any], Callable[[], None] | None]:
+    # Default run for `atelier.py pipeline`: vanilla base policy, then auto layout and culling mode.
+    stats: dict[str, Any] = apply_vanilla_base_policy(VANILLA_LIST_PATH, plan)
+    targets = find_targets(include_non_stone=args.include_non_stone, plan=plan)
+    stats["mapped_targets"] = len(targets)
+    stats.update(run_generation(targets, plan, detect_recipe_layout(plan), detect_culling_mode(plan)))
+    return stats, lambda: write_json(REPORT_PATH, build_report(targets))
+
+
+def validate_after_apply(args: argparse.Namespace) -> int:
+    if args.skip_validation:
+        return 0
+    results, validation_stats = validate_pack()
+    print_validation_report(results, validation_stats)
+    return 1 if validation_stats["errors"] else 0
+
+
+def main() -> int:
     args = parse_args()
 
+    if args.apply_plan is not None:
+        plan = ChangePlan.load(args.apply_plan)
+        applied = plan.apply()
+        print(f"Applied plan: {args.apply_plan}")
+        for action, count in applied.items():
+            print(f"- {action}: {count}")
+        return validate_after_apply(args)
+
+    plan = ChangePlan()
+
     if not args.import_vanilla_compatible:
         policy_stats = apply_vanilla_base_policy(
             vanilla_list_path=args.vanilla_list,
-            dry_run=args.dry_run,
+            plan=plan,
         )
         print("Vanilla base policy summary:")
         for key, value in policy_stats.items():
@@ -1547,31 +1640,48 @@ def main() -> None:
         import_stats = import_vanilla_compatible_blocks(
             vanilla_blocks_json_path=args.vanilla_blocks_json,
             vanilla_list_path=args.vanilla_list,
-            dry_run=args.dry_run,
+            plan=plan,
         )
 
         print("Vanilla import summary:")
         for key, value in import_stats.items():
             print(f"- {key}: {value}")
 
-    targets = find_targets(include_non_stone=args.include_non_stone)
+    targets = find_targets(include_non_stone=args.include_non_stone, plan=plan)
 
     report = build_report(targets)
-    REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    write_json(REPORT_PATH, report)
+    if args.plan_out is not None:
+        # The saved plan carries the report, so --apply-plan writes the one it was built with.
+        plan.write_json(REPORT_PATH, report)
+    else:
+        write_json(REPORT_PATH, report)
 
     print(f"Mapped targets: {len(targets)}")
     print(f"Report: {REPORT_PATH.relative_to(ROOT)}")
 
-    if args.dry_run:
-        print("Dry run enabled. No files were changed.")
-        return
-
-    stats = run_generation(targets, dry_run=False)
+    recipe_layout = detect_recipe_layout(plan) if args.recipe_layout == "auto" else args.recipe_layout
+    culling_mode = detect_culling_mode(plan) if args.culling_mode == "auto" else args.culling_mode
+    stats = run_generation(targets, plan, recipe_layout, culling_mode)
     print("Generation summary:")
     for key, value in stats.items():
         print(f"- {key}: {value}")
 
+    if args.plan_out is not None:
+        plan.save(args.plan_out)
+        print(f"Plan: {args.plan_out}")
+
+    if args.dry_run:
+        print_plan(plan, show_diff=args.show_diff)
+        print("Dry run enabled. No files were changed.")
+        return 0
+
+    applied = plan.apply()
+    print("Applied changes:")
+    for action, count in applied.items():
+        print(f"- {action}: {count}")
+
+    return validate_after_apply(args)
+
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+"""
+Persistent cache of parsed pack JSON, shared by every tool that reads through pack_io.
+
+Entries are keyed by the file's path (relative to the repository) and validated
+against its size and mtime_ns; when those changed but the sha1 of the bytes did not
+(a checkout or copy touched the file), the entry is reused and re-stamped. Payloads
+are stored as marshal blobs and decoded on every read, so callers always get a fresh
+object they are free to mutate.
+
+The store lives in tools/generated/json_cache.bin (gitignored), is loaded on first
+use and written back at exit when something changed. It is bounded LRU-style by the
+total size of the blobs. Set ATELIER_JSON_CACHE=0 to bypass it.
+"""
+
+import atexit
+import hashlib
+import json
+import marshal
+import os
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pack_io import ROOT
+
+CACHE_PATH = ROOT / "tools/generated/json_cache.bin"
+# marshal's format is tied to the interpreter, so the Python version is part of the header.
+CACHE_HEADER = ("json_cache", 1, marshal.version, sys.version_info[:2])
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class CacheEntry:
+    size: int
+    mtime_ns: int
+    sha1: str
+    blob: bytes
+
+
+class JsonCache:
+    def __init__(self, path: Path = CACHE_PATH, max_bytes: int = MAX_CACHE_BYTES) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.total_bytes = 0
+        self.dirty = False
+        self.stats = {"hits": 0, "rehashed": 0, "parsed": 0}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            header, rows = marshal.loads(self.path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return
+        if tuple(header) != CACHE_HEADER:
+            return
+        for key, size, mtime_ns, sha1, blob in rows:
+            self.entries[key] = CacheEntry(size, mtime_ns, sha1, blob)
+            self.total_bytes += len(blob)
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        rows = [(key, e.size, e.mtime_ns, e.sha1, e.blob) for key, e in self.entries.items()]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_bytes(marshal.dumps((CACHE_HEADER, rows)))
+        os.replace(temp_path, self.path)
+        self.dirty = False
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= len(previous.blob)
+        self.entries[key] = entry
+        self.total_bytes += len(entry.blob)
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.total_bytes -= len(evicted.blob)
+        self.dirty = True
+
+    def read_json(self, path: Path) -> Any:
+        key = path.relative_to(ROOT).as_posix() if path.is_relative_to(ROOT) else path.as_posix()
+        stat = path.stat()
+        entry = self.entries.get(key)
+        if entry is not None and entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+            self.entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return marshal.loads(entry.blob)
+
+        data = path.read_bytes()
+        sha1 = hashlib.sha1(data).hexdigest()
+        if entry is not None and entry.sha1 == sha1:
+            self._store(key, CacheEntry(stat.st_size, stat.st_mtime_ns, sha1, entry.blob))
+            self.stats["rehashed"] += 1
+            return marshal.loads(entry.blob)
+
+        payload = json.loads(data.decode("utf-8"))
+        self._store(key, CacheEntry(stat.st_size, stat.st_mtime_ns, sha1, marshal.dumps(payload)))
+        self.stats["parsed"] += 1
+        return payload
+
+
+_CACHE: JsonCache | None = None
+
+
+def cache_enabled() -> bool:
+    return os.environ.get("ATELIER_JSON_CACHE", "1") != "0"
+
+
+def shared_cache() -> JsonCache:
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = JsonCache()
+        atexit.register(_CACHE.save)
+    return _CACHE
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+"""
+Pixel-width label wrapping for lang entries.
+
+Widths follow the advance widths of the Minecraft default bitmap font (glyph width plus
+the one pixel spacing), so wrapping matches what the in-game tooltip actually renders
+instead of a plain character count. Accented Latin letters use the width of their base
+letter. Results are cached per (label, width).
+"""
+
+import unicodedata
+from functools import lru_cache
+from typing import Iterable
+
+DEFAULT_GLYPH_WIDTH = 6
+# 32 default-width glyphs, the budget previously expressed as LANG_NAME_MAX_CHARS.
+LABEL_MAX_WIDTH = 32 * DEFAULT_GLYPH_WIDTH
+LINE_BREAK = "\\n"
+
+NARROW_GLYPH_WIDTHS: dict[str, int] = {
+    " ": 4,
+    "!": 2,
+    '"': 5,
+    "'": 3,
+    "(": 5,
+    ")": 5,
+    "*": 5,
+    ",": 2,
+    ".": 2,
+    ":": 2,
+    ";": 2,
+    "<": 5,
+    ">": 5,
+    "@": 7,
+    "I": 4,
+    "[": 4,
+    "]": 4,
+    "`": 3,
+    "f": 5,
+    "i": 2,
+    "k": 5,
+    "l": 3,
+    "t": 4,
+    "{": 5,
+    "|": 2,
+    "}": 5,
+    "~": 7,
+}
+
+
+def build_glyph_width_table() -> dict[str, int]:
+    # Basic Latin, Latin-1 Supplement and Latin Extended-A cover every label we ship.
+    table: dict[str, int] = {}
+    for code_point in range(0x20, 0x180):
+        char = chr(code_point)
+        base_char = unicodedata.normalize("NFD", char)[0]
+        table[char] = NARROW_GLYPH_WIDTHS.get(char, NARROW_GLYPH_WIDTHS.get(base_char, DEFAULT_GLYPH_WIDTH))
+    return table
+
+
+GLYPH_WIDTH_TABLE = build_glyph_width_table()
+
+
+def text_width(text: str) -> int:
+    table = GLYPH_WIDTH_TABLE
+    return sum(table.get(char, DEFAULT_GLYPH_WIDTH) for char in text)
+
+
+@lru_cache(maxsize=None)
+def wrap_label_lines(label: str, max_width: int = LABEL_MAX_WIDTH) -> str:
+    words = [word for word in label.split() if word]
+    if not words:
+        return label
+
+    space_width = GLYPH_WIDTH_TABLE[" "]
+    lines: list[str] = []
+    current_line = ""
+    current_width = 0
+
+    for word in words:
+        word_width = text_width(word)
+        if not current_line:
+            current_line = word
+            current_width = word_width
+            continue
+
+        candidate_width = current_width + space_width + word_width
+        if candidate_width <= max_width:
+            current_line = f"{current_line} {word}"
+            current_width = candidate_width
+        else:
+            lines.append(current_line)
+            current_line = word
+            current_width = word_width
+
+    if current_line:
+        lines.append(current_line)
+
+    return LINE_BREAK.join(lines)
+
+
+def wrap_labels(labels: Iterable[str], max_width: int = LABEL_MAX_WIDTH) -> dict[str, str]:
+    return {label: wrap_label_lines(label, max_width) for label in dict.fromkeys(labels)}
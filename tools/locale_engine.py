@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+"""
+Locale plugins used to build block display names.
+
+Each supported language is declared once as a `LocalePlugin` (lang file, word map,
+variant templates, block form templates and modifier agreement forms) and added to
+`LOCALE_PLUGINS` through `register_locale`. Generators iterate the registry instead
+of branching on language codes, so adding a language is a data change.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pack_io import ROOT, RP_ROOT
+
+VANILLA_NAME_LIST_PATH = ROOT / "tools/vanilla_blocks_list.md"
+
+BLOCK_FORM_WORDS = ("bricks", "tiles", "pillar")
+PLURAL_BLOCK_FORM_WORDS = {"bricks", "tiles"}
+MODIFIER_WORDS = ("chiseled", "cracked", "polished", "smooth", "mossy")
+
+ENGLISH_NAME_TOKENS = (
+    "Chiseled",
+    "Cracked",
+    "Polished",
+    "Smooth",
+    "Bricks",
+    "Tiles",
+    "Stairs",
+    "Slab",
+    "Pillar",
+    "Deepslate",
+    "Blackstone",
+)
+
+
+@dataclass(frozen=True)
+class LocalePlugin:
+    code: str
+    lang_path: Path
+    variant_templates: dict[str, str]
+    word_map: dict[str, str] = field(default_factory=dict)
+    base_overrides: dict[str, str] = field(default_factory=dict)
+    # block form -> (template with material, label without material)
+    block_form_templates: dict[str, tuple[str, str]] = field(default_factory=dict)
+    # modifier -> (singular form, plural form), appended after the label
+    modifier_forms: dict[str, tuple[str, str]] = field(default_factory=dict)
+    vanilla_name_list: Path | None = None
+    humanize_identifiers: bool = False
+    rejects_english_labels: bool = True
+
+
+LOCALE_PLUGINS: dict[str, LocalePlugin] = {}
+
+
+def register_locale(plugin: LocalePlugin) -> LocalePlugin:
+    LOCALE_PLUGINS[plugin.code] = plugin
+    return plugin
+
+
+def iter_locales() -> list[LocalePlugin]:
+    return list(LOCALE_PLUGINS.values())
+
+
+def humanize_identifier(identifier: str) -> str:
+    words = identifier.split("_")
+    return " ".join(word.capitalize() for word in words)
+
+
+def contains_english_tokens(label: str) -> bool:
+    return any(token in label for token in ENGLISH_NAME_TOKENS)
+
+
+def translate_material_words(words: list[str], locale: LocalePlugin) -> str:
+    translated = [locale.word_map.get(word, word.capitalize()) for word in words]
+    return " ".join(translated).strip()
+
+
+def localize_base_name(base_name: str, locale: LocalePlugin, vanilla_name_map: dict[str, str]) -> str:
+    if locale.humanize_identifiers:
+        return humanize_identifier(base_name)
+
+    if base_name in vanilla_name_map:
+        return vanilla_name_map[base_name]
+
+    if base_name in locale.base_overrides:
+        return locale.base_overrides[base_name]
+
+    words = base_name.split("_")
+    is_plural = False
+
+    block_form = None
+    if words and words[-1] in BLOCK_FORM_WORDS:
+        block_form = words.pop()
+        is_plural = block_form in PLURAL_BLOCK_FORM_WORDS
+
+    modifiers: list[str] = []
+    while words and words[0] in MODIFIER_WORDS:
+        modifiers.append(words.pop(0))
+
+    material_text = translate_material_words(words, locale)
+
+    form_templates = locale.block_form_templates.get(block_form) if block_form else None
+    if form_templates is None:
+        label = material_text
+    else:
+        with_material, without_material = form_templates
+        label = with_material.format(material=material_text) if material_text else without_material
+
+    for modifier in modifiers:
+        forms = locale.modifier_forms.get(modifier)
+        if forms:
+            label = f"{label} {forms[1] if is_plural else forms[0]}".strip()
+
+    return label
+
+
+def format_variant_label(base_label: str, variant_suffix: str, locale: LocalePlugin) -> str:
+    template = locale.variant_templates.get(variant_suffix, "{base}")
+    return template.format(base=base_label)
+
+
+register_locale(
+    LocalePlugin(
+        code="en_US",
+        lang_path=RP_ROOT / "texts/en_US.lang",
+        variant_templates={
+            "slab": "{base} Slab",
+            "stairs": "{base} Stairs",
+            "vertical_slab": "{base} Vertical Slab",
+            "three_steps_stairs": "{base} Three-Step Stairs",
+        },
+        humanize_identifiers=True,
+        rejects_english_labels=False,
+    )
+)
+
+register_locale(
+    LocalePlugin(
+        code="pt_BR",
+        lang_path=RP_ROOT / "texts/pt_BR.lang",
+        variant_templates={
+            "slab": "Laje de {base}",
+            "stairs": "Escada de {base}",
+            "vertical_slab": "Laje Vertical de {base}",
+            "three_steps_stairs": "Escada de Três Degraus de {base}",
+        },
+        word_map={
+            "andesite": "Andesito",
+            "basalt": "Basalto",
+            "blackstone": "Pedra-Negra",
+            "calcite": "Calcita",
+            "cobblestone": "Pedregulho",
+            "deepslate": "Ardósia Abissal",
+            "diorite": "Diorito",
+            "dripstone": "Espeleotema",
+            "granite": "Granito",
+            "mud": "Lama",
+            "netherrack": "Netherrack",
+            "nether": "Nether",
+            "obsidian": "Obsidiana",
+            "packed": "Compactada",
+            "polished": "Polido",
+            "prismarine": "Prismarinho",
+            "purpur": "Purpur",
+            "quartz": "Quartzo",
+            "red": "Vermelho",
+            "sandstone": "Arenito",
+            "smooth": "Liso",
+            "stone": "Pedra",
+            "tuff": "Tufo",
+        },
+        base_overrides={
+            "cobbled_deepslate": "Pedregulho de Ardósia Abissal",
+            "dark_prismarine": "Prismarinho Escuro",
+            "gilded_blackstone": "Pedra-Negra Dourada",
+            "packed_mud": "Lama Compactada",
+        },
+        block_form_templates={
+            "bricks": ("Tijolos de {material}", "Tijolos"),
+            "tiles": ("Ladrilhos de {material}", "Ladrilhos"),
+            "pillar": ("Pilar de {material}", "Pilar"),
+        },
+        modifier_forms={
+            "chiseled": ("Talhado", "Talhados"),
+            "cracked": ("Rachado", "Rachados"),
+            "polished": ("Polido", "Polidos"),
+            "smooth": ("Liso", "Lisos"),
+            "mossy": ("Musgoso", "Musgosos"),
+        },
+        vanilla_name_list=VANILLA_NAME_LIST_PATH,
+    )
+)
+
+register_locale(
+    LocalePlugin(
+        code="es_MX",
+        lang_path=RP_ROOT / "texts/es_MX.lang",
+        variant_templates={
+            "slab": "Losa de {base}",
+            "stairs": "Escalera de {base}",
+            "vertical_slab": "Losa Vertical de {base}",
+            "three_steps_stairs": "Escalera de Tres Peldaños de {base}",
+        },
+        word_map={
+            "andesite": "Andesita",
+            "basalt": "Basalto",
+            "blackstone": "Piedra Negra",
+            "calcite": "Calcita",
+            "cobblestone": "Adoquín",
+            "deepslate": "Pizarra Profunda",
+            "diorite": "Diorita",
+            "dripstone": "Espeleotema",
+            "granite": "Granito",
+            "mud": "Lodo",
+            "netherrack": "Netherrack",
+            "nether": "Nether",
+            "obsidian": "Obsidiana",
+            "packed": "Compactado",
+            "polished": "Pulido",
+            "prismarine": "Prismarina",
+            "purpur": "Purpur",
+            "quartz": "Cuarzo",
+            "red": "Rojo",
+            "sandstone": "Arenisca",
+            "smooth": "Liso",
+            "stone": "Piedra",
+            "tuff": "Tufo",
+        },
+        base_overrides={
+            "cobbled_deepslate": "Adoquín de Pizarra Profunda",
+            "dark_prismarine": "Prismarina Oscura",
+            "gilded_blackstone": "Piedra Negra Dorada",
+            "packed_mud": "Lodo Compactado",
+        },
+        block_form_templates={
+            "bricks": ("Ladrillos de {material}", "Ladrillos"),
+            "tiles": ("Losetas de {material}", "Losetas"),
+            "pillar": ("Pilar de {material}", "Pilar"),
+        },
+        modifier_forms={
+            "chiseled": ("Cincelado", "Cincelados"),
+            "cracked": ("Agrietado", "Agrietados"),
+            "polished": ("Pulido", "Pulidos"),
+            "smooth": ("Liso", "Lisos"),
+            "mossy": ("Musgoso", "Musgosos"),
+        },
+    )
+)
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
+from pack_io import ROOT
+
 TARGET_DIRS = [ROOT / "BP", ROOT / "RP", ROOT / "tools", ROOT / "Upcoming"]
 SKIP_DIR_NAMES = {"node_modules", ".git", ".venv", "builds", "_unpacked"}
 ALLOWED_SUFFIXES = {
@@ -0,0 +1,479 @@
+from __future__ import annotations
+
+"""
+Offline optimizer for the block models in RP/models/blocks.
+
+Per bone, two passes run over the axis-aligned cubes (cubes with rotation, pivot,
+inflate or mirror, and cubes using box UV, are left alone):
+
+1. Merge: two cubes that share their extents on two axes and touch on the third are
+   replaced by one cube, but only when every side face's UV rectangles continue each
+   other (same texel scale and direction), so the merged face samples exactly the same
+   texels. The two touching caps disappear.
+2. Hidden faces: a face fully covered by other cubes of the same bone is dropped by
+   omitting it from the per-face `uv` map.
+
+Bone names are never changed. When cubes are merged, `geometry_part.cube` indices in
+the culling files of blocks that use the geometry are remapped. Geometries used by
+blocks with a non-opaque render method are skipped, since internal faces can show
+through translucent textures. Files keep their formatting style (compact Blockbench
+layout or fully expanded) and only changed files are rewritten.
+
+Examples
+--------
+- python tools/optimize_geometry.py --dry-run
+- python tools/optimize_geometry.py --dry-run --show-diff
+- python tools/optimize_geometry.py
+"""
+
+import argparse
+import copy
+import json
+import re
+from typing import Any
+
+from change_plan import ChangePlan, print_plan
+from derive_culling import BP_ROOT, CULLING_DIR, MODELS_DIR, collect_culling_usage
+
+EPSILON = 1e-6
+VERTICES_PER_FACE = 4
+
+FACES = ("north", "east", "south", "west", "up", "down")
+# face -> (axis of its normal, +1 / -1 along that axis)
+FACE_NORMALS: dict[str, tuple[int, int]] = {
+    "east": (0, 1),
+    "west": (0, -1),
+    "up": (1, 1),
+    "down": (1, -1),
+    "south": (2, 1),
+    "north": (2, -1),
+}
+# face -> model axes mapped to the texture (u, v) axes
+FACE_UV_AXES: dict[str, tuple[int, int]] = {
+    "north": (0, 1),
+    "south": (0, 1),
+    "east": (2, 1),
+    "west": (2, 1),
+    "up": (0, 2),
+    "down": (0, 2),
+}
+UNMERGEABLE_KEYS = ("rotation", "pivot", "inflate", "mirror")
+OPAQUE_RENDER_METHODS = {"opaque"}
+COMPACT_LIST_PATTERN = re.compile(r'"(?:origin|size|pivot)": \[-?\d')
+
+Box = tuple[list[float], list[float]]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Merge cubes and drop hidden faces in RP/models/blocks.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the report and planned changes without writing files.")
+    parser.add_argument("--show-diff", action="store_true", help="With --dry-run, print a unified diff for every change.")
+    return parser.parse_args()
+
+
+def close(first: float, second: float) -> bool:
+    return abs(first - second) <= EPSILON
+
+
+def cube_box(cube: dict[str, Any]) -> Box:
+    low = [float(value) for value in cube["origin"]]
+    high = [low[axis] + float(cube["size"][axis]) for axis in range(3)]
+    return low, high
+
+
+def is_simple_cube(cube: dict[str, Any]) -> bool:
+    if not isinstance(cube.get("uv"), dict):
+        return False
+    for key in UNMERGEABLE_KEYS:
+        value = cube.get(key)
+        if value is None:
+            continue
+        if key == "inflate" and not value:
+            continue
+        if key == "rotation" and not any(value):
+            continue
+        return False
+    return True
+
+
+def count_faces(geometry: dict[str, Any]) -> int:
+    total = 0
+    for bone in geometry.get("bones", []):
+        for cube in bone.get("cubes", []):
+            uv = cube.get("uv")
+            total += len(uv) if isinstance(uv, dict) else len(FACES)
+    return total
+
+
+def count_cubes(geometry: dict[str, Any]) -> int:
+    return sum(len(bone.get("cubes", [])) for bone in geometry.get("bones", []))
+
+
+def merged_uv_span(
+    low_face: dict[str, Any],
+    high_face: dict[str, Any],
+    component: int,
+    low_span: tuple[float, float],
+    high_span: tuple[float, float],
+) -> tuple[float, float] | None:
+    # Returns the merged (start, size) along one texture component, or None when the
+    # high cube's texels are not the continuation of the low cube's.
+    start = float(low_face["uv"][component])
+    size = float(low_face["uv_size"][component])
+    other_start = float(high_face["uv"][component])
+    other_size = float(high_face["uv_size"][component])
+    length = low_span[1] - low_span[0]
+    if close(length, 0):
+        return None
+    scale = size / length
+
+    # Texture start at the low end of the cube.
+    expected_start = start + scale * (high_span[0] - low_span[0])
+    expected_size = scale * (high_span[1] - high_span[0])
+    if close(other_start, expected_start) and close(other_size, expected_size):
+        return start, size + other_size
+
+    # Texture start at the high end of the cube.
+    expected_start = start - scale * (high_span[1] - low_span[0]) + size
+    if close(other_start, expected_start) and close(other_size, expected_size):
+        return other_start, size + other_size
+    return None
+
+
+def try_merge(first: dict[str, Any], second: dict[str, Any]) -> dict[str, Any] | None:
+    box_a, box_b = cube_box(first), cube_box(second)
+    merge_axis = None
+    for axis in range(3):
+        others = [other for other in range(3) if other != axis]
+        if not all(close(box_a[0][other], box_b[0][other]) and close(box_a[1][other], box_b[1][other]) for other in others):
+            continue
+        if close(box_a[1][axis], box_b[0][axis]):
+            merge_axis = axis
+            low, high = first, second
+        elif close(box_b[1][axis], box_a[0][axis]):
+            merge_axis = axis
+            low, high = second, first
+        break
+    if merge_axis is None:
+        return None
+
+    low_box, high_box = cube_box(low), cube_box(high)
+    merged_uv: dict[str, Any] = {}
+    for face in FACES:
+        normal_axis, sign = FACE_NORMALS[face]
+        low_face = low["uv"].get(face)
+        high_face = high["uv"].get(face)
+        if normal_axis == merge_axis:
+            # Caps: the outer one comes from the cube on that side, the touching pair is dropped.
+            outer = high_face if sign > 0 else low_face
+            if outer is not None:
+                merged_uv[face] = copy.deepcopy(outer)
+            continue
+
+        if (low_face is None) != (high_face is None):
+            return None
+        if low_face is None:
+            continue
+        if {key: value for key, value in low_face.items() if key not in ("uv", "uv_size")} != {
+            key: value for key, value in high_face.items() if key not in ("uv", "uv_size")
+        }:
+            return None
+
+        component = FACE_UV_AXES[face].index(merge_axis)
+        fixed = 1 - component
+        if not (
+            close(float(low_face["uv"][fixed]), float(high_face["uv"][fixed]))
+            and close(float(low_face["uv_size"][fixed]), float(high_face["uv_size"][fixed]))
+        ):
+            return None
+        span = merged_uv_span(
+            low_face,
+            high_face,
+            component,
+            (low_box[0][merge_axis], low_box[1][merge_axis]),
+            (high_box[0][merge_axis], high_box[1][merge_axis]),
+        )
+        if span is None:
+            return None
+        face_uv = copy.deepcopy(low_face)
+        face_uv["uv"][component] = tidy_number(span[0])
+        face_uv["uv_size"][component] = tidy_number(span[1])
+        merged_uv[face] = face_uv
+
+    merged = copy.deepcopy(low)
+    merged["size"][merge_axis] = tidy_number(high_box[1][merge_axis] - low_box[0][merge_axis])
+    merged["uv"] = {face: merged_uv[face] for face in low["uv"] if face in merged_uv}
+    for face in FACES:
+        if face in merged_uv and face not in merged["uv"]:
+            merged["uv"][face] = merged_uv[face]
+    return merged
+
+
+def tidy_number(value: float) -> float | int:
+    rounded = round(value, 4)
+    return int(rounded) if rounded == int(rounded) else rounded
+
+
+def merge_bone_cubes(cubes: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[int]]:
+    # Returns the merged cube list and, for each original index, its new index.
+    slots: list[dict[str, Any] | None] = list(cubes)
+    owner = list(range(len(cubes)))
+    changed = True
+    while changed:
+        changed = False
+        for first_index, first in enumerate(slots):
+            if first is None or not is_simple_cube(first):
+                continue
+            for second_index in range(first_index + 1, len(slots)):
+                second = slots[second_index]
+                if second is None or not is_simple_cube(second):
+                    continue
+                merged = try_merge(first, second)
+                if merged is None:
+                    continue
+                slots[first_index] = merged
+                slots[second_index] = None
+                owner = [first_index if target == second_index else target for target in owner]
+                first = merged
+                changed = True
+
+    new_positions: dict[int, int] = {}
+    merged_cubes: list[dict[str, Any]] = []
+    for index, cube in enumerate(slots):
+        if cube is not None:
+            new_positions[index] = len(merged_cubes)
+            merged_cubes.append(cube)
+    return merged_cubes, [new_positions[target] for target in owner]
+
+
+def face_rect(box: Box, face: str) -> tuple[float, tuple[float, float], tuple[float, float]]:
+    normal_axis, sign = FACE_NORMALS[face]
+    plane = box[1][normal_axis] if sign > 0 else box[0][normal_axis]
+    first_axis, second_axis = [axis for axis in range(3) if axis != normal_axis]
+    return (
+        plane,
+        (box[0][first_axis], box[1][first_axis]),
+        (box[0][second_axis], box[1][second_axis]),
+    )
+
+
+def rect_covered(target: tuple[tuple[float, float], tuple[float, float]], covers: list[tuple[tuple[float, float], tuple[float, float]]]) -> bool:
+    (u0, u1), (v0, v1) = target
+    if close(u0, u1) or close(v0, v1):
+        return False
+    clipped = [
+        ((max(a0, u0), min(a1, u1)), (max(b0, v0), min(b1, v1)))
+        for (a0, a1), (b0, b1) in covers
+        if min(a1, u1) - max(a0, u0) > EPSILON and min(b1, v1) - max(b0, v0) > EPSILON
+    ]
+    if not clipped:
+        return False
+
+    u_cuts = sorted({u0, u1, *(value for rect in clipped for value in rect[0])})
+    v_cuts = sorted({v0, v1, *(value for rect in clipped for value in rect[1])})
+    for u_low, u_high in zip(u_cuts, u_cuts[1:]):
+        if close(u_low, u_high):
+            continue
+        u_mid = (u_low + u_high) / 2
+        for v_low, v_high in zip(v_cuts, v_cuts[1:]):
+            if close(v_low, v_high):
+                continue
+            v_mid = (v_low + v_high) / 2
+            if not any(a0 <= u_mid <= a1 and b0 <= v_mid <= b1 for (a0, a1), (b0, b1) in clipped):
+                return False
+    return True
+
+
+def drop_hidden_faces(cubes: list[dict[str, Any]]) -> int:
+    simple = [(index, cube_box(cube)) for index, cube in enumerate(cubes) if is_simple_cube(cube)]
+    dropped = 0
+    for index, box in simple:
+        cube = cubes[index]
+        for face in list(cube["uv"]):
+            if face not in FACE_NORMALS:
+                continue
+            normal_axis, sign = FACE_NORMALS[face]
+            plane, first_span, second_span = face_rect(box, face)
+            covers = []
+            for other_index, other_box in simple:
+                if other_index == index:
+                    continue
+                # The other cube must fill the space just outside the face.
+                if sign > 0:
+                    inside = other_box[0][normal_axis] <= plane + EPSILON and other_box[1][normal_axis] > plane + EPSILON
+                else:
+                    inside = other_box[1][normal_axis] >= plane - EPSILON and other_box[0][normal_axis] < plane - EPSILON
+                if not inside:
+                    continue
+                _, other_first, other_second = face_rect(other_box, face)
+                covers.append((other_first, other_second))
+            if rect_covered((first_span, second_span), covers):
+                del cube["uv"][face]
+                dropped += 1
+    return dropped
+
+
+def optimize_geometry(geometry: dict[str, Any]) -> tuple[dict[str, Any], dict[str, list[int]]]:
+    optimized = copy.deepcopy(geometry)
+    index_maps: dict[str, list[int]] = {}
+    for bone in optimized.get("bones", []):
+        cubes = bone.get("cubes")
+        if not cubes:
+            continue
+        merged, index_map = merge_bone_cubes(cubes)
+        bone["cubes"] = merged
+        drop_hidden_faces(merged)
+        if index_map != list(range(len(index_map))):
+            index_maps[bone["name"]] = index_map
+    return optimized, index_maps
+
+
+def collect_render_methods(plan: ChangePlan) -> dict[str, set[str]]:
+    methods: dict[str, set[str]] = {}
+    for path in plan.rglob(BP_ROOT / "blocks", "*.json"):
+        block = plan.read_json(path).get("minecraft:block", {})
+        geometry = block.get("components", {}).get("minecraft:geometry")
+        geometry_id = geometry if isinstance(geometry, str) else (geometry or {}).get("identifier")
+        if not geometry_id:
+            continue
+        found = methods.setdefault(geometry_id, set())
+        variants = [block.get("components", {})] + [item.get("components", {}) for item in block.get("permutations", [])]
+        for variant in variants:
+            for instance in variant.get("minecraft:material_instances", {}).values():
+                if isinstance(instance, dict):
+                    found.add(instance.get("render_method", "opaque"))
+    return methods
+
+
+def dump_geometry_text(payload: Any, compact: bool) -> str:
+    if not compact:
+        return json.dumps(payload, ensure_ascii=False, indent="\t")
+
+    def is_scalar(value: Any) -> bool:
+        return not isinstance(value, (dict, list))
+
+    def inline(value: Any) -> bool:
+        if isinstance(value, list):
+            return all(is_scalar(item) for item in value)
+        if isinstance(value, dict):
+            # Face UV entries: only lists and strings, e.g. {"uv": [0, 8], "uv_size": [16, 8]}.
+            return bool(value) and all(
+                isinstance(item, str) or (isinstance(item, list) and all(is_scalar(entry) for entry in item))
+                for item in value.values()
+            ) and any(isinstance(item, list) for item in value.values())
+        return True
+
+    def render(value: Any, depth: int) -> str:
+        if inline(value):
+            if isinstance(value, list):
+                return "[" + ", ".join(json.dumps(item, ensure_ascii=False) for item in value) + "]"
+            if isinstance(value, dict):
+                return "{" + ", ".join(f"{json.dumps(key)}: {render(item, depth)}" for key, item in value.items()) + "}"
+            return json.dumps(value, ensure_ascii=False)
+        indent = "\t" * (depth + 1)
+        closing = "\t" * depth
+        if isinstance(value, list):
+            items = [indent + render(item, depth + 1) for item in value]
+            return "[\n" + ",\n".join(items) + "\n" + closing + "]"
+        items = [f"{indent}{json.dumps(key, ensure_ascii=False)}: {render(item, depth + 1)}" for key, item in value.items()]
+        return "{\n" + ",\n".join(items) + "\n" + closing + "}"
+
+    return render(payload, 0)
+
+
+def remap_culling(plan: ChangePlan, geometry_id: str, index_maps: dict[str, list[int]]) -> int:
+    usage = collect_culling_usage(plan)
+    culling_ids = {culling_id for culling_id, (geometry_ids, _) in usage.items() if geometry_id in geometry_ids}
+    updated = 0
+    for path in plan.glob(CULLING_DIR, "*.json"):
+        payload = plan.read_json(path)
+        rules_root = payload.get("minecraft:block_culling_rules", {})
+        if rules_root.get("description", {}).get("identifier") not in culling_ids:
+            continue
+        rules: list[dict[str, Any]] = []
+        for rule in rules_root.get("rules", []):
+            part = rule.get("geometry_part", {})
+            index_map = index_maps.get(part.get("bone"))
+            if index_map is not None and part.get("cube", 0) < len(index_map):
+                part["cube"] = index_map[part.get("cube", 0)]
+            if rule not in rules:
+                rules.append(rule)
+        if rules != plan.read_json(path)["minecraft:block_culling_rules"]["rules"]:
+            rules_root["rules"] = rules
+            plan.write_json(path, payload)
+            updated += 1
+    return updated
+
+
+def optimize_models(plan: ChangePlan) -> list[dict[str, Any]]:
+    render_methods = collect_render_methods(plan)
+    reports: list[dict[str, Any]] = []
+    for path in plan.glob(MODELS_DIR, "*.json"):
+        text = plan.read_text(path)
+        payload = json.loads(text)
+        compact = bool(COMPACT_LIST_PATTERN.search(text))
+        file_changed = False
+
+        for position, geometry in enumerate(payload.get("minecraft:geometry", [])):
+            geometry_id = geometry.get("description", {}).get("identifier", "")
+            report: dict[str, Any] = {
+                "path": plan.relative(path),
+                "geometry": geometry_id,
+                "cubes_before": count_cubes(geometry),
+                "faces_before": count_faces(geometry),
+            }
+            reports.append(report)
+
+            methods = render_methods.get(geometry_id, set())
+            if methods - OPAQUE_RENDER_METHODS:
+                report["skipped"] = f"used with render methods {sorted(methods)}"
+                continue
+
+            optimized, index_maps = optimize_geometry(geometry)
+            report["cubes_after"] = count_cubes(optimized)
+            report["faces_after"] = count_faces(optimized)
+            if optimized != geometry:
+                payload["minecraft:geometry"][position] = optimized
+                file_changed = True
+            if index_maps:
+                report["culling_files_remapped"] = remap_culling(plan, geometry_id, index_maps)
+
+        if file_changed:
+            trailing_newline = "\n" if text.endswith("\n") else ""
+            plan.write_text(path, dump_geometry_text(payload, compact) + trailing_newline)
+    return reports
+
+
+def main() -> int:
+    args = parse_args()
+    plan = ChangePlan()
+    reports = optimize_models(plan)
+
+    print("Geometry optimization report:")
+    for report in reports:
+        print(f"{report['path']} ({report['geometry']})")
+        if "skipped" in report:
+            print(f"  skipped: {report['skipped']}")
+            continue
+        print(f"  cubes: {report['cubes_before']} -> {report['cubes_after']}")
+        print(f"  faces: {report['faces_before']} -> {report['faces_after']}")
+        print(
+            f"  vertices: {report['faces_before'] * VERTICES_PER_FACE} -> {report['faces_after'] * VERTICES_PER_FACE}"
+        )
+        if "culling_files_remapped" in report:
+            print(f"  culling files remapped: {report['culling_files_remapped']}")
+
+    if args.dry_run:
+        print_plan(plan, show_diff=args.show_diff)
+        print("Dry run enabled. No files were changed.")
+        return 0
+
+    applied = plan.apply()
+    print("Applied changes:")
+    for action, count in applied.items():
+        print(f"- {action}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
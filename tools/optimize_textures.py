@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+"""
+Lossless PNG optimization for the shipped textures.
+
+Every PNG under RP/textures is decoded with Pillow and re-encoded by a small PNG
+writer that tries:
+- an indexed palette (1, 2, 4 or 8 bit, with tRNS for translucent entries) when the
+  image has at most 256 colors;
+- grayscale or RGB without alpha when the pixels allow it, otherwise RGBA;
+- each fixed scanline filter and a per-row adaptive choice, compressed with zlib
+  level 9.
+Only IHDR/PLTE/tRNS/IDAT/IEND are written, so ancillary chunks (text, time, color
+profiles) are dropped. The smallest candidate is kept if it beats the original and
+decodes to exactly the same RGBA pixels; otherwise the original bytes are copied.
+Images with 16-bit samples (IHDR bit depth 16) are copied unchanged, since decoding
+them to 8-bit RGBA would drop precision. Files Pillow cannot decode are copied as they
+are and reported as skipped.
+
+Files are processed in parallel and written to the staging directory given with
+--out (the RP root inside the packaging folder), mirroring their path under RP.
+
+Examples
+--------
+- python tools/optimize_textures.py --out temp_mcaddon/RP
+- python tools/optimize_textures.py --out temp_mcaddon/RP --jobs 1
+"""
+
+import argparse
+import io
+import struct
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from pack_io import RP_ROOT
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - runtime dependency guard
+    print("Pillow is required. Please install it in your Python environment.", file=sys.stderr)
+    raise SystemExit(1)
+
+TEXTURES_DIR = RP_ROOT / "textures"
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+ZLIB_LEVEL = 9
+FILTER_TYPES = (0, 1, 2, 3, 4)
+LOSSY_MODES = {"I", "I;16", "I;16B", "I;16L", "F"}
+# Offset of the bit depth byte: signature (8) + chunk length (4) + b"IHDR" (4) + width/height (8).
+IHDR_BIT_DEPTH_OFFSET = 24
+DECODE_ERRORS = (OSError, SyntaxError, ValueError)
+
+COLOR_TYPE_GRAY = 0
+COLOR_TYPE_RGB = 2
+COLOR_TYPE_PALETTE = 3
+COLOR_TYPE_GRAY_ALPHA = 4
+COLOR_TYPE_RGBA = 6
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Losslessly recompress RP/textures PNGs into a staging directory.")
+    parser.add_argument(
+        "--out",
+        type=Path,
+        required=True,
+        help="Staging RP root; textures are written to <out>/textures/... (may be RP itself to optimize in place).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count; 1 disables parallelism).",
+    )
+    return parser.parse_args()
+
+
+def png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+
+def paeth_predictor(left: int, up: int, up_left: int) -> int:
+    estimate = left + up - up_left
+    distance_left = abs(estimate - left)
+    distance_up = abs(estimate - up)
+    distance_up_left = abs(estimate - up_left)
+    if distance_left <= distance_up and distance_left <= distance_up_left:
+        return left
+    if distance_up <= distance_up_left:
+        return up
+    return up_left
+
+
+def filter_row(filter_type: int, row: bytes, previous: bytes, bpp: int) -> bytes:
+    if filter_type == 0:
+        return row
+    out = bytearray(len(row))
+    for index, value in enumerate(row):
+        left = row[index - bpp] if index >= bpp else 0
+        up = previous[index]
+        if filter_type == 1:
+            predicted = left
+        elif filter_type == 2:
+            predicted = up
+        elif filter_type == 3:
+            predicted = (left + up) // 2
+        else:
+            up_left = previous[index - bpp] if index >= bpp else 0
+            predicted = paeth_predictor(left, up, up_left)
+        out[index] = (value - predicted) & 0xFF
+    return bytes(out)
+
+
+def filtered_stream(rows: list[bytes], bpp: int, strategy: int | None) -> bytes:
+    # strategy: a fixed filter type, or None for the per-row minimum-sum heuristic.
+    previous = bytes(len(rows[0])) if rows else b""
+    chunks: list[bytes] = []
+    for row in rows:
+        if strategy is None:
+            candidates = [(filter_type, filter_row(filter_type, row, previous, bpp)) for filter_type in FILTER_TYPES]
+            filter_type, data = min(
+                candidates,
+                key=lambda item: sum(value if value < 128 else 256 - value for value in item[1]),
+            )
+        else:
+            filter_type, data = strategy, filter_row(strategy, row, previous, bpp)
+        chunks.append(bytes([filter_type]) + data)
+        previous = row
+    return b"".join(chunks)
+
+
+def best_idat(rows: list[bytes], bpp: int) -> bytes:
+    candidates = [
+        zlib.compress(filtered_stream(rows, bpp, strategy), ZLIB_LEVEL)
+        for strategy in (*FILTER_TYPES, None)
+    ]
+    return min(candidates, key=len)
+
+
+def encode_png(
+    width: int,
+    height: int,
+    bit_depth: int,
+    color_type: int,
+    rows: list[bytes],
+    bpp: int,
+    palette: bytes = b"",
+    transparency: bytes = b"",
+) -> bytes:
+    header = struct.pack(">IIBBBBB", width, height, bit_depth, color_type, 0, 0, 0)
+    chunks = [PNG_SIGNATURE, png_chunk(b"IHDR", header)]
+    if palette:
+        chunks.append(png_chunk(b"PLTE", palette))
+    if transparency:
+        chunks.append(png_chunk(b"tRNS", transparency))
+    chunks.append(png_chunk(b"IDAT", best_idat(rows, bpp)))
+    chunks.append(png_chunk(b"IEND", b""))
+    return b"".join(chunks)
+
+
+def pack_indices(indices: list[int], bit_depth: int) -> bytes:
+    if bit_depth == 8:
+        return bytes(indices)
+    per_byte = 8 // bit_depth
+    packed = bytearray()
+    for start in range(0, len(indices), per_byte):
+        value = 0
+        group = indices[start : start + per_byte]
+        for position, index in enumerate(group):
+            value |= index << (8 - bit_depth * (position + 1))
+        packed.append(value)
+    return bytes(packed)
+
+
+def palette_candidate(width: int, height: int, pixels: list[tuple[int, int, int, int]]) -> bytes | None:
+    colors = set(pixels)
+    if len(colors) > 256:
+        return None
+    # Translucent entries first so tRNS can stop at the last one.
+    ordered = sorted(colors, key=lambda color: (color[3] == 255, color))
+    lookup = {color: index for index, color in enumerate(ordered)}
+    bit_depth = next(depth for depth in (1, 2, 4, 8) if len(ordered) <= 1 << depth)
+
+    palette = b"".join(bytes(color[:3]) for color in ordered)
+    translucent = [color[3] for color in ordered if color[3] != 255]
+    rows = [
+        pack_indices([lookup[pixel] for pixel in pixels[row * width : (row + 1) * width]], bit_depth)
+        for row in range(height)
+    ]
+    return encode_png(width, height, bit_depth, COLOR_TYPE_PALETTE, rows, 1, palette, bytes(translucent))
+
+
+def direct_candidate(width: int, height: int, pixels: list[tuple[int, int, int, int]]) -> bytes:
+    has_alpha = any(pixel[3] != 255 for pixel in pixels)
+    is_gray = all(pixel[0] == pixel[1] == pixel[2] for pixel in pixels)
+    if is_gray:
+        color_type, channels = (COLOR_TYPE_GRAY_ALPHA, (0, 3)) if has_alpha else (COLOR_TYPE_GRAY, (0,))
+    else:
+        color_type, channels = (COLOR_TYPE_RGBA, (0, 1, 2, 3)) if has_alpha else (COLOR_TYPE_RGB, (0, 1, 2))
+
+    rows = [
+        bytes(pixel[channel] for pixel in pixels[row * width : (row + 1) * width] for channel in channels)
+        for row in range(height)
+    ]
+    return encode_png(width, height, 8, color_type, rows, len(channels))
+
+
+def decode_rgba(data: bytes) -> tuple[tuple[int, int], bytes]:
+    with Image.open(io.BytesIO(data)) as image:
+        return image.size, image.convert("RGBA").tobytes()
+
+
+def optimize_png(data: bytes) -> bytes:
+    if len(data) > IHDR_BIT_DEPTH_OFFSET and data[IHDR_BIT_DEPTH_OFFSET] == 16:
+        return data
+    with Image.open(io.BytesIO(data)) as image:
+        if image.mode in LOSSY_MODES:
+            return data
+        rgba = image.convert("RGBA")
+        width, height = rgba.size
+        original_pixels = rgba.tobytes()
+    pixels = list(zip(original_pixels[0::4], original_pixels[1::4], original_pixels[2::4], original_pixels[3::4]))
+
+    candidates = [direct_candidate(width, height, pixels)]
+    indexed = palette_candidate(width, height, pixels)
+    if indexed is not None:
+        candidates.append(indexed)
+
+    best = min(candidates, key=len)
+    if len(best) >= len(data):
+        return data
+    if decode_rgba(best) != ((width, height), original_pixels):
+        return data
+    return best
+
+
+def optimize_file(task: tuple[str, str]) -> tuple[str, int, int, str | None]:
+    # Undecodable files are shipped as they are; one broken PNG must not abort the run.
+    source, target = task
+    data = Path(source).read_bytes()
+    error: str | None = None
+    try:
+        optimized = optimize_png(data)
+    except DECODE_ERRORS as exc:
+        optimized, error = data, f"{type(exc).__name__}: {exc}"
+    target_path = Path(target)
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    target_path.write_bytes(optimized)
+    return source, len(data), len(optimized), error
+
+
+def optimize_textures(out_root: Path, jobs: int | None = None) -> tuple[dict[str, int], dict[str, str]]:
+    tasks = [
+        (str(path), str(out_root / path.relative_to(RP_ROOT)))
+        for path in sorted(TEXTURES_DIR.rglob("*.png"))
+    ]
+    if jobs == 1:
+        results = [optimize_file(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(optimize_file, tasks, chunksize=8))
+
+    bytes_before = sum(before for _, before, _, _ in results)
+    bytes_after = sum(after for _, _, after, _ in results)
+    skipped = {source: error for source, _, _, error in results if error is not None}
+    stats = {
+        "files": len(results),
+        "optimized_files": sum(1 for _, before, after, _ in results if after < before),
+        "skipped_files": len(skipped),
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "bytes_saved": bytes_before - bytes_after,
+    }
+    return stats, skipped
+
+
+def main() -> int:
+    args = parse_args()
+    stats, skipped = optimize_textures(args.out.resolve(), args.jobs)
+    print("Texture optimization summary:")
+    for key, value in stats.items():
+        print(f"- {key}: {value}")
+    if skipped:
+        print("Skipped (copied unchanged):")
+        for source, error in sorted(skipped.items()):
+            print(f"- {Path(source).relative_to(RP_ROOT).as_posix()}: {error}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+"""
+Sync the pack into a local SQLite catalog and query it.
+
+`sync` ingests BP blocks, recipes, RP culling rules, the crafting item catalog,
+RP/blocks.json, RP/textures/terrain_texture.json and the lang files into
+tools/generated/pack_catalog.sqlite (gitignored). Every source file is tracked in
+`files` with its size, mtime_ns and sha1: files whose stat is unchanged are skipped,
+files whose bytes are unchanged are only re-stamped, and the rows of changed or
+deleted files are replaced. `--full` rebuilds everything.
+
+`query` syncs and then runs one SQL statement, printing tab-separated rows (or JSON).
+Tables (every row keeps the repo-relative `path` of the file it came from):
+- blocks(identifier, base, shape, directory, geometry, texture, culling);
+- recipes(identifier, type, tags, result_item, result_count);
+- recipe_inputs(recipe, item, count);
+- culling_rules(identifier, rules);
+- catalog_groups(category, name, icon, position) and catalog_items(category, group_name, item, position);
+- block_assets(identifier, sound) and block_asset_textures(identifier, face, texture);
+- terrain_textures(name, texture, position);
+- lang_entries(locale, key, value, line), plus the view lang_missing(locale, key).
+
+Tools can read the catalog with `open_catalog()` (synced on open) instead of walking
+BP/RP. Generators working on a ChangePlan should keep reading through the plan, which
+also sees the files planned by earlier stages.
+
+Examples
+--------
+- python tools/pack_catalog.py sync
+- python tools/pack_catalog.py sync --full
+- python tools/pack_catalog.py query "SELECT base FROM blocks WHERE shape = 'slab' EXCEPT SELECT base FROM blocks WHERE shape = 'vertical_slab'"
+- python tools/pack_catalog.py query "SELECT recipe, path FROM recipe_inputs WHERE item = 'minecraft:polished_andesite'"
+- python tools/pack_catalog.py query --json "SELECT key FROM lang_missing WHERE locale = 'es_MX'"
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from crafting_catalog import CATALOG_PATH, group_name
+from generate_uniform_variants import split_variant_item_name
+from pack_io import ROOT, BP_ROOT, RP_ROOT, dump_json_text
+from texture_index import atlas_texture_paths
+from validate_pack import strip_json_comments
+
+DB_PATH = ROOT / "tools/generated/pack_catalog.sqlite"
+# Bump when the schema or the ingesters change; older databases are rebuilt.
+SCHEMA_VERSION = 2
+
+SCHEMA_SQL = """
+CREATE TABLE files (path TEXT PRIMARY KEY, kind TEXT NOT NULL, size INTEGER, mtime_ns INTEGER, sha1 TEXT);
+CREATE TABLE blocks (
+    path TEXT NOT NULL, identifier TEXT NOT NULL, base TEXT, shape TEXT, directory TEXT,
+    geometry TEXT, texture TEXT, culling TEXT
+);
+CREATE TABLE recipes (path TEXT NOT NULL, identifier TEXT, type TEXT, tags TEXT, result_item TEXT, result_count INTEGER);
+CREATE TABLE recipe_inputs (path TEXT NOT NULL, recipe TEXT, item TEXT NOT NULL, count INTEGER);
+CREATE TABLE culling_rules (path TEXT NOT NULL, identifier TEXT, rules INTEGER);
+CREATE TABLE catalog_groups (path TEXT NOT NULL, category TEXT, name TEXT, icon TEXT, position INTEGER);
+CREATE TABLE catalog_items (path TEXT NOT NULL, category TEXT, group_name TEXT, item TEXT NOT NULL, position INTEGER);
+CREATE TABLE block_assets (path TEXT NOT NULL, identifier TEXT NOT NULL, sound TEXT);
+CREATE TABLE block_asset_textures (path TEXT NOT NULL, identifier TEXT NOT NULL, face TEXT, texture TEXT);
+CREATE TABLE terrain_textures (path TEXT NOT NULL, name TEXT NOT NULL, texture TEXT, position INTEGER);
+CREATE TABLE lang_entries (path TEXT NOT NULL, locale TEXT NOT NULL, key TEXT NOT NULL, value TEXT, line INTEGER);
+
+CREATE INDEX blocks_identifier ON blocks (identifier);
+CREATE INDEX blocks_base ON blocks (base, shape);
+CREATE INDEX recipes_result ON recipes (result_item);
+CREATE INDEX recipe_inputs_item ON recipe_inputs (item);
+CREATE INDEX culling_identifier ON culling_rules (identifier);
+CREATE INDEX catalog_items_item ON catalog_items (item);
+CREATE INDEX block_assets_identifier ON block_assets (identifier);
+CREATE INDEX block_asset_textures_texture ON block_asset_textures (texture);
+CREATE INDEX terrain_textures_name ON terrain_textures (name);
+CREATE INDEX lang_key ON lang_entries (key, locale);
+
+-- remove_file_rows deletes by path from every data table.
+CREATE INDEX blocks_path ON blocks (path);
+CREATE INDEX recipes_path ON recipes (path);
+CREATE INDEX recipe_inputs_path ON recipe_inputs (path);
+CREATE INDEX culling_rules_path ON culling_rules (path);
+CREATE INDEX catalog_groups_path ON catalog_groups (path);
+CREATE INDEX catalog_items_path ON catalog_items (path);
+CREATE INDEX block_assets_path ON block_assets (path);
+CREATE INDEX block_asset_textures_path ON block_asset_textures (path);
+CREATE INDEX terrain_textures_path ON terrain_textures (path);
+CREATE INDEX lang_entries_path ON lang_entries (path);
+
+CREATE VIEW lang_missing AS
+    SELECT locales.locale, keys.key
+    FROM (SELECT DISTINCT locale FROM lang_entries) AS locales
+    CROSS JOIN (SELECT DISTINCT key FROM lang_entries) AS keys
+    WHERE NOT EXISTS (
+        SELECT 1 FROM lang_entries AS entry WHERE entry.locale = locales.locale AND entry.key = keys.key
+    );
+"""
+DATA_TABLES = (
+    "blocks",
+    "recipes",
+    "recipe_inputs",
+    "culling_rules",
+    "catalog_groups",
+    "catalog_items",
+    "block_assets",
+    "block_asset_textures",
+    "terrain_textures",
+    "lang_entries",
+)
+
+# kind -> (directory or file, glob pattern or None for a single file)
+SOURCES: dict[str, tuple[Path, str | None]] = {
+    "block": (BP_ROOT / "blocks", "**/*.json"),
+    "recipe": (BP_ROOT / "recipes", "**/*.json"),
+    "culling": (RP_ROOT / "block_culling", "**/*.json"),
+    "catalog": (CATALOG_PATH, None),
+    "block_assets": (RP_ROOT / "blocks.json", None),
+    "terrain_texture": (RP_ROOT / "textures/terrain_texture.json", None),
+    "lang": (RP_ROOT / "texts", "*.lang"),
+}
+
+Rows = dict[str, list[tuple[Any, ...]]]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Sync the pack into a SQLite catalog and query it.")
+    parser.add_argument("--db", type=Path, default=DB_PATH, help="Catalog database path.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    sync_parser = commands.add_parser("sync", help="Ingest the files changed since the last sync.")
+    sync_parser.add_argument("--full", action="store_true", help="Drop the catalog and ingest every file.")
+    query_parser = commands.add_parser("query", help="Sync, then run one SQL statement.")
+    query_parser.add_argument("sql", help="SQL statement to run.")
+    query_parser.add_argument("--json", action="store_true", help="Print the rows as a JSON list of objects.")
+    query_parser.add_argument("--no-sync", action="store_true", help="Query the catalog as last synced.")
+    return parser.parse_args()
+
+
+def relative_key(path: Path) -> str:
+    return path.relative_to(ROOT).as_posix()
+
+
+def load_pack_json(text: str) -> Any:
+    return json.loads(strip_json_comments(text))
+
+
+def ingest_block(key: str, text: str) -> Rows:
+    block = load_pack_json(text).get("minecraft:block")
+    if not isinstance(block, dict):
+        return {}
+    identifier = block.get("description", {}).get("identifier")
+    if not isinstance(identifier, str):
+        return {}
+    components = block.get("components", {})
+    geometry = components.get("minecraft:geometry")
+    if isinstance(geometry, dict):
+        geometry_id, culling = geometry.get("identifier"), geometry.get("culling")
+    else:
+        geometry_id, culling = geometry, None
+    texture = components.get("minecraft:material_instances", {}).get("*", {}).get("texture")
+
+    name = identifier.split(":", 1)[-1]
+    base, shape = split_variant_item_name(name) or (name, None)
+    directory = key.rsplit("/", 1)[0]
+    return {"blocks": [(key, identifier, base, shape, directory, geometry_id, texture, culling)]}
+
+
+def recipe_item(entry: Any) -> tuple[str | None, int]:
+    if isinstance(entry, str):
+        return entry, 1
+    if isinstance(entry, dict):
+        return entry.get("item"), int(entry.get("count", 1))
+    return None, 0
+
+
+def ingest_recipe(key: str, text: str) -> Rows:
+    payload = load_pack_json(text)
+    recipe_key = next((name for name in payload if name.startswith("minecraft:recipe_")), None)
+    if recipe_key is None:
+        return {}
+    recipe = payload[recipe_key]
+    identifier = recipe.get("description", {}).get("identifier")
+    result_item, result_count = recipe_item(recipe.get("result", recipe.get("output")))
+
+    inputs: list[tuple[str | None, int]] = []
+    if "ingredients" in recipe:
+        inputs = [recipe_item(entry) for entry in recipe["ingredients"]]
+    elif "key" in recipe:
+        pattern = "".join(recipe.get("pattern", []))
+        inputs = [(recipe_item(entry)[0], pattern.count(symbol)) for symbol, entry in recipe["key"].items()]
+    elif "input" in recipe:
+        inputs = [recipe_item(recipe["input"])]
+
+    return {
+        "recipes": [
+            (key, identifier, recipe_key.removeprefix("minecraft:recipe_"), ",".join(recipe.get("tags", [])), result_item, result_count)
+        ],
+        "recipe_inputs": [(key, identifier, item, count) for item, count in inputs if item],
+    }
+
+
+def ingest_culling(key: str, text: str) -> Rows:
+    rules = load_pack_json(text).get("minecraft:block_culling_rules", {})
+    identifier = rules.get("description", {}).get("identifier")
+    return {"culling_rules": [(key, identifier, len(rules.get("rules", [])))]}
+
+
+def ingest_catalog(key: str, text: str) -> Rows:
+    rows: Rows = {"catalog_groups": [], "catalog_items": []}
+    for category in load_pack_json(text)["minecraft:crafting_items_catalog"]["categories"]:
+        category_name = category["category_name"]
+        for position, group in enumerate(category.get("groups", [])):
+            name = group_name(group)
+            rows["catalog_groups"].append((key, category_name, name, group.get("group_identifier", {}).get("icon"), position))
+            rows["catalog_items"].extend(
+                (key, category_name, name, item, item_position) for item_position, item in enumerate(group.get("items", []))
+            )
+    return rows
+
+
+def ingest_block_assets(key: str, text: str) -> Rows:
+    rows: Rows = {"block_assets": [], "block_asset_textures": []}
+    for identifier, entry in load_pack_json(text).items():
+        if not isinstance(entry, dict):
+            continue
+        rows["block_assets"].append((key, identifier, entry.get("sound")))
+        textures = entry.get("textures")
+        faces = textures.items() if isinstance(textures, dict) else [("*", textures)] if textures else []
+        rows["block_asset_textures"].extend((key, identifier, face, texture) for face, texture in faces)
+    return rows
+
+
+def ingest_terrain_texture(key: str, text: str) -> Rows:
+    rows = []
+    for name, entry in load_pack_json(text).get("texture_data", {}).items():
+        rows.extend((key, name, texture, position) for position, texture in enumerate(atlas_texture_paths(entry)))
+    return {"terrain_textures": rows}
+
+
+def ingest_lang(key: str, text: str) -> Rows:
+    locale = Path(key).stem
+    rows = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("##") or "=" not in line:
+            continue
+        entry_key, value = line.split("=", 1)
+        rows.append((key, locale, entry_key, value, line_number))
+    return {"lang_entries": rows}
+
+
+INGESTERS: dict[str, Callable[[str, str], Rows]] = {
+    "block": ingest_block,
+    "recipe": ingest_recipe,
+    "culling": ingest_culling,
+    "catalog": ingest_catalog,
+    "block_assets": ingest_block_assets,
+    "terrain_texture": ingest_terrain_texture,
+    "lang": ingest_lang,
+}
+
+
+def iter_source_files() -> Iterator[tuple[str, Path]]:
+    for kind, (location, pattern) in SOURCES.items():
+        if pattern is None:
+            if location.is_file():
+                yield kind, location
+            continue
+        for path in sorted(location.glob(pattern)):
+            if path.is_file():
+                yield kind, path
+
+
+def create_schema(connection: sqlite3.Connection) -> None:
+    for name, object_type in connection.execute("SELECT name, type FROM sqlite_master WHERE type IN ('table', 'view')").fetchall():
+        connection.execute(f"DROP {object_type.upper()} IF EXISTS {name}")
+    connection.executescript(SCHEMA_SQL)
+    connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def remove_file_rows(connection: sqlite3.Connection, key: str) -> None:
+    for table in DATA_TABLES:
+        connection.execute(f"DELETE FROM {table} WHERE path = ?", (key,))
+
+
+def insert_rows(connection: sqlite3.Connection, rows: Rows) -> None:
+    for table, values in rows.items():
+        if values:
+            placeholders = ", ".join("?" * len(values[0]))
+            connection.executemany(f"INSERT INTO {table} VALUES ({placeholders})", values)
+
+
+def sync_catalog(connection: sqlite3.Connection, full: bool = False) -> dict[str, int]:
+    stats = {"files": 0, "ingested": 0, "restamped": 0, "removed": 0}
+    with connection:
+        if full or connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            create_schema(connection)
+        known = {row[0]: row[1:] for row in connection.execute("SELECT path, size, mtime_ns, sha1 FROM files")}
+
+        seen: set[str] = set()
+        for kind, path in iter_source_files():
+            key = relative_key(path)
+            seen.add(key)
+            stats["files"] += 1
+            stat = path.stat()
+            previous = known.get(key)
+            if previous is not None and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                continue
+
+            data = path.read_bytes()
+            sha1 = hashlib.sha1(data).hexdigest()
+            if previous is None or previous[2] != sha1:
+                remove_file_rows(connection, key)
+                insert_rows(connection, INGESTERS[kind](key, data.decode("utf-8")))
+                stats["ingested"] += 1
+            else:
+                stats["restamped"] += 1
+            connection.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                (key, kind, stat.st_size, stat.st_mtime_ns, sha1),
+            )
+
+        for key in known.keys() - seen:
+            remove_file_rows(connection, key)
+            connection.execute("DELETE FROM files WHERE path = ?", (key,))
+            stats["removed"] += 1
+    return stats
+
+
+def open_catalog(path: Path = DB_PATH, sync: bool = True) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path)
+    connection.row_factory = sqlite3.Row
+    if sync:
+        sync_catalog(connection)
+    return connection
+
+
+def block_identifiers(connection: sqlite3.Connection, directory: Path | None = None) -> list[str]:
+    # Same answer as globbing `directory` (non-recursive) and reading each description.identifier.
+    if directory is None:
+        rows = connection.execute("SELECT identifier FROM blocks ORDER BY path")
+    else:
+        rows = connection.execute("SELECT identifier FROM blocks WHERE directory = ? ORDER BY path", (relative_key(directory),))
+    return [row["identifier"] for row in rows]
+
+
+def print_rows(cursor: sqlite3.Cursor, as_json: bool) -> None:
+    columns = [column[0] for column in cursor.description or ()]
+    rows = cursor.fetchall()
+    if as_json:
+        sys.stdout.write(dump_json_text([dict(zip(columns, row)) for row in rows]))
+        return
+    print("\t".join(columns))
+    for row in rows:
+        print("\t".join("" if value is None else str(value) for value in row))
+    print(f"({len(rows)} rows)")
+
+
+def main() -> int:
+    args = parse_args()
+    connection = open_catalog(args.db, sync=False)
+    try:
+        if args.command == "sync":
+            stats = sync_catalog(connection, full=args.full)
+            print("Catalog sync summary:")
+            for key, value in stats.items():
+                print(f"- {key}: {value}")
+            return 0
+
+        if not args.no_sync:
+            sync_catalog(connection)
+        try:
+            cursor = connection.execute(args.sql)
+        except sqlite3.Error as error:
+            print(f"Query failed: {error}", file=sys.stderr)
+            return 1
+        print_rows(cursor, args.json)
+        return 0
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+"""
+Pack paths and JSON I/O shared by the tools.
+
+Every tool resolves the repository through ROOT here and reads/writes pack JSON with
+the same helpers, so the on-disk format (UTF-8, 4-space indent, trailing newline,
+non-ASCII kept as is) is defined once. Reads go through the persistent parsed-JSON
+cache in json_cache.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+BP_ROOT = ROOT / "BP"
+RP_ROOT = ROOT / "RP"
+
+
+def dump_json_text(payload: Any) -> str:
+    return json.dumps(payload, ensure_ascii=False, indent=4) + "\n"
+
+
+def read_json(path: Path) -> Any:
+    # Imported here: json_cache itself imports ROOT from this module.
+    from json_cache import cache_enabled, shared_cache
+
+    if cache_enabled():
+        return shared_cache().read_json(path)
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_json(path: Path, payload: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(dump_json_text(payload), encoding="utf-8")
@@ -0,0 +1,537 @@
+from __future__ import annotations
+
+"""
+Promote staged blocks into the pack, together with all their variants, in one transaction.
+
+Staged content lives in:
+- `Upcoming/*.json`: entire blocks, one per file;
+- `tools/Upcoming/{blocks,block_culling,recipes}`: hand-made files laid out like BP/blocks,
+  RP/block_culling and BP/recipes, grouped by the block id they define, cull or craft.
+
+For the chosen ids (every staged id by default) a single ChangePlan:
+1. moves each staged file to the path the generators use: entire blocks go through
+   build_entire_block_target_path and are rebuilt on the entire-block template with the
+   staged texture, tags and durability; variants, culling and stonecutter recipes get their
+   generator file names (staged per-block culling is dropped in the shared culling mode);
+2. adds the RP/blocks.json entries of the promoted blocks;
+3. generates the slab/stairs/three-step/vertical variants, culling and recipes of those
+   blocks only, plus the reverse recipes of their forward recipes;
+4. adds their lang entries, crafting catalog items and STAIR_IDS / shape family / sound
+   event rows, merged into the existing files instead of being rebuilt from a pack scan.
+Ids that cannot be promoted stay staged and are reported with the reason: already in the
+pack, a vanilla base the vanilla base policy would remove again, a texture key missing
+from RP/textures/terrain_texture.json (unless --allow-missing-textures), or a variant
+whose base block is neither in the pack nor promoted with it.
+
+Examples
+--------
+- python tools/promote_upcoming.py --list
+- python tools/promote_upcoming.py polished_basalt_tiles tuff_bricks --dry-run --show-diff
+- python tools/promote_upcoming.py
+"""
+
+import argparse
+import copy
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from change_plan import ChangePlan, print_plan
+from crafting_catalog import CraftingCatalog
+from generate_sound_events import (
+    SOUND_CONFIG_PATH,
+    SOUND_EVENTS_SCRIPT_PATH,
+    parse_sound_rules,
+    render_sound_events_script,
+)
+from generate_uniform_variants import (
+    ASSETS_BLOCKS_PATH,
+    CULLING_DIR,
+    ENTIRE_BLOCK_TEMPLATE_NAME,
+    SHAPE_FAMILIES_SCRIPT_PATH,
+    SLAB_GROUP_NAME,
+    STAIR_IDS_PATTERN,
+    STAIRS_GROUP_NAME,
+    STAIRS_SCRIPT_PATH,
+    STONEWORK_GROUP_NAME,
+    THREE_STEP_STAIRS_GROUP_NAME,
+    VANILLA_LIST_PATH,
+    VANILLA_WOOD_FAMILY_NAMES,
+    VARIANT_SUFFIXES,
+    VERTICAL_SLABS_GROUP_NAME,
+    TargetBlock,
+    apply_vanilla_shapes,
+    build_entire_block_from_template,
+    build_entire_block_target_path,
+    build_material_order,
+    build_target,
+    create_reverse_variant_recipes,
+    culling_identifier,
+    culling_path,
+    detect_culling_mode,
+    detect_recipe_layout,
+    detect_vanilla_bases_with_local_textures,
+    generate_target_files,
+    infer_material_token,
+    load_vanilla_base_names,
+    order_shape_families,
+    render_shape_families_script,
+    replace_stair_ids,
+    sort_variant_items_by_material,
+    split_variant_item_name,
+    stonecutter_recipe_path,
+    update_assets_blocks,
+    update_block_localization_names,
+    variant_block_path,
+    variant_filename,
+    variant_sort_parts,
+)
+from pack_io import ROOT, BP_ROOT, RP_ROOT
+from validate_pack import print_validation_report, validate_pack
+
+UPCOMING_DIR = ROOT / "Upcoming"
+STAGED_DIR = ROOT / "tools/Upcoming"
+STAGED_BLOCKS_DIR = STAGED_DIR / "blocks"
+STAGED_CULLING_DIR = STAGED_DIR / "block_culling"
+STAGED_RECIPES_DIR = STAGED_DIR / "recipes"
+TERRAIN_TEXTURE_PATH = RP_ROOT / "textures/terrain_texture.json"
+
+NAMESPACE = "dorios_atelier"
+CULLING_PREFIX = f"{NAMESPACE}:culling."
+
+# Components a staged entire block keeps over the template's.
+SOURCE_COMPONENT_KEYS = (
+    "minecraft:destructible_by_mining",
+    "minecraft:destructible_by_explosion",
+    "minecraft:light_dampening",
+    "minecraft:light_emission",
+)
+
+VARIANT_CATALOG_GROUPS = {
+    "slab": SLAB_GROUP_NAME,
+    "stairs": STAIRS_GROUP_NAME,
+    "three_steps_stairs": THREE_STEP_STAIRS_GROUP_NAME,
+    "vertical_slab": VERTICAL_SLABS_GROUP_NAME,
+}
+
+SHAPE_FAMILY_PATTERN = re.compile(r"^    \{ (.*) \},$", re.MULTILINE)
+SHAPE_FAMILY_FIELD_PATTERN = re.compile(r"(\w+): '([^']+)'")
+SHAPE_FAMILY_ALIAS_PATTERN = re.compile(r"^    '([^']+)': '([^']+)',$", re.MULTILINE)
+SOUND_EVENT_PATTERN = re.compile(r"^\t\['([^']+)', '([^']+)'\],$", re.MULTILINE)
+
+
+@dataclass
+class StagedBlock:
+    identifier: str
+    block_path: Path | None = None
+    culling_paths: list[Path] = field(default_factory=list)
+    recipe_paths: list[Path] = field(default_factory=list)
+    status: str = "ready"
+
+    @property
+    def name(self) -> str:
+        return self.identifier.split(":", 1)[1]
+
+    @property
+    def variant(self) -> tuple[str, str] | None:
+        return split_variant_item_name(self.name)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Promote staged Upcoming blocks into the pack with all their variants.")
+    parser.add_argument("ids", nargs="*", help="Staged block ids or names to promote (default: every staged block).")
+    parser.add_argument("--list", action="store_true", help="List the staged ids and whether they can be promoted.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the planned changes without touching files.")
+    parser.add_argument("--show-diff", action="store_true", help="With --dry-run, print a unified diff for every change.")
+    parser.add_argument(
+        "--allow-missing-textures",
+        action="store_true",
+        help="Promote blocks whose texture key is not in RP/textures/terrain_texture.json yet.",
+    )
+    parser.add_argument("--include-non-stone", action="store_true", help="Also generate variants for non-stone blocks.")
+    parser.add_argument("--skip-validation", action="store_true", help="Do not validate the promoted files after applying.")
+    return parser.parse_args()
+
+
+def normalize_identifier(value: str) -> str:
+    name = Path(value).stem if value.endswith(".json") else value
+    return name if ":" in name else f"{NAMESPACE}:{name}"
+
+
+def block_identifier(payload: dict[str, Any]) -> str | None:
+    identifier = payload.get("minecraft:block", {}).get("description", {}).get("identifier")
+    return identifier if isinstance(identifier, str) else None
+
+
+def block_texture(payload: dict[str, Any]) -> str | None:
+    components = payload.get("minecraft:block", {}).get("components", {})
+    texture = components.get("minecraft:material_instances", {}).get("*", {}).get("texture")
+    return texture if isinstance(texture, str) else None
+
+
+def variant_suffix_of(identifier: str) -> str | None:
+    parsed = split_variant_item_name(identifier.split(":", 1)[1])
+    return parsed[1] if parsed is not None else None
+
+
+def collect_staged(plan: ChangePlan) -> dict[str, StagedBlock]:
+    staged: dict[str, StagedBlock] = {}
+
+    def entry(identifier: str) -> StagedBlock:
+        return staged.setdefault(identifier, StagedBlock(identifier))
+
+    for path in plan.glob(UPCOMING_DIR, "*.json") + plan.rglob(STAGED_BLOCKS_DIR, "*.json"):
+        identifier = block_identifier(plan.read_json(path))
+        if identifier is not None:
+            entry(identifier).block_path = path
+
+    for path in plan.rglob(STAGED_CULLING_DIR, "*.json"):
+        rules = plan.read_json(path).get("minecraft:block_culling_rules", {})
+        identifier = rules.get("description", {}).get("identifier", "")
+        if identifier.startswith(CULLING_PREFIX):
+            entry(f"{NAMESPACE}:{identifier.removeprefix(CULLING_PREFIX)}").culling_paths.append(path)
+
+    for path in plan.rglob(STAGED_RECIPES_DIR, "*.json"):
+        for key, recipe in plan.read_json(path).items():
+            result = recipe.get("result", {}) if key.startswith("minecraft:recipe_") else {}
+            if isinstance(result, dict) and isinstance(result.get("item"), str):
+                entry(result["item"]).recipe_paths.append(path)
+
+    return staged
+
+
+def pack_block_path(name: str) -> Path:
+    parsed = split_variant_item_name(name)
+    return variant_block_path(*parsed) if parsed is not None else build_entire_block_target_path(name)
+
+
+def resolve_statuses(staged: dict[str, StagedBlock], plan: ChangePlan, allow_missing_textures: bool) -> None:
+    terrain_textures = plan.read_json(TERRAIN_TEXTURE_PATH).get("texture_data", {})
+    vanilla_bases = load_vanilla_base_names(VANILLA_LIST_PATH) & {block.name for block in staged.values()}
+    kept_vanilla_bases = detect_vanilla_bases_with_local_textures(vanilla_bases, plan)
+
+    # Entire blocks first: a staged variant can be promoted along with its base block.
+    for block in sorted(staged.values(), key=lambda block: block.variant is not None):
+        texture = block_texture(plan.read_json(block.block_path)) if block.block_path is not None else None
+        if plan.exists(pack_block_path(block.name)):
+            block.status = "present"
+        elif block.block_path is None:
+            block.status = "no_block_file"
+        elif block.name in vanilla_bases and block.name not in kept_vanilla_bases:
+            block.status = "vanilla"
+        elif texture is None or (texture not in terrain_textures and not allow_missing_textures):
+            block.status = "missing_texture"
+        elif block.variant is not None:
+            base = staged.get(f"{NAMESPACE}:{block.variant[0]}")
+            promoted_base = base is not None and base.status == "ready"
+            if not promoted_base and not plan.exists(build_entire_block_target_path(block.variant[0])):
+                block.status = "missing_base"
+
+
+def material_sound(base_name: str, assets: dict[str, Any]) -> str:
+    # New blocks sound like the first registered block of the same material.
+    token = infer_material_token(base_name)
+    for identifier, entry in assets.items():
+        name = identifier.split(":", 1)[-1]
+        if isinstance(entry, dict) and "sound" in entry and infer_material_token(name) == token:
+            return str(entry["sound"])
+    return "stone"
+
+
+def build_promoted_entire_block(template: dict[str, Any], source: dict[str, Any], identifier: str, texture: str) -> dict[str, Any]:
+    payload = build_entire_block_from_template(template, identifier, texture)
+    components = payload["minecraft:block"]["components"]
+    source_components = source.get("minecraft:block", {}).get("components", {})
+
+    for key in [key for key in components if key.startswith("tag:")]:
+        del components[key]
+    for key, value in source_components.items():
+        if key.startswith("tag:") or key in SOURCE_COMPONENT_KEYS:
+            components[key] = copy.deepcopy(value)
+    return payload
+
+
+def place_staged_block(
+    block: StagedBlock,
+    template: dict[str, Any],
+    assets: dict[str, Any],
+    plan: ChangePlan,
+    culling_mode: str,
+) -> dict[str, Any]:
+    source = plan.read_json(block.block_path)
+    texture = block_texture(source)
+    if block.variant is None:
+        payload = build_promoted_entire_block(template, source, block.identifier, texture)
+        sound_base = block.name
+    else:
+        payload = copy.deepcopy(source)
+        base_name, suffix = block.variant
+        geometry = payload["minecraft:block"].get("components", {}).get("minecraft:geometry")
+        if isinstance(geometry, dict) and "culling" in geometry:
+            geometry["culling"] = culling_identifier(base_name, suffix, culling_mode)
+        sound_base = base_name
+
+    plan.write_json(pack_block_path(block.name), payload)
+    plan.delete(block.block_path)
+
+    entry = assets.get(block.identifier)
+    base_entry = assets.get(f"{NAMESPACE}:{sound_base}")
+    if isinstance(entry, dict) and "sound" in entry:
+        sound = str(entry["sound"])
+    elif isinstance(base_entry, dict) and "sound" in base_entry:
+        sound = str(base_entry["sound"])
+    else:
+        sound = material_sound(sound_base, assets)
+    assets[block.identifier] = {"sound": sound, "textures": texture}
+    return payload
+
+
+def place_staged_culling(block: StagedBlock, plan: ChangePlan, culling_mode: str) -> int:
+    placed = 0
+    for path in block.culling_paths:
+        if block.variant is not None and culling_mode == "shared":
+            # The promoted block references the shared rules of its shape instead.
+            plan.delete(path)
+            continue
+        target = culling_path(*block.variant, culling_mode) if block.variant is not None else CULLING_DIR / path.name
+        plan.move(path, target)
+        placed += 1
+    return placed
+
+
+def place_staged_recipes(block: StagedBlock, plan: ChangePlan, recipe_layout: str) -> list[Path]:
+    placed: list[Path] = []
+    stonecutter_dir = STAGED_RECIPES_DIR / "stonecutter"
+    for path in block.recipe_paths:
+        if stonecutter_dir not in path.parents:
+            target = BP_ROOT / "recipes" / path.relative_to(STAGED_RECIPES_DIR)
+        else:
+            file_name = path.name
+            recipe = plan.read_json(path).get("minecraft:recipe_shapeless", {})
+            ingredients = recipe.get("ingredients") or [{}]
+            if block.variant is not None and ingredients[0].get("item") == f"{NAMESPACE}:{block.variant[0]}":
+                base_name, suffix = block.variant
+                file_name = f"{Path(variant_filename(base_name, suffix)).stem}_from_{base_name}.json"
+            target = stonecutter_recipe_path(file_name, recipe_layout)
+        plan.move(path, target)
+        placed.append(target)
+    return placed
+
+
+def forward_recipe_paths(targets: list[TargetBlock], plan: ChangePlan) -> list[Path]:
+    paths: list[Path] = []
+    for target in targets:
+        for suffix in VARIANT_SUFFIXES:
+            file_name = f"{Path(variant_filename(target.base_name, suffix)).stem}_from_{target.base_name}.json"
+            for layout in ("flat", "sharded"):
+                path = stonecutter_recipe_path(file_name, layout)
+                if plan.exists(path) and path not in paths:
+                    paths.append(path)
+    return paths
+
+
+def add_catalog_items(identifiers: list[str], plan: ChangePlan) -> int:
+    catalog = CraftingCatalog.for_plan(plan)
+    stonework_group = catalog.group("construction", STONEWORK_GROUP_NAME)
+    stonework_items = stonework_group.get("items", []) if isinstance(stonework_group, dict) else []
+    material_order = build_material_order(stonework_items)
+    added = 0
+
+    for suffix, group_name in VARIANT_CATALOG_GROUPS.items():
+        ids = [identifier for identifier in identifiers if variant_suffix_of(identifier) == suffix]
+        if not ids:
+            continue
+        group = catalog.group("construction", group_name)
+        current = group.get("items", []) if group is not None else []
+        added += len(set(ids) - set(current))
+        # Same order a full uniform run would produce, so the next run finds nothing to do.
+        items = sort_variant_items_by_material(current + ids, material_order)
+        catalog.sync_group("construction", group_name, f"{NAMESPACE}:andesite_tiles_{suffix}", items)
+
+    if stonework_group is not None:
+        for identifier in identifiers:
+            if variant_suffix_of(identifier) is not None or catalog.contains(stonework_group, identifier):
+                continue
+            # Entire blocks go after the last block of their material.
+            token = variant_sort_parts(identifier)[0]
+            items = stonework_group.get("items", [])
+            position = max(
+                (index + 1 for index, item in enumerate(items) if variant_sort_parts(item)[0] == token),
+                default=len(items),
+            )
+            catalog.set_items(stonework_group, items[:position] + [identifier] + items[position:])
+            added += 1
+
+    catalog.save(plan)
+    return added
+
+
+def merge_stair_ids(identifiers: list[str], plan: ChangePlan) -> int:
+    script = plan.read_text(STAIRS_SCRIPT_PATH)
+    match = STAIR_IDS_PATTERN.search(script)
+    existing = set(re.findall(r'"([^"]+)"', match.group(0))) if match else set()
+    stairs_ids = existing | {
+        identifier for identifier in identifiers if variant_suffix_of(identifier) in ("stairs", "three_steps_stairs")
+    }
+    updated = replace_stair_ids(script, sorted(stairs_ids))
+    if updated != script:
+        plan.write_text(STAIRS_SCRIPT_PATH, updated)
+    return len(stairs_ids - existing)
+
+
+def shape_family_base(family: dict[str, str]) -> str:
+    # Vanilla stairs/slab ids do not always contain the base name; the default always does.
+    name = family["default"].split(":", 1)[1]
+    wood = name.removesuffix("_planks")
+    return wood if wood in VANILLA_WOOD_FAMILY_NAMES else name
+
+
+def merge_shape_families(identifiers: list[str], plan: ChangePlan) -> int:
+    script = plan.read_text(SHAPE_FAMILIES_SCRIPT_PATH)
+    families: dict[str, dict[str, str]] = {}
+    for match in SHAPE_FAMILY_PATTERN.finditer(script):
+        family = dict(SHAPE_FAMILY_FIELD_PATTERN.findall(match.group(1)))
+        families[shape_family_base(family)] = family
+    aliases = dict(SHAPE_FAMILY_ALIAS_PATTERN.findall(script))
+
+    before = len(families)
+    for identifier in identifiers:
+        parsed = split_variant_item_name(identifier.split(":", 1)[1])
+        if parsed is None:
+            continue
+        base_name, suffix = parsed
+        family = families.setdefault(base_name, {})
+        family[suffix] = identifier
+        custom_id = f"{NAMESPACE}:{base_name}"
+        family["default"] = custom_id if plan.exists(build_entire_block_target_path(base_name)) else f"minecraft:{base_name}"
+
+    aliases.update(apply_vanilla_shapes(families, load_vanilla_base_names(VANILLA_LIST_PATH)))
+    plan.write_text(SHAPE_FAMILIES_SCRIPT_PATH, render_shape_families_script(order_shape_families(families), aliases))
+    return len(families) - before
+
+
+def merge_sound_events(identifiers: list[str], plan: ChangePlan) -> int:
+    rules = parse_sound_rules(plan.read_text(SOUND_CONFIG_PATH))
+    assets = plan.read_json(ASSETS_BLOCKS_PATH)
+    events = dict(SOUND_EVENT_PATTERN.findall(plan.read_text(SOUND_EVENTS_SCRIPT_PATH)))
+
+    before = len(events)
+    for identifier in identifiers:
+        entry = assets.get(identifier)
+        events[identifier] = rules.resolve(identifier, entry.get("sound") if isinstance(entry, dict) else None)
+    plan.write_text(SOUND_EVENTS_SCRIPT_PATH, render_sound_events_script(dict(sorted(events.items()))))
+    return len(events) - before
+
+
+def promote(
+    blocks: Iterable[StagedBlock],
+    plan: ChangePlan,
+    include_non_stone: bool = False,
+) -> dict[str, int]:
+    blocks = [block for block in blocks if block.status == "ready"]
+    recipe_layout = detect_recipe_layout(plan)
+    culling_mode = detect_culling_mode(plan)
+    template = plan.read_json(build_entire_block_target_path(Path(ENTIRE_BLOCK_TEMPLATE_NAME).stem))
+    assets = plan.read_json(ASSETS_BLOCKS_PATH)
+
+    targets: list[TargetBlock] = []
+    promoted_ids: list[str] = []
+    placed_culling = 0
+    forward_recipes: list[Path] = []
+    for block in sorted(blocks, key=lambda block: block.variant is not None):
+        payload = place_staged_block(block, template, assets, plan, culling_mode)
+        placed_culling += place_staged_culling(block, plan, culling_mode)
+        forward_recipes += place_staged_recipes(block, plan, recipe_layout)
+        promoted_ids.append(block.identifier)
+        if block.variant is None:
+            components = payload["minecraft:block"].get("components", {})
+            target = build_target(block.identifier, components, assets[block.identifier], include_non_stone, plan)
+            if target is not None:
+                targets.append(target)
+    if blocks:
+        plan.write_json(ASSETS_BLOCKS_PATH, assets)
+
+    stats: dict[str, int] = {"promoted_blocks": len(promoted_ids), "placed_culling": placed_culling}
+    stats["placed_recipes"] = len(forward_recipes)
+    stats.update(generate_target_files(targets, plan, recipe_layout, culling_mode))
+    created_reverse_recipes, _ = create_reverse_variant_recipes(
+        plan, recipe_layout, forward_recipes + forward_recipe_paths(targets, plan)
+    )
+    stats["created_reverse_variant_recipes"] = created_reverse_recipes
+    stats["assets_variant_entries"] = sum(update_assets_blocks(targets, plan))
+
+    identifiers = list(
+        dict.fromkeys(
+            promoted_ids
+            + [f"{NAMESPACE}:{target.base_name}_{suffix}" for target in targets for suffix in VARIANT_SUFFIXES]
+        )
+    )
+    identifiers = [identifier for identifier in identifiers if plan.exists(pack_block_path(identifier.split(":", 1)[1]))]
+    if not identifiers:
+        return stats
+
+    stats["catalog_items"] = add_catalog_items(identifiers, plan)
+    stats["tracked_stairs_ids"] = merge_stair_ids(identifiers, plan)
+    stats["shape_families"] = merge_shape_families(identifiers, plan)
+    stats["sound_event_ids"] = merge_sound_events(identifiers, plan)
+    _, stats["created_localization_entries"] = update_block_localization_names(plan, identifiers)
+    return stats
+
+
+def main() -> int:
+    args = parse_args()
+    plan = ChangePlan()
+    staged = collect_staged(plan)
+    resolve_statuses(staged, plan, args.allow_missing_textures)
+
+    if args.list:
+        print("Staged blocks:")
+        for identifier, block in sorted(staged.items()):
+            print(f"- {identifier}: {block.status}")
+        return 0
+
+    requested = [normalize_identifier(value) for value in args.ids] or sorted(staged)
+    unknown = [identifier for identifier in requested if identifier not in staged]
+    if unknown:
+        print("Not staged: " + ", ".join(unknown))
+        return 1
+
+    selected = [staged[identifier] for identifier in requested]
+    stats = promote(selected, plan, include_non_stone=args.include_non_stone)
+
+    print("Promotion summary:")
+    for key, value in stats.items():
+        print(f"- {key}: {value}")
+    skipped = [block for block in selected if block.status != "ready"]
+    if skipped:
+        print("Not promoted:")
+        for block in skipped:
+            print(f"- {block.identifier}: {block.status}")
+
+    if args.dry_run:
+        print_plan(plan, show_diff=args.show_diff)
+        print("Dry run enabled. No files were changed.")
+        return 0
+
+    # Only the promoted files are validated; the rest of the pack was not touched.
+    written = [
+        change.path
+        for change in plan.changes()
+        if change.content is not None
+        and change.path.suffix == ".json"
+        and any(change.path.is_relative_to(pack_root) for pack_root in (BP_ROOT, RP_ROOT))
+    ]
+    applied = plan.apply()
+    print("Applied changes:")
+    for action, count in applied.items():
+        print(f"- {action}: {count}")
+
+    if not args.skip_validation and written:
+        results, validation_stats = validate_pack(written)
+        print_validation_report(results, validation_stats)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
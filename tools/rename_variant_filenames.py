@@ -1,8 +1,58 @@
 from __future__ import annotations
 
+"""
+Shorten variant file names (and move vertical_slabs/ to vslab/) as one checked batch.
+
+The whole rename is planned before anything moves:
+1. every file in TARGET_DIRS gets its short name (TOKEN_REPLACEMENTS, applied in one
+   regex pass), and sharded stonecutter recipes move to the shard of that name; then
+   every file of a DIRECTORY_RENAMES source gets the new folder;
+2. the collision graph is built and moves are rejected, with a reason, when several
+   files want the same name (`fan_in`), the name the generators derive for the file
+   would no longer match (`generator_name`, see below), or the target stays occupied
+   (`occupied`, or `duplicate` when the occupant defines the same identifier);
+   rejections propagate to moves that needed the rejected file out of the way (`blocked`);
+3. the remaining moves are staged simultaneously on a ChangePlan, so chains and swap
+   cycles (a -> b, b -> a) need no temporary names;
+4. quoted references to a moved file or folder (full path, pack-relative path, or a
+   base name that is unique in the pack) are rewritten in one indexed pass over the
+   pack JSON, BP scripts, tools and workflows.
+
+The generators locate variant blocks, culling files and stonecutter recipes by
+computing their file names from identifiers (`variant_filename` and friends), which
+no reference rewrite can update. Renaming such a file to anything else makes the next
+generator run recreate it under the old name, next to the renamed copy, so those
+moves are rejected unless --ignore-generator-names is given.
+
+Before applying, the inverse plan is saved as a journal in
+tools/generated/rename_journal.json; a failed apply is rolled back from it, and
+--rollback undoes the last applied batch (refused if the files changed since).
+
+Examples
+--------
+- python tools/rename_variant_filenames.py --dry-run --list-conflicts
+- python tools/rename_variant_filenames.py --dry-run --show-diff
+- python tools/rename_variant_filenames.py
+- python tools/rename_variant_filenames.py --rollback
+"""
+
+import argparse
+import re
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
-ROOT = Path(__file__).resolve().parents[1]
+from change_plan import ChangePlan, print_plan
+from generate_uniform_variants import (
+    SHARED_CULLING_FILES,
+    STONECUTTER_DIR,
+    VARIANT_FILE_SUFFIXES,
+    split_variant_item_name,
+    stonecutter_recipe_path,
+    variant_filename,
+)
+from pack_io import ROOT, BP_ROOT, RP_ROOT
 
 TARGET_DIRS = [
     ROOT / "BP/blocks/decorative/slabs",
@@ -10,8 +60,12 @@ TARGET_DIRS = [
     ROOT / "BP/blocks/decorative/unique_stairs",
     ROOT / "BP/blocks/decorative/vertical_slabs",
     ROOT / "RP/block_culling",
-    ROOT / "BP/recipes/stonecutter",
+    STONECUTTER_DIR,
 ]
+DIRECTORY_RENAMES = {
+    ROOT / "BP/blocks/decorative/vertical_slabs": ROOT / "BP/blocks/decorative/vslab",
+}
+JOURNAL_PATH = ROOT / "tools/generated/rename_journal.json"
 
 TOKEN_REPLACEMENTS = [
     ("three_steps_stairs", "tss"),
@@ -24,59 +78,298 @@ TOKEN_REPLACEMENTS = [
     ("polished", "pl"),
     ("smooth", "sm"),
 ]
+# Alternation in list order: the longer tokens win where they overlap, as with chained replaces.
+TOKEN_PATTERN = re.compile("|".join(re.escape(old) for old, _ in TOKEN_REPLACEMENTS))
+TOKEN_MAP = dict(TOKEN_REPLACEMENTS)
+
+# (directory, pattern, recursive) scanned for references; this module is left out on purpose.
+REFERENCE_SOURCES = [
+    (BP_ROOT, "*.json", True),
+    (BP_ROOT / "scripts", "*.js", True),
+    (RP_ROOT, "*.json", True),
+    (ROOT / "tools", "*.py", False),
+    (ROOT / "tools", "*.json", False),
+    (ROOT / ".github", "*.yml", True),
+]
+
+
+@dataclass
+class RenamePlan:
+    moves: dict[Path, Path] = field(default_factory=dict)
+    # rejected source -> (wanted target, reason)
+    conflicts: dict[Path, tuple[Path, str]] = field(default_factory=dict)
+    cycles: list[list[Path]] = field(default_factory=list)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Shorten variant file names and update references in one batch.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the planned changes without touching files.")
+    parser.add_argument("--show-diff", action="store_true", help="With --dry-run, print a unified diff for every change.")
+    parser.add_argument("--list-conflicts", action="store_true", help="List every rejected move and its reason.")
+    parser.add_argument(
+        "--ignore-generator-names",
+        action="store_true",
+        help="Also rename files whose new name no longer matches the name the generators derive.",
+    )
+    parser.add_argument("--rollback", action="store_true", help="Undo the last applied rename batch from its journal.")
+    return parser.parse_args()
 
 
 def rename_text(text: str) -> str:
-    updated = text
-    for old, new in TOKEN_REPLACEMENTS:
-        updated = updated.replace(old, new)
-    return updated
+    return TOKEN_PATTERN.sub(lambda match: TOKEN_MAP[match.group(0)], text)
 
 
-def rename_files() -> tuple[int, int]:
-    renamed = 0
-    skipped = 0
+def pack_identifier(payload: Any) -> str | None:
+    for key, value in payload.items() if isinstance(payload, dict) else ():
+        if key != "format_version" and isinstance(value, dict):
+            identifier = value.get("description", {}).get("identifier")
+            return identifier if isinstance(identifier, str) else None
+    return None
+
+
+def generator_file_name(payload: Any) -> str | None:
+    # The file name the uniform generator derives for this file, or None if it does not manage it.
+    identifier = pack_identifier(payload)
+    if identifier is None:
+        return None
+    name = identifier.split(":", 1)[-1]
+
+    if "minecraft:block" in payload:
+        parsed = split_variant_item_name(name)
+        return variant_filename(*parsed) if parsed else None
+
+    if "minecraft:block_culling_rules" in payload:
+        name = name.removeprefix("culling.")
+        if name in SHARED_CULLING_FILES:
+            return SHARED_CULLING_FILES[name]
+        parsed = split_variant_item_name(name)
+        return variant_filename(*parsed) if parsed else None
+
+    recipe = payload.get("minecraft:recipe_shapeless", {})
+    if "stonecutter" not in recipe.get("tags", []) or not recipe.get("ingredients"):
+        return None
+    result = str(recipe.get("result", {}).get("item", "")).split(":", 1)[-1]
+    ingredient = str(recipe["ingredients"][0].get("item", "")).split(":", 1)[-1]
+    forward = split_variant_item_name(result)
+    if forward is not None and forward[0] == ingredient:
+        return f"{ingredient}_{VARIANT_FILE_SUFFIXES[forward[1]]}_from_{ingredient}.json"
+    reverse = split_variant_item_name(ingredient)
+    if reverse is not None and reverse[0] == result:
+        return f"{result}_from_{ingredient}.json"
+    return None
 
-    for directory in TARGET_DIRS:
-        if not directory.exists() or not directory.is_dir():
-            continue
 
-        files = sorted([path for path in directory.iterdir() if path.is_file() and path.suffix.lower() == ".json"])
-        for source in files:
+def propose_file_renames(plan: ChangePlan) -> dict[Path, Path]:
+    proposals: dict[Path, Path] = {}
+    # A renamed folder is shortened under its new name on later runs.
+    directories = dict.fromkeys([*TARGET_DIRS, *(DIRECTORY_RENAMES.get(directory, directory) for directory in TARGET_DIRS)])
+    for directory in directories:
+        # Sharded recipes sit in a subfolder that the generators derive from the file name.
+        sharded = directory == STONECUTTER_DIR
+        for source in plan.rglob(directory, "*.json") if sharded else plan.glob(directory, "*.json"):
             target_name = rename_text(source.name)
             if target_name == source.name:
                 continue
+            if sharded and source.parent != STONECUTTER_DIR:
+                proposals[source] = stonecutter_recipe_path(target_name, "sharded")
+            else:
+                proposals[source] = source.with_name(target_name)
+    return proposals
+
+
+def propose_directory_renames(plan: ChangePlan) -> dict[Path, Path]:
+    proposals: dict[Path, Path] = {}
+    for old_dir, new_dir in DIRECTORY_RENAMES.items():
+        for source in plan.rglob(old_dir, "*"):
+            proposals[source] = new_dir / source.relative_to(old_dir)
+    return proposals
+
+
+def find_cycles(moves: dict[Path, Path]) -> list[list[Path]]:
+    cycles: list[list[Path]] = []
+    visited: set[Path] = set()
+    for start in moves:
+        chain: list[Path] = []
+        current = start
+        while current in moves and current not in visited:
+            visited.add(current)
+            chain.append(current)
+            current = moves[current]
+        if current in chain:
+            cycles.append(chain[chain.index(current):])
+    return cycles
+
+
+def build_rename_plan(plan: ChangePlan, proposals: dict[Path, Path], check_generator_names: bool) -> RenamePlan:
+    result = RenamePlan()
+    sources_by_target: dict[Path, list[Path]] = {}
+    for source, target in proposals.items():
+        sources_by_target.setdefault(target, []).append(source)
+
+    accepted: dict[Path, Path] = {}
+    for source, target in proposals.items():
+        if len(sources_by_target[target]) > 1:
+            result.conflicts[source] = (target, f"fan_in ({len(sources_by_target[target])} files)")
+            continue
+        if check_generator_names and source.suffix == ".json" and target.name != source.name:
+            expected = generator_file_name(plan.read_json(source))
+            if expected is not None and expected != target.name:
+                result.conflicts[source] = (target, f"generator_name (generators expect {expected})")
+                continue
+        accepted[source] = target
+
+    # A target is free once its current file moves away; rejections can cascade along chains.
+    changed = True
+    while changed:
+        changed = False
+        for source, target in list(accepted.items()):
+            if target in accepted or target == source or not plan.exists(target):
+                continue
+            if target in proposals:
+                reason = f"blocked ({plan.relative(target)} cannot move)"
+            elif target.suffix == ".json" and pack_identifier(plan.read_json(target)) == pack_identifier(plan.read_json(source)):
+                reason = "duplicate (target defines the same identifier)"
+            else:
+                reason = "occupied"
+            result.conflicts[source] = (target, reason)
+            del accepted[source]
+            changed = True
+
+    result.moves = accepted
+    result.cycles = find_cycles(accepted)
+    return result
+
+
+def stage_moves(plan: ChangePlan, moves: dict[Path, Path]) -> None:
+    # Read everything first, so chains and cycles move simultaneously.
+    texts = {source: plan.read_text(source) for source in moves}
+    for source in moves:
+        plan.delete(source)
+    for source, target in moves.items():
+        plan.write_text(target, texts[source])
+
+
+def reference_index(plan: ChangePlan, moves: dict[Path, Path], directories: dict[Path, Path]) -> dict[str, str]:
+    # Base names are only indexed when they were unique in the pack before the moves.
+    targets = set(moves.values())
+    files_before = [path for path in plan.rglob(BP_ROOT, "*") + plan.rglob(RP_ROOT, "*") if path not in targets]
+    name_counts = Counter(path.name for path in [*files_before, *moves])
 
-            target = source.with_name(target_name)
-            if target.exists() and target != source:
-                skipped += 1
+    index: dict[str, str] = {}
+    for source, target in [*moves.items(), *directories.items()]:
+        old, new = source.relative_to(ROOT).as_posix(), target.relative_to(ROOT).as_posix()
+        index[old] = new
+        # Tools usually join pack-relative paths onto BP_ROOT / RP_ROOT.
+        index[old.split("/", 1)[1]] = new.split("/", 1)[1]
+        if source.name != target.name and name_counts[source.name] == 1:
+            index[source.name] = target.name
+    return index
+
+
+def rewrite_references(plan: ChangePlan, index: dict[str, str]) -> dict[str, int]:
+    stats = {"files": 0, "references": 0}
+    if not index:
+        return stats
+    alternatives = "|".join(re.escape(key) for key in sorted(index, key=len, reverse=True))
+    pattern = re.compile(rf"([\"'])({alternatives})\1")
+    own_path = Path(__file__).resolve()
+
+    for directory, glob_pattern, recursive in REFERENCE_SOURCES:
+        for path in plan.rglob(directory, glob_pattern) if recursive else plan.glob(directory, glob_pattern):
+            if path == own_path:
                 continue
+            text = plan.read_text(path)
+            updated, count = pattern.subn(lambda match: f"{match.group(1)}{index[match.group(2)]}{match.group(1)}", text)
+            if count:
+                plan.write_text(path, updated)
+                stats["files"] += 1
+                stats["references"] += count
+    return stats
+
+
+def plan_renames(plan: ChangePlan, check_generator_names: bool = True) -> tuple[RenamePlan, dict[str, int]]:
+    file_plan = build_rename_plan(plan, propose_file_renames(plan), check_generator_names)
+    stage_moves(plan, file_plan.moves)
+    # Folder moves keep the names, so they are planned on top of the staged file renames.
+    directory_plan = build_rename_plan(plan, propose_directory_renames(plan), check_generator_names)
+    stage_moves(plan, directory_plan.moves)
+
+    moves: dict[Path, Path] = {}
+    for source, target in file_plan.moves.items():
+        moves[source] = directory_plan.moves.pop(target, target)
+    moves.update(directory_plan.moves)
+    moved_directories = {
+        old_dir: new_dir
+        for old_dir, new_dir in DIRECTORY_RENAMES.items()
+        if any(old_dir in source.parents for source in moves) and not plan.rglob(old_dir, "*")
+    }
+    stats = rewrite_references(plan, reference_index(plan, moves, moved_directories))
+
+    combined = RenamePlan(
+        moves=moves,
+        conflicts={**file_plan.conflicts, **directory_plan.conflicts},
+        cycles=file_plan.cycles + directory_plan.cycles,
+    )
+    return combined, stats
+
+
+def apply_with_journal(plan: ChangePlan) -> dict[str, int]:
+    undo = plan.inverse()
+    undo.save(JOURNAL_PATH)
+    try:
+        return plan.apply()
+    except Exception:
+        undo.apply()
+        raise
+
+
+def rollback() -> int:
+    if not JOURNAL_PATH.exists():
+        print(f"No rename journal at {JOURNAL_PATH.relative_to(ROOT).as_posix()}.")
+        return 1
+    undo = ChangePlan.load(JOURNAL_PATH)
+    applied = undo.apply()
+    JOURNAL_PATH.unlink()
+    print("Rolled back changes:")
+    for action, count in applied.items():
+        print(f"- {action}: {count}")
+    return 0
 
-            source.rename(target)
-            renamed += 1
 
-    return renamed, skipped
+def main() -> int:
+    args = parse_args()
+    if args.rollback:
+        return rollback()
 
+    plan = ChangePlan()
+    rename_plan, reference_stats = plan_renames(plan, check_generator_names=not args.ignore_generator_names)
+    reasons = Counter(reason.split(" ", 1)[0] for _, reason in rename_plan.conflicts.values())
 
-def rename_vertical_slabs_dir() -> bool:
-    old_dir = ROOT / "BP/blocks/decorative/vertical_slabs"
-    new_dir = ROOT / "BP/blocks/decorative/vslab"
-    if not old_dir.exists() or not old_dir.is_dir():
-        return False
-    if new_dir.exists():
-        return False
-    old_dir.rename(new_dir)
-    return True
+    print("Rename summary:")
+    print(f"- renamed: {len(rename_plan.moves)}")
+    print(f"- swap_cycles: {len(rename_plan.cycles)}")
+    print(f"- rejected: {len(rename_plan.conflicts)}")
+    for reason, count in sorted(reasons.items()):
+        print(f"  - {reason}: {count}")
+    print(f"- reference_files: {reference_stats['files']}")
+    print(f"- references: {reference_stats['references']}")
 
+    if args.list_conflicts and rename_plan.conflicts:
+        print("Rejected moves:")
+        for source, (target, reason) in sorted(rename_plan.conflicts.items()):
+            print(f"- {plan.relative(source)} -> {target.name}: {reason}")
 
-def main() -> None:
-    renamed, skipped = rename_files()
-    dir_renamed = rename_vertical_slabs_dir()
+    if args.dry_run:
+        print_plan(plan, show_diff=args.show_diff)
+        print("Dry run enabled. No files were changed.")
+        return 0
 
-    print(f"Renamed files: {renamed}")
-    print(f"Skipped collisions: {skipped}")
-    print(f"Renamed directory vertical_slabs -> vslab: {dir_renamed}")
+    applied = apply_with_journal(plan)
+    print("Applied changes:")
+    for action, count in applied.items():
+        print(f"- {action}: {count}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
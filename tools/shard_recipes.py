@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+"""
+Move stonecutter recipes between the flat layout and per-material shard folders.
+
+`pack` moves every `BP/recipes/stonecutter/*.json` into
+`BP/recipes/stonecutter/<material>/` (material inferred from the file name with the
+same token priority the catalog uses), so the pack loads a few dozen small folders
+instead of one directory with over a thousand entries. `unpack` moves them back.
+File contents, and therefore recipe identifiers, are never touched, and the two
+commands are exact inverses.
+
+Examples
+--------
+- python tools/shard_recipes.py pack --dry-run
+- python tools/shard_recipes.py pack
+- python tools/shard_recipes.py unpack
+"""
+
+import argparse
+from pathlib import Path
+
+from change_plan import ChangePlan, print_plan
+from generate_uniform_variants import (
+    STONECUTTER_DIR,
+    iter_stonecutter_recipe_files,
+    stonecutter_recipe_path,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Shard or unshard BP/recipes/stonecutter by material.")
+    parser.add_argument("command", choices=("pack", "unpack"), help="pack into shard folders, or unpack to the flat layout.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the planned moves without touching files.")
+    return parser.parse_args()
+
+
+def plan_layout(plan: ChangePlan, recipe_layout: str) -> tuple[int, list[str]]:
+    moves: dict[Path, Path] = {}
+    targets: set[Path] = set()
+    collisions: list[str] = []
+
+    for recipe_path in iter_stonecutter_recipe_files(plan):
+        target_path = stonecutter_recipe_path(recipe_path.name, recipe_layout)
+        if target_path in targets:
+            collisions.append(recipe_path.name)
+            continue
+        targets.add(target_path)
+        moves[recipe_path] = target_path
+
+    if collisions:
+        return 0, collisions
+
+    moved = 0
+    for source_path, target_path in moves.items():
+        if source_path == target_path:
+            continue
+        plan.move(source_path, target_path)
+        moved += 1
+    return moved, []
+
+
+def main() -> int:
+    args = parse_args()
+    recipe_layout = "sharded" if args.command == "pack" else "flat"
+
+    plan = ChangePlan()
+    moved, collisions = plan_layout(plan, recipe_layout)
+    if collisions:
+        print(f"Refusing to {args.command}: duplicate recipe file names under {STONECUTTER_DIR}:")
+        for name in sorted(set(collisions)):
+            print(f"- {name}")
+        return 1
+
+    print(f"Recipes to move: {moved}")
+    if args.dry_run:
+        print_plan(plan)
+        print("Dry run enabled. No files were changed.")
+        return 0
+
+    plan.apply()
+    print(f"Layout: {recipe_layout}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
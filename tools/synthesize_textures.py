@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+"""
+Synthesize cracked/mossy/polished/smooth texture variants from the stone bases.
+
+Every base texture in RP/textures/blocks/stones (files without a modifier prefix and
+without a _top/_side face suffix) is loaded once, grouped by size and stacked into a
+float32 array, so each kernel runs once per size group instead of once per texture:
+- cracked: random-walk crack mask (drawn for the whole batch at once) that darkens
+  the pixels it covers;
+- mossy: blocky value noise biased towards the top rows, overlaid with a two-tone
+  moss palette;
+- polished: palette shift that pulls colors towards the texture mean and lifts
+  brightness;
+- smooth: 3x3 box blur followed by a stronger palette shift.
+Noise is seeded per texture name (plus --seed), so reruns and partial runs give the
+same pixels. Alpha is never changed.
+
+Only textures something asks for are synthesized: by default, the
+`utilitycraft_<modifier>_<base>` terrain keys that a block uses (RP/blocks.json or BP
+material_instances, as indexed by texture_index.py), or the `<modifier>_<base>` names
+given with --targets. Unused outputs would only be deleted again by
+`texture_index.py --prune`. Outputs are written as `<modifier>_<base>.png` next to the
+bases and registered in terrain_texture.json under that key. Existing images (hand
+painted ones such as cracked_andesite_bricks) are kept unless --overwrite is given.
+A --targets name that no selected modifier and available base can produce is listed
+as unknown, and the run exits with 1 without writing anything.
+
+Examples
+--------
+- python tools/synthesize_textures.py --dry-run
+- python tools/synthesize_textures.py --modifiers cracked mossy
+- python tools/synthesize_textures.py --targets mossy_andesite_bricks polished_tuff_tiles --overwrite
+"""
+
+import argparse
+import io
+import sys
+import zlib
+from typing import Callable
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:  # pragma: no cover - runtime dependency guard
+    print("NumPy and Pillow are required. Please install them in your Python environment.", file=sys.stderr)
+    raise SystemExit(1)
+
+from change_plan import ChangePlan, print_plan
+from pack_io import RP_ROOT
+from texture_index import build_texture_index
+
+STONES_DIR = RP_ROOT / "textures" / "blocks" / "stones"
+TERRAIN_TEXTURE_PATH = RP_ROOT / "textures" / "terrain_texture.json"
+TERRAIN_KEY_PREFIX = "utilitycraft_"
+
+MODIFIERS = ("cracked", "mossy", "polished", "smooth")
+NON_BASE_PREFIXES = (*(f"{modifier}_" for modifier in MODIFIERS), "chiseled_", "carved_", "glowing_")
+NON_BASE_SUFFIXES = ("_top", "_side")
+NON_BASE_NAMES = {"gloves"}
+
+CRACK_WALKERS = 3
+CRACK_DARKEN = 0.55
+MOSS_CELL = 4
+MOSS_COVERAGE = 0.45
+MOSS_DARK = np.array([62, 84, 38], dtype=np.float32)
+MOSS_LIGHT = np.array([98, 124, 56], dtype=np.float32)
+MOSS_OPACITY = 0.85
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate modifier texture variants from the stone base textures.")
+    parser.add_argument(
+        "--modifiers",
+        nargs="+",
+        choices=MODIFIERS,
+        default=list(MODIFIERS),
+        help="Modifiers to synthesize (default: all).",
+    )
+    parser.add_argument("--bases", nargs="+", default=None, help="Limit to these base texture names.")
+    parser.add_argument(
+        "--targets",
+        nargs="+",
+        default=None,
+        help="Synthesize these <modifier>_<base> textures instead of the ones blocks reference; unknown names exit with 1.",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Extra seed mixed into every per-texture noise seed.")
+    parser.add_argument("--overwrite", action="store_true", help="Replace existing modifier textures.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the planned changes without touching files.")
+    return parser.parse_args()
+
+
+def is_base_texture(name: str) -> bool:
+    return (
+        name not in NON_BASE_NAMES
+        and not name.startswith(NON_BASE_PREFIXES)
+        and not name.endswith(NON_BASE_SUFFIXES)
+    )
+
+
+def texture_seed(name: str, modifier: str, seed: int) -> int:
+    return zlib.crc32(f"{modifier}:{name}".encode("utf-8")) ^ seed
+
+
+def load_batches(names: list[str]) -> dict[tuple[int, int], tuple[list[str], np.ndarray]]:
+    # Group by size so each kernel sees one (N, H, W, 4) array per group.
+    groups: dict[tuple[int, int], tuple[list[str], list[np.ndarray]]] = {}
+    for name in names:
+        with Image.open(STONES_DIR / f"{name}.png") as image:
+            pixels = np.asarray(image.convert("RGBA"), dtype=np.float32)
+        group_names, arrays = groups.setdefault(pixels.shape[:2], ([], []))
+        group_names.append(name)
+        arrays.append(pixels)
+    return {size: (group_names, np.stack(arrays)) for size, (group_names, arrays) in groups.items()}
+
+
+def luminance(rgb: np.ndarray) -> np.ndarray:
+    return rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def overlay(batch: np.ndarray, color: np.ndarray, mask: np.ndarray, opacity: float) -> np.ndarray:
+    # color: (N, H, W, 3) or broadcastable; mask: (N, H, W) in [0, 1].
+    weight = (mask * opacity)[..., None]
+    rgb = batch[..., :3] * (1.0 - weight) + color * weight
+    return np.concatenate([rgb, batch[..., 3:]], axis=-1)
+
+
+def palette_shift(batch: np.ndarray, contrast: float, brightness: float) -> np.ndarray:
+    rgb = batch[..., :3]
+    opaque = (batch[..., 3:] > 0).astype(np.float32)
+    mean = (rgb * opaque).sum(axis=(1, 2), keepdims=True) / np.maximum(opaque.sum(axis=(1, 2), keepdims=True), 1.0)
+    shifted = mean + (rgb - mean) * contrast
+    shifted = shifted * brightness
+    return np.concatenate([shifted, batch[..., 3:]], axis=-1)
+
+
+def box_blur(batch: np.ndarray) -> np.ndarray:
+    # Wraps around the edges so the blurred texture still tiles.
+    rgb = batch[..., :3]
+    total = np.zeros_like(rgb)
+    for dy in (-1, 0, 1):
+        for dx in (-1, 0, 1):
+            total += np.roll(rgb, shift=(dy, dx), axis=(1, 2))
+    return np.concatenate([total / 9.0, batch[..., 3:]], axis=-1)
+
+
+def crack_masks(names: list[str], height: int, width: int, seed: int) -> np.ndarray:
+    count = len(names)
+    steps = max(height, width)
+    rngs = [np.random.default_rng(texture_seed(name, "cracked", seed)) for name in names]
+    starts = np.stack([rng.integers(0, (height, width), size=(CRACK_WALKERS, 2)) for rng in rngs])
+    moves = np.stack([rng.integers(-1, 2, size=(steps, CRACK_WALKERS, 2)) for rng in rngs])
+
+    # Walk every crack of every texture together: positions are (N, steps + 1, walkers, 2).
+    positions = starts[:, None] + np.cumsum(moves, axis=1)
+    positions = np.concatenate([starts[:, None], positions], axis=1) % (height, width)
+
+    mask = np.zeros((count, height, width), dtype=np.float32)
+    batch_index = np.broadcast_to(np.arange(count)[:, None, None], positions.shape[:3])
+    mask[batch_index, positions[..., 0], positions[..., 1]] = 1.0
+    return mask
+
+
+def moss_masks(names: list[str], height: int, width: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    cells = (max(height // MOSS_CELL, 1), max(width // MOSS_CELL, 1))
+    rngs = [np.random.default_rng(texture_seed(name, "mossy", seed)) for name in names]
+    coarse = np.stack([rng.random(cells, dtype=np.float32) for rng in rngs])
+    fine = np.stack([rng.random((height, width), dtype=np.float32) for rng in rngs])
+
+    blocky = np.repeat(np.repeat(coarse, MOSS_CELL, axis=1), MOSS_CELL, axis=2)[:, :height, :width]
+    top_bias = np.linspace(1.0, 0.0, height, dtype=np.float32)[None, :, None]
+    score = blocky * 0.6 + fine * 0.25 + top_bias * 0.35
+    mask = (score > 1.0 - MOSS_COVERAGE).astype(np.float32)
+    return mask, fine
+
+
+def cracked_kernel(batch: np.ndarray, names: list[str], seed: int) -> np.ndarray:
+    mask = crack_masks(names, batch.shape[1], batch.shape[2], seed)
+    return overlay(batch, np.zeros(3, dtype=np.float32), mask, CRACK_DARKEN)
+
+
+def mossy_kernel(batch: np.ndarray, names: list[str], seed: int) -> np.ndarray:
+    mask, tone = moss_masks(names, batch.shape[1], batch.shape[2], seed)
+    # Pick between the two moss tones per pixel, keeping some of the stone's shading.
+    shade = (luminance(batch[..., :3]) / 255.0)[..., None]
+    color = np.where((tone > 0.5)[..., None], MOSS_LIGHT, MOSS_DARK) * (0.7 + 0.6 * shade)
+    return overlay(batch, color, mask, MOSS_OPACITY)
+
+
+def polished_kernel(batch: np.ndarray, names: list[str], seed: int) -> np.ndarray:
+    return palette_shift(batch, contrast=0.6, brightness=1.06)
+
+
+def smooth_kernel(batch: np.ndarray, names: list[str], seed: int) -> np.ndarray:
+    return palette_shift(box_blur(batch), contrast=0.45, brightness=1.03)
+
+
+KERNELS: dict[str, Callable[[np.ndarray, list[str], int], np.ndarray]] = {
+    "cracked": cracked_kernel,
+    "mossy": mossy_kernel,
+    "polished": polished_kernel,
+    "smooth": smooth_kernel,
+}
+
+
+def encode_png(pixels: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(np.clip(np.rint(pixels), 0, 255).astype(np.uint8)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def referenced_targets(plan: ChangePlan) -> set[str]:
+    # Texture names behind the utilitycraft_* terrain keys that blocks use.
+    used_keys = build_texture_index(plan).key_users["terrain"]
+    return {key.removeprefix(TERRAIN_KEY_PREFIX) for key in used_keys if key.startswith(TERRAIN_KEY_PREFIX)}
+
+
+def synthesize_textures(
+    plan: ChangePlan,
+    modifiers: list[str],
+    bases: list[str] | None = None,
+    seed: int = 0,
+    overwrite: bool = False,
+    targets: list[str] | None = None,
+) -> tuple[dict[str, int], list[str]]:
+    wanted = set(targets) if targets is not None else referenced_targets(plan)
+    available = sorted(path.stem for path in plan.glob(STONES_DIR, "*.png") if is_base_texture(path.stem))
+    # (modifier, base) pairs that are requested and can be derived from an available base.
+    requested = [
+        (modifier, name)
+        for name in available
+        if bases is None or name in bases
+        for modifier in modifiers
+        if f"{modifier}_{name}" in wanted
+    ]
+    pending = {
+        (modifier, name)
+        for modifier, name in requested
+        if overwrite or not plan.exists(STONES_DIR / f"{modifier}_{name}.png")
+    }
+    # Explicit targets that no selected modifier and available base can produce (typos, missing bases).
+    unknown = sorted(set(targets or ()) - {f"{modifier}_{name}" for modifier, name in requested})
+    names = sorted({name for _, name in pending})
+
+    terrain = plan.read_json(TERRAIN_TEXTURE_PATH)
+    texture_data = terrain.setdefault("texture_data", {})
+    stats = {
+        "requested_textures": len(requested),
+        "bases": len(names),
+        "written_textures": 0,
+        "kept_existing": len(requested) - len(pending),
+        "registered_keys": 0,
+    }
+
+    for (height, width), (group_names, batch) in load_batches(names).items():
+        for modifier in modifiers:
+            selected = [index for index, name in enumerate(group_names) if (modifier, name) in pending]
+            if not selected:
+                continue
+
+            output = KERNELS[modifier](batch[selected], [group_names[index] for index in selected], seed)
+            for position, index in enumerate(selected):
+                target = f"{modifier}_{group_names[index]}"
+                plan.write_bytes(STONES_DIR / f"{target}.png", encode_png(output[position]))
+                stats["written_textures"] += 1
+
+    for modifier, name in requested:
+        target = f"{modifier}_{name}"
+        key = f"{TERRAIN_KEY_PREFIX}{target}"
+        if key not in texture_data:
+            texture_data[key] = {"textures": (STONES_DIR / target).relative_to(RP_ROOT).as_posix()}
+            stats["registered_keys"] += 1
+
+    if stats["registered_keys"]:
+        plan.write_json(TERRAIN_TEXTURE_PATH, terrain)
+    return stats, unknown
+
+
+def main() -> int:
+    args = parse_args()
+    plan = ChangePlan()
+    stats, unknown = synthesize_textures(plan, args.modifiers, args.bases, args.seed, args.overwrite, args.targets)
+
+    print("Texture synthesis summary:")
+    for key, value in stats.items():
+        print(f"- {key}: {value}")
+
+    if unknown:
+        print("Unknown targets (not <modifier>_<base> of the selected modifiers and available bases):")
+        for name in unknown:
+            print(f"- {name}")
+        print("No files were changed.")
+        return 1
+
+    if args.dry_run:
+        print_plan(plan)
+        print("Dry run enabled. No files were changed.")
+        return 0
+
+    applied = plan.apply()
+    print("Applied changes:")
+    for action, count in applied.items():
+        print(f"- {action}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+"""
+Reverse index of texture usage across BP/RP, with an optional pruner for dead assets.
+
+One pass reads every input once and records who uses what:
+- RP/textures/terrain_texture.json and item_texture.json: atlas key -> texture paths;
+- RP/blocks.json: block -> terrain keys (string or per-face `textures`);
+- BP/blocks material_instances: block -> terrain keys;
+- BP/items `minecraft:icon`: item -> item atlas keys;
+- any other BP/RP JSON string starting with `textures/` (attachables, entities):
+  direct texture path references.
+
+Unreferenced terrain/item keys and PNG/TGA files under RP/textures that no key or
+direct path uses are reported; keys used by blocks but missing from the atlas are
+listed as well (usually vanilla keys). With --prune, unused keys are removed from
+the atlases and unused image files are deleted. Pack icons are never touched.
+
+Examples
+--------
+- python tools/texture_index.py
+- python tools/texture_index.py --index-out tools/generated/texture_index.json
+- python tools/texture_index.py --prune --dry-run
+"""
+
+import argparse
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from change_plan import ChangePlan, dump_json_text, print_plan
+from pack_io import BP_ROOT, RP_ROOT
+from validate_pack import strip_json_comments
+
+TEXTURES_DIR = RP_ROOT / "textures"
+TERRAIN_TEXTURE_PATH = TEXTURES_DIR / "terrain_texture.json"
+ITEM_TEXTURE_PATH = TEXTURES_DIR / "item_texture.json"
+BLOCKS_JSON_PATH = RP_ROOT / "blocks.json"
+
+IMAGE_SUFFIXES = (".png", ".tga")
+BLOCKS_JSON_META_KEYS = {"format_version"}
+
+
+@dataclass
+class TextureIndex:
+    # atlas name ("terrain" / "item") -> key -> texture paths (relative to RP, no suffix)
+    atlas_keys: dict[str, dict[str, list[str]]] = field(default_factory=lambda: {"terrain": {}, "item": {}})
+    # atlas name -> key -> users ("RP/blocks.json:<id>", "BP/blocks/...json")
+    key_users: dict[str, dict[str, set[str]]] = field(default_factory=lambda: {"terrain": {}, "item": {}})
+    # texture path -> files that reference it directly
+    direct_paths: dict[str, set[str]] = field(default_factory=dict)
+    # texture path (no suffix) -> image file
+    images: dict[str, Path] = field(default_factory=dict)
+
+    def use_key(self, atlas: str, key: str, user: str) -> None:
+        self.key_users[atlas].setdefault(key, set()).add(user)
+
+    def unused_keys(self, atlas: str) -> list[str]:
+        users = self.key_users[atlas]
+        return sorted(key for key in self.atlas_keys[atlas] if key not in users)
+
+    def missing_keys(self, atlas: str) -> list[str]:
+        keys = self.atlas_keys[atlas]
+        return sorted(key for key in self.key_users[atlas] if key not in keys)
+
+    def used_paths(self, pruned_keys: dict[str, set[str]] | None = None) -> set[str]:
+        used = set(self.direct_paths)
+        for atlas, keys in self.atlas_keys.items():
+            skipped = (pruned_keys or {}).get(atlas, set())
+            for key, paths in keys.items():
+                if key not in skipped:
+                    used.update(paths)
+        return used
+
+    def unused_images(self, pruned_keys: dict[str, set[str]] | None = None) -> list[str]:
+        used = self.used_paths(pruned_keys)
+        return sorted(path for path in self.images if path not in used)
+
+    def to_payload(self) -> dict[str, Any]:
+        textures: dict[str, dict[str, list[str]]] = {}
+        for atlas, keys in self.atlas_keys.items():
+            for key, paths in keys.items():
+                for path in paths:
+                    entry = textures.setdefault(path, {"keys": [], "users": []})
+                    entry["keys"].append(f"{atlas}:{key}")
+                    entry["users"].extend(sorted(self.key_users[atlas].get(key, ())))
+        for path, users in self.direct_paths.items():
+            entry = textures.setdefault(path, {"keys": [], "users": []})
+            entry["users"].extend(sorted(users))
+        for path in self.images:
+            textures.setdefault(path, {"keys": [], "users": []})
+        return {path: textures[path] for path in sorted(textures)}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Index texture usage across BP/RP and report or prune unused assets.")
+    parser.add_argument("--prune", action="store_true", help="Remove unused atlas keys and delete unused image files.")
+    parser.add_argument("--dry-run", action="store_true", help="With --prune, print the planned changes without touching files.")
+    parser.add_argument(
+        "--index-out",
+        type=Path,
+        default=None,
+        help="Write the reverse index (texture path -> atlas keys and users) to this JSON file.",
+    )
+    return parser.parse_args()
+
+
+def read_pack_json(plan: ChangePlan, path: Path) -> Any:
+    return json.loads(strip_json_comments(plan.read_text(path)))
+
+
+def atlas_texture_paths(entry: Any) -> list[str]:
+    textures = entry.get("textures") if isinstance(entry, dict) else entry
+    if isinstance(textures, str):
+        return [textures]
+    if isinstance(textures, dict):
+        return [textures["path"]] if isinstance(textures.get("path"), str) else []
+    if isinstance(textures, list):
+        paths: list[str] = []
+        for item in textures:
+            paths.extend(atlas_texture_paths({"textures": item}))
+        return paths
+    return []
+
+
+def collect_direct_paths(value: Any, user: str, index: TextureIndex) -> None:
+    if isinstance(value, str):
+        if value.startswith("textures/"):
+            index.direct_paths.setdefault(value, set()).add(user)
+    elif isinstance(value, dict):
+        for item in value.values():
+            collect_direct_paths(item, user, index)
+    elif isinstance(value, list):
+        for item in value:
+            collect_direct_paths(item, user, index)
+
+
+def index_block_file(payload: dict[str, Any], user: str, index: TextureIndex) -> None:
+    block = payload.get("minecraft:block", {})
+    variants = [block.get("components", {})] + [item.get("components", {}) for item in block.get("permutations", [])]
+    for components in variants:
+        for instance in components.get("minecraft:material_instances", {}).values():
+            # String instances alias another instance name, not a texture.
+            if isinstance(instance, dict) and isinstance(instance.get("texture"), str):
+                index.use_key("terrain", instance["texture"], user)
+
+
+def index_item_file(payload: dict[str, Any], user: str, index: TextureIndex) -> None:
+    icon = payload.get("minecraft:item", {}).get("components", {}).get("minecraft:icon")
+    if isinstance(icon, str):
+        index.use_key("item", icon, user)
+    elif isinstance(icon, dict):
+        if isinstance(icon.get("texture"), str):
+            index.use_key("item", icon["texture"], user)
+        for key in (icon.get("textures") or {}).values():
+            if isinstance(key, str):
+                index.use_key("item", key, user)
+
+
+def index_blocks_json(payload: dict[str, Any], index: TextureIndex) -> None:
+    for block_id, entry in payload.items():
+        if block_id in BLOCKS_JSON_META_KEYS or not isinstance(entry, dict):
+            continue
+        user = f"RP/blocks.json:{block_id}"
+        textures = entry.get("textures")
+        if isinstance(textures, str):
+            index.use_key("terrain", textures, user)
+        elif isinstance(textures, dict):
+            for key in textures.values():
+                if isinstance(key, str):
+                    index.use_key("terrain", key, user)
+        carried = entry.get("carried_textures")
+        if isinstance(carried, str):
+            index.use_key("terrain", carried, user)
+
+
+def build_texture_index(plan: ChangePlan) -> TextureIndex:
+    index = TextureIndex()
+    atlases = {TERRAIN_TEXTURE_PATH: "terrain", ITEM_TEXTURE_PATH: "item"}
+
+    for path in plan.rglob(TEXTURES_DIR, "*"):
+        if path.suffix.lower() in IMAGE_SUFFIXES:
+            index.images[path.relative_to(RP_ROOT).with_suffix("").as_posix()] = path
+
+    for pack_root in (BP_ROOT, RP_ROOT):
+        for path in plan.rglob(pack_root, "*.json"):
+            relative = plan.relative(path)
+            try:
+                payload = read_pack_json(plan, path)
+            except json.JSONDecodeError:
+                continue
+
+            if path in atlases:
+                keys = index.atlas_keys[atlases[path]]
+                for key, entry in payload.get("texture_data", {}).items():
+                    keys[key] = atlas_texture_paths(entry)
+            elif path == BLOCKS_JSON_PATH:
+                index_blocks_json(payload, index)
+            elif isinstance(payload, dict) and "minecraft:block" in payload:
+                index_block_file(payload, relative, index)
+            elif isinstance(payload, dict) and "minecraft:item" in payload:
+                index_item_file(payload, relative, index)
+            else:
+                collect_direct_paths(payload, relative, index)
+    return index
+
+
+def prune_unused(plan: ChangePlan, index: TextureIndex) -> dict[str, int]:
+    pruned_keys = {atlas: set(index.unused_keys(atlas)) for atlas in index.atlas_keys}
+    atlas_paths = {"terrain": TERRAIN_TEXTURE_PATH, "item": ITEM_TEXTURE_PATH}
+    for atlas, keys in pruned_keys.items():
+        if not keys:
+            continue
+        payload = plan.read_json(atlas_paths[atlas])
+        payload["texture_data"] = {key: value for key, value in payload["texture_data"].items() if key not in keys}
+        plan.write_text(atlas_paths[atlas], dump_json_text(payload))
+
+    unused_images = index.unused_images(pruned_keys)
+    for texture_path in unused_images:
+        plan.delete(index.images[texture_path])
+
+    return {
+        "pruned_terrain_keys": len(pruned_keys["terrain"]),
+        "pruned_item_keys": len(pruned_keys["item"]),
+        "deleted_images": len(unused_images),
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    plan = ChangePlan()
+    index = build_texture_index(plan)
+
+    if args.index_out is not None:
+        args.index_out.parent.mkdir(parents=True, exist_ok=True)
+        args.index_out.write_text(dump_json_text(index.to_payload()), encoding="utf-8")
+        print(f"Index: {args.index_out}")
+
+    sections = (
+        ("Unused terrain keys", index.unused_keys("terrain")),
+        ("Unused item keys", index.unused_keys("item")),
+        ("Terrain keys used but not defined (vanilla or missing)", index.missing_keys("terrain")),
+        ("Item keys used but not defined (vanilla or missing)", index.missing_keys("item")),
+        ("Unused images", index.unused_images()),
+    )
+    for title, entries in sections:
+        print(f"{title}: {len(entries)}")
+        for entry in entries:
+            print(f"- {entry}")
+
+    if not args.prune:
+        return 0
+
+    stats = prune_unused(plan, index)
+    print("Prune summary:")
+    for key, value in stats.items():
+        print(f"- {key}: {value}")
+
+    if args.dry_run:
+        print_plan(plan)
+        print("Dry run enabled. No files were changed.")
+        return 0
+
+    plan.apply()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,488 @@
+from __future__ import annotations
+
+"""
+Validate every JSON file in BP/ and RP/ against the schemas vendored in tools/schemas.
+
+Schemas are compiled once into nested checker functions (a small JSON Schema subset:
+type, enum, const, pattern, properties, required, additionalProperties,
+patternProperties, propertyNames, items, min/max items, properties and length,
+minimum/maximum, anyOf, oneOf and local `#/definitions/...` references). A file is
+matched to a schema by its top-level key (`minecraft:block`, `minecraft:recipe_*`,
+`minecraft:block_culling_rules`) or, for the resource pack indexes, by its path;
+anything else is only checked for being parseable. `//` and `/* */` comments are
+tolerated because the game accepts them.
+
+Results are cached per file content hash in tools/generated/validation_cache.json, so
+only files that changed since the last run (or every file, when a schema changed)
+are re-checked. Errors are reported as `<file>: <JSON path>: <message>`.
+
+Examples
+--------
+- python tools/validate_pack.py
+- python tools/validate_pack.py --no-cache
+- python tools/validate_pack.py BP/blocks
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from pack_io import ROOT
+
+SCHEMA_DIR = ROOT / "tools/schemas"
+CACHE_PATH = ROOT / "tools/generated/validation_cache.json"
+PACK_DIRS = (ROOT / "BP", ROOT / "RP")
+
+CACHE_FORMAT_VERSION = 1
+# Below this many files the process pool costs more than it saves.
+PARALLEL_THRESHOLD = 64
+
+PATH_SCHEMAS = {
+    "RP/blocks.json": "blocks_json",
+    "RP/textures/terrain_texture.json": "terrain_texture",
+}
+KEY_SCHEMAS = {
+    "minecraft:block": "block",
+    "minecraft:recipe_shapeless": "recipe",
+    "minecraft:recipe_shaped": "recipe",
+    "minecraft:recipe_furnace": "recipe",
+    "minecraft:block_culling_rules": "block_culling_rules",
+}
+
+Checker = Callable[[Any, str, list[str]], None]
+
+JSON_TYPES: dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate BP/RP JSON files against the vendored schemas.")
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help="Files or directories to validate (default: BP and RP).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-check every file instead of only files whose hash changed.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count; 1 disables parallelism).",
+    )
+    args = parser.parse_args()
+    outside = [str(path) for path in args.paths if not resolve_path(path).is_relative_to(ROOT)]
+    if outside:
+        parser.error(f"path(s) outside the repository: {', '.join(outside)} (expected paths under {ROOT})")
+    return args
+
+
+def strip_json_comments(text: str) -> str:
+    if "//" not in text and "/*" not in text:
+        return text
+
+    result: list[str] = []
+    index = 0
+    length = len(text)
+    in_string = False
+    while index < length:
+        char = text[index]
+        if in_string:
+            result.append(char)
+            if char == "\\" and index + 1 < length:
+                result.append(text[index + 1])
+                index += 2
+                continue
+            if char == '"':
+                in_string = False
+            index += 1
+            continue
+
+        if char == '"':
+            in_string = True
+            result.append(char)
+            index += 1
+        elif text.startswith("//", index):
+            newline = text.find("\n", index)
+            index = length if newline == -1 else newline
+        elif text.startswith("/*", index):
+            end = text.find("*/", index + 2)
+            index = length if end == -1 else end + 2
+        else:
+            result.append(char)
+            index += 1
+    return "".join(result)
+
+
+def child_path(path: str, key: str | int) -> str:
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    if re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", key):
+        return f"{path}.{key}"
+    return f"{path}[{json.dumps(key, ensure_ascii=False)}]"
+
+
+def compile_schema(schema: dict[str, Any], definitions: dict[str, Any], compiled_refs: dict[str, Checker]) -> Checker:
+    checks: list[Checker] = []
+
+    if "$ref" in schema:
+        ref = schema["$ref"]
+        prefix = "#/definitions/"
+        if not ref.startswith(prefix) or ref[len(prefix):] not in definitions:
+            raise ValueError(f"Unsupported schema reference: {ref}")
+        name = ref[len(prefix):]
+        if name not in compiled_refs:
+            # Placeholder first so recursive definitions resolve lazily.
+            compiled_refs[name] = lambda value, path, errors: compiled_refs[name](value, path, errors)
+            compiled_refs[name] = compile_schema(definitions[name], definitions, compiled_refs)
+        checks.append(lambda value, path, errors: compiled_refs[name](value, path, errors))
+
+    if "type" in schema:
+        type_names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        predicates = [JSON_TYPES[type_name] for type_name in type_names]
+        expected = " or ".join(type_names)
+
+        def check_type(value: Any, path: str, errors: list[str]) -> None:
+            if not any(predicate(value) for predicate in predicates):
+                errors.append(f"{path}: expected {expected}, got {type(value).__name__}")
+
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = schema["enum"]
+
+        def check_enum(value: Any, path: str, errors: list[str]) -> None:
+            # `True == 1` in Python, so booleans only match boolean enum members.
+            if not any(value == item and isinstance(value, bool) == isinstance(item, bool) for item in allowed):
+                errors.append(f"{path}: {json.dumps(value, ensure_ascii=False)} is not one of {allowed}")
+
+        checks.append(check_enum)
+
+    if "const" in schema:
+        constant = schema["const"]
+
+        def check_const(value: Any, path: str, errors: list[str]) -> None:
+            if value != constant:
+                errors.append(f"{path}: expected {json.dumps(constant, ensure_ascii=False)}")
+
+        checks.append(check_const)
+
+    if "pattern" in schema:
+        regex = re.compile(schema["pattern"])
+
+        def check_pattern(value: Any, path: str, errors: list[str]) -> None:
+            if isinstance(value, str) and not regex.search(value):
+                errors.append(f"{path}: {value!r} does not match {regex.pattern}")
+
+        checks.append(check_pattern)
+
+    for keyword, compare, label in (
+        ("minLength", lambda size, limit: size >= limit, "at least"),
+        ("maxLength", lambda size, limit: size <= limit, "at most"),
+    ):
+        if keyword in schema:
+            limit = schema[keyword]
+
+            def check_length(value: Any, path: str, errors: list[str], limit=limit, compare=compare, label=label) -> None:
+                if isinstance(value, str) and not compare(len(value), limit):
+                    errors.append(f"{path}: expected {label} {limit} characters")
+
+            checks.append(check_length)
+
+    for keyword, compare, label in (
+        ("minimum", lambda number, limit: number >= limit, ">="),
+        ("maximum", lambda number, limit: number <= limit, "<="),
+    ):
+        if keyword in schema:
+            limit = schema[keyword]
+
+            def check_bound(value: Any, path: str, errors: list[str], limit=limit, compare=compare, label=label) -> None:
+                if JSON_TYPES["number"](value) and not compare(value, limit):
+                    errors.append(f"{path}: expected {label} {limit}, got {value}")
+
+            checks.append(check_bound)
+
+    for keyword, compare, label, kind in (
+        ("minItems", lambda size, limit: size >= limit, "at least", list),
+        ("maxItems", lambda size, limit: size <= limit, "at most", list),
+        ("minProperties", lambda size, limit: size >= limit, "at least", dict),
+        ("maxProperties", lambda size, limit: size <= limit, "at most", dict),
+    ):
+        if keyword in schema:
+            limit = schema[keyword]
+            noun = "items" if kind is list else "properties"
+
+            def check_size(value: Any, path: str, errors: list[str], limit=limit, compare=compare, label=label, kind=kind, noun=noun) -> None:
+                if isinstance(value, kind) and not compare(len(value), limit):
+                    errors.append(f"{path}: expected {label} {limit} {noun}, got {len(value)}")
+
+            checks.append(check_size)
+
+    if "required" in schema:
+        required = schema["required"]
+
+        def check_required(value: Any, path: str, errors: list[str]) -> None:
+            if isinstance(value, dict):
+                for key in required:
+                    if key not in value:
+                        errors.append(f"{path}: missing required property {key!r}")
+
+        checks.append(check_required)
+
+    if any(keyword in schema for keyword in ("properties", "patternProperties", "additionalProperties", "propertyNames")):
+        properties = {
+            key: compile_schema(sub_schema, definitions, compiled_refs)
+            for key, sub_schema in schema.get("properties", {}).items()
+        }
+        pattern_properties = [
+            (re.compile(pattern), compile_schema(sub_schema, definitions, compiled_refs))
+            for pattern, sub_schema in schema.get("patternProperties", {}).items()
+        ]
+        additional = schema.get("additionalProperties", True)
+        additional_checker = compile_schema(additional, definitions, compiled_refs) if isinstance(additional, dict) else None
+        name_checker = (
+            compile_schema(schema["propertyNames"], definitions, compiled_refs) if "propertyNames" in schema else None
+        )
+
+        def check_properties(value: Any, path: str, errors: list[str]) -> None:
+            if not isinstance(value, dict):
+                return
+            for key, item in value.items():
+                item_path = child_path(path, key)
+                if name_checker is not None:
+                    name_checker(key, item_path, errors)
+                matched = False
+                if key in properties:
+                    properties[key](item, item_path, errors)
+                    matched = True
+                for regex, checker in pattern_properties:
+                    if regex.search(key):
+                        checker(item, item_path, errors)
+                        matched = True
+                if matched:
+                    continue
+                if additional is False:
+                    errors.append(f"{item_path}: unexpected property")
+                elif additional_checker is not None:
+                    additional_checker(item, item_path, errors)
+
+        checks.append(check_properties)
+
+    if "items" in schema:
+        item_checker = compile_schema(schema["items"], definitions, compiled_refs)
+
+        def check_items(value: Any, path: str, errors: list[str]) -> None:
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    item_checker(item, child_path(path, index), errors)
+
+        checks.append(check_items)
+
+    for keyword in ("anyOf", "oneOf"):
+        if keyword in schema:
+            options = [compile_schema(option, definitions, compiled_refs) for option in schema[keyword]]
+            exactly_one = keyword == "oneOf"
+
+            def check_options(value: Any, path: str, errors: list[str], options=options, exactly_one=exactly_one) -> None:
+                option_errors: list[list[str]] = []
+                for option in options:
+                    found: list[str] = []
+                    option(value, path, found)
+                    option_errors.append(found)
+                passing = sum(1 for found in option_errors if not found)
+                if passing == 0:
+                    # Report the form whose type matched rather than the shortest mismatch.
+                    type_prefix = f"{path}: expected "
+                    closest = min(
+                        option_errors,
+                        key=lambda found: (any(error.startswith(type_prefix) for error in found), len(found)),
+                    )
+                    errors.append(f"{path}: does not match any allowed form ({closest[0]})")
+                elif exactly_one and passing > 1:
+                    errors.append(f"{path}: matches more than one allowed form")
+
+            checks.append(check_options)
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value: Any, path: str, errors: list[str]) -> None:
+        for check in checks:
+            check(value, path, errors)
+
+    return check_all
+
+
+def schema_path(schema_name: str) -> Path:
+    return SCHEMA_DIR / f"{schema_name}.schema.json"
+
+
+@lru_cache(maxsize=None)
+def load_validator(schema_name: str) -> Checker:
+    schema = json.loads(schema_path(schema_name).read_text(encoding="utf-8"))
+    return compile_schema(schema, schema.get("definitions", {}), {})
+
+
+def schema_fingerprint() -> str:
+    digest = hashlib.sha1()
+    for path in sorted(SCHEMA_DIR.glob("*.schema.json")):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def select_schema(relative: str, payload: Any) -> str | None:
+    if relative in PATH_SCHEMAS:
+        return PATH_SCHEMAS[relative]
+    if isinstance(payload, dict):
+        for key in payload:
+            if key in KEY_SCHEMAS:
+                return KEY_SCHEMAS[key]
+    return None
+
+
+def validate_text(relative: str, text: str) -> list[str]:
+    try:
+        payload = json.loads(strip_json_comments(text))
+    except json.JSONDecodeError as error:
+        return [f"$: invalid JSON at line {error.lineno} column {error.colno}: {error.msg}"]
+
+    schema_name = select_schema(relative, payload)
+    if schema_name is None:
+        return []
+
+    errors: list[str] = []
+    load_validator(schema_name)(payload, "$", errors)
+    return errors
+
+
+def validate_file(relative: str) -> tuple[str, list[str]]:
+    text = (ROOT / relative).read_text(encoding="utf-8-sig")
+    return relative, validate_text(relative, text)
+
+
+def resolve_path(path: Path) -> Path:
+    return (path if path.is_absolute() else (Path.cwd() / path)).resolve()
+
+
+def iter_json_files(paths: Iterable[Path]) -> list[Path]:
+    found: set[Path] = set()
+    for path in map(resolve_path, paths):
+        # Results and the cache are keyed by repo-relative paths; main() rejects anything else.
+        if not path.is_relative_to(ROOT):
+            continue
+        if path.is_file():
+            found.add(path)
+        elif path.is_dir():
+            found.update(item for item in path.rglob("*.json") if item.is_file())
+    return sorted(found)
+
+
+def file_sha1(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def load_cache(fingerprint: str) -> dict[str, dict[str, Any]]:
+    if not CACHE_PATH.exists():
+        return {}
+    try:
+        payload = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+    if payload.get("version") != CACHE_FORMAT_VERSION or payload.get("schemas") != fingerprint:
+        return {}
+    return payload.get("files", {})
+
+
+def save_cache(fingerprint: str, entries: dict[str, dict[str, Any]]) -> None:
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": CACHE_FORMAT_VERSION, "schemas": fingerprint, "files": entries}
+    CACHE_PATH.write_text(json.dumps(payload, ensure_ascii=False, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def validate_pack(
+    paths: Iterable[Path] | None = None,
+    use_cache: bool = True,
+    jobs: int | None = None,
+) -> tuple[dict[str, list[str]], dict[str, int]]:
+    files = iter_json_files(paths if paths else PACK_DIRS)
+    fingerprint = schema_fingerprint()
+    cache = load_cache(fingerprint) if use_cache else {}
+
+    results: dict[str, list[str]] = {}
+    entries: dict[str, dict[str, Any]] = {}
+    pending: list[str] = []
+    for path in files:
+        relative = path.relative_to(ROOT).as_posix()
+        digest = file_sha1(path)
+        cached = cache.get(relative)
+        if cached is not None and cached.get("sha1") == digest:
+            results[relative] = cached.get("errors", [])
+            entries[relative] = cached
+        else:
+            pending.append(relative)
+            entries[relative] = {"sha1": digest}
+
+    worker_count = jobs if jobs is not None else (os.cpu_count() or 1)
+    if worker_count > 1 and len(pending) >= PARALLEL_THRESHOLD:
+        chunk_size = max(1, len(pending) // (worker_count * 4))
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            checked = list(executor.map(validate_file, pending, chunksize=chunk_size))
+    else:
+        checked = [validate_file(relative) for relative in pending]
+
+    for relative, errors in checked:
+        results[relative] = errors
+        entries[relative]["errors"] = errors
+
+    if use_cache:
+        # Keep entries for files outside this run's selection so partial runs do not evict them.
+        merged = {key: value for key, value in cache.items() if (ROOT / key).is_file()}
+        merged.update(entries)
+        save_cache(fingerprint, merged)
+
+    stats = {
+        "files": len(files),
+        "checked": len(pending),
+        "cached": len(files) - len(pending),
+        "files_with_errors": sum(1 for errors in results.values() if errors),
+        "errors": sum(len(errors) for errors in results.values()),
+    }
+    return results, stats
+
+
+def print_validation_report(results: dict[str, list[str]], stats: dict[str, int]) -> None:
+    for relative in sorted(results):
+        for error in results[relative]:
+            print(f"{relative}: {error}")
+    print("Validation summary:")
+    for key, value in stats.items():
+        print(f"- {key}: {value}")
+
+
+def main() -> int:
+    args = parse_args()
+    results, stats = validate_pack(args.paths, use_cache=not args.no_cache, jobs=args.jobs)
+    print_validation_report(results, stats)
+    return 1 if stats["errors"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())